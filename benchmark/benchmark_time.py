@@ -29,12 +29,14 @@ bazel run -c opt //benchmark:benchmark_time -- --f add_index from_pandas
 """
 import argparse
 import time
-from typing import List, NamedTuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, NamedTuple, Union
 import logging
 
 import numpy as np
 import pandas as pd
 import temporian as tp
+from temporian.implementation.numpy_cc.operators import operators_cc
 
 
 def _build_toy_dataset(
@@ -153,6 +155,32 @@ def benchmark_propagate(runner):
         )
 
 
+def benchmark_select_index_values(runner):
+    """Selects half of the index keys of an EventSet, in the dictionary and in
+    the compact layout."""
+
+    runner.add_separator()
+
+    np.random.seed(0)
+    n = 4_000_000
+    evset = tp.event_set(
+        timestamps=np.sort(np.random.randn(n) * n),
+        features={
+            "data": np.random.randn(n),
+            "index": np.random.randint(0, 100_000, n),
+        },
+        indexes=["index"],
+    )
+    node = evset.node()
+    output = node.select_index_values(evset.get_index_keys()[::2])
+
+    for layout, layout_evset in [("dict", evset), ("compact", evset.compact())]:
+        runner.benchmark(
+            f"select_index_values:{layout}",
+            lambda: tp.run(output, input={node: layout_evset}),
+        )
+
+
 def benchmark_cast(runner):
     runner.add_separator()
     for n in [100, 1_000_000]:
@@ -349,6 +377,109 @@ def benchmark_add_index_v2(runner):
             )
 
 
+def _run_in_threads(callbacks: List[Callable], num_threads: int) -> None:
+    """Runs a list of callbacks in a pool of threads."""
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        for future in [executor.submit(callback) for callback in callbacks]:
+            future.result()
+
+
+def benchmark_moving_sum_threads(runner):
+    """Runs the moving sum c++ kernel on independent data in several threads.
+
+    The c++ kernels release the GIL. Therefore, the wall time should decrease
+    with the number of threads (up to the number of cores).
+    """
+
+    runner.add_separator()
+
+    np.random.seed(0)
+    num_tasks = 16
+    n = 1_000_000
+    tasks = [
+        (np.sort(np.random.randn(n) * n), np.random.randn(n))
+        for _ in range(num_tasks)
+    ]
+    callbacks = [
+        lambda timestamps=timestamps, values=values: operators_cc.moving_sum(
+            evset_timestamps=timestamps,
+            evset_values=values,
+            window_length=10.0,
+        )
+        for timestamps, values in tasks
+    ]
+
+    for num_threads in [1, 2, 4, 8]:
+        runner.benchmark(
+            f"moving_sum_threads:t{num_threads}",
+            lambda: _run_in_threads(callbacks, num_threads),
+        )
+
+
+def benchmark_left_join_idxs_threads(runner):
+    """Runs the left join c++ kernel on independent data in several threads.
+
+    See "benchmark_moving_sum_threads" for details.
+    """
+
+    runner.add_separator()
+
+    np.random.seed(0)
+    num_tasks = 16
+    n = 1_000_000
+    tasks = [
+        (
+            np.sort(np.random.randint(0, n, n)).astype(np.float64),
+            np.sort(np.random.randint(0, n, n)).astype(np.float64),
+        )
+        for _ in range(num_tasks)
+    ]
+    callbacks = [
+        lambda left=left, right=right: operators_cc.left_join_idxs(
+            left_timestamps=left,
+            right_timestamps=right,
+        )
+        for left, right in tasks
+    ]
+
+    for num_threads in [1, 2, 4, 8]:
+        runner.benchmark(
+            f"left_join_idxs_threads:t{num_threads}",
+            lambda: _run_in_threads(callbacks, num_threads),
+        )
+
+
+def benchmark_moving_sum_index_threads(runner):
+    """Runs a moving sum on an EventSet with many index keys using
+    `tp.run(num_index_threads=...)`."""
+
+    runner.add_separator()
+
+    np.random.seed(0)
+    n = 4_000_000
+    evset = tp.event_set(
+        timestamps=np.sort(np.random.randn(n) * n),
+        features={
+            "data": np.random.randn(n),
+            "index": np.random.randint(0, 1_000, n),
+        },
+        indexes=["index"],
+    )
+    node = evset.node()
+    output = node.moving_sum(window_length=10.0)
+
+    for num_index_threads in [1, 2, 4, 8]:
+        runner.benchmark(
+            f"moving_sum_index_threads:t{num_index_threads}",
+            lambda: tp.run(
+                output,
+                input={node: evset},
+                num_index_threads=num_index_threads,
+            ),
+        )
+
+
 class BenchmarkResult(NamedTuple):
     name: str
     wall_time_seconds: float
@@ -430,11 +561,15 @@ def main():
         "calendar_day_of_month",
         "sample",
         "propagate",
+        "select_index_values",
         "cast",
         "unique_timestamps",
         "add_index",
         "add_index_v2",
         "from_pandas_with_objects",
+        "moving_sum_threads",
+        "left_join_idxs_threads",
+        "moving_sum_index_threads",
     ]
     if args.functions is not None:
         benchmarks_to_run = args.functions
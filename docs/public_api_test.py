@@ -21,11 +21,18 @@ import temporian as tp
 PUBLIC_API_SYMBOLS = {
     "EventSet",
     "IndexData",
+    "CompactData",
+    "DictionaryArray",
+    "MemoryUsage",
     "EventSetNode",
     "Schema",
     "duration",
     "run",
     "has_leak",
+    "required_features",
+    "schedule_cache_info",
+    "clear_schedule_cache",
+    "Profiler",
     "event_set",
     "input_node",
     "plot",
@@ -39,14 +46,25 @@ PUBLIC_API_SYMBOLS = {
     "from_pandas",
     "to_parquet",
     "from_parquet",
+    "to_arrow",
+    "from_arrow",
+    "save_event_set",
+    "load_event_set",
     "to_tensorflow_dataset",
     "from_tensorflow_record",
     "to_tensorflow_record",
     # DTYPES
     "float64",
     "float32",
+    "float16",
     "int32",
     "int64",
+    "int8",
+    "int16",
+    "uint8",
+    "uint16",
+    "uint32",
+    "uint64",
     "bool_",
     "str_",
     "bytes_",
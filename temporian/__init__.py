@@ -43,8 +43,15 @@ from temporian.core.data.node import input_node
 # Dtypes
 from temporian.core.data.dtype import float64
 from temporian.core.data.dtype import float32
+from temporian.core.data.dtype import float16
 from temporian.core.data.dtype import int32
 from temporian.core.data.dtype import int64
+from temporian.core.data.dtype import int8
+from temporian.core.data.dtype import int16
+from temporian.core.data.dtype import uint8
+from temporian.core.data.dtype import uint16
+from temporian.core.data.dtype import uint32
+from temporian.core.data.dtype import uint64
 from temporian.core.data.dtype import bool_
 from temporian.core.data.dtype import str_
 from temporian.core.data.dtype import bytes_
@@ -56,7 +63,15 @@ from temporian.core.data.schema import Schema
 from temporian.core.data import duration
 
 # EventSets
-from temporian.implementation.numpy.data.event_set import EventSet, IndexData
+from temporian.implementation.numpy.data.dictionary_array import (
+    DictionaryArray,
+)
+from temporian.implementation.numpy.data.event_set import (
+    CompactData,
+    EventSet,
+    IndexData,
+)
+from temporian.implementation.numpy.data.memory_usage import MemoryUsage
 from temporian.implementation.numpy.data.io import event_set
 
 # Serialization
@@ -68,10 +83,18 @@ from temporian.core.serialization import load_graph
 # Graph execution
 from temporian.core.evaluation import run
 from temporian.core.evaluation import has_leak
+from temporian.core.evaluation import required_features
+from temporian.core.evaluation import schedule_cache_info
+from temporian.core.evaluation import clear_schedule_cache
+from temporian.core.profiler import Profiler
 
 # IO
+from temporian.io.arrow import from_arrow
+from temporian.io.arrow import to_arrow
 from temporian.io.csv import to_csv
 from temporian.io.csv import from_csv
+from temporian.io.native import save_event_set
+from temporian.io.native import load_event_set
 from temporian.io.pandas import to_pandas
 from temporian.io.pandas import from_pandas
 from temporian.io.parquet import from_parquet
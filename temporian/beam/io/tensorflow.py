@@ -93,19 +93,15 @@ class _DictToTFExample(beam.DoFn):
         # Features
         for feature_schema in self._schema.features:
             src_value = dict_example[feature_schema.name]
-            if feature_schema.dtype in [
-                DType.BOOLEAN,
-                DType.INT32,
-                DType.INT64,
-            ]:
+            if (
+                feature_schema.dtype == DType.BOOLEAN
+                or feature_schema.dtype.is_integer
+            ):
                 f(ex, feature_schema.name).int64_list.value[
                     :
                 ] = src_value = dict_example[feature_schema.name]
 
-            elif feature_schema.dtype in [
-                DType.FLOAT32,
-                DType.FLOAT64,
-            ]:
+            elif feature_schema.dtype.is_float:
                 f(ex, feature_schema.name).float_list.value[
                     :
                 ] = src_value = dict_example[feature_schema.name]
@@ -121,16 +117,12 @@ class _DictToTFExample(beam.DoFn):
         # Indexes
         for index_schema in self._schema.indexes:
             src_value = dict_example[index_schema.name]
-            if index_schema.dtype in [
-                DType.BOOLEAN,
-                DType.INT32,
-                DType.INT64,
-            ]:
+            if (
+                index_schema.dtype == DType.BOOLEAN
+                or index_schema.dtype.is_integer
+            ):
                 f(ex, index_schema.name).int64_list.value.append(src_value)
-            elif index_schema.dtype in [
-                DType.FLOAT32,
-                DType.FLOAT64,
-            ]:
+            elif index_schema.dtype.is_float:
                 f(ex, index_schema.name).float_list.value.append(src_value)
             elif index_schema.dtype == DType.STRING:
                 f(ex, index_schema.name).bytes_list.value.append(src_value)
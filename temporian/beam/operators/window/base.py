@@ -47,6 +47,13 @@ class BaseWindowBeamImplementation(BeamOperatorImplementation):
     ) -> Dict[str, BeamEventSet]:
         assert isinstance(self.operator, BaseWindowOperator)
 
+        if self.operator.has_multiple_winlen:
+            raise NotImplementedError(
+                "Window operators with several window lengths are not yet"
+                " supported with Beam. Use one operator per window length"
+                " instead."
+            )
+
         numpy_implementation = self._implementation()(self.operator)
 
         if self.operator.has_sampling:
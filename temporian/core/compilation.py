@@ -29,7 +29,9 @@ from temporian.implementation.numpy.data.event_set import EventSet
 F = TypeVar("F", bound=Callable)
 
 
-def compile(fn: Optional[F] = None, *, verbose: int = 0) -> F:
+def compile(
+    fn: Optional[F] = None, *, verbose: int = 0, optimize: bool = False
+) -> F:
     """Compiles a Temporian function.
 
     A Temporian function is a function that takes
@@ -79,6 +81,14 @@ def compile(fn: Optional[F] = None, *, verbose: int = 0) -> F:
         verbose: If >0, prints details about the execution on the standard error
             output when the wrapped function is applied eagerly on EventSets.
             The larger the number, the more information is displayed.
+        optimize: If true, the graph is optimized when the wrapped function is
+            applied eagerly on EventSets e.g., identical operators created
+            several times in the function are only executed once. Optimizing
+            has a fixed cost per call, so it is disabled by default (and for the
+            operators of the API, which are compiled functions themselves) and
+            is worth enabling on functions containing many operators. When the
+            wrapped function is applied on EventSetNodes, pass `optimize=True`
+            to [`tp.run()`][temporian.run] to optimize the graph.
 
     Returns:
         The compiled function.
@@ -120,7 +130,14 @@ def compile(fn: Optional[F] = None, *, verbose: int = 0) -> F:
             elif is_eager:
                 from temporian.core.evaluation import run
 
-                return run(query=outputs, input=inputs_map, verbose=verbose)
+                return run(
+                    query=outputs,
+                    input=inputs_map,
+                    verbose=verbose,
+                    optimize=optimize,
+                    # The graph created by each call is only evaluated once.
+                    use_schedule_cache=False,
+                )
 
             return outputs
 
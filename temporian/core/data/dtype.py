@@ -28,6 +28,13 @@ class DType(Enum):
     INT32 = "int32"
     STRING = "str_"
     BOOLEAN = "bool_"
+    INT8 = "int8"
+    INT16 = "int16"
+    UINT8 = "uint8"
+    UINT16 = "uint16"
+    UINT32 = "uint32"
+    UINT64 = "uint64"
+    FLOAT16 = "float16"
 
     def __str__(self) -> str:
         return self.value
@@ -37,11 +44,25 @@ class DType(Enum):
 
     @property
     def is_float(self) -> bool:
-        return self in (DType.FLOAT64, DType.FLOAT32)
+        return self in (DType.FLOAT64, DType.FLOAT32, DType.FLOAT16)
 
     @property
     def is_integer(self) -> bool:
-        return self in (DType.INT64, DType.INT32)
+        return self.is_unsigned_integer or self in (
+            DType.INT64,
+            DType.INT32,
+            DType.INT16,
+            DType.INT8,
+        )
+
+    @property
+    def is_unsigned_integer(self) -> bool:
+        return self in (
+            DType.UINT64,
+            DType.UINT32,
+            DType.UINT16,
+            DType.UINT8,
+        )
 
     @property
     def is_numerical(self) -> bool:
@@ -106,6 +127,13 @@ DTYPE_TO_PY_TYPES = {
     DType.FLOAT32: float,
     DType.INT64: int,
     DType.INT32: int,
+    DType.INT16: int,
+    DType.INT8: int,
+    DType.UINT64: int,
+    DType.UINT32: int,
+    DType.UINT16: int,
+    DType.UINT8: int,
+    DType.FLOAT16: float,
     DType.STRING: bytes,
     DType.BOOLEAN: bool,
 }
@@ -132,6 +160,9 @@ def check_is_valid_index_dtype(dtype: DType):
 
 # API dtypes definition
 
+float16 = DType.FLOAT16
+"""16-bit floating point number."""
+
 float32 = DType.FLOAT32
 """32-bit floating point number."""
 
@@ -144,6 +175,24 @@ int32 = DType.INT32
 int64 = DType.INT64
 """64-bit integer."""
 
+int8 = DType.INT8
+"""8-bit integer."""
+
+int16 = DType.INT16
+"""16-bit integer."""
+
+uint8 = DType.UINT8
+"""8-bit unsigned integer."""
+
+uint16 = DType.UINT16
+"""16-bit unsigned integer."""
+
+uint32 = DType.UINT32
+"""32-bit unsigned integer."""
+
+uint64 = DType.UINT64
+"""64-bit unsigned integer."""
+
 bool_ = DType.BOOLEAN
 """Boolean value."""
 
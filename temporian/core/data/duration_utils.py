@@ -17,10 +17,14 @@
 Timestamps and durations are expressed with a double (noted float) in python.
 By convention, all calendar functions represent dates as Unix epoch in UTC.
 This datatype is equivalent to a double in C.
+
+EventSets with a timestamp unit (see `TimestampUnit`) store their timestamps as
+int64 numbers of ticks instead. Durations are always expressed in seconds, and
+are converted into ticks by the operators.
 """
 import datetime
 from enum import Enum
-from typing import Union, Iterable, List, Any
+from typing import Optional, Union, Iterable, List, Any
 
 import numpy as np
 
@@ -45,6 +49,118 @@ Timestamp = Union[np.datetime64, datetime.datetime, int, float]
 NormalizedTimestamp = float
 
 
+class TimestampUnit(str, Enum):
+    """Unit of int64 timestamps."""
+
+    SECONDS = "s"
+    MILLISECONDS = "ms"
+    MICROSECONDS = "us"
+    NANOSECONDS = "ns"
+
+    @property
+    def ticks_per_second(self) -> int:
+        return _TICKS_PER_SECOND[self]
+
+
+_TICKS_PER_SECOND = {
+    TimestampUnit.SECONDS: 1,
+    TimestampUnit.MILLISECONDS: 1_000,
+    TimestampUnit.MICROSECONDS: 1_000_000,
+    TimestampUnit.NANOSECONDS: 1_000_000_000,
+}
+
+# Largest number of ticks of a duration. Longer durations (e.g., infinite
+# window lengths) are clipped to this value. The difference of two
+# non-negative durations cannot overflow an int64.
+MAX_DURATION_TICKS = 2**62
+
+
+def normalize_timestamp_unit(
+    x: Optional[Union[TimestampUnit, str]]
+) -> Optional[TimestampUnit]:
+    if x is None or isinstance(x, TimestampUnit):
+        return x
+    try:
+        return TimestampUnit(x)
+    except ValueError as e:
+        raise ValueError(
+            f"Invalid timestamp unit {x!r}. Possible options are"
+            f" {[unit.value for unit in TimestampUnit]} or None (float64"
+            " timestamps in seconds)."
+        ) from e
+
+
+def duration_to_ticks(
+    duration: Union[NormalizedDuration, np.ndarray], unit: TimestampUnit
+) -> Union[int, np.ndarray]:
+    """Converts durations in seconds into numbers of ticks.
+
+    Infinite durations are clipped to +/- `MAX_DURATION_TICKS`, and NaN
+    durations are converted to 0.
+
+    Args:
+        duration: Single duration or NumPy array of durations, in seconds.
+        unit: Unit of a tick.
+
+    Returns:
+        Number of ticks as a python int for a single duration, or as an int64
+        NumPy array.
+    """
+
+    ticks = np.clip(
+        np.nan_to_num(
+            np.round(
+                np.asarray(duration, dtype=np.float64) * unit.ticks_per_second
+            ),
+            nan=0,
+        ),
+        -MAX_DURATION_TICKS,
+        MAX_DURATION_TICKS,
+    ).astype(np.int64)
+    if ticks.ndim == 0:
+        return int(ticks)
+    return ticks
+
+
+def duration_in_timestamp_unit(
+    duration: Union[NormalizedDuration, np.ndarray],
+    unit: Optional[TimestampUnit],
+) -> Union[NormalizedDuration, int, np.ndarray]:
+    """Expresses durations in seconds in the unit of the timestamps.
+
+    If `unit` is None (i.e., float64 timestamps in seconds), the durations are
+    returned as is. Otherwise, they are converted with `duration_to_ticks`.
+    """
+
+    if unit is None:
+        return duration
+    return duration_to_ticks(duration, unit)
+
+
+def ticks_to_seconds(ticks: np.ndarray, unit: TimestampUnit) -> np.ndarray:
+    """Converts int64 timestamps or durations into float64 seconds."""
+
+    return ticks / unit.ticks_per_second
+
+
+def timestamp_to_ticks(x: Timestamp, unit: TimestampUnit) -> int:
+    """Converts a timestamp into a number of ticks.
+
+    Numbers are already expressed in ticks. Dates are converted without loss
+    of precision. Naive datetimes are interpreted as UTC.
+    """
+
+    if isinstance(x, datetime.datetime):
+        if x.tzinfo is not None:
+            x = x.astimezone(datetime.timezone.utc)
+        x = np.datetime64(x.replace(tzinfo=None))
+    if isinstance(x, np.datetime64):
+        return int(x.astype(f"datetime64[{unit.value}]").astype(np.int64))
+    if isinstance(x, (int, float, np.integer, np.floating)):
+        return int(x)
+    raise ValueError(f"Invalid timestamp {x!r} of type {type(x)}.")
+
+
 def normalize_duration(x: Duration) -> NormalizedDuration:
     if isinstance(x, (int, float)) and x > 0:
         return NormalizedDuration(x)
@@ -19,12 +19,14 @@ from dataclasses import dataclass
 from typing import List, Optional, Tuple, TYPE_CHECKING, Union
 
 from temporian.core.data.dtype import DType, IndexDType
+from temporian.core.data.duration_utils import TimestampUnit
 from temporian.core.data.schema import Schema, FeatureSchema, IndexSchema
 from temporian.core.event_set_ops import EventSetOperations
 from temporian.utils import string
 
 if TYPE_CHECKING:
     from temporian.core.operators.base import Operator
+    from temporian.core.profiler import Profiler
     from temporian.core.typing import EventSetCollection, NodeToEventSetMapping
 
 
@@ -146,7 +148,12 @@ class EventSetNode(EventSetOperations):
         self,
         input: NodeToEventSetMapping,
         verbose: int = 0,
-        check_execution: bool = True,
+        check_execution: Union[bool, str] = "sampled",
+        num_threads: int = 1,
+        num_index_threads: int = 1,
+        schedule_policy: str = "default",
+        optimize: bool = False,
+        profiler: Optional[Profiler] = None,
     ) -> EventSetCollection:
         """Evaluates the EventSetNode on the specified input.
 
@@ -159,6 +166,11 @@ class EventSetNode(EventSetOperations):
             input=input,
             verbose=verbose,
             check_execution=check_execution,
+            num_threads=num_threads,
+            num_index_threads=num_index_threads,
+            schedule_policy=schedule_policy,
+            optimize=optimize,
+            profiler=profiler,
         )
 
     def __repr__(self) -> str:
@@ -181,6 +193,7 @@ def input_node(
     is_unix_timestamp: bool = False,
     same_sampling_as: Optional[EventSetNode] = None,
     name: Optional[str] = None,
+    timestamp_unit: Optional[Union[TimestampUnit, str]] = None,
 ) -> EventSetNode:
     """Creates an input [`EventSetNode`][temporian.EventSetNode].
 
@@ -215,6 +228,9 @@ def input_node(
             `is_unix_timestamp` should not be provided. Some operators require
             for input EventSetNodes to have the same sampling.
         name: Name for the EventSetNode.
+        timestamp_unit: If set, the timestamps are int64 numbers of this unit
+            (e.g., "ns" for nanoseconds) instead of float64 numbers of seconds.
+            Should not be provided with `same_sampling_as`.
 
     Returns:
         EventSetNode with the given specifications.
@@ -240,6 +256,7 @@ def input_node(
             features=features,
             indexes=indexes,
             is_unix_timestamp=is_unix_timestamp,
+            timestamp_unit=timestamp_unit,
             name=name,
             creator=None,
         )
@@ -296,9 +313,10 @@ def create_node_new_features_existing_sampling(
     return EventSetNode(
         schema=Schema(
             features=features,
-            # The indexes and is_unix_timestamp are defined by the sampling.
+            # The indexes and timestamp format are defined by the sampling.
             indexes=sampling_node.schema.indexes,
             is_unix_timestamp=sampling_node.schema.is_unix_timestamp,
+            timestamp_unit=sampling_node.schema.timestamp_unit,
         ),
         # Making use to use the same sampling reference.
         sampling=sampling_node.sampling_node,
@@ -315,6 +333,7 @@ def create_node_new_features_new_sampling(
     is_unix_timestamp: bool,
     creator: Optional[Operator],
     name: Optional[str] = None,
+    timestamp_unit: Optional[TimestampUnit] = None,
 ) -> EventSetNode:
     """Creates an EventSetNode with a new sampling and new features."""
 
@@ -331,6 +350,7 @@ def create_node_new_features_new_sampling(
             features=features,
             indexes=indexes,
             is_unix_timestamp=is_unix_timestamp,
+            timestamp_unit=timestamp_unit,
         ),
         # New sampling
         sampling=Sampling(creator=creator),
@@ -16,9 +16,13 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import List, Tuple, Dict, Union
+from typing import List, Optional, Tuple, Dict, Union
 
 from temporian.core.data.dtype import DType, IndexDType
+from temporian.core.data.duration_utils import (
+    TimestampUnit,
+    normalize_timestamp_unit,
+)
 
 
 @dataclass(frozen=True)
@@ -52,6 +56,9 @@ class Schema:
         features: List of feature names and types.
         indexes: List of index names and types.
         is_unix_timestamp: Whether values correspond to Unix timestamps.
+        timestamp_unit: If None (default), timestamps are float64 numbers of
+            seconds. Otherwise, timestamps are int64 numbers of `timestamp_unit`
+            (e.g., "ns" for nanoseconds).
     """
 
     def __init__(
@@ -59,10 +66,12 @@ class Schema:
         features: Union[List[FeatureSchema], List[Tuple[str, DType]]],
         indexes: Union[List[IndexSchema], List[Tuple[str, IndexDType]]] = [],
         is_unix_timestamp: bool = False,
+        timestamp_unit: Optional[Union[TimestampUnit, str]] = None,
     ):
         self._features = list(map(_normalize_feature, features))
         self._indexes = list(map(_normalize_index, indexes))
         self._is_unix_timestamp = is_unix_timestamp
+        self._timestamp_unit = normalize_timestamp_unit(timestamp_unit)
 
     def __eq__(self, other):
         if not isinstance(other, Schema):
@@ -71,6 +80,7 @@ class Schema:
             self._features == other._features
             and self._indexes == other._indexes
             and self._is_unix_timestamp == other._is_unix_timestamp
+            and self._timestamp_unit == other._timestamp_unit
         )
 
     @property
@@ -85,6 +95,17 @@ class Schema:
     def is_unix_timestamp(self) -> bool:
         return self._is_unix_timestamp
 
+    @property
+    def timestamp_unit(self) -> Optional[TimestampUnit]:
+        return self._timestamp_unit
+
+    @property
+    def timestamp_dtype(self) -> DType:
+        """Dtype of the timestamps: int64 if the schema has a timestamp unit,
+        float64 otherwise."""
+
+        return DType.FLOAT64 if self._timestamp_unit is None else DType.INT64
+
     def feature_names(self) -> List[str]:
         return [feature.name for feature in self._features]
 
@@ -109,6 +130,8 @@ class Schema:
             f"indexes: {self._indexes}\n"
             f"is_unix_timestamp: {self._is_unix_timestamp}\n"
         )
+        if self._timestamp_unit is not None:
+            r += f"timestamp_unit: {self._timestamp_unit.value}\n"
         return r
 
     def check_compatible_index(self, other: Schema):
@@ -118,6 +141,15 @@ class Schema:
                 f" {other.indexes}"
             )
 
+    def check_compatible_timestamps(self, other: Schema):
+        if self.timestamp_unit != other.timestamp_unit:
+            raise ValueError(
+                "Arguments don't have the same timestamp unit."
+                f" {_unit_repr(self.timestamp_unit)} !="
+                f" {_unit_repr(other.timestamp_unit)}. Create the EventSets"
+                " with the same `timestamp_unit`."
+            )
+
     def check_compatible_features(self, other: Schema, check_order: bool):
         if set(self.features) != set(other.features):
             raise ValueError(
@@ -131,6 +163,10 @@ class Schema:
             )
 
 
+def _unit_repr(unit: Optional[TimestampUnit]) -> str:
+    return "float64 seconds" if unit is None else f"int64 {unit.value}"
+
+
 def _normalize_feature(x):
     if isinstance(x, FeatureSchema):
         return x
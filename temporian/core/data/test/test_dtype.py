@@ -22,6 +22,15 @@ class DTypeTest(absltest.TestCase):
         for dtype in DType:
             dtype.missing_value()
 
+    def test_narrow_dtypes(self):
+        self.assertTrue(DType.INT8.is_integer)
+        self.assertFalse(DType.INT8.is_unsigned_integer)
+        self.assertTrue(DType.UINT64.is_integer)
+        self.assertTrue(DType.UINT64.is_unsigned_integer)
+        self.assertTrue(DType.FLOAT16.is_float)
+        self.assertFalse(DType.FLOAT16.is_integer)
+        self.assertEqual(DType.UINT16.missing_value(), 0)
+
 
 if __name__ == "__main__":
     absltest.main()
@@ -16,6 +16,8 @@
 
 from dataclasses import dataclass
 
+import numpy as np
+
 from temporian.core.typing import IndexKey
 
 
@@ -33,3 +35,21 @@ class MapExtras:
     index_key: IndexKey
     timestamp: float
     feature_name: str
+
+
+@dataclass
+class VectorizedMapExtras:
+    """Object containing information about the position of the values passed
+    to the function of a vectorized
+    [`EventSet.map()`][temporian.EventSet.map] in an
+    [`EventSet`][temporian.EventSet].
+
+    Attributes:
+        index_key: The index the values belong to.
+        timestamps: The timestamps of the values' events.
+        feature_name: The name of the feature the values belong to.
+    """
+
+    index_key: IndexKey
+    timestamps: np.ndarray
+    feature_name: str
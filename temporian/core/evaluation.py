@@ -16,10 +16,13 @@
 
 import time
 import sys
-from typing import Dict, List, Set, Optional
+from typing import Dict, List, Set, Optional, Union
 from collections import defaultdict
 
+from temporian.core.data.dtype import DType
 from temporian.core.data.node import EventSetNode
+from temporian.core.data.node import Sampling
+from temporian.core.data.node import create_node_new_features_existing_sampling
 from temporian.core.operators.base import Operator
 from temporian.core.typing import (
     EventSetCollection,
@@ -28,16 +31,41 @@ from temporian.core.typing import (
 )
 from temporian.implementation.numpy import evaluation as np_eval
 from temporian.implementation.numpy.data.event_set import EventSet
+from temporian.implementation.numpy.operators.base import CheckMode
 from temporian.core.graph import infer_graph
-from temporian.core.schedule import Schedule, ScheduleStep
+from temporian.core.optimization import (
+    eliminate_common_subexpressions,
+    fuse_elementwise_operators,
+    needed_features,
+    push_down_projections,
+)
+from temporian.core.profiler import Profiler
+from temporian.core.schedule import (
+    Schedule,
+    ScheduleStep,
+    ScheduleCache,
+    ScheduleCacheInfo,
+    SchedulePolicy,
+    fused_input_nodes,
+)
 from temporian.core.operators.leak import LeakOperator
 
+# Schedules computed by "run". The cache size is controlled by
+# "config.schedule_cache_size".
+schedule_cache = ScheduleCache()
+
 
 def run(
     query: EventSetNodeCollection,
     input: NodeToEventSetMapping,
     verbose: int = 0,
-    check_execution: bool = True,
+    check_execution: Union[bool, str, CheckMode] = CheckMode.sampled,
+    num_threads: int = 1,
+    num_index_threads: int = 1,
+    schedule_policy: Union[str, SchedulePolicy] = SchedulePolicy.default,
+    optimize: bool = False,
+    profiler: Optional[Profiler] = None,
+    use_schedule_cache: bool = True,
 ) -> EventSetCollection:
     """Evaluates [`EventSetNodes`][temporian.EventSetNode] on [`EventSets`][temporian.EventSet].
 
@@ -94,6 +122,15 @@ def run(
 
         ```
 
+    The execution schedule (i.e. the list of operators to run) is cached by
+    `query` and `input` EventSetNodes. Running the same graph multiple times
+    on new EventSets fed to the same input EventSetNodes (e.g.,
+    `tp.run(output_node, {input_node: new_evset})`) skips the graph inference
+    and scheduling. The number of cached schedules is controlled by
+    `tp.config.schedule_cache_size`. See
+    [`tp.schedule_cache_info()`][temporian.schedule_cache_info] and
+    [`tp.clear_schedule_cache()`][temporian.clear_schedule_cache].
+
     Args:
         query: EventSetNodes to compute. Supports EventSetNode, dict of EventSetNodes and list of EventSetNodes.
         input: Event sets to be used for the computation. Supports EventSet,
@@ -105,9 +142,49 @@ def run(
             sets, they will be used as input for those EventSetNodes.
         verbose: If >0, prints details about the execution on the standard error
             output. The larger the number, the more information is displayed.
-        check_execution: If true, the input and output of the op implementation
-            are validated to check any bug in the library internal code. If
-            false, checks are skipped.
+        check_execution: Validation of the inputs and outputs of the op
+            implementations, to detect bugs in the library internal code. If
+            "sampled" (default), only the first
+            `tp.config.check_execution_max_index_keys` index keys of each
+            EventSet are checked, so that the overhead does not depend on the
+            number of index keys. True is the same as "sampled". If "full", all
+            the index keys are checked, which is slower on EventSets with many
+            index keys. If "off" or False, checks are skipped.
+        num_threads: Number of threads used to run the operators. If 1
+            (default), the operators are executed one after another. If >1,
+            independent operators (e.g., operators in different branches of
+            the graph) are executed in parallel as soon as their inputs are
+            available.
+        num_index_threads: Number of threads used to run each operator. If >1,
+            the index keys of the EventSets are split into partitions, and
+            operators that compute each index key independently (e.g., window,
+            calendar, filter, resample, or join operators) process the
+            partitions in parallel. Useful for EventSets with many index
+            keys.
+        schedule_policy: Order in which the operators are executed. If
+            "default", the operators are executed in order of creation. If
+            "memory", the operators are ordered to reduce the peak memory
+            usage e.g., an operator that consumes a large intermediate result
+            is executed before an operator that creates another large
+            intermediate result. The memory usage is estimated from the number
+            of events in the `input` EventSets and the feature dtypes. The
+            results are the same for both policies.
+        optimize: If true, the graph is optimized before being executed e.g.,
+            operators identical to other operators (same operator, attributes,
+            and inputs) are only executed once, and chains of element-wise
+            operators (e.g., `(a + b) * 2 - c.abs()`) are executed in a single
+            pass without materializing the intermediate results. Operators only
+            process the features needed to compute `query`, and the `input`
+            EventSets can contain only those features (see
+            [`tp.required_features()`][temporian.required_features]). The
+            results are the same as without optimization.
+        profiler: If set, the execution of each operator (e.g., wall and CPU
+            time, number of events, allocated memory) is recorded in this
+            [`tp.Profiler`][temporian.Profiler].
+        use_schedule_cache: If true, the schedule is read from and stored in
+            the schedule cache. Set to false for graphs evaluated only once
+            (e.g., the operators applied eagerly on EventSets) so that they do
+            not evict the schedules of the graphs evaluated repeatedly.
 
     Returns:
         An object with the same structure as `query` containing the results.
@@ -116,22 +193,88 @@ def run(
             returned value will be a list of EventSet with the same order.
     """
     # TODO: Create an internal configuration object for options such as
-    # `check_execution`.
+    # `check_execution`, `num_threads`, `num_index_threads`,
+    # `schedule_policy`, `optimize` and `profiler`.
+
+    if num_threads < 1:
+        raise ValueError(
+            f"num_threads should be greater or equal to 1. Got {num_threads}"
+            " instead."
+        )
+    if num_index_threads < 1:
+        raise ValueError(
+            "num_index_threads should be greater or equal to 1. Got"
+            f" {num_index_threads} instead."
+        )
+    if not SchedulePolicy.is_valid(schedule_policy):
+        raise ValueError(
+            "schedule_policy should be one of"
+            f" {[item.value for item in SchedulePolicy]}. Got"
+            f" {schedule_policy!r} instead."
+        )
+    schedule_policy = SchedulePolicy(schedule_policy)
+    if isinstance(check_execution, bool):
+        check_execution = (
+            CheckMode.sampled if check_execution else CheckMode.off
+        )
+    if not CheckMode.is_valid(check_execution):
+        raise ValueError(
+            "check_execution should be a boolean or one of"
+            f" {[item.value for item in CheckMode]}. Got"
+            f" {check_execution!r} instead."
+        )
+    check_execution = CheckMode(check_execution)
 
     begin_time = time.perf_counter()
 
     input = _normalize_input(input)
     normalized_query = _normalize_query(query)
 
-    if verbose >= 1:
-        print("Build schedule", file=sys.stderr)
+    # Input EventSets containing a subset of the features of their node are
+    # fed to new input nodes.
+    partial_inputs = _partial_inputs(input) if optimize else {}
 
     # Schedule execution
     assert isinstance(normalized_query, set)
     input_nodes = set(input.keys())
-    schedule = build_schedule(
-        inputs=input_nodes, outputs=normalized_query, verbose=verbose
+    # The number of events of the inputs is only used by the memory policy.
+    input_num_events = (
+        {node: evset.num_events() for node, evset in input.items()}
+        if schedule_policy == SchedulePolicy.memory
+        else {}
     )
+    schedule_key = ScheduleCache.key(
+        input_nodes,
+        normalized_query,
+        schedule_policy,
+        optimize,
+        input_num_events,
+    )
+    # Schedules with partial inputs are not cached as their input nodes are
+    # created for each call.
+    use_schedule_cache = use_schedule_cache and not partial_inputs
+    schedule = schedule_cache.get(schedule_key) if use_schedule_cache else None
+    if schedule is None:
+        if verbose >= 1:
+            print("Build schedule", file=sys.stderr)
+
+        schedule = build_schedule(
+            inputs=input_nodes,
+            outputs=normalized_query,
+            verbose=verbose,
+            policy=schedule_policy,
+            optimize=optimize,
+            input_num_events={
+                partial_inputs.get(node, node): num_events
+                for node, num_events in input_num_events.items()
+            },
+            partial_inputs=partial_inputs,
+        )
+        if use_schedule_cache:
+            schedule_cache.put(schedule_key, schedule)
+
+    elif verbose >= 1:
+        print("Use cached schedule", file=sys.stderr)
 
     if verbose == 1:
         print(
@@ -147,10 +290,16 @@ def run(
     # Note: "outputs" is a dictionary of event (including the query events) to
     # event data.
     outputs = np_eval.run_schedule(
-        input,
+        {
+            partial_inputs.get(node, node): evset
+            for node, evset in input.items()
+        },
         schedule,
         verbose=verbose,
         check_execution=check_execution,
+        num_threads=num_threads,
+        num_index_threads=num_index_threads,
+        profiler=profiler,
     )
 
     end_time = time.perf_counter()
@@ -165,17 +314,37 @@ def build_schedule(
     inputs: Optional[Set[EventSetNode]],
     outputs: Set[EventSetNode],
     verbose: int = 0,
+    policy: SchedulePolicy = SchedulePolicy.default,
+    optimize: bool = False,
+    input_num_events: Optional[Dict[EventSetNode, int]] = None,
+    partial_inputs: Optional[Dict[EventSetNode, EventSetNode]] = None,
 ) -> Schedule:
     """Calculates which operators need to be executed in which order to compute
     a set of output EventSetNodes given a set of input EventSetNodes.
 
-    This implementation is based on Kahn's algorithm.
+    This implementation is based on Kahn's algorithm. With the `memory` policy,
+    the next operator to schedule is the ready operator with the smallest
+    estimated memory balance i.e. the memory allocated by its outputs minus
+    the memory released after its execution.
 
     Args:
         inputs: Input EventSetNodes.
         outputs: Output EventSetNodes.
         verbose: If >0, prints details about the execution on the standard error
             output. The larger the number, the more information is displayed.
+        policy: Order in which ready operators are scheduled.
+        optimize: If true, operators identical to an operator created before
+            are not executed. Instead, they are scheduled as aliases of the
+            first operator. Chains of element-wise operators are fused into a
+            single step. Operators are re-created to only process the
+            features needed to compute the outputs.
+        input_num_events: Number of events in the input EventSetNodes. Used to
+            estimate the memory usage with the `memory` policy. Missing inputs
+            are assumed to contain one event.
+        partial_inputs: Mapping from input EventSetNodes to EventSetNodes with
+            the same sampling and a subset of their features. The schedule
+            reads the features from those EventSetNodes instead. Requires
+            `optimize=True`.
 
     Returns:
         Tuple of:
@@ -192,11 +361,92 @@ def build_schedule(
     # are missing.
     graph = infer_graph(inputs, outputs)
 
+    if partial_inputs and not optimize:
+        raise ValueError("partial_inputs requires optimize=True")
+
     schedule = Schedule(input_nodes=graph.inputs)
 
     if verbose >= 2:
         print("Graph:\n", graph, file=sys.stderr)
 
+    # "aliases[op]" is the operator computing the same results as "op".
+    aliases: Dict[Operator, Operator] = {}
+    # "fused_ops[op]" are the operators executed together with "op".
+    fused_ops: Dict[Operator, List[Operator]] = {}
+    if optimize:
+        # Operators computing the outputs are scheduled as aliases of their
+        # re-created version.
+        rewritten = push_down_projections(graph, partial_inputs)
+        output_aliases = {
+            node.creator: rewritten[node.creator]
+            for node in outputs
+            if node.creator in rewritten
+        }
+        optimized_outputs = set()
+        for node in outputs:
+            if node.creator in output_aliases:
+                optimized_outputs.update(
+                    output_aliases[node.creator].outputs.values()
+                )
+            else:
+                optimized_outputs.add(node)
+        if rewritten:
+            graph = infer_graph(
+                {
+                    (partial_inputs or {}).get(node, node)
+                    for node in graph.inputs
+                },
+                optimized_outputs,
+            )
+            schedule.input_nodes = graph.inputs
+            if verbose >= 1:
+                print(
+                    f"Remove unused features from {len(rewritten)} operators",
+                    file=sys.stderr,
+                )
+
+        aliases = eliminate_common_subexpressions(graph)
+        fused_ops = fuse_elementwise_operators(
+            graph, aliases, optimized_outputs | set(graph.inputs)
+        )
+        if verbose >= 1 and aliases:
+            print(
+                f"Remove {len(aliases)} duplicated operators", file=sys.stderr
+            )
+        if verbose >= 1 and fused_ops:
+            num_fused_ops = sum(len(ops) for ops in fused_ops.values())
+            print(
+                f"Fuse {num_fused_ops} element-wise operators", file=sys.stderr
+            )
+        aliases.update(output_aliases)
+
+    # The inputs of the fused operators.
+    fused_inputs = {
+        op: fused_input_nodes(ops + [op]) for op, ops in fused_ops.items()
+    }
+
+    def op_inputs(op: Operator) -> Dict[str, EventSetNode]:
+        """Nodes required to execute "op" in the schedule."""
+
+        if op in aliases:
+            return aliases[op].outputs
+        if op in fused_inputs:
+            return fused_inputs[op]
+        return op.inputs
+
+    # Operators required to compute the outputs. Operators only used by
+    # aliased operators, and fused operators, are not required.
+    required_ops: Set[Operator] = set()
+    pending_nodes = list(outputs)
+    while pending_nodes:
+        node = pending_nodes.pop()
+        if node in graph.inputs or node.creator is None:
+            continue
+        if node.creator in required_ops:
+            continue
+        required_ops.add(node.creator)
+        pending_nodes.extend(op_inputs(node.creator).values())
+
     # Operators ready to be computed (i.e. ready to be added to "planned_ops")
     # as all their inputs are already computed by "planned_ops" or specified by
     # "inputs".
@@ -212,9 +462,9 @@ def build_schedule(
     op_to_num_pending_inputs: Dict[Operator, int] = defaultdict(lambda: 0)
 
     # Compute "node_to_op" and "op_to_num_pending_inputs".
-    for op in graph.operators:
+    for op in required_ops:
         num_pending_inputs = 0
-        for input_node in op.inputs.values():
+        for input_node in op_inputs(op).values():
             node_to_op[input_node].append(op)
             if input_node in graph.inputs:
                 # This input is already available
@@ -233,15 +483,38 @@ def build_schedule(
     # Execute the op with smallest internal ordered id first.
     ready_ops.sort(key=lambda op: op._internal_ordered_id, reverse=True)
 
+    memory_estimator = None
+    if policy == SchedulePolicy.memory:
+        memory_estimator = _MemoryEstimator(input_num_events or {})
+        # Nodes never released by the schedule.
+        kept_nodes = set(outputs) | set(graph.inputs)
+
     # Compute the schedule
     while ready_ops:
         # Get an op ready to be scheduled
-        op = ready_ops.pop()
+        if memory_estimator is None:
+            op = ready_ops.pop()
+        else:
+            op_idx = min(
+                range(len(ready_ops)),
+                key=lambda idx: (
+                    memory_estimator.balance(
+                        ready_ops[idx],
+                        op_inputs(ready_ops[idx]),
+                        ready_ops[idx] in aliases,
+                        node_to_op,
+                        kept_nodes,
+                    ),
+                    ready_ops[idx]._internal_ordered_id,
+                ),
+            )
+            op = ready_ops.pop(op_idx)
+            memory_estimator.schedule(op)
         ready_ops_set.remove(op)
 
         # Nodes released after the op is executed
         released_nodes = []
-        for input in op.inputs.values():
+        for input in op_inputs(op).values():
             if input in outputs:
                 continue
             if input not in node_to_op:
@@ -257,7 +530,12 @@ def build_schedule(
 
         # Schedule the op
         schedule.steps.append(
-            ScheduleStep(op=op, released_nodes=released_nodes)
+            ScheduleStep(
+                op=op,
+                released_nodes=released_nodes,
+                alias_of=aliases.get(op),
+                fused_ops=fused_ops.get(op, []),
+            )
         )
 
         # Update all the ops that depends on "op". Enlist the ones that are
@@ -282,6 +560,112 @@ def build_schedule(
     return schedule
 
 
+# Estimated number of bytes of one value of each dtype. Strings are variable
+# length and are estimated by the size of a short python bytes.
+_DTYPE_NUM_BYTES = {
+    DType.FLOAT64: 8,
+    DType.FLOAT32: 4,
+    DType.FLOAT16: 2,
+    DType.INT64: 8,
+    DType.INT32: 4,
+    DType.INT16: 2,
+    DType.INT8: 1,
+    DType.UINT64: 8,
+    DType.UINT32: 4,
+    DType.UINT16: 2,
+    DType.UINT8: 1,
+    DType.BOOLEAN: 1,
+    DType.STRING: 16,
+}
+
+# Number of bytes of a timestamp.
+_TIMESTAMP_NUM_BYTES = 8
+
+
+class _MemoryEstimator:
+    """Estimates the memory allocated by the nodes of a graph.
+
+    The number of events of a sampling created by an operator is estimated as
+    the largest number of events of the operator inputs.
+    """
+
+    def __init__(self, input_num_events: Dict[EventSetNode, int]):
+        self._sampling_num_events: Dict[Sampling, int] = {}
+        for node, num_events in input_num_events.items():
+            self._sampling_num_events[node.sampling_node] = num_events
+
+    def _num_events(self, sampling: Sampling) -> int:
+        return self._sampling_num_events.get(sampling, 1)
+
+    def schedule(self, op: Operator) -> None:
+        """Registers the samplings created by an operator."""
+
+        num_events = max(
+            (self._num_events(i.sampling_node) for i in op.inputs.values()),
+            default=1,
+        )
+        for output in op.outputs.values():
+            if output.sampling_node not in self._sampling_num_events:
+                self._sampling_num_events[output.sampling_node] = num_events
+
+    def owned_bytes(self, node: EventSetNode, creator: Operator) -> int:
+        """Estimated number of bytes allocated by "creator" for "node".
+
+        Features and samplings forwarded from the operator inputs are not
+        counted.
+        """
+
+        num_bytes = 0
+        for feature_schema, feature in zip(
+            node.schema.features, node.feature_nodes
+        ):
+            if feature.creator is creator:
+                num_bytes += _DTYPE_NUM_BYTES.get(feature_schema.dtype, 8)
+        if node.sampling_node.creator is creator:
+            num_bytes += _TIMESTAMP_NUM_BYTES
+        return num_bytes
+
+    def balance(
+        self,
+        op: Operator,
+        input_nodes: Dict[str, EventSetNode],
+        is_alias: bool,
+        node_to_op: Dict[EventSetNode, List[Operator]],
+        kept_nodes: Set[EventSetNode],
+    ) -> int:
+        """Estimated number of bytes allocated minus released by an operator.
+
+        An input node is released if "op" is its last pending user and if the
+        node is not in "kept_nodes". An aliased operator does not allocate
+        memory.
+        """
+
+        allocated = 0
+        if not is_alias:
+            num_events = max(
+                (self._num_events(i.sampling_node) for i in op.inputs.values()),
+                default=1,
+            )
+            for output in op.outputs.values():
+                allocated += self.owned_bytes(
+                    output, op
+                ) * self._sampling_num_events.get(
+                    output.sampling_node, num_events
+                )
+
+        released = 0
+        for input in set(input_nodes.values()):
+            if input in kept_nodes or input.creator is None:
+                continue
+            if any(user is not op for user in node_to_op.get(input, [])):
+                continue
+            released += self.owned_bytes(
+                input, input.creator
+            ) * self._num_events(input.sampling_node)
+
+        return allocated - released
+
+
 def has_leak(
     output: EventSetNodeCollection,
     input: Optional[EventSetNodeCollection] = None,
@@ -338,6 +722,141 @@ def has_leak(
     return False
 
 
+def required_features(
+    output: EventSetNodeCollection,
+    input: EventSetNode,
+) -> List[str]:
+    """Lists the features of an input needed to compute some nodes.
+
+    When running with `optimize=True`, the EventSet fed to `input` only needs
+    to contain those features. For instance, only those columns need to be
+    loaded from a file with [`tp.from_parquet()`][temporian.from_parquet] or
+    [`tp.from_csv()`][temporian.from_csv].
+
+    Usage example:
+        ```python
+        >>> a = tp.input_node(
+        ...     [("f1", tp.float64), ("f2", tp.float64), ("f3", tp.float64)]
+        ... )
+        >>> b = (a["f3"] + a["f1"]).moving_sum(5)
+        >>> tp.required_features(b, a)
+        ['f1', 'f3']
+
+        >>> # The input EventSet only contains the required features.
+        >>> evset = tp.event_set(
+        ...     timestamps=[1, 2],
+        ...     features={"f1": [1.0, 2.0], "f3": [3.0, 4.0]},
+        ... )
+        >>> b.run({a: evset}, optimize=True)
+        indexes: []
+        features: [('add_f3_f1', float64)]
+        events:
+            (2 events):
+                timestamps: [1. 2.]
+                'add_f3_f1': [ 4. 10.]
+        ...
+
+        ```
+
+    Args:
+        output: Nodes to compute. Supports Node, dict of Nodes and list of
+            Nodes.
+        input: Input node.
+
+    Returns:
+        Names of the features of `input` needed to compute `output`, in the
+        order of the schema of `input`.
+    """
+
+    graph = infer_graph(inputs=None, outputs=_normalize_query(output))
+    needed, _ = needed_features(graph)
+    return [
+        feature.name
+        for idx, feature in enumerate(input.schema.features)
+        if idx in needed.get(input, set())
+    ]
+
+
+def schedule_cache_info() -> ScheduleCacheInfo:
+    """Gets statistics about the cache of execution schedules of
+    [`tp.run()`][temporian.run].
+
+    Usage example:
+        ```python
+        >>> tp.clear_schedule_cache()
+        >>> a = tp.input_node([("f", tp.float64)])
+        >>> b = a.moving_sum(5)
+        >>> evset = tp.event_set(timestamps=[1, 2], features={"f": [1.0, 2.0]})
+
+        >>> # The first run computes the schedule, the second one reuses it.
+        >>> _ = b.run({a: evset})
+        >>> _ = b.run({a: evset})
+        >>> info = tp.schedule_cache_info()
+        >>> info.hits, info.misses, info.size
+        (1, 1, 1)
+
+        ```
+
+    Returns:
+        Named tuple with the number of cache hits and misses since the last
+        call to [`tp.clear_schedule_cache()`][temporian.clear_schedule_cache],
+        the maximum number of cached schedules (see
+        `tp.config.schedule_cache_size`), and the number of cached schedules.
+    """
+
+    return schedule_cache.info()
+
+
+def clear_schedule_cache() -> None:
+    """Removes all the execution schedules cached by
+    [`tp.run()`][temporian.run], and resets the statistics returned by
+    [`tp.schedule_cache_info()`][temporian.schedule_cache_info].
+
+    The cache keeps a reference to the EventSetNodes of the cached schedules.
+    Clearing the cache releases the graphs that are not used anymore.
+
+    Usage example:
+        ```python
+        >>> a = tp.input_node([("f", tp.float64)])
+        >>> evset = tp.event_set(timestamps=[1, 2], features={"f": [1.0, 2.0]})
+        >>> _ = a.moving_sum(5).run({a: evset})
+        >>> tp.clear_schedule_cache()
+        >>> tp.schedule_cache_info().size
+        0
+
+        ```
+    """
+
+    schedule_cache.clear()
+
+
+def _partial_inputs(
+    input: Dict[EventSetNode, EventSet]
+) -> Dict[EventSetNode, EventSetNode]:
+    """Creates input nodes for the EventSets containing a subset of the
+    features of their node."""
+
+    partial_inputs = {}
+    for node, evset in input.items():
+        schema = evset.schema
+        if (
+            schema == node.schema
+            or schema.indexes != node.schema.indexes
+            or schema.is_unix_timestamp != node.schema.is_unix_timestamp
+            or schema.timestamp_unit != node.schema.timestamp_unit
+            or len(schema.features) >= len(node.schema.features)
+            or any(f not in node.schema.features for f in schema.features)
+        ):
+            continue
+        partial_inputs[node] = create_node_new_features_existing_sampling(
+            features=schema.features,
+            sampling_node=node,
+            creator=None,
+            name=node.name,
+        )
+    return partial_inputs
+
+
 def _normalize_input(
     input: NodeToEventSetMapping,
 ) -> Dict[EventSetNode, EventSet]:
@@ -22,7 +22,10 @@ from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union
 from temporian.core.data.duration import Duration
 
 if TYPE_CHECKING:
-    from temporian.core.operators.map import MapFunction
+    from temporian.core.operators.map import (
+        MapFunction,
+        VectorizedMapFunction,
+    )
     from temporian.core.typing import (
         EventSetOrNode,
         IndexKeyList,
@@ -550,9 +553,24 @@ class EventSetOperations:
 
         Returns:
             Negated EventSet.
+
+        Raises:
+            ValueError: If some features are unsigned integers.
         """
         from temporian.core.operators.scalar import multiply_scalar
 
+        unsigned_features = [
+            feature.name
+            for feature in self.schema.features
+            if feature.dtype.is_unsigned_integer
+        ]
+        if unsigned_features:
+            raise ValueError(
+                "Cannot negate the unsigned integer features"
+                f" {unsigned_features}. Use cast() to convert them to a signed"
+                " dtype first."
+            )
+
         return multiply_scalar(input=self, value=-1)
 
     def __invert__(self: EventSetOrNode) -> EventSetOrNode:
@@ -1751,7 +1769,8 @@ class EventSetOperations:
                     'calendar_hour': [ 6 12]
             ...
 
-            >>> # Option 2: specify timezone name (see pytz.all_timezones)
+            >>> # Option 2: specify timezone name (see pytz.all_timezones),
+            >>> # taking daylight saving time into account
             >>> a.calendar_hour(tz="America/Montevideo")
             indexes: ...
                     'calendar_hour': [ 6 12]
@@ -2605,8 +2624,8 @@ class EventSetOperations:
         """Join [`EventSets`][temporian.EventSet] with different samplings.
 
         Join features from two EventSets based on timestamps. Optionally, join on
-        timestamps and an extra `int64` feature. Joined EventSets should have the
-        same index and non-overlapping feature names.
+        timestamps and an extra `int64` or string feature. Joined EventSets should
+        have the same index and non-overlapping feature names.
 
         To concatenate EventSets with the same sampling, use
         [`tp.glue()`][temporian.glue] instead. [`tp.glue()`][temporian.glue] is
@@ -2681,7 +2700,7 @@ class EventSetOperations:
             other: Right EventSet to join.
             how: Whether to perform a `"left"`, `"inner"`, or `"outer"` join.
                 Currently, only `"left"` join is supported.
-            on: Optional extra int64 feature name to join on.
+            on: Optional extra int64 or string feature name to join on.
 
         Returns:
             The joined EventSets.
@@ -2761,9 +2780,11 @@ class EventSetOperations:
 
     def map(
         self: EventSetOrNode,
-        func: MapFunction,
+        func: Union[MapFunction, VectorizedMapFunction],
         output_dtypes: Optional[TargetDtypes] = None,
         receive_extras: bool = False,
+        vectorized: bool = False,
+        batch_size: Optional[int] = None,
     ) -> EventSetOrNode:
         """Applies a function on each value of an
         [`EventSet`][temporian.EventSet]'s features.
@@ -2777,7 +2798,18 @@ class EventSetOperations:
         If the output of the functon has a different dtype than the input, the
         `output_dtypes` argument must be specified.
 
-        This operator is slow. When possible, existing operators should be used.
+        Calling the function on each value is slow. When possible, existing
+        operators should be used. Otherwise, if `vectorized` is True, the
+        function receives a NumPy array with the values of a feature for an
+        index key, and returns an array with the new values in the same order.
+        If `receive_extras` is True, it also receives a
+        [`VectorizedMapExtras`][temporian.types.VectorizedMapExtras] object
+        with the index key, the timestamps and the feature name of the values.
+        Without extras, the function can be called on the values of several
+        index keys at once, and on the distinct values of dictionary-encoded
+        features (see [`tp.DictionaryArray`][temporian.DictionaryArray]), so
+        it should compute each output value from the corresponding input value
+        only.
 
         A Temporian graph with a `map` operator is not serializable.
 
@@ -2842,6 +2874,23 @@ class EventSetOperations:
 
             ```
 
+        Usage example with `vectorized`:
+            ```python
+            >>> a = tp.event_set(
+            ...     timestamps=[0, 1, 2],
+            ...     features={"value": [10.0, 20.0, 30.0]},
+            ... )
+
+            >>> b = a.map(np.sqrt, vectorized=True)
+            >>> b
+            indexes: ...
+                (3 events):
+                    timestamps: [0. 1. 2.]
+                    'value': [3.1623 4.4721 5.4772]
+            ...
+
+            ```
+
         Args:
             func: The function to apply on each value.
             output_dtypes: Expected dtypes of the output feature(s) after
@@ -2853,8 +2902,14 @@ class EventSetOperations:
                 target dtypes for them. All dtypes must be Temporian types (see
                 `dtype.py`).
             receive_extras: Whether the function should receive a
-                [`MapExtras`][temporian.types.MapExtras] object as second
-                argument.
+                [`MapExtras`][temporian.types.MapExtras] object (or a
+                [`VectorizedMapExtras`][temporian.types.VectorizedMapExtras]
+                object if `vectorized` is True) as second argument.
+            vectorized: Whether the function is applied on arrays of values
+                instead of individual values.
+            batch_size: If set, maximum number of values passed to the
+                function in a single call when `vectorized` is True. Bounds
+                the memory used by the function's intermediate arrays.
 
         Returns:
             EventSet with the function applied on each value.
@@ -2866,6 +2921,8 @@ class EventSetOperations:
             func=func,
             output_dtypes=output_dtypes,
             receive_extras=receive_extras,
+            vectorized=vectorized,
+            batch_size=batch_size,
         )
 
     def log(self: EventSetOrNode) -> EventSetOrNode:
@@ -2985,7 +3042,8 @@ class EventSetOperations:
             ```
 
         Args:
-            window_length: Sliding window's length.
+            window_length: Sliding window's length, or list of lengths. With a
+                list, each output feature is suffixed with its window length.
             sampling: Timestamps to sample the sliding window's value at. If not
                 provided, timestamps in `input` are used.
 
@@ -3043,7 +3101,8 @@ class EventSetOperations:
         examples with external sampling and indices.
 
         Args:
-            window_length: Sliding window's length.
+            window_length: Sliding window's length, or list of lengths. With a
+                list, each output feature is suffixed with its window length.
             sampling: Timestamps to sample the sliding window's value at. If not
                 provided, timestamps in the input are used.
 
@@ -3098,7 +3157,8 @@ class EventSetOperations:
         examples of moving window operations with external sampling and indices.
 
         Args:
-            window_length: Sliding window's length.
+            window_length: Sliding window's length, or list of lengths. With a
+                list, each output feature is suffixed with its window length.
             sampling: Timestamps to sample the sliding window's value at. If not
                 provided, timestamps in the input are used.
 
@@ -3155,7 +3215,8 @@ class EventSetOperations:
         examples of moving window operations with external sampling and indices.
 
         Args:
-            window_length: Sliding window's length.
+            window_length: Sliding window's length, or list of lengths. With a
+                list, each output feature is suffixed with its window length.
             sampling: Timestamps to sample the sliding window's value at. If not
                 provided, timestamps in the input are used.
 
@@ -3196,6 +3257,9 @@ class EventSetOperations:
         missing, or the window does not contain any sampling), outputs missing
         values.
 
+        The sum of 8 and 16-bit integers and of unsigned integers is returned
+        as int64 and uint64 respectively, and the sum of float16 as float32.
+
         Example:
             ```python
             >>> a = tp.event_set(
@@ -3213,11 +3277,29 @@ class EventSetOperations:
 
             ```
 
+        Several window lengths can be computed in a single pass over the
+        events. The output contains one feature per input feature and window
+        length:
+            ```python
+            >>> c = a.moving_sum([tp.duration.seconds(2), 4])
+            >>> c
+            indexes: []
+            features: [('value_2', float64), ('value_4', float64)]
+            events:
+                (6 events):
+                    timestamps: [0. 1. 2. 5. 6. 7.]
+                    'value_2': [ 0. 1. 6. 10. 25. 35.]
+                    'value_4': [ 0. 1. 6. 15. 25. 45.]
+            ...
+
+            ```
+
         See [`EventSet.moving_count()`][temporian.EventSet.moving_count] for
         examples of moving window operations with external sampling and indices.
 
         Args:
-            window_length: Sliding window's length.
+            window_length: Sliding window's length, or list of lengths. With a
+                list, each output feature is suffixed with its window length.
             sampling: Timestamps to sample the sliding window's value at. If not
                 provided, timestamps in the input are used.
 
@@ -3823,7 +3905,8 @@ class EventSetOperations:
         examples of moving window operations with external sampling and indices.
 
         Args:
-            window_length: Sliding window's length.
+            window_length: Sliding window's length, or list of lengths. With a
+                list, each output feature is suffixed with its window length.
             sampling: Timestamps to sample the sliding window's value at. If not
                 provided, timestamps in the input are used.
 
@@ -4101,6 +4184,10 @@ class EventSetOperations:
 
         Datetime timestamps are converted to unix timestamps.
 
+        If the EventSet has int64 timestamps (see the `timestamp_unit` argument
+        of [`tp.event_set()`][temporian.event_set]), the feature is an `int64`
+        number of `timestamp_unit`.
+
         Integer timestamps example:
             ```python
             >>> from datetime import datetime
@@ -4465,7 +4552,8 @@ class EventSetOperations:
         less than (`<`) the provided timestamp.
 
         This operation is equivalent to:
-        `input.filter(input.timestamps() < timestamp)`
+        `input.filter(input.timestamps() < timestamp)`, but does not copy the
+        data (see [`EventSet.time_range()`][temporian.EventSet.time_range]).
 
         Usage example:
             ```python
@@ -4506,7 +4594,7 @@ class EventSetOperations:
         Returns:
             Filtered EventSet.
         """
-        from temporian.core.operators.filter import before
+        from temporian.core.operators.time_range import before
 
         return before(self, timestamp=timestamp)
 
@@ -4524,7 +4612,8 @@ class EventSetOperations:
         greater than (`>`) the provided timestamp.
 
         This operation is equivalent to:
-        `input.filter(input.timestamps() < timestamp)`
+        `input.filter(input.timestamps() > timestamp)`, but does not copy the
+        data (see [`EventSet.time_range()`][temporian.EventSet.time_range]).
 
         Usage example:
             ```python
@@ -4565,10 +4654,78 @@ class EventSetOperations:
         Returns:
             Filtered EventSet.
         """
-        from temporian.core.operators.filter import after
+        from temporian.core.operators.time_range import after
 
         return after(self, timestamp=timestamp)
 
+    def time_range(
+        self: EventSetOrNode,
+        begin: Optional[Union[int, float, datetime]] = None,
+        end: Optional[Union[int, float, datetime]] = None,
+    ) -> EventSetOrNode:
+        """Selects the events [`EventSet`][temporian.EventSet] with a
+        timestamp in the `[begin, end)` range.
+
+        `begin` is included and `end` is excluded. If `begin` (resp. `end`) is
+        not set, the range is not bounded on the left (resp. right). The
+        bounds can be datetimes if the EventSet's timestamps are unix
+        timestamps.
+
+        This operation is equivalent to:
+        `input.filter((input.timestamps() >= begin) & (input.timestamps() <
+        end))`. However, instead of comparing all the timestamps, the range is
+        found with a binary search on the (sorted) timestamps of each index
+        key, and the output features and timestamps are views of the input
+        ones (i.e., no data is copied).
+
+        Usage example:
+            ```python
+            >>> a = tp.event_set(
+            ...     timestamps=[0, 1, 5, 6, 2],
+            ...     features={"f1": [0, 10, 50, 60, 20], "k": [1, 1, 1, 1, 2]},
+            ...     indexes=["k"],
+            ... )
+
+            >>> a.time_range(1, 6)
+            indexes: [('k', int64)]
+            features: [('f1', int64)]
+            events:
+                k=1 (2 events):
+                    timestamps: [1. 5.]
+                    'f1': [10 50]
+                k=2 (1 events):
+                    timestamps: [2.]
+                    'f1': [20]
+            ...
+
+            >>> from datetime import datetime
+            >>> a = tp.event_set(
+            ...     timestamps=[datetime(2022, 1, 1), datetime(2022, 1, 2)],
+            ...     features={"f1": [1, 2]},
+            ... )
+
+            >>> a.time_range(begin=datetime(2022, 1, 1, 12))
+            indexes: []
+            features: [('f1', int64)]
+            events:
+                 (1 events):
+                    timestamps: ['2022-01-02T00:00:00']
+                    'f1': [2]
+            ...
+
+            ```
+
+        Args:
+            begin: Start of the range (included).
+            end: End of the range (excluded).
+
+        Returns:
+            EventSet with the events in the range.
+        """
+        from temporian.core.operators.time_range import time_range
+
+        return time_range(self, begin=begin, end=end)
+
     def fillna(self: EventSetOrNode, value: float = 0.0) -> EventSetOrNode:
         """Replaces all the NaN values with `value`.
 
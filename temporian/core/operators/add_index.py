@@ -53,6 +53,7 @@ class AddIndexOperator(Operator):
                 features=output_feature_schemas,
                 indexes=output_indexes,
                 is_unix_timestamp=input.schema.is_unix_timestamp,
+                timestamp_unit=input.schema.timestamp_unit,
                 creator=self,
             ),
         )
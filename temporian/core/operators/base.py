@@ -36,6 +36,7 @@ AttributeType = Union[
     Dict[str, str],
     List[DType],
     List[NormalizedIndexKey],
+    List[float],
     Callable,  # Non serializable
 ]
 
@@ -285,6 +286,11 @@ class Operator(ABC):
                 isinstance(v, DType) for v in value
             )
 
+        def is_list_float(value):
+            return isinstance(value, list) and all(
+                isinstance(v, float) for v in value
+            )
+
         # Check exact matching between attr type (except ANY) and value type
         if (
             attr_type == pb.OperatorDef.Attribute.Type.STRING
@@ -342,6 +348,7 @@ class Operator(ABC):
             and not is_list_str(value)
             and not is_dict_str(value)
             and not is_list_dtype(value)
+            and not is_list_float(value)
         ):
             raise ValueError(
                 "Attribute of type ANY has an invalid value type:"
@@ -37,6 +37,7 @@ class BeginOperator(Operator):
                 features=[],
                 indexes=input.schema.indexes,
                 is_unix_timestamp=input.schema.is_unix_timestamp,
+                timestamp_unit=input.schema.timestamp_unit,
                 creator=self,
             ),
         )
@@ -17,7 +17,6 @@
 from temporian.core import operator_lib
 from temporian.core.compilation import compile
 from temporian.core.data.node import EventSetNode
-from temporian.core.data.dtype import DType
 from temporian.core.operators.binary.base import BaseBinaryOperator
 from temporian.core.typing import EventSetOrNode
 
@@ -78,7 +77,7 @@ class DivideOperator(BaseArithmeticOperator):
 
         # Assuming previous dtype check of input_1 and input_2 features
         for feat in input_1.schema.features:
-            if feat.dtype in [DType.INT32, DType.INT64]:
+            if feat.dtype.is_integer:
                 raise ValueError(
                     "Cannot use the divide operator on feature "
                     f"{feat.name} of type {feat.dtype}. Cast to "
@@ -14,8 +14,7 @@
 
 """Base calendar operator class definition."""
 import pytz
-import datetime
-from typing import Union
+from typing import Optional, Tuple, Union
 from abc import ABC, abstractmethod
 
 from temporian.core.data.dtype import DType
@@ -27,29 +26,38 @@ from temporian.core.operators.base import Operator
 from temporian.proto import core_pb2 as pb
 
 
-def timezone_to_utc_offset(timezone: Union[str, float, int]) -> float:
-    """Normalizes timezone (tz name or number) to a float (UTC offset)."""
-    if isinstance(timezone, (bytes, str)):
-        tz_time = datetime.datetime.now(tz=pytz.timezone(timezone))
-        offset_timedelta = datetime.datetime.utcoffset(tz_time)
-        return (
-            0.0
-            if offset_timedelta is None
-            else offset_timedelta.total_seconds() / 3600
-        )
+def normalize_timezone(
+    timezone: Union[str, bytes, float, int]
+) -> Tuple[float, Optional[str]]:
+    """Normalizes timezone (tz name or number) to a UTC offset in hours and a
+    tz name.
+
+    Returns `(0.0, name)` for a tz name, and `(offset, None)` for a number.
+    """
+    if isinstance(timezone, bytes):
+        timezone = timezone.decode()
+    if isinstance(timezone, str):
+        # Raises an error if the timezone does not exist.
+        pytz.timezone(timezone)
+        return 0.0, timezone
     if not isinstance(timezone, (int, float)):
         raise TypeError(
             "Timezone argument (tz) must be a number of hours (int or"
             " float) between (-24, 24) or a timezone name (string, see"
             f" pytz.all_timezones). Got '{timezone}' ({type(timezone)})."
         )
-    return float(timezone)
+    return float(timezone), None
 
 
 class BaseCalendarOperator(Operator, ABC):
     """Interface definition and common logic for calendar operators."""
 
-    def __init__(self, sampling: EventSetNode, utc_offset: float):
+    def __init__(
+        self,
+        sampling: EventSetNode,
+        utc_offset: float,
+        timezone: Optional[str] = None,
+    ):
         super().__init__()
 
         if not sampling.schema.is_unix_timestamp:
@@ -68,6 +76,11 @@ class BaseCalendarOperator(Operator, ABC):
         self._utc_offset = utc_offset
         self.add_attribute("utc_offset", utc_offset)
 
+        # attribute: timezone name, with daylight saving time
+        self._timezone = timezone
+        if timezone is not None:
+            self.add_attribute("timezone", timezone)
+
         # input and output
         self.add_input("sampling", sampling)
         self.add_output(
@@ -90,15 +103,28 @@ class BaseCalendarOperator(Operator, ABC):
                     key="utc_offset",
                     type=pb.OperatorDef.Attribute.Type.FLOAT_64,
                 ),
+                pb.OperatorDef.Attribute(
+                    key="timezone",
+                    type=pb.OperatorDef.Attribute.Type.STRING,
+                    is_optional=True,
+                ),
             ],
             outputs=[pb.OperatorDef.Output(key="output")],
         )
 
     @property
     def utc_offset(self) -> float:
-        """Gets timezone offset from UTC, in hours."""
+        """Gets timezone offset from UTC, in hours.
+
+        Ignored if `timezone` is set.
+        """
         return self._utc_offset
 
+    @property
+    def timezone(self) -> Optional[str]:
+        """Gets timezone name (see `pytz.all_timezones`), if any."""
+        return self._timezone
+
     @classmethod
     @abstractmethod
     def operator_def_key(cls) -> str:
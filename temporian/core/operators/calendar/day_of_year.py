@@ -20,7 +20,7 @@ from temporian.core.compilation import compile
 from temporian.core.data.node import EventSetNode
 from temporian.core.operators.calendar.base import (
     BaseCalendarOperator,
-    timezone_to_utc_offset,
+    normalize_timezone,
 )
 from temporian.core.typing import EventSetOrNode
 
@@ -43,6 +43,8 @@ def calendar_day_of_year(
     sampling: EventSetOrNode, tz: Union[str, float, int] = 0
 ) -> EventSetOrNode:
     assert isinstance(sampling, EventSetNode)
-    utc_offset = timezone_to_utc_offset(tz)
+    utc_offset, timezone = normalize_timezone(tz)
 
-    return CalendarDayOfYearOperator(sampling, utc_offset).outputs["output"]
+    return CalendarDayOfYearOperator(sampling, utc_offset, timezone).outputs[
+        "output"
+    ]
@@ -122,6 +122,34 @@ class CalendarTimezoneTest(TestCase):
             self, self.evset.calendar_second(tz_offset), expected
         )
 
+    def test_daylight_saving_time(self):
+        timestamps = [
+            datetime(2020, 1, 1, 12, 0),  # EST (UTC-5)
+            datetime(2020, 3, 8, 6, 59),  # EST
+            datetime(2020, 3, 8, 7, 0),  # EDT (UTC-4)
+            datetime(2020, 7, 1, 12, 0),  # EDT
+            datetime(2020, 11, 1, 6, 0),  # EST
+        ]
+        evset = event_set(timestamps=timestamps)
+        expected = event_set(
+            timestamps=timestamps,
+            features={"calendar_hour": i32([7, 1, 3, 8, 1])},
+            same_sampling_as=evset,
+        )
+        assertOperatorResult(
+            self, evset.calendar_hour("America/New_York"), expected
+        )
+
+        # Same values in the compact layout.
+        compact = evset.compact()
+        self.assertEqual(
+            compact.calendar_hour("America/New_York")
+            .get_index_value(())
+            .features[0]
+            .tolist(),
+            [7, 1, 3, 8, 1],
+        )
+
     def test_invalid_timezone(self):
         with self.assertRaises(UnknownTimeZoneError):
             self.evset.calendar_hour(tz="I'm a fake timezone")
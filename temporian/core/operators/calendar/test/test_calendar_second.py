@@ -41,6 +41,26 @@ class CalendarSecondTest(TestCase):
         result = evset.calendar_second()
         assertOperatorResult(self, result, expected)
 
+    def test_int64_timestamps(self):
+        timestamps = [
+            "1970-01-01 00:00:00.999999999",
+            "2023-05-05 12:30:30.000000001",
+            "2023-12-12 23:59:59.999999999",
+        ]
+        evset = event_set(timestamps=timestamps, timestamp_unit="ns")
+
+        expected = event_set(
+            timestamps=timestamps,
+            features={
+                "calendar_second": i32([0, 30, 59]),
+            },
+            timestamp_unit="ns",
+            same_sampling_as=evset,
+        )
+
+        result = evset.calendar_second()
+        assertOperatorResult(self, result, expected)
+
 
 if __name__ == "__main__":
     absltest.main()
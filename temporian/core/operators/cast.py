@@ -95,6 +95,7 @@ class CastOperator(Operator):
             features=[],
             indexes=input.schema.indexes,
             is_unix_timestamp=input.schema.is_unix_timestamp,
+            timestamp_unit=input.schema.timestamp_unit,
         )
         is_noop = True
         for new_dtype, feature_node, feature_schema in zip(
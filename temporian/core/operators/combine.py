@@ -74,6 +74,7 @@ class Combine(Operator):
                 input.schema, check_order=False
             )
             first_input.schema.check_compatible_index(input.schema)
+            first_input.schema.check_compatible_timestamps(input.schema)
 
             # Output is unix if all inputs are
             all_unix_timestamp &= input.schema.is_unix_timestamp
@@ -86,6 +87,7 @@ class Combine(Operator):
                 features=first_input.schema.features,
                 indexes=first_input.indexes,
                 is_unix_timestamp=all_unix_timestamp,
+                timestamp_unit=first_input.schema.timestamp_unit,
                 creator=self,
             ),
         )
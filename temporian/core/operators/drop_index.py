@@ -62,6 +62,7 @@ class DropIndexOperator(Operator):
                 features=self._output_feature_schemas,
                 indexes=output_indexes,
                 is_unix_timestamp=input.schema.is_unix_timestamp,
+                timestamp_unit=input.schema.timestamp_unit,
                 creator=self,
             ),
         )
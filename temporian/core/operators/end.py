@@ -38,6 +38,7 @@ class EndOperator(Operator):
                 features=[],
                 indexes=input.schema.indexes,
                 is_unix_timestamp=input.schema.is_unix_timestamp,
+                timestamp_unit=input.schema.timestamp_unit,
                 creator=self,
             ),
         )
@@ -98,6 +98,7 @@ class FastFourierTransform(Operator):
                 ],
                 indexes=input.schema.indexes,
                 is_unix_timestamp=input.schema.is_unix_timestamp,
+                timestamp_unit=input.schema.timestamp_unit,
                 creator=self,
             ),
         )
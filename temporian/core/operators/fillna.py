@@ -21,7 +21,6 @@ from temporian.core.data.node import (
 from temporian.core.typing import EventSetOrNode
 from temporian.utils.typecheck import typecheck
 from temporian.core.operators.glue import glue
-from temporian.core.data.dtype import DType
 
 
 @typecheck
@@ -35,7 +34,7 @@ def fillna(
     output = []
     for feature in input.schema.features:
         selected = input[feature.name]
-        if feature.dtype in [DType.FLOAT32, DType.FLOAT64]:
+        if feature.dtype.is_float:
             selected = selected.isnan().where(value, selected)
         output.append(selected)
     return glue(*output)
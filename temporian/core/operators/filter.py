@@ -14,8 +14,7 @@
 
 """Filter operator class and public API function definition."""
 
-from datetime import datetime
-from typing import Optional, Union
+from typing import Optional
 
 from temporian.core import operator_lib
 from temporian.core.compilation import (
@@ -62,6 +61,7 @@ class FilterOperator(Operator):
                 features=input.schema.features,
                 indexes=input.schema.indexes,
                 is_unix_timestamp=input.schema.is_unix_timestamp,
+                timestamp_unit=input.schema.timestamp_unit,
                 creator=self,
             ),
         )
@@ -95,51 +95,3 @@ def filter(
     assert isinstance(condition, EventSetNode)
 
     return FilterOperator(input, condition).outputs["output"]
-
-
-@compile
-def before(
-    input: EventSetOrNode, timestamp: Union[float, datetime]
-) -> EventSetOrNode:
-    assert isinstance(input, EventSetNode)
-
-    if isinstance(timestamp, datetime):
-        if not input.schema.is_unix_timestamp:
-            raise ValueError(
-                "Cannot use a datetime timestamp to filter timestamps that are"
-                " not unix timestamp. Set `is_unix_timestamp=True` on the"
-                " EventSet or use a float when calling `before`"
-            )
-        timestamp = timestamp.timestamp()
-    else:
-        if input.schema.is_unix_timestamp:
-            raise ValueError(
-                "Cannot use a float timestamp to filter unix timestamp. Set"
-                " `is_unix_timestamp=False` on the EventSet or use a float"
-                " when calling `before`"
-            )
-    return filter(input, input.timestamps() < timestamp)
-
-
-@compile
-def after(
-    input: EventSetOrNode, timestamp: Union[float, datetime]
-) -> EventSetOrNode:
-    assert isinstance(input, EventSetNode)
-
-    if isinstance(timestamp, datetime):
-        if not input.schema.is_unix_timestamp:
-            raise ValueError(
-                "Cannot use a datetime timestamp to filter timestamps that are"
-                " not unix timestamp. Set `is_unix_timestamp=True` on the"
-                " EventSet or use a float when calling `after`"
-            )
-        timestamp = timestamp.timestamp()
-    else:
-        if input.schema.is_unix_timestamp:
-            raise ValueError(
-                "Cannot use a float timestamp to filter unix timestamp. Set"
-                " `is_unix_timestamp=False` on the EventSet or use a float when"
-                " calling `after`"
-            )
-    return filter(input, input.timestamps() > timestamp)
@@ -51,6 +51,7 @@ class FilterMaxMovingCount(Operator):
                 features=[],
                 indexes=input.schema.indexes,
                 is_unix_timestamp=input.schema.is_unix_timestamp,
+                timestamp_unit=input.schema.timestamp_unit,
                 creator=self,
             ),
         )
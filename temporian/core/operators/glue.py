@@ -77,6 +77,7 @@ class GlueOperator(Operator):
                     features=output_feature_schemas,
                     indexes=first_sampling_node.schema.indexes,
                     is_unix_timestamp=first_sampling_node.schema.is_unix_timestamp,
+                    timestamp_unit=first_sampling_node.schema.timestamp_unit,
                 ),
                 sampling=first_sampling_node.sampling_node,
                 features=output_features,
@@ -52,6 +52,7 @@ class Join(Operator):
         self._on = on
 
         left.schema.check_compatible_index(right.schema)
+        left.schema.check_compatible_timestamps(right.schema)
 
         if how not in [JOIN_LEFT]:
             raise ValueError(
@@ -67,9 +68,9 @@ class Join(Operator):
                         f'Feature "{on}" does not exist in {node_name}'
                     )
                 on_dtype = node.schema.features[feature_names.index(on)].dtype
-                if on_dtype != DType.INT64:
+                if on_dtype not in [DType.INT64, DType.STRING]:
                     raise ValueError(
-                        '"on" feature should be of type int64. Got'
+                        '"on" feature should be of type int64 or string. Got'
                         f" {on_dtype} instead for {node_name}."
                     )
 
@@ -96,6 +97,7 @@ class Join(Operator):
                     features=output_feature_schemas,
                     indexes=left.schema.indexes,
                     is_unix_timestamp=left.schema.is_unix_timestamp,
+                    timestamp_unit=left.schema.timestamp_unit,
                 ),
                 sampling=left.sampling_node,
                 features=output_features,
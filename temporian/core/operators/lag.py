@@ -49,6 +49,7 @@ class LagOperator(Operator):
                 features=input.schema.features,
                 indexes=input.schema.indexes,
                 is_unix_timestamp=input.schema.is_unix_timestamp,
+                timestamp_unit=input.schema.timestamp_unit,
                 creator=self,
             ),
         )
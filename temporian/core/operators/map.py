@@ -14,7 +14,10 @@
 
 """Map operator class and public API function definitions."""
 
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+
 from temporian.core import operator_lib
 from temporian.core.compilation import compile
 from temporian.core.data.dtype import DType
@@ -23,7 +26,7 @@ from temporian.core.data.node import (
     create_node_new_features_existing_sampling,
 )
 from temporian.core.data.schema import FeatureSchema
-from temporian.core.dataclasses import MapExtras
+from temporian.core.dataclasses import MapExtras, VectorizedMapExtras
 from temporian.core.operators.base import Operator
 from temporian.core.typing import EventSetOrNode, TargetDtypes, Scalar
 from temporian.implementation.numpy.data.dtype_normalization import (
@@ -44,27 +47,52 @@ information about the value's position in the EventSet, and return the new
 value.
 """
 
+VectorizedMapFunction = Union[
+    Callable[[np.ndarray], np.ndarray],
+    Callable[[np.ndarray, VectorizedMapExtras], np.ndarray],
+]
+"""A function that maps an array of values of an
+[`EventSet`][temporian.EventSet]'s feature to an array of new values.
+
+The function must receive the original values and optionally a
+[`VectorizedMapExtras`][temporian.types.VectorizedMapExtras] object, which
+includes additional information about the values' position in the EventSet,
+and return an array with the new values, in the same order.
+"""
+
 
 class Map(Operator):
     def __init__(
         self,
         input: EventSetNode,
-        func: MapFunction,
+        func: Union[MapFunction, VectorizedMapFunction],
         receive_extras: bool,
         dtype: Optional[DType] = None,
         dtype_to_dtype: Optional[Dict[DType, DType]] = None,
         feature_name_to_dtype: Optional[Dict[str, DType]] = None,
+        vectorized: bool = False,
+        batch_size: Optional[int] = None,
+        dtypes: Optional[List[DType]] = None,
     ):
         """Constructor.
 
-        There can only be one of dtype, dtype_to_dtype or feature_name_to_dtype.
+        There can only be one of dtype, dtype_to_dtype, feature_name_to_dtype
+        or dtypes.
 
         Args:
             input: Input node.
-            func: Function to apply to each elemnent.
+            func: Function to apply to each elemnent, or to arrays of
+                elements if `vectorized` is True.
+            receive_extras: Whether func receives the extras as second
+                argument.
             dtype: All the output features are expected to be of this type.
             dtype_to_dtype: Mapping between current dtype and new dtype.
             feature_name_to_dtype: Mapping between feature name and new dtype.
+            vectorized: Whether func is applied on arrays of elements.
+            batch_size: Maximum number of elements passed to func in a single
+                call, if `vectorized` is True.
+            dtypes: Output dtype for each of the input feature (indexed by
+                feature idx).
         """
         super().__init__()
 
@@ -72,23 +100,43 @@ class Map(Operator):
         assert (
             sum(
                 x is not None
-                for x in [dtype, dtype_to_dtype, feature_name_to_dtype]
+                for x in [dtype, dtype_to_dtype, feature_name_to_dtype, dtypes]
             )
             <= 1
         )
 
-        # output_dtypes is an array of output dtype for all the input features,
-        # in the same order
-        output_dtypes = build_dtypes_list_from_target_dtypes(
-            input, dtype, dtype_to_dtype, feature_name_to_dtype
-        )
-        assert len(output_dtypes) == len(input.schema.features)
+        # "dtypes" is an array of output dtype for all the input features, in
+        # the same order. It is stored as an attribute so that the operator can
+        # be re-created from its attributes (e.g., when optimizing the graph).
+        if dtypes is None:
+            dtypes = build_dtypes_list_from_target_dtypes(
+                input, dtype, dtype_to_dtype, feature_name_to_dtype
+            )
+        assert len(dtypes) == len(input.schema.features)
 
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError(
+                f"batch_size should be strictly positive. Got {batch_size}."
+            )
+        if batch_size is not None and not vectorized:
+            raise ValueError("batch_size requires vectorized=True.")
+
+        self.add_attribute("receive_extras", receive_extras)
         self._receive_extras = receive_extras
 
+        self.add_attribute("dtypes", dtypes)
+        self._dtypes = dtypes
+
         self.add_attribute("func", func)
         self._func = func
 
+        self.add_attribute("vectorized", vectorized)
+        self._vectorized = vectorized
+
+        if batch_size is not None:
+            self.add_attribute("batch_size", batch_size)
+        self._batch_size = batch_size
+
         self.add_input("input", input)
 
         self.add_output(
@@ -96,7 +144,7 @@ class Map(Operator):
             create_node_new_features_existing_sampling(
                 features=[
                     FeatureSchema(f.name, dtype)
-                    for f, dtype in zip(input.schema.features, output_dtypes)
+                    for f, dtype in zip(input.schema.features, dtypes)
                 ],
                 sampling_node=input,
                 creator=self,
@@ -106,13 +154,25 @@ class Map(Operator):
         self.check()
 
     @property
-    def func(self) -> MapFunction:
+    def func(self) -> Union[MapFunction, VectorizedMapFunction]:
         return self._func
 
     @property
     def receive_extras(self) -> bool:
         return self._receive_extras
 
+    @property
+    def dtypes(self) -> List[DType]:
+        return self._dtypes
+
+    @property
+    def vectorized(self) -> bool:
+        return self._vectorized
+
+    @property
+    def batch_size(self) -> Optional[int]:
+        return self._batch_size
+
     @classmethod
     def build_op_definition(cls) -> pb.OperatorDef:
         return pb.OperatorDef(
@@ -123,6 +183,23 @@ class Map(Operator):
                     type=pb.OperatorDef.Attribute.Type.CALLABLE,
                     is_optional=False,
                 ),
+                pb.OperatorDef.Attribute(
+                    key="receive_extras",
+                    type=pb.OperatorDef.Attribute.Type.BOOL,
+                ),
+                pb.OperatorDef.Attribute(
+                    key="dtypes",
+                    type=pb.OperatorDef.Attribute.Type.LIST_DTYPE,
+                ),
+                pb.OperatorDef.Attribute(
+                    key="vectorized",
+                    type=pb.OperatorDef.Attribute.Type.BOOL,
+                ),
+                pb.OperatorDef.Attribute(
+                    key="batch_size",
+                    type=pb.OperatorDef.Attribute.Type.INTEGER_64,
+                    is_optional=True,
+                ),
             ],
             inputs=[pb.OperatorDef.Input(key="input")],
             outputs=[pb.OperatorDef.Output(key="output")],
@@ -137,9 +214,11 @@ operator_lib.register_operator(Map)
 @compile
 def map(
     input: EventSetOrNode,
-    func: MapFunction,
+    func: Union[MapFunction, VectorizedMapFunction],
     output_dtypes: Optional[TargetDtypes],
     receive_extras: bool,
+    vectorized: bool = False,
+    batch_size: Optional[int] = None,
 ) -> EventSetOrNode:
     assert isinstance(input, EventSetNode)
 
@@ -156,4 +235,6 @@ def map(
         dtype=dtype,
         feature_name_to_dtype=feature_name_to_dtype,
         dtype_to_dtype=dtype_to_dtype,
+        vectorized=vectorized,
+        batch_size=batch_size,
     ).outputs["output"]
@@ -70,6 +70,7 @@ class Propagate(Operator):
                 features=input.schema.features,
                 indexes=sampling.schema.indexes,
                 is_unix_timestamp=sampling.schema.is_unix_timestamp,
+                timestamp_unit=sampling.schema.timestamp_unit,
                 creator=self,
             ),
         )
@@ -63,6 +63,7 @@ class RenameOperator(Operator):
                     features=new_feature_schemas,
                     indexes=new_indexes,
                     is_unix_timestamp=input.schema.is_unix_timestamp,
+                    timestamp_unit=input.schema.timestamp_unit,
                     creator=self,
                 ),
             )
@@ -37,6 +37,7 @@ class Resample(Operator):
         self.add_input("sampling", sampling)
 
         input.schema.check_compatible_index(sampling.schema)
+        input.schema.check_compatible_timestamps(sampling.schema)
 
         self.add_output(
             "output",
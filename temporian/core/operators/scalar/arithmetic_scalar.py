@@ -18,7 +18,6 @@ from typing import Union
 
 from temporian.core import operator_lib
 from temporian.core.compilation import compile
-from temporian.core.data.dtype import DType
 from temporian.core.data.node import EventSetNode
 from temporian.core.operators.scalar.base import (
     BaseScalarOperator,
@@ -64,7 +63,7 @@ class DivideScalarOperator(BaseScalarOperator):
         super().__init__(input, value, is_value_first)
 
         for feat in input.schema.features:
-            if feat.dtype in [DType.INT32, DType.INT64]:
+            if feat.dtype.is_integer:
                 raise ValueError(
                     "Cannot use the divide operator on feature "
                     f"{feat.name} of type {feat.dtype}. Cast to a "
@@ -14,8 +14,11 @@
 
 """Base scalar operator class definition."""
 
+import math
 from typing import Union, List
 
+import numpy as np
+
 from temporian.core.data.dtype import DType
 from temporian.core.data.node import (
     EventSetNode,
@@ -23,6 +26,9 @@ from temporian.core.data.node import (
 )
 from temporian.core.data.schema import FeatureSchema
 from temporian.core.operators.base import Operator
+from temporian.implementation.numpy.data.dtype_normalization import (
+    tp_dtype_to_np_dtype,
+)
 from temporian.proto import core_pb2 as pb
 
 
@@ -68,18 +74,13 @@ class BaseScalarOperator(Operator):
 
         # Check that the feature dtype doesn't need an upcast to operate with
         # this value type
+        numerical_dtypes = [dtype for dtype in DType if dtype.is_numerical]
         self.map_vtype_dtype = {
-            float: [DType.FLOAT32, DType.FLOAT64],
-            int: [DType.INT32, DType.INT64, DType.FLOAT32, DType.FLOAT64],
+            float: [dtype for dtype in DType if dtype.is_float],
+            int: numerical_dtypes,
             str: [DType.STRING],
             bytes: [DType.STRING],
-            bool: [
-                DType.BOOLEAN,
-                DType.INT32,
-                DType.INT64,
-                DType.FLOAT32,
-                DType.FLOAT64,
-            ],
+            bool: [DType.BOOLEAN] + numerical_dtypes,
         }
         if not self.ignore_value_dtype_checking:
             for feature in input.schema.features:
@@ -92,6 +93,29 @@ class BaseScalarOperator(Operator):
                         " first, or change the value type."
                     )
 
+                # The output of the operation keeps the dtype of the feature.
+                if (
+                    type(value) in (int, float)
+                    and feature.dtype.is_numerical
+                    and self.output_feature_dtype(feature) == feature.dtype
+                ):
+                    np_dtype = tp_dtype_to_np_dtype(feature.dtype)
+                    limits = (
+                        np.iinfo(np_dtype)
+                        if feature.dtype.is_integer
+                        else np.finfo(np_dtype)
+                    )
+                    # Infinite and NaN values are representable by all the
+                    # float dtypes.
+                    is_finite = type(value) is int or math.isfinite(value)
+                    if is_finite and not limits.min <= value <= limits.max:
+                        raise ValueError(
+                            f"Value {value} is out of the range of feature"
+                            f" '{feature.name}' (dtype {feature.dtype}). Use"
+                            " cast() to convert the feature to a wider dtype"
+                            " first."
+                        )
+
         # outputs
         output_features = [  # pylint: disable=g-complex-comprehension
             FeatureSchema(
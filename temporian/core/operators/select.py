@@ -58,6 +58,7 @@ class SelectOperator(Operator):
                     features=output_feature_schemas,
                     indexes=input.schema.indexes,
                     is_unix_timestamp=input.schema.is_unix_timestamp,
+                    timestamp_unit=input.schema.timestamp_unit,
                 ),
                 sampling=input.sampling_node,
                 features=output_features,
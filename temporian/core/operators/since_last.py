@@ -49,6 +49,7 @@ class SinceLast(Operator):
             self._has_sampling = True
             effective_sampling_node = sampling
             input.schema.check_compatible_index(sampling.schema)
+            input.schema.check_compatible_timestamps(sampling.schema)
 
         else:
             effective_sampling_node = input
@@ -199,6 +199,94 @@ class ArithmeticScalarTest(absltest.TestCase):
         with self.assertRaisesRegex(ValueError, "Use cast()"):
             _ = evset + value
 
+    def test_narrow_dtypes(self) -> None:
+        """Test that the dtype of narrow features is kept."""
+
+        evset = event_set(
+            timestamps=[1, 2, 3],
+            features={
+                "a": np.array([1, 2, 3], dtype=np.int8),
+                "b": np.array([1, 2, 3], dtype=np.uint16),
+                "c": np.array([1.5, 2.5, np.nan], dtype=np.float16),
+            },
+        )
+        expected = event_set(
+            timestamps=[1, 2, 3],
+            features={
+                "a": np.array([11, 12, 13], dtype=np.int8),
+                "b": np.array([11, 12, 13], dtype=np.uint16),
+                "c": np.array([11.5, 12.5, np.nan], dtype=np.float16),
+            },
+            same_sampling_as=evset,
+        )
+        assertOperatorResult(self, evset + 10, expected)
+
+    def test_value_out_of_range(self) -> None:
+        """Test the value of an integer operation must fit in the dtype of
+        the feature."""
+
+        evset = event_set(
+            timestamps=[1, 2],
+            features={"a": np.array([1, 2], dtype=np.uint8)},
+        )
+        with self.assertRaisesRegex(ValueError, "out of the range"):
+            _ = evset + 1000
+        with self.assertRaisesRegex(ValueError, "out of the range"):
+            _ = evset * -1
+
+        # Comparisons are not affected.
+        self.assertEqual(
+            (evset > 1000)["a"].data[()].features[0].tolist(), [False, False]
+        )
+
+    def test_float_value_out_of_range(self) -> None:
+        """Test the value of a float operation must fit in the dtype of the
+        feature."""
+
+        evset = event_set(
+            timestamps=[1, 2],
+            features={"h": np.array([1.0, 2.0], dtype=np.float16)},
+        )
+        with self.assertRaisesRegex(ValueError, "out of the range"):
+            _ = evset + 70000.0
+        with self.assertRaisesRegex(ValueError, "out of the range"):
+            _ = evset * 70000
+
+        # Values in range keep the float16 dtype, even when NumPy would
+        # upcast them.
+        expected = event_set(
+            timestamps=[1, 2],
+            features={"h": np.array([65001, 65002], dtype=np.float16)},
+            same_sampling_as=evset,
+        )
+        assertOperatorResult(self, evset + 65000, expected)
+        assertOperatorResult(
+            self, evset.compact() + 65000, expected, check_sampling=False
+        )
+        self.assertTrue(
+            np.isinf((evset + float("inf"))["h"].data[()].features[0]).all()
+        )
+
+    def test_negate_unsigned(self) -> None:
+        evset = event_set(
+            timestamps=[1, 2],
+            features={
+                "a": np.array([1, 2], dtype=np.uint8),
+                "b": np.array([1, 2], dtype=np.int8),
+            },
+        )
+        with self.assertRaisesRegex(
+            ValueError, r"Cannot negate the unsigned integer features \['a'\]"
+        ):
+            _ = -evset
+
+        expected = event_set(
+            timestamps=[1, 2],
+            features={"b": np.array([-1, -2], dtype=np.int8)},
+            same_sampling_as=evset,
+        )
+        assertOperatorResult(self, -evset["b"], expected, check_sampling=False)
+
     def test_addition_with_string_value(self) -> None:
         """Test correct addition operator with string value."""
 
@@ -128,6 +128,32 @@ class CastTest(parameterized.TestCase):
                 check_overflow=True,
             )
 
+    def test_narrow_dtypes(self) -> None:
+        evset = event_set(
+            timestamps=[1, 2, 3],
+            features={"a": [-1, 0, 200], "b": [0.5, 1.0, 1.5]},
+        )
+        result = evset.cast({"a": DType.INT16, "b": DType.FLOAT16})
+        expected = event_set(
+            timestamps=[1, 2, 3],
+            features={
+                "a": np.array([-1, 0, 200], dtype=np.int16),
+                "b": np.array([0.5, 1.0, 1.5], dtype=np.float16),
+            },
+            same_sampling_as=evset,
+        )
+        assertOperatorResult(self, result, expected)
+
+        # Negative values don't fit in unsigned dtypes.
+        with self.assertRaisesRegex(ValueError, "Overflow"):
+            evset["a"].cast(DType.UINT16)
+        # 200 doesn't fit in int8.
+        with self.assertRaisesRegex(ValueError, "Overflow"):
+            evset["a"].cast(DType.INT8)
+        # float64 values above the float16 range.
+        with self.assertRaisesRegex(ValueError, "Overflow"):
+            (evset["b"] * 1e6).cast(DType.FLOAT16)
+
     def test_no_overflow_boolean(self) -> None:
         """Test that no overflow error is raised when
         converting to boolean type"""
@@ -12,11 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from unittest import mock
+
 import numpy as np
 from absl.testing import absltest, parameterized
 from absl.testing.parameterized import TestCase
 
 from temporian.implementation.numpy.data.io import event_set
+from temporian.implementation.numpy.operators import fast_fourier_transform
 from temporian.test.utils import assertOperatorResult, f32, i32
 
 
@@ -65,6 +68,41 @@ class FastFourierTransformTest(TestCase):
             self, result, expected_output, check_sampling=False
         )
 
+    @parameterized.parameters(None, "hamming")
+    def test_batches_and_indexes(self, window):
+        values = np.sin(np.arange(20) * 0.7).astype(np.float32)
+        evset = event_set(
+            timestamps=list(range(20)) + [0, 1],
+            features={
+                "a": np.concatenate([values, f32([1, 2])]),
+                "k": [1] * 20 + [2] * 2,
+            },
+            indexes=["k"],
+        )
+
+        def expected(frame_end):
+            data = values[frame_end - 3 : frame_end + 1]
+            if window == "hamming":
+                data = np.hamming(4) * data
+            return np.abs(np.fft.fft(data))[:2].astype(np.float32)
+
+        # Transforms 2 frames per batch.
+        with mock.patch.object(fast_fourier_transform, "_BATCH_NUM_VALUES", 8):
+            result = evset.experimental_fast_fourier_transform(
+                num_events=4, hop_size=3, window=window
+            )
+
+        frame_ends = list(range(3, 20, 3))
+        index_data = result.get_index_value((1,))
+        np.testing.assert_array_equal(index_data.timestamps, frame_ends)
+        np.testing.assert_allclose(
+            np.stack(index_data.features, axis=1),
+            np.stack([expected(end) for end in frame_ends]),
+            rtol=1e-6,
+        )
+        # Not enough events for a single frame.
+        self.assertEqual(len(result.get_index_value((2,))), 0)
+
     def test_good(self):
         evset = event_set([0, 0, 0, 0], features={"a": f32([0, 0, 0, 0])})
         evset.experimental_fast_fourier_transform(num_events=4)
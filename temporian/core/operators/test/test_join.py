@@ -17,6 +17,9 @@ import math
 from absl.testing import absltest
 from absl.testing.parameterized import TestCase
 
+from temporian.implementation.numpy.data.dictionary_array import (
+    DictionaryArray,
+)
 from temporian.implementation.numpy.data.io import event_set
 from temporian.test.utils import assertOperatorResult, f64
 
@@ -73,6 +76,63 @@ class JoinTest(TestCase):
 
         assertOperatorResult(self, result, expected, check_sampling=False)
 
+    def test_base_on_string(self):
+        left_c = ["x", "y", "z", "w", "v", "u"]
+        right_c = ["x", "z", "y", "w", "t"]
+        for encode in [False, True]:
+            evset_left = event_set(
+                timestamps=[1, 2, 2, 3, 4, 5],
+                features={
+                    "a": [11, 12, 13, 14, 15, 16],
+                    "c": DictionaryArray.encode(left_c) if encode else left_c,
+                },
+            )
+            evset_right = event_set(
+                timestamps=[1, 2, 2, 3, 4],
+                features={
+                    "c": DictionaryArray.encode(right_c) if encode else right_c,
+                    "b": [11.0, 12.0, 13.0, 14.0, 15.0],
+                },
+            )
+
+            result = evset_left.join(evset_right, on="c")
+
+            expected = event_set(
+                timestamps=[1, 2, 2, 3, 4, 5],
+                features={
+                    "a": [11, 12, 13, 14, 15, 16],
+                    "c": left_c,
+                    "b": [11.0, 13.0, 12.0, 14.0, math.nan, math.nan],
+                },
+            )
+
+            assertOperatorResult(self, result, expected, check_sampling=False)
+
+    def test_int64_timestamps(self):
+        evset_left = event_set(
+            timestamps=[1, 2, 3, 2**60 + 1],
+            features={"a": [11, 12, 13, 14]},
+            timestamp_unit="ns",
+        )
+        evset_right = event_set(
+            timestamps=[1, 3, 2**60],
+            features={"b": [21.0, 22.0, 23.0]},
+            timestamp_unit="ns",
+        )
+
+        result = evset_left.join(evset_right)
+
+        expected = event_set(
+            timestamps=[1, 2, 3, 2**60 + 1],
+            features={
+                "a": [11, 12, 13, 14],
+                "b": [21.0, math.nan, 22.0, math.nan],
+            },
+            timestamp_unit="ns",
+        )
+
+        assertOperatorResult(self, result, expected, check_sampling=False)
+
     def test_left(self):
         evset_1 = event_set([0], features={"a": [0]})
         evset_2 = event_set([0], features={"b": [0]})
@@ -18,6 +18,9 @@ import numpy as np
 
 from temporian.core.compilation import compile
 from temporian.core.serialization import save
+from temporian.implementation.numpy.data.dictionary_array import (
+    DictionaryArray,
+)
 from temporian.implementation.numpy.data.io import event_set
 from temporian.test.utils import assertOperatorResult
 
@@ -147,6 +150,118 @@ class MapTest(TestCase):
         ):
             evset.map(lambda x: "v" + str(x), receive_extras=True)
 
+    def test_vectorized(self):
+        evset = event_set(
+            timestamps=[1, 2, 3, 4],
+            features={"x": [10, 20, 30, 40], "k": [1, 1, 2, 2]},
+            indexes=["k"],
+        )
+        expected = event_set(
+            timestamps=[1, 2, 3, 4],
+            features={"x": [20.0, 40.0, 60.0, 80.0], "k": [1, 1, 2, 2]},
+            indexes=["k"],
+            same_sampling_as=evset,
+        )
+
+        calls = []
+
+        def f(values):
+            calls.append(len(values))
+            return values * 2.0
+
+        assertOperatorResult(
+            self, evset.map(f, output_dtypes=float, vectorized=True), expected
+        )
+        self.assertEqual(calls, [2, 2])
+
+        # In the compact layout, all the index keys are mapped at once.
+        calls.clear()
+        result = evset.compact().map(f, output_dtypes=float, vectorized=True)
+        self.assertEqual(result, expected)
+        self.assertEqual(calls, [4])
+
+        calls.clear()
+        result = evset.compact().map(
+            f, output_dtypes=float, vectorized=True, batch_size=3
+        )
+        self.assertEqual(result, expected)
+        self.assertEqual(calls, [3, 1])
+
+    def test_vectorized_with_extras(self):
+        evset = event_set(
+            timestamps=[1, 2, 3],
+            features={"x": [10, 20, 30], "k": [1, 1, 2]},
+            indexes=["k"],
+        )
+
+        def f(values, extras):
+            self.assertEqual(extras.feature_name, "x")
+            return values + extras.timestamps * extras.index_key[0]
+
+        expected = event_set(
+            timestamps=[1, 2, 3],
+            features={"x": [11, 22, 36], "k": [1, 1, 2]},
+            indexes=["k"],
+            same_sampling_as=evset,
+        )
+        for batch_size in [None, 1]:
+            assertOperatorResult(
+                self,
+                evset.map(
+                    f,
+                    receive_extras=True,
+                    vectorized=True,
+                    batch_size=batch_size,
+                ),
+                expected,
+            )
+            result = evset.compact().map(
+                f, receive_extras=True, vectorized=True, batch_size=batch_size
+            )
+            self.assertEqual(result, expected)
+
+    def test_vectorized_dictionary(self):
+        values = DictionaryArray.encode(["a", "b", "a", "a"])
+        evset = event_set(timestamps=[1, 2, 3, 4], features={"x": values})
+
+        calls = []
+
+        def f(values):
+            calls.append(len(values))
+            return np.char.upper(values)
+
+        result = evset.map(f, vectorized=True)
+        expected = event_set(
+            timestamps=[1, 2, 3, 4],
+            features={"x": ["A", "B", "A", "A"]},
+            same_sampling_as=evset,
+        )
+        assertOperatorResult(self, result, expected)
+        # Only the vocabulary is mapped.
+        self.assertEqual(calls, [2])
+
+    def test_vectorized_wrong_shape(self):
+        evset = event_set(timestamps=[1, 2], features={"x": [10, 20]})
+
+        with self.assertRaisesRegex(
+            ValueError,
+            (
+                "should return a one-dimensional array with one value per input"
+                " value. Got an array of shape \\(\\) for 2 values of"
+                " feature 'x'"
+            ),
+        ):
+            evset.map(np.sum, vectorized=True)
+
+    def test_batch_size_requires_vectorized(self):
+        evset = event_set(timestamps=[1, 2], features={"x": [10, 20]})
+
+        with self.assertRaisesRegex(ValueError, "requires vectorized=True"):
+            evset.map(lambda x: x, batch_size=2)
+
+        with self.assertRaisesRegex(ValueError, "strictly positive"):
+            evset.map(lambda x: x, vectorized=True, batch_size=0)
+
     def test_serialize_fails(self):
         @compile
         def f(e):
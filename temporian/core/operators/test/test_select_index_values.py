@@ -161,6 +161,42 @@ class SelectIndexValuesTest(TestCase):
 
         assertOperatorResult(self, result, expected, check_sampling=False)
 
+    def test_compact(self):
+        evset = event_set(
+            timestamps=[1, 2, 3, 4, 5, 6],
+            features={
+                "a": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+                "c": ["A", "A", "B", "B", "C", "C"],
+                "d": [1, 2, 1, 1, 1, 2],
+            },
+            indexes=["c", "d"],
+        ).compact()
+
+        result = evset.select_index_values(
+            [("C", 1), ("B", 1), ("A", 2), ("C", 1)]
+        )
+        self.assertTrue(result.is_compact())
+
+        expected = event_set(
+            timestamps=[5, 3, 4, 2],
+            features={
+                "a": [5.0, 3.0, 4.0, 2.0],
+                "c": ["C", "B", "B", "A"],
+                "d": [1, 1, 1, 2],
+            },
+            indexes=["c", "d"],
+        )
+        assertOperatorResult(self, result, expected, check_sampling=False)
+        self.assertEqual(
+            result.get_index_keys(), [(b"C", 1), (b"B", 1), (b"A", 2)]
+        )
+
+        with self.assertRaisesRegex(
+            ValueError,
+            r"Index key '\(b'D', 1\)' not found in input EventSet.",
+        ):
+            evset.select_index_values(("D", 1))
+
     def test_wrong_index_key(self):
         with self.assertRaisesRegex(
             ValueError, r"Index key '\(b'D',\)' not found in input EventSet."
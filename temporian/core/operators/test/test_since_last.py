@@ -42,6 +42,21 @@ class SinceLastTest(TestCase):
 
         assertOperatorResult(self, result, expected)
 
+    def test_int64_timestamps(self):
+        evset = event_set(timestamps=[1, 5, 8, 2**60], timestamp_unit="us")
+
+        result = evset.since_last()
+
+        # The durations are expressed in seconds.
+        expected = event_set(
+            timestamps=[1, 5, 8, 2**60],
+            features={"since_last": [nan, 4e-6, 3e-6, (2**60 - 8) * 1e-6]},
+            timestamp_unit="us",
+            same_sampling_as=evset,
+        )
+
+        assertOperatorResult(self, result, expected)
+
     def test_no_sampling_2steps(self):
         ts = [1, 5, 8, 9, 1, 1, 2, 2, 2]
         x = [1, 1, 1, 1, 2, 2, 2, 2, 2]
@@ -0,0 +1,143 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime
+
+import numpy as np
+from absl.testing import absltest
+from absl.testing.parameterized import TestCase, parameters
+
+from temporian.implementation.numpy.data.io import event_set
+from temporian.test.utils import assertOperatorResult
+
+
+class TimeRangeTest(TestCase):
+    def test_basic(self):
+        evset = event_set(
+            timestamps=[1, 2, 3, 4, 2, 5],
+            features={"x": [1, 2, 3, 4, 5, 6], "k": [1, 1, 1, 1, 2, 2]},
+            indexes=["k"],
+        )
+
+        result = evset.time_range(2, 4)
+
+        expected = event_set(
+            timestamps=[2, 3, 2],
+            features={"x": [2, 3, 5], "k": [1, 1, 2]},
+            indexes=["k"],
+        )
+
+        assertOperatorResult(self, result, expected, check_sampling=False)
+
+    @parameters(
+        (None, None, [1, 2, 2, 3]),
+        (2, None, [2, 2, 3]),
+        (None, 2, [1]),
+        (1.5, 2.5, [2, 2]),
+        (3, 1, []),
+        (4, 5, []),
+    )
+    def test_bounds(self, begin, end, expected_timestamps):
+        evset = event_set(timestamps=[1, 2, 2, 3])
+
+        result = evset.time_range(begin, end)
+
+        expected = event_set(
+            timestamps=np.array(expected_timestamps, dtype=np.float64)
+        )
+        assertOperatorResult(self, result, expected, check_sampling=False)
+
+    def test_no_copy(self):
+        evset = event_set(
+            timestamps=[1, 2, 3, 4],
+            features={"x": [1, 2, 3, 4], "y": ["a", "b", "c", "d"]},
+        )
+
+        result = evset.time_range(2, 4)
+
+        src = evset.get_index_value(())
+        dst = result.get_index_value(())
+        self.assertTrue(np.shares_memory(dst.timestamps, src.timestamps))
+        for dst_feature, src_feature in zip(dst.features, src.features):
+            self.assertTrue(np.shares_memory(dst_feature, src_feature))
+
+    def test_compact(self):
+        evset = event_set(
+            timestamps=[1, 2, 3, 4, 2, 5],
+            features={"x": [1, 2, 3, 4, 5, 6], "k": [1, 1, 1, 1, 2, 2]},
+            indexes=["k"],
+        )
+
+        self.assertEqual(
+            evset.compact().time_range(2, 4), evset.time_range(2, 4)
+        )
+
+    def test_datetime(self):
+        evset = event_set(
+            timestamps=[
+                datetime(2023, 11, 16, 10, 15, 00),
+                datetime(2023, 11, 16, 10, 16, 00),
+                datetime(2023, 11, 16, 10, 17, 00),
+            ],
+            features={"x": [4, 5, 6]},
+        )
+
+        result = evset.time_range(
+            datetime(2023, 11, 16, 10, 16, 00),
+            datetime(2023, 11, 16, 10, 17, 00),
+        )
+
+        expected = event_set(
+            timestamps=[datetime(2023, 11, 16, 10, 16, 00)],
+            features={"x": [5]},
+        )
+        assertOperatorResult(self, result, expected, check_sampling=False)
+
+        with self.assertRaisesRegex(ValueError, "Cannot use a float timestamp"):
+            evset.time_range(1.0)
+
+    def test_timestamp_unit(self):
+        evset = event_set(
+            timestamps=[
+                "2023-11-16 10:15:00.000000001",
+                "2023-11-16 10:15:00.000000002",
+                "2023-11-16 10:15:00.000000003",
+            ],
+            timestamp_unit="ns",
+        )
+
+        result = evset.time_range(
+            begin=datetime(2023, 11, 16, 10, 15), end=datetime(2023, 11, 17)
+        )
+        assertOperatorResult(self, result, evset, check_sampling=False)
+
+        evset = event_set(timestamps=[1, 2, 3], timestamp_unit="ns")
+
+        def timestamps(evset):
+            return evset.get_index_value(()).timestamps.tolist()
+
+        self.assertEqual(timestamps(evset.time_range(begin=1.5)), [2, 3])
+        self.assertEqual(timestamps(evset.before(2.5)), [1, 2])
+        self.assertEqual(timestamps(evset.after(2)), [3])
+        self.assertEqual(timestamps(evset.after(1.5)), [2, 3])
+
+    def test_nan(self):
+        evset = event_set(timestamps=[1, 2, 3])
+
+        self.assertEqual(evset.time_range(end=np.nan), evset.before(np.nan))
+        self.assertEqual(len(evset.before(np.nan).get_index_value(())), 0)
+
+
+if __name__ == "__main__":
+    absltest.main()
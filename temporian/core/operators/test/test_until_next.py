@@ -36,6 +36,23 @@ class UntilNextTest(absltest.TestCase):
 
         assertOperatorResult(self, result, expected, check_sampling=False)
 
+    def test_int64_timestamps(self):
+        a = event_set(timestamps=[0, 10, 11, 20, 30], timestamp_unit="ms")
+        b = event_set(timestamps=[1, 12, 21, 22, 42], timestamp_unit="ms")
+
+        result = a.until_next(sampling=b, timeout=0.005)
+
+        # The durations are expressed in seconds.
+        expected = event_set(
+            timestamps=[1, 12, 12, 21, 35],
+            features={
+                "until_next": [0.001, 0.002, 0.001, 0.001, math.nan],
+            },
+            timestamp_unit="ms",
+        )
+
+        assertOperatorResult(self, result, expected, check_sampling=False)
+
     def test_no_sampling(self):
         a = event_set(timestamps=[0], features={"x": ["a"]}, indexes=["x"])
         b = event_set(timestamps=[0], features={"x": ["b"]}, indexes=["x"])
@@ -71,6 +71,7 @@ class TickCalendar(Operator):
                 features=[],
                 indexes=input.schema.indexes,
                 is_unix_timestamp=True,
+                timestamp_unit=input.schema.timestamp_unit,
                 creator=self,
             ),
         )
@@ -0,0 +1,215 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""TimeRange operator class and public API function definitions."""
+
+import math
+from datetime import datetime
+from typing import Optional, Union
+
+import numpy as np
+
+from temporian.core import operator_lib
+from temporian.core.compilation import compile
+from temporian.core.data.duration_utils import timestamp_to_ticks
+from temporian.core.data.node import (
+    EventSetNode,
+    create_node_new_features_new_sampling,
+)
+from temporian.core.operators.base import Operator
+from temporian.core.typing import EventSetOrNode
+from temporian.proto import core_pb2 as pb
+
+Timestamp = Union[int, float, datetime]
+
+# Normalized bound of a time range: an int64 tick if the EventSet has a
+# timestamp unit, and a float otherwise.
+NormalizedTimestamp = Union[int, float]
+
+
+class TimeRange(Operator):
+    def __init__(
+        self,
+        input: EventSetNode,
+        begin: Optional[NormalizedTimestamp] = None,
+        end: Optional[NormalizedTimestamp] = None,
+    ):
+        super().__init__()
+
+        self._begin = begin
+        self._end = end
+
+        self.add_input("input", input)
+        if begin is not None:
+            self.add_attribute("begin", begin)
+        if end is not None:
+            self.add_attribute("end", end)
+
+        self.add_output(
+            "output",
+            create_node_new_features_new_sampling(
+                features=input.schema.features,
+                indexes=input.schema.indexes,
+                is_unix_timestamp=input.schema.is_unix_timestamp,
+                timestamp_unit=input.schema.timestamp_unit,
+                creator=self,
+            ),
+        )
+        self.check()
+
+    @property
+    def begin(self) -> Optional[NormalizedTimestamp]:
+        return self._begin
+
+    @property
+    def end(self) -> Optional[NormalizedTimestamp]:
+        return self._end
+
+    @classmethod
+    def build_op_definition(cls) -> pb.OperatorDef:
+        return pb.OperatorDef(
+            key="TIME_RANGE",
+            attributes=[
+                pb.OperatorDef.Attribute(
+                    key="begin",
+                    type=pb.OperatorDef.Attribute.Type.ANY,
+                    is_optional=True,
+                ),
+                pb.OperatorDef.Attribute(
+                    key="end",
+                    type=pb.OperatorDef.Attribute.Type.ANY,
+                    is_optional=True,
+                ),
+            ],
+            inputs=[pb.OperatorDef.Input(key="input")],
+            outputs=[pb.OperatorDef.Output(key="output")],
+        )
+
+
+operator_lib.register_operator(TimeRange)
+
+
+def normalize_timestamp(
+    input: EventSetNode, timestamp: Timestamp, fn_name: str
+) -> Union[int, float]:
+    """Converts a user timestamp into the representation of the timestamps of
+    an EventSet.
+
+    Datetimes are converted into unix seconds, or into ticks if the EventSet
+    has a timestamp unit. Numerical values are returned as is.
+    """
+
+    if isinstance(timestamp, datetime):
+        if not input.schema.is_unix_timestamp:
+            raise ValueError(
+                "Cannot use a datetime timestamp to filter timestamps that are"
+                " not unix timestamp. Set `is_unix_timestamp=True` on the"
+                f" EventSet or use a float when calling `{fn_name}`"
+            )
+        if input.schema.timestamp_unit is None:
+            return timestamp.timestamp()
+        return timestamp_to_ticks(timestamp, input.schema.timestamp_unit)
+
+    if input.schema.is_unix_timestamp:
+        raise ValueError(
+            "Cannot use a float timestamp to filter unix timestamp. Set"
+            " `is_unix_timestamp=False` on the EventSet or use a float"
+            f" when calling `{fn_name}`"
+        )
+    if not isinstance(timestamp, (int, float, np.integer, np.floating)):
+        raise ValueError(
+            f"Expected a number or a datetime when calling `{fn_name}`. Got"
+            f" {timestamp!r} instead."
+        )
+    if isinstance(timestamp, np.integer):
+        return int(timestamp)
+    if isinstance(timestamp, np.floating):
+        return float(timestamp)
+    return timestamp
+
+
+def _lower_bound(
+    input: EventSetNode, timestamp: Union[int, float]
+) -> NormalizedTimestamp:
+    """Smallest timestamp representation greater or equal to `timestamp`."""
+
+    if input.schema.timestamp_unit is None:
+        return float(timestamp)
+    if not math.isfinite(timestamp):
+        raise ValueError(
+            "The bounds of a time range on an EventSet with a timestamp unit"
+            f" should be finite. Got {timestamp} instead."
+        )
+    return math.ceil(timestamp)
+
+
+def _upper_bound(
+    input: EventSetNode, timestamp: Union[int, float]
+) -> NormalizedTimestamp:
+    """Exclusive upper bound selecting the timestamps smaller than
+    `timestamp`."""
+
+    if input.schema.timestamp_unit is None and math.isnan(timestamp):
+        # No timestamp is smaller than NaN.
+        return -math.inf
+    return _lower_bound(input, timestamp)
+
+
+@compile
+def time_range(
+    input: EventSetOrNode,
+    begin: Optional[Timestamp] = None,
+    end: Optional[Timestamp] = None,
+) -> EventSetOrNode:
+    assert isinstance(input, EventSetNode)
+
+    normalized_begin = None
+    if begin is not None:
+        normalized_begin = _lower_bound(
+            input, normalize_timestamp(input, begin, "time_range")
+        )
+
+    normalized_end = None
+    if end is not None:
+        normalized_end = _upper_bound(
+            input, normalize_timestamp(input, end, "time_range")
+        )
+
+    return TimeRange(
+        input=input, begin=normalized_begin, end=normalized_end
+    ).outputs["output"]
+
+
+@compile
+def before(input: EventSetOrNode, timestamp: Timestamp) -> EventSetOrNode:
+    assert isinstance(input, EventSetNode)
+
+    end = _upper_bound(input, normalize_timestamp(input, timestamp, "before"))
+    return TimeRange(input=input, end=end).outputs["output"]
+
+
+@compile
+def after(input: EventSetOrNode, timestamp: Timestamp) -> EventSetOrNode:
+    assert isinstance(input, EventSetNode)
+
+    timestamp = normalize_timestamp(input, timestamp, "after")
+
+    # First timestamp strictly greater than `timestamp`.
+    if input.schema.timestamp_unit is None:
+        begin = float(np.nextafter(float(timestamp), math.inf))
+    else:
+        begin = _lower_bound(input, timestamp)
+        if begin == timestamp:
+            begin += 1
+    return TimeRange(input=input, begin=begin).outputs["output"]
@@ -24,7 +24,6 @@ from temporian.core.compilation import compile
 from temporian.core.operators.base import Operator
 from temporian.core.typing import EventSetOrNode
 from temporian.proto import core_pb2 as pb
-from temporian.core.data import dtype
 
 
 class Timestamps(Operator):
@@ -36,7 +35,7 @@ class Timestamps(Operator):
         self.add_output(
             "output",
             create_node_new_features_existing_sampling(
-                features=[("timestamps", dtype.float64)],
+                features=[("timestamps", input.schema.timestamp_dtype)],
                 sampling_node=input,
                 creator=self,
             ),
@@ -113,12 +113,8 @@ class IsNanOperator(BaseUnaryOperator):
 
     @classmethod
     def allowed_dtypes(cls) -> List[DType]:
-        return [
-            DType.BOOLEAN,
-            DType.FLOAT32,
-            DType.FLOAT64,
-            DType.INT32,
-            DType.INT64,
+        return [DType.BOOLEAN] + [
+            dtype for dtype in DType if dtype.is_numerical
         ]
 
     @classmethod
@@ -133,12 +129,8 @@ class NotNanOperator(BaseUnaryOperator):
 
     @classmethod
     def allowed_dtypes(cls) -> List[DType]:
-        return [
-            DType.BOOLEAN,
-            DType.FLOAT32,
-            DType.FLOAT64,
-            DType.INT32,
-            DType.INT64,
+        return [DType.BOOLEAN] + [
+            dtype for dtype in DType if dtype.is_numerical
         ]
 
     @classmethod
@@ -153,12 +145,7 @@ class AbsOperator(BaseUnaryOperator):
 
     @classmethod
     def allowed_dtypes(cls) -> List[DType]:
-        return [
-            DType.FLOAT32,
-            DType.FLOAT64,
-            DType.INT32,
-            DType.INT64,
-        ]
+        return [dtype for dtype in DType if dtype.is_numerical]
 
     @classmethod
     def get_output_dtype(cls, feature_dtype: DType) -> DType:
@@ -172,10 +159,7 @@ class LogOperator(BaseUnaryOperator):
 
     @classmethod
     def allowed_dtypes(cls) -> List[DType]:
-        return [
-            DType.FLOAT32,
-            DType.FLOAT64,
-        ]
+        return [dtype for dtype in DType if dtype.is_float]
 
     @classmethod
     def get_output_dtype(cls, feature_dtype: DType) -> DType:
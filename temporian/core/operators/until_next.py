@@ -46,6 +46,7 @@ class UntilNext(Operator):
 
         self.add_input("input", input)
         self.add_input("sampling", sampling)
+        input.schema.check_compatible_timestamps(sampling.schema)
 
         self.add_attribute("timeout", timeout)
         self._timeout = timeout
@@ -61,6 +62,7 @@ class UntilNext(Operator):
                 features=[("until_next", DType.FLOAT64)],
                 indexes=input.schema.indexes,
                 is_unix_timestamp=input.schema.is_unix_timestamp,
+                timestamp_unit=input.schema.timestamp_unit,
                 creator=self,
             ),
         )
@@ -15,7 +15,10 @@
 """Base calendar operator class definition."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
+
+import numpy as np
+
 from temporian.core.data.duration_utils import normalize_duration
 
 
@@ -45,6 +48,9 @@ class BaseWindowOperator(Operator, ABC):
         has_variable_winlen = isinstance(window_length, EventSetNode)
         self._has_variable_winlen = has_variable_winlen
 
+        has_multiple_winlen = isinstance(window_length, (list, tuple))
+        self._has_multiple_winlen = has_multiple_winlen
+
         has_sampling = sampling is not None
         self._has_sampling = has_sampling
 
@@ -57,6 +63,7 @@ class BaseWindowOperator(Operator, ABC):
                     " EventSet's sampling will be used."
                 )
             input.schema.check_compatible_index(sampling.schema)
+            input.schema.check_compatible_timestamps(sampling.schema)
             self.add_input("sampling", sampling)
 
         if has_variable_winlen:
@@ -68,11 +75,22 @@ class BaseWindowOperator(Operator, ABC):
                     "`window_length` must have exactly one float64 feature."
                 )
             self.add_input("window_length", window_length)
-            self._window_length = None
+            self._window_lengths = None
+        elif has_multiple_winlen:
+            window_lengths = [normalize_duration(w) for w in window_length]
+            if not window_lengths:
+                raise ValueError("`window_length` cannot be an empty list.")
+            if len(set(window_lengths)) != len(window_lengths):
+                raise ValueError(
+                    "`window_length` cannot contain duplicated window lengths."
+                    f" Got {window_lengths!r}."
+                )
+            self.add_attribute("window_length", window_lengths)
+            self._window_lengths = window_lengths
         else:
             window_length = normalize_duration(window_length)
             self.add_attribute("window_length", window_length)
-            self._window_length = window_length
+            self._window_lengths = [window_length]
 
         self.add_input("input", input)
 
@@ -97,19 +115,52 @@ class BaseWindowOperator(Operator, ABC):
         self.check()
 
     def feature_schema(self, input: EventSetNode):
-        return [  # pylint: disable=g-complex-comprehension
+        return self.features_per_window_length(
+            [  # pylint: disable=g-complex-comprehension
+                FeatureSchema(
+                    name=f.name,
+                    dtype=self.get_feature_dtype(f),
+                )
+                for f in input.schema.features
+            ]
+        )
+
+    def features_per_window_length(
+        self, features: List[FeatureSchema]
+    ) -> List[FeatureSchema]:
+        """Output features for each window length.
+
+        With several window lengths, each feature is repeated for each window
+        length, and suffixed with the window length (e.g., "a" becomes "a_60"
+        and "a_3600").
+        """
+
+        if not self._has_multiple_winlen:
+            return features
+        assert self._window_lengths is not None
+        return [
             FeatureSchema(
-                name=f.name,
-                dtype=self.get_feature_dtype(f),
+                name=f"{f.name}_{_window_length_suffix(window_length)}",
+                dtype=f.dtype,
             )
-            for f in input.schema.features
+            for f in features
+            for window_length in self._window_lengths
         ]
 
     @property
     def window_length(self) -> Optional[NormalizedDuration]:
         """Returns None if window_length is variable (i.e. an EventSet was
-        passed as `window_length` to the operator)."""
-        return self._window_length
+        passed as `window_length` to the operator), or if there are several
+        window lengths."""
+        if self._window_lengths is None or self._has_multiple_winlen:
+            return None
+        return self._window_lengths[0]
+
+    @property
+    def window_lengths(self) -> Optional[List[NormalizedDuration]]:
+        """Constant window lengths, in order. Returns None if window_length is
+        variable."""
+        return self._window_lengths
 
     @property
     def has_sampling(self) -> bool:
@@ -119,14 +170,20 @@ class BaseWindowOperator(Operator, ABC):
     def has_variable_winlen(self) -> bool:
         return self._has_variable_winlen
 
+    @property
+    def has_multiple_winlen(self) -> bool:
+        """Whether a list of window lengths was passed to the operator."""
+        return self._has_multiple_winlen
+
     @classmethod
     def build_op_definition(cls) -> pb.OperatorDef:
         return pb.OperatorDef(
             key=cls.operator_def_key(),
             attributes=[
+                # A float, or a list of floats for several window lengths.
                 pb.OperatorDef.Attribute(
                     key="window_length",
-                    type=pb.OperatorDef.Attribute.Type.FLOAT_64,
+                    type=pb.OperatorDef.Attribute.Type.ANY,
                     is_optional=True,
                 ),
             ],
@@ -146,3 +203,9 @@ class BaseWindowOperator(Operator, ABC):
     @abstractmethod
     def get_feature_dtype(self, feature: FeatureSchema) -> DType:
         """Gets the dtype of the output feature."""
+
+
+def _window_length_suffix(window_length: NormalizedDuration) -> str:
+    """Shortest representation of a window length, e.g. "60" or "0.5"."""
+
+    return np.format_float_positional(window_length, trim="-")
@@ -34,7 +34,9 @@ class MovingCountOperator(BaseWindowOperator):
         return DType.INT32
 
     def feature_schema(self, input: EventSetNode):
-        return [FeatureSchema(name="count", dtype=DType.INT32)]
+        return self.features_per_window_length(
+            [FeatureSchema(name="count", dtype=DType.INT32)]
+        )
 
 
 operator_lib.register_operator(MovingCountOperator)
@@ -38,7 +38,7 @@ class MovingStandardDeviationOperator(BaseWindowOperator):
                 " cast features e.g. `.cast(tp.float32)`"
             )
         return (
-            DType.FLOAT32 if feature.dtype == DType.FLOAT32 else DType.FLOAT64
+            DType.FLOAT64 if feature.dtype == DType.FLOAT64 else DType.FLOAT32
         )
 
 
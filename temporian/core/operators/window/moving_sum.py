@@ -39,6 +39,13 @@ class MovingSumOperator(BaseWindowOperator):
                 f" features only, but received feature {feature.name!r} with"
                 f" type {feature.dtype}"
             )
+        # Like in NumPy, narrow values are summed in 64 bits.
+        if feature.dtype in (DType.INT8, DType.INT16):
+            return DType.INT64
+        if feature.dtype.is_unsigned_integer:
+            return DType.UINT64
+        if feature.dtype == DType.FLOAT16:
+            return DType.FLOAT32
         return feature.dtype
 
 
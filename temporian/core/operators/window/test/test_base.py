@@ -17,11 +17,15 @@
 Use it to test expected behavior from the base classes, such as errors or
 warnings."""
 
+import os
+import tempfile
 from math import nan
 from unittest.mock import patch
 
 from absl.testing import absltest
+import numpy as np
 
+import temporian as tp
 from temporian.implementation.numpy.data.io import event_set
 from temporian.implementation.numpy.operators.window import (
     base as base_window_impl,
@@ -133,17 +137,188 @@ class SimpleMovingAverageTest(absltest.TestCase):
             timestamps=[1], features={"a": [1.0]}, same_sampling_as=evset
         )
 
-        cpp_moving_sum_mock.return_value = f64([10.0])
+        cpp_moving_sum_mock.return_value = [f64([10.0])]
 
         evset.moving_sum(window_length=window_length)
 
         # sampling_timestamps not passed
         cpp_moving_sum_mock.assert_called_once_with(
             evset_timestamps=evset.data[()].timestamps,
-            evset_values=evset.data[()].features[0],
+            evset_values=[evset.data[()].features[0]],
             window_length=window_length.data[()].features[0],
         )
 
+    def test_several_features(self):
+        """Tests that the features with the same dtype are computed together,
+        and give the same result as when computed one by one."""
+        evset = event_set(
+            timestamps=[1, 2, 2, 4, 7, 8],
+            features={
+                "a": [1.0, 2.0, nan, 4.0, 5.0, 6.0],
+                "b": [6, 5, 4, 3, 2, 1],
+                "c": [0.5, 0.5, 1.5, nan, 2.5, 3.5],
+                "d": np.array([1, 2, 3, 4, 5, 6], np.float16),
+            },
+        )
+        sampling = event_set(timestamps=[0, 2, 3, 8, 10])
+        window_length = event_set(
+            timestamps=[1, 2, 2, 4, 7, 8],
+            features={"w": [1.0, 2.0, 0.5, 3.0, nan, 10.0]},
+            same_sampling_as=evset,
+        )
+
+        for mode, kwargs in [
+            ("constant", {"window_length": 2.0}),
+            ("sampling", {"window_length": 2.0, "sampling": sampling}),
+            ("variable", {"window_length": window_length}),
+        ]:
+            for operator in ["moving_sum", "moving_max", "moving_min"]:
+                with self.subTest(operator=operator, mode=mode):
+                    result = getattr(evset, operator)(**kwargs)
+                    for name in ["a", "b", "c", "d"]:
+                        expected = getattr(evset[[name]], operator)(**kwargs)
+                        assertOperatorResult(
+                            self, result[[name]], expected, check_sampling=False
+                        )
+
+    def test_several_features_single_call_per_dtype(self):
+        evset = event_set(
+            timestamps=[1, 2],
+            features={"a": [1.0, 2.0], "b": [3, 4], "c": [5.0, 6.0]},
+        )
+
+        with patch.object(
+            operators_cc, "moving_sum", wraps=operators_cc.moving_sum
+        ) as cpp_moving_sum_mock:
+            evset.moving_sum(window_length=2.0)
+
+        self.assertEqual(cpp_moving_sum_mock.call_count, 2)
+        self.assertEqual(
+            [
+                len(call.kwargs["evset_values"])
+                for call in cpp_moving_sum_mock.call_args_list
+            ],
+            [2, 1],
+        )
+
+    def test_several_window_lengths(self):
+        """Tests that several window lengths give the same results as one
+        operator per window length."""
+        evset = event_set(
+            timestamps=[1, 2, 2, 4, 7, 8, 20],
+            features={
+                "a": [1.0, 2.0, nan, 4.0, 5.0, 6.0, 7.0],
+                "b": [6, 5, 4, 3, 2, 1, 0],
+                "i": ["x", "x", "y", "x", "y", "x", "x"],
+            },
+            indexes=["i"],
+        )
+        sampling = event_set(
+            timestamps=[0, 2, 3, 8, 10, 1],
+            features={"i": ["x", "x", "x", "x", "y", "z"]},
+            indexes=["i"],
+        )
+        window_lengths = [1, 2.5, 6, np.inf]
+
+        for mode, kwargs in [
+            ("no_sampling", {}),
+            ("sampling", {"sampling": sampling}),
+        ]:
+            for operator in [
+                "moving_sum",
+                "moving_max",
+                "moving_min",
+                "moving_count",
+            ]:
+                with self.subTest(operator=operator, mode=mode):
+                    result = getattr(evset, operator)(window_lengths, **kwargs)
+                    features = (
+                        ["count"] if operator == "moving_count" else ["a", "b"]
+                    )
+                    self.assertEqual(
+                        result.schema.feature_names(),
+                        [
+                            f"{feature}_{suffix}"
+                            for feature in features
+                            for suffix in ["1", "2.5", "6", "inf"]
+                        ],
+                    )
+                    for window_length, suffix in zip(
+                        window_lengths, ["1", "2.5", "6", "inf"]
+                    ):
+                        expected = getattr(evset, operator)(
+                            window_length, **kwargs
+                        )
+                        assertOperatorResult(
+                            self,
+                            result[[f"{f}_{suffix}" for f in features]],
+                            expected.rename(
+                                {f: f"{f}_{suffix}" for f in features}
+                            ),
+                            check_sampling=False,
+                        )
+
+    def test_several_window_lengths_timestamp_unit(self):
+        evset = event_set(
+            timestamps=[1_000, 1_500, 3_000],
+            features={"a": [1, 2, 3]},
+            timestamp_unit="ms",
+        )
+        result = evset.moving_sum([1, 2])
+        expected = event_set(
+            timestamps=[1_000, 1_500, 3_000],
+            features={"a_1": [1, 3, 3], "a_2": [1, 3, 5]},
+            timestamp_unit="ms",
+            same_sampling_as=evset,
+        )
+        assertOperatorResult(self, result, expected)
+
+    def test_several_window_lengths_selected_feature(self):
+        """Tests that selecting some of the outputs only computes the needed
+        input features."""
+        evset = event_set(
+            timestamps=[1, 2, 3],
+            features={"a": [1, 2, 3], "b": [4.0, 5.0, 6.0]},
+        )
+        input_node = evset.node()
+        result = tp.run(
+            input_node.moving_sum([1, 2])[["b_2", "b_1"]], {input_node: evset}
+        )
+        expected = event_set(
+            timestamps=[1, 2, 3],
+            features={"b_2": [4.0, 9.0, 11.0], "b_1": [4.0, 5.0, 6.0]},
+            same_sampling_as=evset,
+        )
+        assertOperatorResult(self, result, expected, check_sampling=False)
+
+    def test_several_window_lengths_save_graph(self):
+        evset = event_set(timestamps=[1, 2, 3], features={"a": [1, 2, 3]})
+        input_node = evset.node()
+        output_node = input_node.moving_sum([1, 2.5])
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "graph.tem")
+            tp.save_graph(
+                inputs={"i": input_node}, outputs={"o": output_node}, path=path
+            )
+            loaded_inputs, loaded_outputs = tp.load_graph(
+                path=path, squeeze=True
+            )
+
+        self.assertEqual(
+            tp.run(loaded_outputs, {loaded_inputs: evset}),
+            tp.run(output_node, {input_node: evset}),
+        )
+
+    def test_several_window_lengths_invalid(self):
+        evset = event_set(timestamps=[1], features={"a": [1.0]})
+        with self.assertRaisesRegex(ValueError, "cannot be an empty list"):
+            evset.moving_sum([])
+        with self.assertRaisesRegex(ValueError, "duplicated window lengths"):
+            evset.moving_sum([1, 2, 1.0])
+        with self.assertRaisesRegex(ValueError, "strictly positive"):
+            evset.moving_sum([1, -2])
+
 
 if __name__ == "__main__":
     absltest.main()
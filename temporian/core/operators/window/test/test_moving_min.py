@@ -103,6 +103,30 @@ class MovingMinTest(TestCase):
 
         assertOperatorResult(self, result, expected)
 
+    def test_narrow_dtypes(self):
+        timestamps = [1, 2, 3, 4]
+        evset = event_set(
+            timestamps=timestamps,
+            features={
+                "a": np.array([5, -3, 7, 9], dtype=np.int16),
+                "b": np.array([200, 250, 3, 4], dtype=np.uint8),
+                "c": np.array([1.5, 0.5, nan, 4.0], dtype=np.float16),
+            },
+        )
+
+        expected = event_set(
+            timestamps=timestamps,
+            features={
+                "a": np.array([5, -3, -3, 7], dtype=np.int16),
+                "b": np.array([200, 200, 3, 3], dtype=np.uint8),
+                "c": np.array([1.5, 0.5, 0.5, 4.0], dtype=np.float16),
+            },
+            same_sampling_as=evset,
+        )
+
+        result = evset.moving_min(window_length=2.0)
+        assertOperatorResult(self, result, expected)
+
     def test_error_input_bytes(self):
         evset = event_set([1, 2], {"f": ["A", "B"]})
         with self.assertRaisesRegex(
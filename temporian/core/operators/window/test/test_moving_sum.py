@@ -172,6 +172,85 @@ class MovingSumTest(TestCase):
         result = evset.moving_sum(window_length=window)
         assertOperatorResult(self, result, expected)
 
+    def test_narrow_dtypes(self):
+        timestamps = [1, 2, 3, 4]
+        evset = event_set(
+            timestamps=timestamps,
+            features={
+                "a": np.array([100, 100, 100, -5], dtype=np.int8),
+                "b": np.array([200, 250, 3, 4], dtype=np.uint8),
+                "c": np.array([1, 2, 3, 4], dtype=np.uint64),
+                "d": np.array([1.5, 2.5, nan, 4.0], dtype=np.float16),
+            },
+        )
+
+        expected = event_set(
+            timestamps=timestamps,
+            features={
+                "a": np.array([100, 200, 300, 295], dtype=np.int64),
+                "b": np.array([200, 450, 453, 457], dtype=np.uint64),
+                "c": np.array([1, 3, 6, 10], dtype=np.uint64),
+                "d": f32([1.5, 4.0, 4.0, 8.0]),
+            },
+            same_sampling_as=evset,
+        )
+
+        result = evset.moving_sum(window_length=10.0)
+        assertOperatorResult(self, result, expected)
+
+    def test_int64_timestamps(self):
+        # Timestamps in nanoseconds.
+        evset = event_set(
+            timestamps=[0, 500_000_000, 1_000_000_000, 1_000_000_001],
+            features={"a": [1, 2, 3, 4]},
+            timestamp_unit="ns",
+        )
+        sampling = event_set(
+            timestamps=[999_999_999, 2_000_000_000], timestamp_unit="ns"
+        )
+        window = event_set(
+            timestamps=[1_000_000_000, 1_000_000_001],
+            features={"w": [0.6, nan]},
+            timestamp_unit="ns",
+        )
+
+        assertOperatorResult(
+            self,
+            evset.moving_sum(window_length=1.0),
+            event_set(
+                timestamps=[0, 500_000_000, 1_000_000_000, 1_000_000_001],
+                features={"a": [1, 3, 5, 9]},
+                timestamp_unit="ns",
+                same_sampling_as=evset,
+            ),
+        )
+        assertOperatorResult(
+            self,
+            evset.moving_sum(window_length=1.0, sampling=sampling),
+            event_set(
+                timestamps=[999_999_999, 2_000_000_000],
+                features={"a": [3, 4]},
+                timestamp_unit="ns",
+                same_sampling_as=sampling,
+            ),
+        )
+        assertOperatorResult(
+            self,
+            evset.moving_sum(window_length=window),
+            event_set(
+                timestamps=[1_000_000_000, 1_000_000_001],
+                features={"a": [5, 0]},
+                timestamp_unit="ns",
+                same_sampling_as=window,
+            ),
+        )
+
+    def test_error_timestamp_unit(self):
+        evset = event_set(timestamps=[1, 2], features={"a": [1, 2]})
+        sampling = event_set(timestamps=[1, 2], timestamp_unit="ms")
+        with self.assertRaisesRegex(ValueError, "same timestamp unit"):
+            evset.moving_sum(window_length=1.0, sampling=sampling)
+
     def test_error_input_bytes(self):
         evset = event_set([1, 2], {"f": ["A", "B"]})
         with self.assertRaisesRegex(
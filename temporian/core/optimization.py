@@ -0,0 +1,534 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Optimization passes applied on a graph before scheduling."""
+
+from collections import defaultdict
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from temporian.core.data.node import EventSetNode
+from temporian.core.graph import Graph
+from temporian.core.operators.add_index import AddIndexOperator
+from temporian.core.operators.base import Operator
+from temporian.core.operators.begin import BeginOperator
+from temporian.core.operators.binary.base import BaseBinaryOperator
+from temporian.core.operators.calendar.base import BaseCalendarOperator
+from temporian.core.operators.cast import CastOperator
+from temporian.core.operators.drop_index import DropIndexOperator
+from temporian.core.operators.end import EndOperator
+from temporian.core.operators.enumerate import Enumerate
+from temporian.core.operators.filter import FilterOperator
+from temporian.core.operators.glue import GlueOperator
+from temporian.core.operators.lag import LagOperator
+from temporian.core.operators.leak import LeakOperator
+from temporian.core.operators.prefix import Prefix
+from temporian.core.operators.propagate import Propagate
+from temporian.core.operators.rename import RenameOperator
+from temporian.core.operators.resample import Resample
+from temporian.core.operators.scalar.base import BaseScalarOperator
+from temporian.core.operators.select import SelectOperator
+from temporian.core.operators.since_last import SinceLast
+from temporian.core.operators.tick import Tick
+from temporian.core.operators.tick_calendar import TickCalendar
+from temporian.core.operators.time_range import TimeRange
+from temporian.core.operators.timestamps import Timestamps
+from temporian.core.operators.unary import BaseUnaryOperator
+from temporian.core.operators.unique_timestamps import UniqueTimestamps
+from temporian.core.operators.until_next import UntilNext
+from temporian.core.operators.window.base import BaseWindowOperator
+from temporian.core.operators.window.moving_count import MovingCountOperator
+
+# Operators computing each output value from the input values of the same
+# event and same feature.
+ELEMENTWISE_OPERATORS = (
+    BaseBinaryOperator,
+    BaseScalarOperator,
+    BaseUnaryOperator,
+)
+
+
+def eliminate_common_subexpressions(graph: Graph) -> Dict[Operator, Operator]:
+    """Finds the operators computing the same result as another operator.
+
+    Two operators compute the same result if they have the same definition key,
+    the same attributes, and if their inputs compute the same results.
+    Operators are compared in order of creation, and the first created operator
+    of a group of identical operators is the one to execute.
+
+    Attributes that are callables (e.g., the function of a `map` operator) are
+    compared by identity.
+
+    Args:
+        graph: Graph to optimize.
+
+    Returns:
+        Mapping from each duplicated operator to the identical operator
+        created first. Operators not in the mapping are unique.
+    """
+
+    # "canonical_nodes[n]" is the node computing the same result as "n"
+    # and computed by a non duplicated operator. Only contains the nodes
+    # produced by duplicated operators.
+    canonical_nodes: Dict[EventSetNode, EventSetNode] = {}
+
+    # Operators already seen, indexed by their structure.
+    op_by_key: Dict[Hashable, Operator] = {}
+
+    duplicates: Dict[Operator, Operator] = {}
+
+    # An operator is always created after the operators it depends on.
+    for op in sorted(graph.operators, key=lambda op: op._internal_ordered_id):
+        key = (
+            op.definition.key,
+            _freeze(op.attributes),
+            tuple(
+                (input_key, canonical_nodes.get(input_node, input_node))
+                for input_key, input_node in sorted(op.inputs.items())
+            ),
+        )
+        canonical_op = op_by_key.get(key)
+        if canonical_op is None:
+            op_by_key[key] = op
+            continue
+
+        duplicates[op] = canonical_op
+        for output_key, output_node in op.outputs.items():
+            canonical_nodes[output_node] = canonical_op.outputs[output_key]
+
+    return duplicates
+
+
+def fuse_elementwise_operators(
+    graph: Graph,
+    duplicates: Dict[Operator, Operator],
+    kept_nodes: Set[EventSetNode],
+) -> Dict[Operator, List[Operator]]:
+    """Groups chains of element-wise operators.
+
+    An element-wise operator (binary, scalar or unary operator) is fused into
+    the element-wise operator consuming its output if this output is not used
+    by any other operator and is not in "kept_nodes". All the operators of a
+    group share the same sampling. A group is identified by its last
+    operator, the only one whose output is used outside the group.
+
+    Args:
+        graph: Graph to optimize.
+        duplicates: Duplicated operators, as returned by
+            `eliminate_common_subexpressions`. Duplicated operators are not
+            fused. They use the outputs of the operator they duplicate.
+        kept_nodes: Nodes that should be materialized e.g., the outputs of the
+            graph.
+
+    Returns:
+        Mapping from the last operator of each group to the other operators of
+        the group, in order of execution. Groups with a single operator are not
+        listed.
+    """
+
+    # "users[n]" is the set of operators using node "n".
+    users: Dict[EventSetNode, Set[Operator]] = defaultdict(set)
+    for op in graph.operators:
+        used_op = duplicates[op].outputs if op in duplicates else op.inputs
+        for input_node in used_op.values():
+            users[input_node].add(op)
+
+    def fusible(op: Operator) -> bool:
+        return isinstance(op, ELEMENTWISE_OPERATORS) and op not in duplicates
+
+    # "groups[op]" is the list of operators fused into "op".
+    groups: Dict[Operator, List[Operator]] = {}
+
+    # An operator is always created after the operators it depends on.
+    for op in sorted(graph.operators, key=lambda op: op._internal_ordered_id):
+        if not fusible(op):
+            continue
+        group: List[Operator] = []
+        for input_node in dict.fromkeys(op.inputs.values()):
+            producer = input_node.creator
+            if (
+                producer is None
+                or producer not in groups
+                or input_node in kept_nodes
+                or users[input_node] != {op}
+            ):
+                continue
+            group.extend(groups.pop(producer))
+            group.append(producer)
+        groups[op] = group
+
+    return {
+        op: sorted(group, key=lambda op: op._internal_ordered_id)
+        for op, group in groups.items()
+        if group
+    }
+
+
+# Operators whose output features are computed independently from the input
+# features with the same index. Inputs other than "input", "input_1" and
+# "input_2" are listed with the features they need ("None" for all the
+# features).
+_FEATURE_WISE_OPERATORS = (
+    BaseBinaryOperator,
+    BaseScalarOperator,
+    BaseUnaryOperator,
+    BaseWindowOperator,
+    CastOperator,
+    FilterOperator,
+    LagOperator,
+    LeakOperator,
+    Prefix,
+    Propagate,
+    RenameOperator,
+    Resample,
+    TimeRange,
+)
+_FEATURE_WISE_INPUTS = ("input", "input_1", "input_2")
+_OTHER_INPUTS_NEEDED_FEATURES = {
+    "sampling": [],
+    "condition": None,
+    "window_length": None,
+}
+
+# Operators whose output features do not depend on the input features.
+_FEATURE_LESS_OPERATORS = (
+    BaseCalendarOperator,
+    BeginOperator,
+    EndOperator,
+    Enumerate,
+    MovingCountOperator,
+    SinceLast,
+    Tick,
+    TickCalendar,
+    Timestamps,
+    UniqueTimestamps,
+    UntilNext,
+)
+
+
+class _Projection(NamedTuple):
+    """Features of the inputs needed to compute some output features.
+
+    Attributes:
+        inputs: Index of the features needed for each input.
+        output: Index of the features of the output of the operator re-created
+            with the projected inputs.
+        attributes: Attributes of the operator re-created with the projected
+            inputs.
+    """
+
+    inputs: Dict[str, List[int]]
+    output: List[int]
+    attributes: Dict[str, Any]
+
+
+def _project_operator(op: Operator, output: List[int]) -> Optional[_Projection]:
+    """Computes the input features of an operator needed for some of its
+    output features.
+
+    Returns None if the operator does not support projections.
+    """
+
+    if len(op.outputs) != 1:
+        return None
+    all_output = _all_features(op.outputs["output"])
+    attributes = dict(op.attributes)
+
+    if isinstance(op, _FEATURE_WISE_OPERATORS):
+        inputs = {}
+        for key, node in op.inputs.items():
+            if key in _FEATURE_WISE_INPUTS:
+                inputs[key] = output
+            else:
+                needed = _OTHER_INPUTS_NEEDED_FEATURES[key]
+                inputs[key] = _all_features(node) if needed is None else needed
+        if isinstance(op, MovingCountOperator):
+            inputs["input"] = []
+            output = all_output
+        elif isinstance(op, BaseWindowOperator) and op.has_multiple_winlen:
+            # Each input feature is computed for all the window lengths.
+            assert op.window_lengths is not None
+            num_windows = len(op.window_lengths)
+            needed = sorted(set(i // num_windows for i in output))
+            inputs["input"] = needed
+            output = [
+                needed.index(i // num_windows) * num_windows + i % num_windows
+                for i in output
+            ]
+        if isinstance(op, CastOperator):
+            attributes["dtypes"] = [attributes["dtypes"][i] for i in output]
+        return _Projection(inputs=inputs, output=output, attributes=attributes)
+
+    if isinstance(op, _FEATURE_LESS_OPERATORS):
+        return _Projection(
+            inputs={key: [] for key in op.inputs},
+            output=all_output,
+            attributes=attributes,
+        )
+
+    if isinstance(op, SelectOperator):
+        input_names = op.inputs["input"].schema.feature_names()
+        feature_names = [attributes["feature_names"][i] for i in output]
+        attributes["feature_names"] = feature_names
+        return _Projection(
+            inputs={
+                "input": sorted(input_names.index(n) for n in feature_names)
+            },
+            output=output,
+            attributes=attributes,
+        )
+
+    if isinstance(op, GlueOperator):
+        inputs = {}
+        begin = 0
+        for key, node in op.inputs.items():
+            end = begin + len(node.schema.features)
+            inputs[key] = [i - begin for i in output if begin <= i < end]
+            begin = end
+        return _Projection(inputs=inputs, output=output, attributes=attributes)
+
+    if isinstance(op, AddIndexOperator):
+        input_features = op.inputs["input"].schema.features
+        # Index in the input of the output features.
+        output_to_input = [
+            idx
+            for idx, feature in enumerate(input_features)
+            if feature.name not in attributes["indexes"]
+        ]
+        index_features = [
+            idx
+            for idx, feature in enumerate(input_features)
+            if feature.name in attributes["indexes"]
+        ]
+        return _Projection(
+            inputs={
+                "input": sorted(
+                    [output_to_input[i] for i in output] + index_features
+                )
+            },
+            output=output,
+            attributes=attributes,
+        )
+
+    if isinstance(op, DropIndexOperator):
+        num_input_features = len(op.inputs["input"].schema.features)
+        input_output = [i for i in output if i < num_input_features]
+        return _Projection(
+            inputs={"input": input_output},
+            output=input_output + all_output[num_input_features:],
+            attributes=attributes,
+        )
+
+    return None
+
+
+def needed_features(
+    graph: Graph,
+) -> Tuple[Dict[EventSetNode, Set[int]], Dict[Operator, "_Projection"]]:
+    """Computes the features of each node needed to compute the graph outputs.
+
+    Args:
+        graph: Graph to analyse.
+
+    Returns:
+        The index of the features needed for each node of the graph, and the
+        projection of each operator of the graph.
+    """
+
+    ops = sorted(graph.operators, key=lambda op: op._internal_ordered_id)
+
+    # "needed[n]" is the index of the features of "n" needed by the operators
+    # using "n".
+    needed: Dict[EventSetNode, Set[int]] = defaultdict(set)
+    for node in graph.outputs:
+        needed[node].update(_all_features(node))
+
+    # Features of the inputs needed by each operator.
+    projections: Dict[Operator, _Projection] = {}
+
+    # An operator is always created after the operators it depends on.
+    for op in reversed(ops):
+        output = (
+            sorted(needed[op.outputs["output"]]) if len(op.outputs) == 1 else []
+        )
+        projection = _project_operator(op, output)
+        if projection is None:
+            # All the features of all the inputs are needed.
+            projection = _Projection(
+                inputs={
+                    key: _all_features(node) for key, node in op.inputs.items()
+                },
+                output=[
+                    feature_idx
+                    for node in op.outputs.values()
+                    for feature_idx in _all_features(node)
+                ],
+                attributes=op.attributes,
+            )
+        projections[op] = projection
+        for key, node in op.inputs.items():
+            needed[node].update(projection.inputs[key])
+
+    return needed, projections
+
+
+def push_down_projections(
+    graph: Graph,
+    partial_inputs: Optional[Dict[EventSetNode, EventSetNode]] = None,
+) -> Dict[Operator, Operator]:
+    """Removes the features not needed to compute the outputs of a graph.
+
+    The graph is rewritten so that each operator only processes the features
+    needed to compute the graph outputs. Features are removed with `select`
+    operators placed as close as possible to the inputs. For example, in
+    `a.filter(c).add_index("x")["y"]`, the "filter" and "add_index" operators
+    are re-created to only process the features "x" and "y".
+
+    The operators of the graph are not modified. Instead, operators are
+    re-created when their inputs change.
+
+    Args:
+        graph: Graph to optimize.
+        partial_inputs: Mapping from input nodes of the graph to nodes with
+            the same sampling and a subset of their features. The rewritten
+            graph reads the features from those nodes instead.
+
+    Returns:
+        Mapping from each operator of the graph to its re-created version.
+        Re-created operators computing outputs of the graph have the same
+        output schema as the original operators.
+
+    Raises:
+        ValueError: A partial input misses features needed to compute the
+            outputs.
+    """
+
+    ops = sorted(graph.operators, key=lambda op: op._internal_ordered_id)
+    needed, projections = needed_features(graph)
+
+    # "new_nodes[n]" is the node, in the rewritten graph, containing the
+    # features "available_features[n]" of the node "n".
+    new_nodes: Dict[EventSetNode, EventSetNode] = {}
+    available_features: Dict[EventSetNode, List[int]] = {}
+
+    for node, partial_node in (partial_inputs or {}).items():
+        feature_names = node.schema.feature_names()
+        available = [
+            feature_names.index(name)
+            for name in partial_node.schema.feature_names()
+        ]
+        missing = [
+            feature_names[idx] for idx in sorted(needed[node] - set(available))
+        ]
+        if missing:
+            raise ValueError(
+                f"The features {missing} are needed to compute the outputs but"
+                " are missing from the input EventSet. The input EventSet"
+                f" contains the features {partial_node.schema.feature_names()}."
+            )
+        new_nodes[node] = partial_node
+        available_features[node] = available
+
+    # Projected nodes, indexed by new node and projected features.
+    selections: Dict[Any, EventSetNode] = {}
+
+    def project(node: EventSetNode, features: List[int]) -> EventSetNode:
+        new_node = new_nodes.get(node, node)
+        available = available_features.get(node, _all_features(node))
+        if available == features:
+            return new_node
+        key = (new_node, tuple(features))
+        if key not in selections:
+            feature_names = new_node.schema.feature_names()
+            selections[key] = SelectOperator(
+                input=new_node,
+                feature_names=[
+                    feature_names[available.index(i)] for i in features
+                ],
+            ).outputs["output"]
+        return selections[key]
+
+    rewritten: Dict[Operator, Operator] = {}
+    for op in ops:
+        projection = projections[op]
+        if isinstance(op, SelectOperator):
+            # Selections are done by name on the available features.
+            new_inputs = {
+                key: new_nodes.get(node, node)
+                for key, node in op.inputs.items()
+            }
+        else:
+            new_inputs = {
+                key: project(node, projection.inputs[key])
+                for key, node in op.inputs.items()
+            }
+        is_unchanged = all(
+            new_inputs[key] is node for key, node in op.inputs.items()
+        ) and (
+            len(op.outputs) != 1
+            or len(projection.output)
+            == len(op.outputs["output"].schema.features)
+        )
+        if is_unchanged:
+            continue
+
+        if (
+            isinstance(op, SelectOperator)
+            and op.outputs["output"] not in graph.outputs
+            and new_inputs["input"].schema.feature_names()
+            == projection.attributes["feature_names"]
+        ):
+            # The selection is already done.
+            new_nodes[op.outputs["output"]] = new_inputs["input"]
+            available_features[op.outputs["output"]] = projection.output
+            continue
+
+        new_op = op.__class__(**new_inputs, **projection.attributes)
+        rewritten[op] = new_op
+        for key, node in op.outputs.items():
+            new_nodes[node] = new_op.outputs[key]
+        if len(op.outputs) == 1:
+            available_features[op.outputs["output"]] = projection.output
+
+    return rewritten
+
+
+def _all_features(node: EventSetNode) -> List[int]:
+    """Index of all the features of a node."""
+
+    return list(range(len(node.schema.features)))
+
+
+def _freeze(value: Any) -> Hashable:
+    """Converts an attribute value into a hashable value."""
+
+    if isinstance(value, dict):
+        return (
+            dict,
+            tuple(sorted((key, _freeze(item)) for key, item in value.items())),
+        )
+    if isinstance(value, (list, tuple)):
+        return (list, tuple(_freeze(item) for item in value))
+    if isinstance(value, Hashable):
+        return (type(value), value)
+    # Unknown unhashable values are compared by identity.
+    return (type(value), id(value))
@@ -0,0 +1,204 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-operator profiling of the execution of a graph."""
+
+import dataclasses
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class ProfiledStep:
+    """Measurements of the execution of a schedule step.
+
+    Attributes:
+        step_idx: Index of the step in the schedule.
+        operator_key: Key of the operator e.g. "MOVING_SUM".
+        operator_id: Unique id of the operator in the process.
+        begin_time: Time, in seconds, at which the step started. Relative to
+            the creation of the profiler.
+        wall_time: Duration of the step, in seconds.
+        cpu_time: CPU time of the thread running the step, in seconds. Does
+            not include the time spent in the threads processing the index
+            keys in parallel (see `num_index_threads` in `tp.run()`).
+        thread_id: Identifier of the thread running the step.
+        num_index_keys: Number of index keys in the inputs (or in the outputs,
+            if the step has no inputs) of the step.
+        num_input_events: Number of events in the inputs of the step.
+        num_output_events: Number of events in the outputs of the step.
+        output_num_bytes: Number of bytes of the timestamps and feature values
+            allocated for the outputs of the step. Values shared with the
+            inputs (e.g., the timestamps of an operator that does not change
+            the sampling) are not counted.
+        live_num_bytes: Number of bytes used by all the EventSets alive at the
+            end of the step, including the inputs of the step and the results
+            of the previous steps not yet released. Buffers shared by several
+            EventSets are counted once (see `EventSet.memory_usage()`). None
+            if the profiler was created with `live_memory=False`.
+    """
+
+    step_idx: int
+    operator_key: str
+    operator_id: int
+    begin_time: float
+    wall_time: float
+    cpu_time: float
+    thread_id: int
+    num_index_keys: int
+    num_input_events: int
+    num_output_events: int
+    output_num_bytes: int
+    live_num_bytes: Optional[int]
+
+
+class Profiler:
+    """Records the execution time and resources of each operator.
+
+    A profiler is passed to [`tp.run()`][temporian.run] to record the
+    execution of each step of the schedule. A profiler can be used in several
+    calls to `tp.run()`, in which case the steps of all the calls are
+    recorded.
+
+    Measuring the memory used by all the live EventSets after each step
+    (`live_num_bytes`) walks through all their arrays, which makes profiled
+    runs significantly slower. It is only done if `live_memory` is true.
+
+    Usage example:
+        ```python
+        >>> a = tp.event_set(timestamps=[1, 2, 3], features={"f": [1, 2, 3]})
+        >>> b = a.node().moving_sum(2).lag(1)
+        >>> profiler = tp.Profiler()
+        >>> _ = tp.run(b, a, profiler=profiler)
+        >>> [step.operator_key for step in profiler.steps]
+        ['MOVING_SUM', 'LAG']
+
+        >>> # As a Pandas DataFrame.
+        >>> df = profiler.to_pandas()
+
+        >>> # With the memory used by the live EventSets.
+        >>> profiler = tp.Profiler(live_memory=True)
+        >>> _ = tp.run(b, a, profiler=profiler)
+        >>> profiler.steps[0].live_num_bytes > 0
+        True
+
+        >>> # As a trace viewable in chrome://tracing or https://ui.perfetto.dev
+        >>> profiler.save_chrome_trace(str(tmp_dir / "trace.json"))
+
+        ```
+    """
+
+    def __init__(self, live_memory: bool = False):
+        self._live_memory = live_memory
+        self._origin = time.perf_counter()
+        self._steps: List[ProfiledStep] = []
+        self._lock = threading.Lock()
+
+    @property
+    def steps(self) -> List[ProfiledStep]:
+        """Recorded steps, in order of completion."""
+
+        return self._steps
+
+    @property
+    def live_memory(self) -> bool:
+        """Whether the memory used by the live EventSets is recorded."""
+
+        return self._live_memory
+
+    @property
+    def origin(self) -> float:
+        """Value of `time.perf_counter()` at the creation of the profiler."""
+
+        return self._origin
+
+    def record(self, step: ProfiledStep) -> None:
+        """Records the execution of a step. Thread-safe."""
+
+        with self._lock:
+            self._steps.append(step)
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """Converts the recorded steps into a dictionary of columns."""
+
+        return {
+            field.name: [getattr(step, field.name) for step in self._steps]
+            for field in dataclasses.fields(ProfiledStep)
+        }
+
+    def to_pandas(self) -> "pandas.DataFrame":
+        """Converts the recorded steps into a Pandas DataFrame.
+
+        Each row is a step.
+        """
+
+        import pandas as pd
+
+        return pd.DataFrame(self.to_dict())
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Converts the recorded steps into the Chrome trace event format.
+
+        Each step is a "complete" event (`"ph": "X"`) with the measurements
+        of the step as arguments.
+        """
+
+        events = []
+        for step in self._steps:
+            args = dataclasses.asdict(step)
+            for key in ["begin_time", "wall_time", "thread_id"]:
+                del args[key]
+            events.append(
+                {
+                    "name": step.operator_key,
+                    "cat": "operator",
+                    "ph": "X",
+                    "ts": step.begin_time * 1e6,
+                    "dur": step.wall_time * 1e6,
+                    "pid": 0,
+                    "tid": step.thread_id,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, path: str) -> None:
+        """Saves the recorded steps in a Chrome trace JSON file.
+
+        The file can be opened in chrome://tracing or https://ui.perfetto.dev.
+        """
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+    def __repr__(self) -> str:
+        """Summary of the recorded steps, grouped by operator key."""
+
+        wall_times: Dict[str, float] = {}
+        counts: Dict[str, int] = {}
+        for step in self._steps:
+            wall_times[step.operator_key] = (
+                wall_times.get(step.operator_key, 0.0) + step.wall_time
+            )
+            counts[step.operator_key] = counts.get(step.operator_key, 0) + 1
+
+        lines = [f"Profiler with {len(self._steps)} steps:"]
+        for key, wall_time in sorted(
+            wall_times.items(), key=lambda item: -item[1]
+        ):
+            lines.append(f"    {key}: {wall_time:.5f} s ({counts[key]} steps)")
+        return "\n".join(lines)
@@ -12,11 +12,51 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import List, Set
+from enum import Enum
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from temporian.core.data.node import EventSetNode
 from temporian.core.operators.base import Operator
+from temporian.utils import config
+
+
+class SchedulePolicy(str, Enum):
+    """Order in which ready operators are scheduled.
+
+    default: The operators are scheduled in order of creation. Deterministic
+        and cheap to compute.
+    memory: The operators are scheduled to minimize the estimated peak memory
+        usage. The memory usage is estimated from the number of events in the
+        inputs and the dtypes of the features.
+    """
+
+    default = "default"
+    memory = "memory"
+
+    def __str__(self) -> str:
+        return self.value
+
+    def __repr__(self) -> str:
+        return self.value
+
+    @classmethod
+    def is_valid(cls, value: Any) -> bool:
+        return isinstance(value, SchedulePolicy) or (
+            isinstance(value, str)
+            and value in [item.value for item in SchedulePolicy]
+        )
 
 
 @dataclass
@@ -26,8 +66,174 @@ class ScheduleStep:
     # List of nodes that will not be used anymore after "op" is executed.
     released_nodes: List[EventSetNode]
 
+    # If set, "op" is not executed. Instead, the outputs of "op" are the
+    # outputs of "alias_of", an identical operator executed before.
+    alias_of: Optional[Operator] = None
+
+    # Element-wise operators executed together with, and before, "op". Their
+    # outputs are not materialized.
+    fused_ops: List[Operator] = field(default_factory=list)
+
+    @property
+    def input_nodes(self) -> Dict[str, EventSetNode]:
+        """Nodes required to execute the step."""
+
+        if self.alias_of is not None:
+            return self.alias_of.outputs
+        if self.fused_ops:
+            return fused_input_nodes(self.fused_ops + [self.op])
+        return self.op.inputs
+
+
+def fused_input_nodes(ops: List[Operator]) -> Dict[str, EventSetNode]:
+    """Lists the inputs of a group of operators not computed by the group."""
+
+    computed_nodes = {node for op in ops for node in op.outputs.values()}
+    input_nodes: Dict[str, EventSetNode] = {}
+    for op in ops:
+        for input_node in op.inputs.values():
+            if input_node not in computed_nodes:
+                computed_nodes.add(input_node)
+                input_nodes[f"input_{len(input_nodes)}"] = input_node
+    return input_nodes
+
 
 @dataclass
 class Schedule:
     steps: List[ScheduleStep] = field(default_factory=list)
     input_nodes: Set[EventSetNode] = field(default_factory=set)
+
+
+# Key of a schedule in the cache i.e. the input and output nodes, the schedule
+# policy, whether the graph is optimized, and the magnitude of the number of
+# events of each input (only for the `memory` policy).
+ScheduleKey = Tuple[
+    FrozenSet[EventSetNode],
+    FrozenSet[EventSetNode],
+    SchedulePolicy,
+    bool,
+    FrozenSet[Tuple[EventSetNode, int]],
+]
+
+
+class ScheduleCacheInfo(NamedTuple):
+    """Statistics about a schedule cache."""
+
+    hits: int
+    misses: int
+    max_size: int
+    size: int
+
+
+class ScheduleCache:
+    """LRU cache of schedules.
+
+    Schedules are indexed by the identity of their input and output nodes,
+    by their policy, and by whether the graph is optimized.
+    Schedules computed with the `memory` policy depend on the number of events
+    of the input EventSets. They are also indexed by the order of magnitude
+    (power of two) of the number of events of each input, so that a schedule
+    is only reused for inputs of similar sizes.
+
+    Since operators and nodes are not modified once created, a schedule
+    computed for a given set of input and output nodes remains valid as long
+    as those nodes are alive. The cache keeps a reference to the nodes of the
+    schedules it contains.
+
+    The cache is thread-safe.
+
+    Attributes:
+        max_size: Maximum number of schedules in the cache. If None,
+            `config.schedule_cache_size` is used. If 0, schedules are not
+            cached.
+    """
+
+    def __init__(self, max_size: Optional[int] = None):
+        self._max_size = max_size
+        self._schedules: OrderedDict[ScheduleKey, Schedule] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_size(self) -> int:
+        if self._max_size is None:
+            return config.schedule_cache_size
+        return self._max_size
+
+    @staticmethod
+    def key(
+        inputs: Optional[Set[EventSetNode]],
+        outputs: Set[EventSetNode],
+        policy: SchedulePolicy = SchedulePolicy.default,
+        optimize: bool = False,
+        input_num_events: Optional[Dict[EventSetNode, int]] = None,
+    ) -> ScheduleKey:
+        input_sizes = frozenset()
+        if policy == SchedulePolicy.memory and input_num_events:
+            input_sizes = frozenset(
+                (node, num_events.bit_length())
+                for node, num_events in input_num_events.items()
+            )
+        return (
+            frozenset(inputs or ()),
+            frozenset(outputs),
+            policy,
+            optimize,
+            input_sizes,
+        )
+
+    def get(self, key: ScheduleKey) -> Optional[Schedule]:
+        """Gets a schedule, or None if the schedule is not in the cache."""
+
+        with self._lock:
+            schedule = self._schedules.get(key)
+            if schedule is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._schedules.move_to_end(key)
+            return schedule
+
+    def put(self, key: ScheduleKey, schedule: Schedule) -> None:
+        """Adds a schedule, evicting the least recently used ones if needed."""
+
+        max_size = self.max_size
+        if max_size <= 0:
+            return
+
+        with self._lock:
+            self._schedules[key] = schedule
+            self._schedules.move_to_end(key)
+            while len(self._schedules) > max_size:
+                self._schedules.popitem(last=False)
+
+    def invalidate(self, node: EventSetNode) -> None:
+        """Removes all the schedules using the node as input or output."""
+
+        with self._lock:
+            for key in list(self._schedules.keys()):
+                if node in key[0] or node in key[1]:
+                    del self._schedules[key]
+
+    def clear(self) -> None:
+        """Removes all the schedules and resets the statistics."""
+
+        with self._lock:
+            self._schedules.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> ScheduleCacheInfo:
+        """Gets the number of hits, misses, and the size of the cache."""
+
+        with self._lock:
+            return ScheduleCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                max_size=self.max_size,
+                size=len(self._schedules),
+            )
+
+    def __len__(self) -> int:
+        return len(self._schedules)
@@ -59,6 +59,13 @@ DTYPE_MAPPING = {
     DType.INT32: pb.DType.DTYPE_INT32,
     DType.BOOLEAN: pb.DType.DTYPE_BOOLEAN,
     DType.STRING: pb.DType.DTYPE_STRING,
+    DType.INT8: pb.DType.DTYPE_INT8,
+    DType.INT16: pb.DType.DTYPE_INT16,
+    DType.UINT8: pb.DType.DTYPE_UINT8,
+    DType.UINT16: pb.DType.DTYPE_UINT16,
+    DType.UINT32: pb.DType.DTYPE_UINT32,
+    DType.UINT64: pb.DType.DTYPE_UINT64,
+    DType.FLOAT16: pb.DType.DTYPE_FLOAT16,
 }
 INV_DTYPE_MAPPING = {v: k for k, v in DTYPE_MAPPING.items()}
 
@@ -288,6 +295,7 @@ def _process_fn_input(input: Any) -> EventSetNode:
             features=[(f.name, f.dtype) for f in input.features],
             indexes=[(i.name, i.dtype) for i in input.indexes],
             is_unix_timestamp=input.is_unix_timestamp,
+            timestamp_unit=input.timestamp_unit,
         )
     if isinstance(input, EventSet):
         return input.node()
@@ -600,6 +608,9 @@ def _serialize_schema(src: Schema) -> pb.Schema:
             for index in src.indexes
         ],
         is_unix_timestamp=src.is_unix_timestamp,
+        timestamp_unit=(
+            src.timestamp_unit.value if src.timestamp_unit is not None else None
+        ),
     )
 
 
@@ -614,6 +625,9 @@ def _unserialize_schema(src: pb.Schema) -> Schema:
             for index in src.indexes
         ],
         is_unix_timestamp=src.is_unix_timestamp,
+        timestamp_unit=(
+            src.timestamp_unit if src.HasField("timestamp_unit") else None
+        ),
     )
 
 
@@ -703,6 +717,12 @@ def _attribute_to_proto(
                 values=[_serialize_dtype(x) for x in value]
             ),
         )
+    # list of floats
+    if isinstance(value, list) and all(isinstance(val, float) for val in value):
+        return pb.Operator.Attribute(
+            key=key,
+            list_float_64=pb.Operator.Attribute.ListFloat64(values=value),
+        )
     # list of index keys
     if isinstance(value, list) and all(isinstance(val, tuple) for val in value):
         return pb.Operator.Attribute(
@@ -736,6 +756,8 @@ def _attribute_from_proto(src: pb.Operator.Attribute) -> base.AttributeType:
         return [_unserialize_dtype(x) for x in src.list_dtype.values]
     if src.HasField("list_index_keys"):
         return [_unserialize_index_key(x) for x in src.list_index_keys.values]
+    if src.HasField("list_float_64"):
+        return list(src.list_float_64.values)
     raise ValueError(f"Non supported proto attribute {src}")
 
 
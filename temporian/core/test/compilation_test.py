@@ -162,7 +162,9 @@ class CompileTest(absltest.TestCase):
 
         f(self.evset)
 
-        run_mock.assert_called_once_with(ANY, ANY, 1)
+        run_mock.assert_called_once_with(
+            ANY, ANY, 1, optimize=False, use_schedule_cache=False
+        )
 
     @patch.object(evaluation, "run", autospec=True)
     def test_verbose_0(self, run_mock):
@@ -172,7 +174,21 @@ class CompileTest(absltest.TestCase):
 
         f(self.evset)
 
-        run_mock.assert_called_once_with(ANY, ANY, 0)
+        run_mock.assert_called_once_with(
+            ANY, ANY, 0, optimize=False, use_schedule_cache=False
+        )
+
+    @patch.object(evaluation, "run", autospec=True)
+    def test_optimize(self, run_mock):
+        @compile(optimize=True)
+        def f(x: EventSetOrNode) -> EventSetOrNode:
+            return prefix(x, "a")
+
+        f(self.evset)
+
+        run_mock.assert_called_once_with(
+            ANY, ANY, 0, optimize=True, use_schedule_cache=False
+        )
 
     def test_call_no_args(self):
         @compile()
@@ -13,10 +13,12 @@
 # limitations under the License.
 
 from absl.testing import absltest
+import numpy as np
 
 from temporian.core import evaluation
+from temporian.core.schedule import Schedule, ScheduleCache
 from temporian.core.test import utils
-from temporian.implementation.numpy.data.event_set import EventSet
+from temporian.implementation.numpy.data.event_set import EventSet, IndexData
 
 import temporian as tp
 
@@ -207,6 +209,454 @@ class EvaluationTest(absltest.TestCase):
         with self.assertRaises(ValueError):
             evaluation.run(i1, [evset_1, evset_2])
 
+    def test_run_schedule_cache(self):
+        evaluation.schedule_cache.clear()
+
+        a = tp.input_node([("f", tp.float64)])
+        b = a.moving_sum(5)
+
+        evset_1 = tp.event_set(timestamps=[1, 2], features={"f": [1.0, 2.0]})
+        evset_2 = tp.event_set(timestamps=[3], features={"f": [3.0]})
+
+        result_1 = b.run({a: evset_1})
+        result_2 = b.run({a: evset_2})
+
+        info = evaluation.schedule_cache.info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.size, 1)
+        self.assertEqual(result_1.get_arbitrary_index_data().features[0][1], 3)
+        self.assertEqual(result_2.get_arbitrary_index_data().features[0][0], 3)
+
+        evaluation.schedule_cache.invalidate(a)
+        self.assertEqual(evaluation.schedule_cache.info().size, 0)
+
+    def test_run_schedule_cache_eager(self):
+        evaluation.schedule_cache.clear()
+
+        a = tp.input_node([("f", tp.float64)])
+        b = a.moving_sum(5)
+        evset = tp.event_set(timestamps=[1, 2], features={"f": [1.0, 2.0]})
+        b.run({a: evset})
+
+        # The graphs of the eager calls are not cached.
+        for _ in range(3):
+            evset.moving_sum(1.0)
+        self.assertEqual(evaluation.schedule_cache.info().size, 1)
+
+        b.run({a: evset})
+        self.assertEqual(evaluation.schedule_cache.info().hits, 1)
+
+    def test_schedule_cache_public_api(self):
+        tp.clear_schedule_cache()
+        self.assertEqual(
+            tp.schedule_cache_info(),
+            (0, 0, tp.config.schedule_cache_size, 0),
+        )
+
+        a = tp.input_node([("f", tp.float64)])
+        b = a.moving_sum(5)
+        evset = tp.event_set(timestamps=[1, 2], features={"f": [1.0, 2.0]})
+        b.run({a: evset})
+        b.run({a: evset})
+
+        info = tp.schedule_cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.size, 1)
+
+        tp.clear_schedule_cache()
+        self.assertEqual(
+            tp.schedule_cache_info(),
+            (0, 0, tp.config.schedule_cache_size, 0),
+        )
+
+    def test_run_schedule_cache_memory_policy(self):
+        evaluation.schedule_cache.clear()
+
+        a = tp.input_node([("f", tp.float64)])
+        b = a.moving_sum(5)
+
+        def run(num_events: int) -> None:
+            evset = tp.event_set(
+                timestamps=list(range(num_events)),
+                features={"f": [1.0] * num_events},
+            )
+            b.run({a: evset}, schedule_policy="memory")
+
+        # The memory-aware schedule is only reused for inputs of similar
+        # sizes.
+        run(2)
+        run(3)
+        run(100)
+        info = evaluation.schedule_cache.info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 2)
+        self.assertEqual(info.size, 2)
+
+    def test_schedule_cache_eviction(self):
+        cache = ScheduleCache(max_size=2)
+        i1 = utils.create_input_node()
+        i2 = utils.create_input_node()
+        i3 = utils.create_input_node()
+        key_1 = cache.key({i1}, {i1})
+        key_2 = cache.key({i2}, {i2})
+        key_3 = cache.key({i3}, {i3})
+
+        cache.put(key_1, Schedule())
+        cache.put(key_2, Schedule())
+        self.assertIsNotNone(cache.get(key_1))
+        cache.put(key_3, Schedule())
+
+        # "key_2" is the least recently used schedule.
+        self.assertIsNone(cache.get(key_2))
+        self.assertIsNotNone(cache.get(key_1))
+        self.assertIsNotNone(cache.get(key_3))
+        self.assertEqual(cache.info(), (3, 1, 2, 2))
+
+        cache.clear()
+        self.assertEqual(cache.info(), (0, 0, 2, 0))
+
+    def test_schedule_cache_disabled(self):
+        cache = ScheduleCache(max_size=0)
+        i1 = utils.create_input_node()
+        key = cache.key({i1}, {i1})
+        cache.put(key, Schedule())
+        self.assertIsNone(cache.get(key))
+        self.assertLen(cache, 0)
+
+    def test_run_num_threads(self):
+        evset = tp.event_set(
+            timestamps=[1, 2, 3, 5, 8],
+            features={
+                "a": [1.0, 2.0, 3.0, 4.0, 5.0],
+                "b": [5, 4, 3, 2, 1],
+            },
+            is_unix_timestamp=True,
+        )
+        node = evset.node()
+        branch_1 = node["a"].moving_sum(2).prefix("s_")
+        branch_2 = node["b"].calendar_second()
+        branch_3 = (node["a"] * 2).cumsum()
+        query = {
+            "x": tp.glue(branch_1, branch_2, branch_3),
+            "y": branch_1,
+            "z": branch_3.lag(1),
+        }
+
+        expected = tp.run(query, evset)
+        result = tp.run(query, evset, num_threads=4)
+        self.assertEqual(result, expected)
+
+    def test_run_num_index_threads(self):
+        num_keys = 50
+        evset = tp.event_set(
+            timestamps=[i % 7 + i // 7 for i in range(num_keys * 3)],
+            features={
+                "a": [float(i % 11) for i in range(num_keys * 3)],
+                "b": [i % 3 for i in range(num_keys * 3)],
+                "k": [i % num_keys for i in range(num_keys * 3)],
+            },
+            indexes=["k"],
+            is_unix_timestamp=True,
+        )
+        node = evset.node()
+        sampling = node.filter(node["b"].equal(1))
+        moving_sum = node["a"].moving_sum(3, sampling=sampling)
+        resampled = node["a"].resample(sampling).prefix("r_")
+        joined = sampling.join(node["a"].cumsum().prefix("j_"))
+        query = {
+            "moving_sum": moving_sum,
+            "resampled": resampled,
+            "joined": joined,
+            "hour": node.calendar_hour(),
+            "drop_index": node.drop_index("k").moving_count(2),
+            "propagate": node.drop_index("k")["a"].propagate(node),
+            "select_index_values": node.select_index_values([(3,), (4,)]),
+        }
+
+        expected = tp.run(query, evset)
+        for num_threads in [1, 3]:
+            result = tp.run(
+                query, evset, num_threads=num_threads, num_index_threads=4
+            )
+            self.assertEqual(result, expected)
+
+    def test_run_num_index_threads_key_order(self):
+        num_keys = 20
+        evset = tp.event_set(
+            timestamps=list(range(num_keys)),
+            features={
+                "a": [float(i) for i in range(num_keys)],
+                "k": list(range(num_keys)),
+            },
+            indexes=["k"],
+        )
+        # Same index keys as "evset", in the reverse order.
+        sampling = tp.event_set(
+            timestamps=list(range(num_keys)),
+            features={"k": list(reversed(range(num_keys)))},
+            indexes=["k"],
+        )
+        self.assertNotEqual(evset.get_index_keys(), sampling.get_index_keys())
+        node = evset.node()
+        sampling_node = sampling.node()
+        query = {
+            "resampled": node.resample(sampling_node),
+            "moving_sum": node.moving_sum(2, sampling=sampling_node),
+            "filtered": node.filter(node["a"] > 2),
+        }
+        inputs = {node: evset, sampling_node: sampling}
+
+        expected = tp.run(query, inputs)
+        result = tp.run(query, inputs, num_index_threads=2)
+        for key, expected_evset in expected.items():
+            self.assertEqual(result[key], expected_evset)
+            self.assertEqual(
+                result[key].get_index_keys(), expected_evset.get_index_keys()
+            )
+
+    def test_run_num_threads_exception(self):
+        evset = tp.event_set(timestamps=[1, 2], features={"a": [1, 2]})
+        node = evset.node()
+        output = node.map(lambda x: 1 / 0).cumsum()
+
+        with self.assertRaises(ZeroDivisionError):
+            tp.run([output, node.cumsum()], evset, num_threads=2)
+
+        with self.assertRaisesRegex(ValueError, "num_threads"):
+            tp.run(output, evset, num_threads=0)
+
+    def test_schedule_memory_policy(self):
+        a = utils.create_input_node()
+        x1 = utils.OpI1O1(a)
+        y1 = utils.OpI1O1(a)
+        s = utils.OpI1O1NotCreator(a)
+        x2 = utils.OpI2O1(x1.outputs["output"], s.outputs["output"])
+        y2 = utils.OpI2O1(y1.outputs["output"], s.outputs["output"])
+        outputs = {x2.outputs["output"], y2.outputs["output"]}
+
+        # "x1" and "y1" are both computed before they can be consumed.
+        schedule = evaluation.build_schedule(inputs={a}, outputs=outputs)
+        self.assertEqual([step.op for step in schedule.steps[:3]], [x1, y1, s])
+
+        # "x1" is consumed before "y1" is computed.
+        schedule = evaluation.build_schedule(
+            inputs={a},
+            outputs=outputs,
+            policy=evaluation.SchedulePolicy.memory,
+            input_num_events={a: 1000},
+        )
+        self.assertEqual(
+            [step.op for step in schedule.steps], [s, x1, x2, y1, y2]
+        )
+        self.assertEqual(
+            schedule.steps[2].released_nodes, [x1.outputs["output"]]
+        )
+
+    def test_run_schedule_policy(self):
+        evset = tp.event_set(
+            timestamps=[1, 2, 3, 5, 8],
+            features={"a": [1.0, 2.0, 3.0, 4.0, 5.0], "b": [5, 4, 3, 2, 1]},
+        )
+        node = evset.node()
+        query = [
+            tp.glue(node["a"].moving_sum(2), node["b"].cumsum()),
+            (node["a"] * 2).lag(1).moving_max(3),
+            node.filter(node["b"] > 2),
+        ]
+
+        expected = tp.run(query, evset)
+        result = tp.run(query, evset, schedule_policy="memory")
+        self.assertEqual(result, expected)
+        result = tp.run(query, evset, schedule_policy="memory", num_threads=2)
+        self.assertEqual(result, expected)
+
+        with self.assertRaisesRegex(ValueError, "schedule_policy"):
+            tp.run(query, evset, schedule_policy="fastest")
+
+    def test_run_check_execution(self):
+        evset = tp.event_set(
+            timestamps=list(range(20)),
+            features={
+                "a": np.arange(20, dtype=np.float64),
+                "k": list(range(20)),
+            },
+            indexes=["k"],
+        )
+        # Corrupt the dtype of the last index key.
+        last_index_key = list(evset.data.keys())[-1]
+        evset.data[last_index_key] = IndexData(
+            [np.array([1], dtype=np.int32)],
+            evset.data[last_index_key].timestamps,
+        )
+        node = evset.node()
+        output = node.lag(1)
+
+        for check_execution in ["off", False, "sampled", True]:
+            tp.run(output, evset, check_execution=check_execution)
+
+        with self.assertRaisesRegex(RuntimeError, "dtype"):
+            tp.run(output, evset, check_execution="full")
+
+        with self.assertRaisesRegex(ValueError, "check_execution"):
+            tp.run(output, evset, check_execution="partial")
+
+    def test_schedule_optimize(self):
+        a = tp.input_node([("f", tp.float64)])
+        b1 = a.moving_sum(5).prefix("x_")
+        b2 = a.moving_sum(5).prefix("x_")
+        c = tp.glue(b1, b2.prefix("y_"))
+
+        schedule = evaluation.build_schedule(inputs={a}, outputs={c})
+        self.assertLen(schedule.steps, 6)
+
+        # The second "moving_sum" is not needed, and the second "prefix" is
+        # an alias of the first one.
+        schedule = evaluation.build_schedule(
+            inputs={a}, outputs={c}, optimize=True
+        )
+        self.assertLen(schedule.steps, 5)
+        self.assertEqual(
+            [step.op for step in schedule.steps if step.alias_of is not None],
+            [b2.creator],
+        )
+
+    def test_run_optimize(self):
+        evset = tp.event_set(
+            timestamps=[1, 2, 3, 5, 8],
+            features={"a": [1.0, 2.0, 3.0, 4.0, 5.0], "b": [5, 4, 3, 2, 1]},
+        )
+        node = evset.node()
+
+        def feature(x):
+            return (x["a"] * 2).moving_sum(2)
+
+        query = [
+            tp.glue(feature(node).prefix("x_"), feature(node).prefix("y_")),
+            feature(node),
+            feature(node).lag(1).resample(node).fillna(),
+        ]
+
+        expected = tp.run(query, evset)
+        for num_threads in [1, 2]:
+            result = tp.run(
+                query, evset, optimize=True, num_threads=num_threads
+            )
+            self.assertEqual(result, expected)
+            self.assertIs(result[1].node(), query[1])
+
+    def test_run_optimize_fusion(self):
+        evset = tp.event_set(
+            timestamps=[1, 2, 3, 4, 5, 6],
+            features={
+                "a": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+                "b": [4.0, 3.0, 2.0, 1.0, 0.0, -1.0],
+                "c": [-1.0, 2.0, -3.0, 4.0, -5.0, 6.0],
+                "k": [1, 1, 2, 2, 3, 3],
+            },
+            indexes=["k"],
+        )
+        node = evset.node()
+        x = node["a"] + node["b"]
+        output = x * 2 - node["c"].abs()
+        query = [output, (x > 2) & ~(node["c"].isnan()), x.cumsum()]
+
+        schedule = evaluation.build_schedule(
+            inputs={node}, outputs=set(query), optimize=True
+        )
+        fused_steps = {
+            step.op: step.fused_ops for step in schedule.steps if step.fused_ops
+        }
+        self.assertLen(fused_steps, 2)
+        self.assertLen(fused_steps[output.creator], 2)
+
+        expected = tp.run(query, evset)
+        for num_index_threads in [1, 2]:
+            result = tp.run(
+                query,
+                evset,
+                optimize=True,
+                num_index_threads=num_index_threads,
+            )
+            self.assertEqual(result, expected)
+
+    def test_run_optimize_projection(self):
+        evset = tp.event_set(
+            timestamps=[1, 2, 3, 4, 5, 6],
+            features={
+                "a": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+                "b": [4.0, 3.0, 2.0, 1.0, 0.0, -1.0],
+                "c": [-1.0, 2.0, -3.0, 4.0, -5.0, 6.0],
+                "k": [1, 1, 2, 2, 1, 2],
+            },
+            is_unix_timestamp=True,
+        )
+        node = evset.node()
+        x = node.filter(node["a"] > 2).add_index("k")
+        query = [
+            x["b"].moving_sum(2),
+            x.drop_index("k")["c"],
+            x.calendar_hour(),
+        ]
+
+        self.assertEqual(
+            tp.required_features(query, node), ["a", "b", "c", "k"]
+        )
+        self.assertEqual(tp.required_features(query[0], node), ["a", "b", "k"])
+        self.assertEqual(tp.required_features(query[2], node), ["a", "k"])
+
+        expected = tp.run(query, evset)
+        self.assertEqual(tp.run(query, evset, optimize=True), expected)
+
+        # Only feed the required features.
+        partial_evset = tp.event_set(
+            timestamps=[1, 2, 3, 4, 5, 6],
+            features={
+                "k": [1, 1, 2, 2, 1, 2],
+                "a": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+                "b": [4.0, 3.0, 2.0, 1.0, 0.0, -1.0],
+            },
+            is_unix_timestamp=True,
+        )
+        self.assertEqual(
+            tp.run(query[0], {node: partial_evset}, optimize=True),
+            expected[0],
+        )
+        with self.assertRaisesRegex(ValueError, r"\['c'\] are needed"):
+            tp.run(query, {node: partial_evset}, optimize=True)
+
+    def test_run_compact(self):
+        evset = tp.event_set(
+            timestamps=[1, 2, 3, 4, 5, 6],
+            features={
+                "a": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+                "b": [4, 3, 2, 1, 0, -1],
+                "k": [1, 1, 2, 2, 1, 3],
+            },
+            indexes=["k"],
+        )
+        node = evset.node()
+        x = node["a"] * 2 + node["b"].cast(tp.float64)
+        query = [x.abs(), (x > 4).moving_count(2), node.lag(1)]
+
+        expected = tp.run(query, evset)
+        compact_evset = {node: evset.compact()}
+        for kwargs in [
+            {},
+            {"optimize": True},
+            {"num_index_threads": 2},
+            {"check_execution": "full"},
+        ]:
+            result = tp.run(query, compact_evset, **kwargs)
+            self.assertEqual(result, expected)
+
+        # Vectorized operators preserve the compact layout.
+        self.assertTrue(tp.run(query[0], compact_evset).is_compact())
+        self.assertTrue(
+            tp.run(query[0], compact_evset, optimize=True).is_compact()
+        )
+
     def test_has_leak(self):
         a = tp.input_node([("f", tp.float32)])
         b = a.moving_sum(5)
@@ -0,0 +1,210 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from absl.testing import absltest
+
+from temporian.core.graph import infer_graph
+from temporian.core.optimization import (
+    eliminate_common_subexpressions,
+    fuse_elementwise_operators,
+    push_down_projections,
+)
+import temporian as tp
+
+
+class OptimizationTest(absltest.TestCase):
+    def test_cse_identical_operators(self):
+        a = tp.input_node([("f", tp.float64), ("g", tp.int64)])
+        b1 = a["f"].moving_sum(5)
+        b2 = a["f"].moving_sum(5)
+
+        graph = infer_graph({a}, {b1, b2})
+        duplicates = eliminate_common_subexpressions(graph)
+
+        # The two "select" and the two "moving_sum" are identical.
+        self.assertLen(duplicates, 2)
+        self.assertIs(duplicates[b2.creator], b1.creator)
+
+    def test_cse_chained_operators(self):
+        a = tp.input_node([("f", tp.float64)])
+        b1 = a.moving_sum(5).prefix("x_").lag(1)
+        b2 = a.moving_sum(5).prefix("x_").lag(1)
+
+        graph = infer_graph({a}, {b1, b2})
+        duplicates = eliminate_common_subexpressions(graph)
+        self.assertLen(duplicates, 3)
+        self.assertIs(duplicates[b2.creator], b1.creator)
+
+    def test_cse_different_operators(self):
+        a = tp.input_node([("f", tp.float64)])
+        c = tp.input_node([("f", tp.float64)], same_sampling_as=a)
+        outputs = {
+            a.moving_sum(5),
+            a.moving_sum(6),
+            a.moving_max(5),
+            c.moving_sum(5),
+            a.map(lambda x: x + 1),
+            a.map(lambda x: x + 1),
+        }
+
+        graph = infer_graph({a, c}, outputs)
+        self.assertEqual(eliminate_common_subexpressions(graph), {})
+
+    def test_cse_same_function(self):
+        def fn(x):
+            return x + 1
+
+        a = tp.input_node([("f", tp.float64)])
+        b1 = a.map(fn)
+        b2 = a.map(fn)
+
+        graph = infer_graph({a}, {b1, b2})
+        self.assertEqual(
+            eliminate_common_subexpressions(graph), {b2.creator: b1.creator}
+        )
+
+    def test_cse_list_attributes(self):
+        a = tp.input_node([("f", tp.float64), ("g", tp.int64)])
+        b1 = a.rename({"f": "x", "g": "y"})
+        b2 = a.rename({"g": "y", "f": "x"})
+        b3 = a.rename({"f": "y", "g": "x"})
+
+        graph = infer_graph({a}, {b1, b2, b3})
+        self.assertEqual(
+            eliminate_common_subexpressions(graph), {b2.creator: b1.creator}
+        )
+
+    def test_fuse_elementwise_operators(self):
+        a = tp.input_node([("f", tp.float64), ("g", tp.float64)])
+        x = a["f"] + a["g"]
+        y = x * 2
+        z = a["f"].abs()
+        output = y - z
+
+        graph = infer_graph({a}, {output})
+        self.assertEqual(
+            fuse_elementwise_operators(graph, {}, {a, output}),
+            {output.creator: [x.creator, y.creator, z.creator]},
+        )
+
+    def test_fuse_elementwise_operators_shared_result(self):
+        a = tp.input_node([("f", tp.float64)])
+        x = a + 1
+        y = x * 2
+        z = x.moving_sum(2)
+        w = y.abs()
+
+        # "x" is used by a non element-wise operator.
+        graph = infer_graph({a}, {w, z})
+        self.assertEqual(
+            fuse_elementwise_operators(graph, {}, {a, w, z}),
+            {w.creator: [y.creator]},
+        )
+
+        # "y" is an output.
+        graph = infer_graph({a}, {w, y})
+        self.assertEqual(
+            fuse_elementwise_operators(graph, {}, {a, w, y}),
+            {y.creator: [x.creator]},
+        )
+
+    def test_push_down_projections(self):
+        a = tp.input_node(
+            [("f", tp.float64), ("g", tp.float64), ("k", tp.int64)]
+        )
+        b = a.add_index("k").resample(a.add_index("k")).drop_index()
+        output = b["f"] * 2
+
+        graph = infer_graph({a}, {output})
+        rewritten = push_down_projections(graph)
+
+        # All the operators except the "input" of "resample" and the final
+        # multiplication are re-created.
+        new_output = rewritten[output.creator].outputs["output"]
+        self.assertEqual(
+            new_output.schema.feature_names(), output.schema.feature_names()
+        )
+        new_graph = infer_graph({a}, {new_output})
+        for op in new_graph.operators:
+            if op.definition.key == "DROP_INDEX":
+                self.assertEqual(
+                    op.outputs["output"].schema.feature_names(), ["f", "k"]
+                )
+            if op.definition.key == "RESAMPLE":
+                self.assertEqual(
+                    op.inputs["input"].schema.feature_names(), ["f"]
+                )
+                self.assertEqual(
+                    op.inputs["sampling"].schema.feature_names(), []
+                )
+
+    def test_push_down_projections_unchanged(self):
+        a = tp.input_node([("f", tp.float64), ("g", tp.float64)])
+        output = a.moving_sum(2).filter(a["f"] > 0)
+
+        graph = infer_graph({a}, {output})
+        self.assertEqual(push_down_projections(graph), {})
+
+    def test_push_down_projections_partial_input(self):
+        a = tp.input_node([("f", tp.float64), ("g", tp.float64)])
+        partial_a = tp.input_node([("g", tp.float64)], same_sampling_as=a)
+        selection = a.lag(1)["g"]
+        output = selection.moving_sum(2)
+
+        graph = infer_graph({a}, {output})
+        rewritten = push_down_projections(graph, {a: partial_a})
+        new_lag = rewritten[selection.creator.inputs["input"].creator]
+        self.assertIs(new_lag.inputs["input"], partial_a)
+        # The selection of "g" is already done.
+        self.assertNotIn(selection.creator, rewritten)
+        self.assertIs(
+            rewritten[output.creator].inputs["input"],
+            new_lag.outputs["output"],
+        )
+
+        with self.assertRaisesRegex(ValueError, "are missing"):
+            push_down_projections(
+                graph,
+                {a: tp.input_node([("f", tp.float64)], same_sampling_as=a)},
+            )
+
+    def test_push_down_projections_map(self):
+        a = tp.input_node(
+            [("f", tp.float64), ("g", tp.float64), ("k", tp.int64)]
+        )
+        output = a.add_index("k")["f"].map(int, output_dtypes=tp.int32)
+
+        graph = infer_graph({a}, {output})
+        rewritten = push_down_projections(graph)
+        new_map = rewritten[output.creator]
+        self.assertEqual(new_map.outputs["output"].schema, output.schema)
+        self.assertEqual(new_map.inputs["input"].schema.feature_names(), ["f"])
+
+        full_evset = tp.event_set(
+            timestamps=[1, 2],
+            features={"f": [1.5, 2.5], "g": [3.0, 4.0], "k": [1, 1]},
+        )
+        partial_evset = tp.event_set(
+            timestamps=[1, 2], features={"f": [1.5, 2.5], "k": [1, 1]}
+        )
+        for evset in [full_evset, partial_evset]:
+            result = output.run({a: evset}, optimize=True)
+            self.assertEqual(result.schema, output.schema)
+            self.assertEqual(
+                result.get_index_value((1,)).features[0].tolist(), [1, 2]
+            )
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -0,0 +1,157 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import tempfile
+
+from absl.testing import absltest
+
+from temporian.core.profiler import ProfiledStep, Profiler
+from temporian.implementation.numpy.data.memory_usage import memory_usage
+import temporian as tp
+
+
+def _step(step_idx: int, operator_key: str, wall_time: float) -> ProfiledStep:
+    return ProfiledStep(
+        step_idx=step_idx,
+        operator_key=operator_key,
+        operator_id=step_idx,
+        begin_time=float(step_idx),
+        wall_time=wall_time,
+        cpu_time=wall_time,
+        thread_id=1,
+        num_index_keys=2,
+        num_input_events=10,
+        num_output_events=5,
+        output_num_bytes=40,
+        live_num_bytes=100,
+    )
+
+
+class ProfilerTest(absltest.TestCase):
+    def test_report(self):
+        profiler = Profiler()
+        profiler.record(_step(0, "LAG", 0.5))
+        profiler.record(_step(1, "MOVING_SUM", 2.0))
+        profiler.record(_step(2, "LAG", 1.0))
+
+        self.assertEqual(
+            profiler.to_dict()["operator_key"], ["LAG", "MOVING_SUM", "LAG"]
+        )
+        df = profiler.to_pandas()
+        self.assertLen(df, 3)
+        self.assertEqual(df["output_num_bytes"].sum(), 120)
+        self.assertEqual(
+            repr(profiler),
+            (
+                "Profiler with 3 steps:\n"
+                "    MOVING_SUM: 2.00000 s (1 steps)\n"
+                "    LAG: 1.50000 s (2 steps)"
+            ),
+        )
+
+    def test_chrome_trace(self):
+        profiler = Profiler()
+        profiler.record(_step(1, "LAG", 0.5))
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "trace.json")
+            profiler.save_chrome_trace(path)
+            with open(path, "r", encoding="utf-8") as f:
+                trace = json.load(f)
+
+        self.assertEqual(trace, profiler.to_chrome_trace())
+        (event,) = trace["traceEvents"]
+        self.assertEqual(event["name"], "LAG")
+        self.assertEqual(event["ph"], "X")
+        self.assertEqual(event["ts"], 1e6)
+        self.assertEqual(event["dur"], 0.5e6)
+        self.assertEqual(event["tid"], 1)
+        self.assertEqual(event["args"]["num_input_events"], 10)
+
+    def test_run(self):
+        evset = tp.event_set(
+            timestamps=[1, 2, 3, 4],
+            features={"a": [1.0, 2.0, 3.0, 4.0], "k": [1, 1, 2, 2]},
+            indexes=["k"],
+        )
+        node = evset.node()
+        output = node.moving_sum(2).filter(node["a"] > 1.5)
+
+        for num_threads in [1, 2]:
+            profiler = Profiler(live_memory=True)
+            tp.run(output, evset, profiler=profiler, num_threads=num_threads)
+
+            steps = sorted(profiler.steps, key=lambda step: step.step_idx)
+            self.assertEqual(
+                [step.operator_key for step in steps],
+                ["MOVING_SUM", "SELECT", "GREATER_SCALAR", "FILTER"],
+            )
+            moving_sum, select, _, filter = steps
+            for step in steps:
+                self.assertEqual(step.num_index_keys, 2)
+                self.assertGreaterEqual(step.wall_time, 0)
+                self.assertGreaterEqual(step.cpu_time, 0)
+                self.assertGreaterEqual(step.begin_time, 0)
+
+            self.assertEqual(moving_sum.num_input_events, 4)
+            self.assertEqual(moving_sum.num_output_events, 4)
+            # The timestamps are shared with the input.
+            self.assertEqual(moving_sum.output_num_bytes, 4 * 8)
+            # The selection does not allocate new values.
+            self.assertEqual(select.output_num_bytes, 0)
+            self.assertEqual(filter.num_input_events, 8)
+            self.assertEqual(filter.num_output_events, 3)
+            self.assertEqual(filter.output_num_bytes, 3 * 8 * 2)
+            # The input and the result of the moving sum are alive.
+            self.assertEqual(
+                moving_sum.live_num_bytes,
+                memory_usage([evset, evset.moving_sum(2)]).total,
+            )
+            self.assertGreater(filter.live_num_bytes, moving_sum.live_num_bytes)
+
+    def test_run_compact(self):
+        evset = tp.event_set(
+            timestamps=[1, 2, 3, 4],
+            features={"a": [1.0, 2.0, 3.0, 4.0], "k": [1, 1, 2, 2]},
+            indexes=["k"],
+        ).compact()
+        node = evset.node()
+        output = (node.moving_sum(2) > 2.5).filter(node["a"] > 1.5)
+
+        profiler = Profiler()
+        tp.run(output, evset, profiler=profiler)
+
+        steps = sorted(profiler.steps, key=lambda step: step.step_idx)
+        self.assertEqual(
+            [step.operator_key for step in steps],
+            [
+                "MOVING_SUM",
+                "GREATER_SCALAR",
+                "SELECT",
+                "GREATER_SCALAR",
+                "FILTER",
+            ],
+        )
+        # The views of the compact layout share the input buffers.
+        self.assertEqual(
+            [step.output_num_bytes for step in steps[:4]], [4 * 8, 4, 0, 4]
+        )
+        # The live memory is not recorded by default.
+        self.assertEqual([step.live_num_bytes for step in steps], [None] * 5)
+
+
+if __name__ == "__main__":
+    absltest.main()
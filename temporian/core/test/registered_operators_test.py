@@ -98,6 +98,7 @@ class RegisteredOperatorsTest(absltest.TestCase):
             "TICK",
             "TICK_CALENDAR",
             "TIMESTAMPS",
+            "TIME_RANGE",
             "UNIQUE_TIMESTAMPS",
             "UNTIL_NEXT",
             "WHERE",
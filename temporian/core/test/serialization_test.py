@@ -21,6 +21,7 @@ from typing import Dict
 
 from absl import logging
 from absl.testing import absltest
+import numpy as np
 import temporian as tp
 from temporian.core import serialization
 from temporian.core import graph
@@ -312,6 +313,55 @@ class SerializationTest(absltest.TestCase):
 
         self.assertEqual(result, loaded_result)
 
+    def test_save_and_load_narrow_dtypes(self):
+        @tp.compile
+        def f(x: EventSetOrNode):
+            return {"output": x.moving_sum(2.0)}
+
+        evset = tp.event_set(
+            timestamps=[1, 2, 3],
+            features={
+                "a": np.array([1, 2, 3], dtype=np.int8),
+                "b": np.array([4, 5, 6], dtype=np.uint32),
+                "c": np.array([0.5, 1.0, 1.5], dtype=np.float16),
+            },
+        )
+        result = f(evset)
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "my_fn.tem")
+            tp.save(f, path, x=evset.schema)
+            inputs, outputs = tp.load_graph(path=path)
+
+        self.assertEqual(
+            inputs["x"].schema.feature_dtypes(),
+            [DType.INT8, DType.UINT32, DType.FLOAT16],
+        )
+        loaded_result = tp.run(outputs, {inputs["x"]: evset})
+        self.assertEqual(result, loaded_result)
+
+    def test_save_and_load_timestamp_unit(self):
+        @tp.compile
+        def f(x: EventSetOrNode):
+            return {"output": x.moving_sum(1.0)}
+
+        evset = tp.event_set(
+            timestamps=[1, 2, 1000],
+            features={"a": [1, 2, 3]},
+            timestamp_unit="ms",
+        )
+        result = f(evset)
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "my_fn.tem")
+            tp.save(f, path, x=evset.schema)
+            inputs, outputs = tp.load_graph(path=path)
+
+        self.assertEqual(inputs["x"].schema, evset.schema)
+        self.assertEqual(inputs["x"].schema.timestamp_unit.value, "ms")
+        loaded_result = tp.run(outputs, {inputs["x"]: evset})
+        self.assertEqual(result, loaded_result)
+
     def test_save_and_load_many_inputs(self):
         @tp.compile
         def f(x: EventSetOrNode, y: EventSetOrNode, z: EventSetOrNode):
@@ -28,8 +28,8 @@ from temporian.core.typing import (
     NodeToEventSetMapping,
     WindowLength,
 )
-from temporian.core.dataclasses import MapExtras
-from temporian.core.operators.map import MapFunction
+from temporian.core.dataclasses import MapExtras, VectorizedMapExtras
+from temporian.core.operators.map import MapFunction, VectorizedMapFunction
 
 # Add all the types that are part of the public API and should be shown in docs.
 __all__ = [
@@ -43,4 +43,6 @@ __all__ = [
     "NodeToEventSetMapping",
     "WindowLength",
     "MapFunction",
+    "VectorizedMapExtras",
+    "VectorizedMapFunction",
 ]
@@ -95,10 +95,11 @@ If receiving a single IndexKey, it is equivalent to receiving a list with a
 single IndexKey.
 """
 
-WindowLength = Union[Duration, EventSetOrNode]
+WindowLength = Union[Duration, List[Duration], EventSetOrNode]
 """Window length of a moving window operator.
 
-A window length can be either constant or variable.
+A window length can be either constant, variable, or a list of constant window
+lengths.
 
 A constant window length is specified with a
 [Duration][temporian.duration.Duration]. For example, `window_length=5.0` or
@@ -112,6 +113,13 @@ on each timestamp will dictate the length of the window in that timestamp.
 
 If an `EventSet`, it should contain strictly positive values. If receiving 0,
 negative values, or missing values, the operator will treat the window as empty.
+
+Several constant window lengths are specified with a list of
+[Durations][temporian.duration.Duration]. For example,
+`window_length=[tp.duration.minutes(1), tp.duration.hours(1)]`. The operator
+is computed for all the window lengths at once, and outputs one feature for each
+input feature and each window length. The output features are suffixed with the
+window length, e.g. feature `"a"` becomes `"a_60"` and `"a_3600"`.
 """
 
 Scalar = Union[int, float, str, bytes, bool]
@@ -0,0 +1,258 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Dictionary-encoded string arrays."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, List, Tuple, Union
+
+import numpy as np
+
+
+class DictionaryArray(np.lib.mixins.NDArrayOperatorsMixin):
+    """One-dimensional array of strings stored as integer codes in a
+    vocabulary.
+
+    A DictionaryArray can be used in place of a NumPy array of bytes for the
+    values of a string feature (i.e., with dtype `tp.str_`). The memory usage
+    of a fixed-width NumPy bytes array grows with the length of the longest
+    value, while a DictionaryArray stores each distinct value once.
+
+    Selecting values (e.g., `array[mask]`) returns a DictionaryArray sharing
+    the same vocabulary. The `equal`, `not_equal`, `add_index`, `drop_index`,
+    `filter` and `join` operators work on the codes directly. Other operations
+    (e.g., `np.asarray(array)`) decode the values into a NumPy bytes array.
+
+    Attributes:
+        codes: One-dimensional int32 or int64 NumPy array. Index of each value
+            in `vocabulary`.
+        vocabulary: One-dimensional NumPy array of distinct bytes values.
+
+    Usage example:
+        ```python
+        >>> values = tp.DictionaryArray.encode(["red", "blue", "red"])
+        >>> values.codes
+        array([1, 0, 1], dtype=int32)
+        >>> values.vocabulary
+        array([b'blue', b'red'], dtype='|S4')
+        >>> evset = tp.event_set(
+        ...     timestamps=[1, 2, 3],
+        ...     features={"color": values},
+        ... )
+        >>> evset.filter(evset["color"].equal("red"))
+        indexes: []
+        features: [('color', str_)]
+        events:
+            (2 events):
+                timestamps: [1. 3.]
+                'color': [b'red' b'red']
+        ...
+
+        ```
+    """
+
+    def __init__(self, codes: np.ndarray, vocabulary: np.ndarray) -> None:
+        if codes.dtype.type not in [np.int32, np.int64]:
+            codes = codes.astype(np.int32)
+        self.codes = codes
+        self.vocabulary = vocabulary
+
+    @classmethod
+    def encode(cls, values: Any) -> DictionaryArray:
+        """Creates a DictionaryArray from a list or an array of strings.
+
+        Str values are encoded in UTF-8. The vocabulary is sorted.
+        """
+
+        values = np.asarray(values)
+        if values.dtype.type in [np.str_, np.object_]:
+            values = np.char.encode(values.astype(np.str_), "UTF-8")
+        vocabulary, codes = np.unique(values, return_inverse=True)
+        return cls(codes.astype(np.int32), vocabulary)
+
+    def decode(self) -> np.ndarray:
+        """Converts the values into a NumPy bytes array."""
+
+        return self.vocabulary[self.codes]
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.vocabulary.dtype
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.codes.shape
+
+    @property
+    def ndim(self) -> int:
+        return self.codes.ndim
+
+    @property
+    def size(self) -> int:
+        return self.codes.size
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + self.vocabulary.nbytes
+
+    def astype(self, dtype: Any, copy: bool = True) -> np.ndarray:
+        return self.decode().astype(dtype, copy=False)
+
+    def copy(self) -> DictionaryArray:
+        return DictionaryArray(self.codes.copy(), self.vocabulary)
+
+    def tolist(self) -> List[bytes]:
+        return self.decode().tolist()
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray:
+        values = self.decode()
+        if dtype is not None:
+            values = values.astype(dtype, copy=False)
+        return values
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if (
+            method == "__call__"
+            and ufunc in [np.equal, np.not_equal]
+            and len(inputs) == 2
+            and not kwargs
+        ):
+            result = equal(*inputs)
+            return result if ufunc is np.equal else ~result
+
+        inputs = tuple(
+            x.decode() if isinstance(x, DictionaryArray) else x for x in inputs
+        )
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def __getitem__(self, item: Any) -> Union[DictionaryArray, np.bytes_]:
+        codes = self.codes[item]
+        if codes.ndim == 0:
+            return self.vocabulary[codes]
+        return DictionaryArray(codes, self.vocabulary)
+
+    def __iter__(self):
+        return iter(self.decode())
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __sizeof__(self) -> int:
+        return (
+            object.__sizeof__(self)
+            + sys.getsizeof(self.codes)
+            + sys.getsizeof(self.vocabulary)
+        )
+
+    def __str__(self) -> str:
+        return str(self.decode())
+
+    def __repr__(self) -> str:
+        return (
+            f"DictionaryArray(codes={self.codes!r},"
+            f" vocabulary={self.vocabulary!r})"
+        )
+
+
+def lookup(vocabulary: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Index of each value in a vocabulary, or -1 if the value is missing."""
+
+    if len(vocabulary) == 0:
+        return np.full(len(values), -1, dtype=np.int64)
+    sorter = np.argsort(vocabulary)
+    positions = np.searchsorted(vocabulary, values, sorter=sorter)
+    positions = sorter[np.minimum(positions, len(vocabulary) - 1)]
+    return np.where(vocabulary[positions] == values, positions, -1)
+
+
+def shared_codes(
+    a: Union[np.ndarray, DictionaryArray],
+    b: Union[np.ndarray, DictionaryArray],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Integer codes of two string arrays in a common vocabulary.
+
+    Two values are equal iff. they have the same code. The work is
+    proportional to the size of the vocabularies if both arrays are
+    dictionary-encoded, and to the number of values otherwise.
+    """
+
+    if isinstance(a, DictionaryArray) and isinstance(b, DictionaryArray):
+        if a.vocabulary is b.vocabulary:
+            return a.codes, b.codes
+        return a.codes, lookup(a.vocabulary, b.vocabulary)[b.codes]
+
+    if isinstance(a, DictionaryArray):
+        return a.codes, lookup(a.vocabulary, b)
+
+    if isinstance(b, DictionaryArray):
+        return lookup(b.vocabulary, a), b.codes
+
+    _, codes = np.unique(np.concatenate([a, b]), return_inverse=True)
+    return codes[: len(a)], codes[len(a) :]
+
+
+def equal(
+    a: Union[np.ndarray, DictionaryArray],
+    b: Union[np.ndarray, DictionaryArray, bytes, str],
+) -> np.ndarray:
+    """Element-wise equality of string arrays, or of a string array and a
+    string."""
+
+    if isinstance(a, (str, bytes)):
+        a, b = b, a
+    if isinstance(b, str):
+        b = b.encode()
+
+    if isinstance(b, bytes):
+        if not isinstance(a, DictionaryArray):
+            return np.char.equal(a, b)
+        code = lookup(a.vocabulary, np.array([b]))[0]
+        return a.codes == code
+
+    if not isinstance(a, DictionaryArray) and not isinstance(
+        b, DictionaryArray
+    ):
+        return np.char.equal(a, b)
+
+    codes_a, codes_b = shared_codes(a, b)
+    return np.equal(codes_a, codes_b)
+
+
+def concatenate(
+    arrays: List[Union[np.ndarray, DictionaryArray]]
+) -> Union[np.ndarray, DictionaryArray]:
+    """Concatenates arrays.
+
+    If all the arrays are dictionary-encoded, the result is a DictionaryArray
+    with the union of the vocabularies.
+    """
+
+    if not arrays or not all(isinstance(x, DictionaryArray) for x in arrays):
+        return np.concatenate(arrays)
+
+    vocabulary = arrays[0].vocabulary
+    if all(x.vocabulary is vocabulary for x in arrays):
+        return DictionaryArray(
+            np.concatenate([x.codes for x in arrays]), vocabulary
+        )
+
+    vocabulary = np.unique(np.concatenate([x.vocabulary for x in arrays]))
+    return DictionaryArray(
+        np.concatenate(
+            [lookup(vocabulary, x.vocabulary)[x.codes] for x in arrays]
+        ),
+        vocabulary,
+    )
@@ -58,6 +58,7 @@ def display_html(evset: EventSet) -> str:
 
     # Other configs
     convert_datetime = evset.schema.is_unix_timestamp
+    timestamp_unit = evset.schema.timestamp_unit
     feature_schemas = evset.schema.features
     all_index_keys = evset.get_index_keys(sort=True)
     num_indexes = len(all_index_keys)
@@ -130,11 +131,18 @@ def display_html(evset: EventSet) -> str:
             row = []
 
             # Timestamp column
-            timestamp_repr = (
-                convert_timestamp_to_datetime(timestamp)
-                if convert_datetime
-                else repr_float_html(timestamp)
-            )
+            if timestamp_unit is not None:
+                timestamp_repr = (
+                    np.datetime64(int(timestamp), timestamp_unit.value)
+                    if convert_datetime
+                    else timestamp
+                )
+            else:
+                timestamp_repr = (
+                    convert_timestamp_to_datetime(timestamp)
+                    if convert_datetime
+                    else repr_float_html(timestamp)
+                )
             row.append(f"{timestamp_repr}")
 
             # Feature values
@@ -388,7 +396,11 @@ def display_text(evset: EventSet) -> str:
             timestamps = index_data.timestamps
             if evset.schema.is_unix_timestamp:
                 # Print datetimes
-                timestamps = timestamps.astype("datetime64[s]")
+                timestamps = timestamps.astype(
+                    "datetime64[s]"
+                    if evset.schema.timestamp_unit is None
+                    else f"datetime64[{evset.schema.timestamp_unit.value}]"
+                )
             data_repr.append(
                 f"{index_key_repr} ({len(timestamps)} events):\n"
                 "    timestamps:"
@@ -21,8 +21,14 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 import numpy as np
 
 from temporian.core.data.dtype import PY_TYPE_TO_DTYPE, DType
-from temporian.core.data.duration_utils import datetime64_array_to_float64
+from temporian.core.data.duration_utils import (
+    TimestampUnit,
+    datetime64_array_to_float64,
+)
 from temporian.core.data.node import EventSetNode
+from temporian.implementation.numpy.data.dictionary_array import (
+    DictionaryArray,
+)
 
 if TYPE_CHECKING:
     from temporian.core.typing import (
@@ -45,6 +51,13 @@ _DTYPE_MAPPING = {
     np.float32: DType.FLOAT32,
     np.int64: DType.INT64,
     np.int32: DType.INT32,
+    np.int16: DType.INT16,
+    np.int8: DType.INT8,
+    np.uint64: DType.UINT64,
+    np.uint32: DType.UINT32,
+    np.uint16: DType.UINT16,
+    np.uint8: DType.UINT8,
+    np.float16: DType.FLOAT16,
     np.str_: DType.STRING,
     np.bytes_: DType.STRING,
     np.bool_: DType.BOOLEAN,
@@ -55,6 +68,13 @@ _DTYPE_REVERSE_MAPPING = {
     DType.FLOAT32: np.float32,
     DType.INT64: np.int64,
     DType.INT32: np.int32,
+    DType.INT16: np.int16,
+    DType.INT8: np.int8,
+    DType.UINT64: np.uint64,
+    DType.UINT32: np.uint32,
+    DType.UINT16: np.uint16,
+    DType.UINT8: np.uint8,
+    DType.FLOAT16: np.float16,
     DType.STRING: np.bytes_,
     DType.BOOLEAN: np.bool_,
 }
@@ -122,8 +142,19 @@ def normalize_features(
         """Encode string/object/bytes to np.bytes, using UTF-8 encoding"""
         return np.char.encode(feat_array, "UTF-8")
 
+    if isinstance(feature_values, DictionaryArray):
+        logging.debug("From DictionaryArray")
+        return feature_values
+
     # Convert pandas, list, tuples -> np.ndarray
-    if str(type(feature_values)) == "<class 'pandas.core.series.Series'>":
+    if str(
+        type(feature_values)
+    ) == "<class 'pandas.core.series.Series'>" and _is_string_categorical(
+        feature_values
+    ):
+        logging.debug("From categorical pandas.Series")
+        return _categorical_to_dictionary_array(feature_values)
+    elif str(type(feature_values)) == "<class 'pandas.core.series.Series'>":
         logging.debug("From pandas.Series")
         if feature_values.dtype == "object":
             feature_values = feature_values.fillna("")
@@ -168,27 +199,73 @@ def normalize_features(
     return feature_values
 
 
+def _is_string_categorical(series: "pandas.Series") -> bool:
+    """Tests if a Pandas Series is categorical with string categories."""
+
+    if series.dtype.name != "category":
+        return False
+    categories = series.cat.categories
+    return categories.dtype == "object" or categories.dtype.kind in "SU"
+
+
+def _categorical_to_dictionary_array(
+    series: "pandas.Series",
+) -> DictionaryArray:
+    """Converts a categorical Pandas Series into a DictionaryArray.
+
+    Missing values are converted to empty strings.
+    """
+
+    vocabulary = np.char.encode(
+        series.cat.categories.to_numpy().astype(np.str_), "UTF-8"
+    )
+    codes = series.cat.codes.to_numpy().astype(np.int32)
+    missing = codes < 0
+    if missing.any():
+        empty_code = np.flatnonzero(vocabulary == b"")
+        if len(empty_code) > 0:
+            codes[missing] = empty_code[0]
+        else:
+            codes[missing] = len(vocabulary)
+            vocabulary = np.append(vocabulary, b"")
+    return DictionaryArray(codes, vocabulary)
+
+
 def normalize_timestamps(
     values: Any,
+    copy: bool = True,
+    timestamp_unit: Optional[TimestampUnit] = None,
 ) -> Tuple[np.ndarray, bool]:
     """Normalizes timestamps to temporian format.
 
     Keep this function in sync with the documentation of "io.event_set".
 
+    Args:
+        values: Timestamps.
+        copy: If false, numpy float64 timestamps (or int64 timestamps if
+            `timestamp_unit` is set) are returned as is instead of being
+            copied.
+        timestamp_unit: If set, the timestamps are normalized to int64 numbers
+            of this unit instead of float64 numbers of seconds.
+
     Returns:
-        Normalized timestamps (numpy float64 of unix epoch in seconds) and if
-        the raw timestamps look like a unix epoch.
+        Normalized timestamps (numpy float64 of unix epoch in seconds, or numpy
+        int64 of unix epoch in `timestamp_unit`) and if the raw timestamps look
+        like a unix epoch.
     """
 
     # Convert to numpy array
     if not isinstance(values, np.ndarray):
         values = np.array(values)
 
+    if timestamp_unit is not None:
+        return _normalize_int64_timestamps(values, copy, timestamp_unit)
+
     # values is represented as a number. Copy and cast to float64.
     if np.issubdtype(values.dtype, np.integer) or np.issubdtype(
         values.dtype, np.floating
     ):
-        values = values.astype(np.float64, copy=True)
+        values = values.astype(np.float64, copy=copy)
 
     if values.dtype.type == np.float64:
         # Check NaN
@@ -212,6 +289,46 @@ def normalize_timestamps(
     )
 
 
+def _normalize_int64_timestamps(
+    values: np.ndarray, copy: bool, timestamp_unit: TimestampUnit
+) -> Tuple[np.ndarray, bool]:
+    """Normalizes timestamps to int64 numbers of `timestamp_unit`.
+
+    Numbers are interpreted as numbers of `timestamp_unit`. Dates are converted
+    without loss of precision.
+    """
+
+    if np.issubdtype(values.dtype, np.integer):
+        return values.astype(np.int64, copy=copy), False
+
+    if np.issubdtype(values.dtype, np.floating):
+        if not np.isfinite(values).all():
+            raise ValueError("Timestamps contain NaN or infinite values.")
+        if (values != np.round(values)).any():
+            raise ValueError(
+                "Timestamps with a timestamp unit should be integers. Instead"
+                " got non integer float values."
+            )
+        return values.astype(np.int64), False
+
+    if values.dtype.type in [np.str_, np.bytes_, np.object_]:
+        # Raises ValueError if cannot parse a value
+        values = values.astype("datetime64[ns]")
+
+    if values.dtype.type == np.datetime64:
+        if np.isnat(values).any():
+            raise ValueError(
+                "Timestamps contain null/NaT values, which are not supported."
+            )
+        values = values.astype(f"datetime64[{timestamp_unit.value}]")
+        return values.view(np.int64), True
+
+    raise ValueError(
+        f"Invalid timestamps array dtype={values.dtype}."
+        " Supported types are: integers, floating point, strings or objects."
+    )
+
+
 def normalize_index_key_list(
     indexes: Optional[IndexKeyList],
     available_indexes: Optional[List[IndexKey]] = None,
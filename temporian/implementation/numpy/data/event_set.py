@@ -14,21 +14,26 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import (
     Any,
     Dict,
+    Iterator,
     List,
     Optional,
     TYPE_CHECKING,
+    Union,
 )
 import sys
 
 import numpy as np
+from temporian.implementation.numpy.data import dictionary_array
 from temporian.implementation.numpy.data.dtype_normalization import (
     _DTYPE_REVERSE_MAPPING,
     normalize_index_key,
 )
+from temporian.implementation.numpy.data.key_index import KeyIndex
 
 from temporian.utils import config
 from temporian.core.data.node import (
@@ -41,6 +46,7 @@ from temporian.core.event_set_ops import EventSetOperations
 if TYPE_CHECKING:
     from temporian.core.typing import IndexKey, NormalizedIndexKey
     from temporian.core.operators.base import Operator
+    from temporian.implementation.numpy.data.memory_usage import MemoryUsage
 
 
 @dataclass
@@ -91,6 +97,11 @@ class IndexData:
         if schema is not None:
             self.check_schema(schema)
 
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # With pickle protocol 5, NumPy arrays are pickled out-of-band (see
+        # `pickle.PickleBuffer`).
+        return IndexData, (self.features, self.timestamps)
+
     def check_schema(self, schema: Schema):
         if not config.debug_mode:
             return
@@ -100,8 +111,14 @@ class IndexData:
         if self.timestamps.ndim != 1:
             raise ValueError("timestamps must be one-dimensional arrays")
 
-        if self.timestamps.dtype.type != np.float64:
-            raise ValueError("Timestamps should be float64")
+        expected_timestamp_dtype = _DTYPE_REVERSE_MAPPING[
+            schema.timestamp_dtype
+        ]
+        if self.timestamps.dtype.type != expected_timestamp_dtype:
+            raise ValueError(
+                f"Timestamps should be {expected_timestamp_dtype.__name__}."
+                f" Instead got {self.timestamps.dtype}."
+            )
 
         if len(self.features) != len(schema.features):
             raise ValueError(
@@ -155,6 +172,160 @@ class IndexData:
         return len(self.timestamps)
 
 
+class CompactData(Mapping):
+    """Features and timestamps data of all the index keys of an EventSet,
+    stored in contiguous arrays.
+
+    The events of the i-th index key are the events `offsets[i]` (included) to
+    `offsets[i+1]` (excluded) of `timestamps` and `features`. Accessing an
+    index key (e.g., `data[index_key]`) returns an
+    [`IndexData`][temporian.IndexData] whose arrays are views (i.e., not
+    copies) of the contiguous arrays.
+
+    Compared to a dictionary of IndexData, the compact layout has a small
+    memory overhead per index key, and operators supporting it process all the
+    index keys in a single vectorized call. The compact layout is read-only.
+
+    Attributes:
+        index_keys: Index keys, in order.
+        offsets: One-dimensional int64 NumPy array with `len(index_keys) + 1`
+            values. Offset of the events of each index key in `timestamps` and
+            `features`.
+        timestamps: One-dimensional NumPy array containing the timestamps of
+            all the index keys.
+        features: List of one-dimensional NumPy arrays containing the feature
+            values of all the index keys.
+
+    Usage example:
+        ```python
+        >>> evset = tp.event_set(
+        ...     timestamps=[1, 2, 3, 4],
+        ...     features={"f": [10, 11, 12, 13], "k": [1, 2, 1, 2]},
+        ...     indexes=["k"],
+        ... ).compact()
+        >>> evset.data.index_keys
+        [(2,), (1,)]
+        >>> evset.data.offsets
+        array([0, 2, 4])
+        >>> evset.data.features
+        [array([11, 13, 10, 12])]
+        >>> evset.data[(2,)]
+        IndexData(features=[array([11, 13])], timestamps=array([2., 4.]))
+
+        ```
+    """
+
+    def __init__(
+        self,
+        index_keys: List[NormalizedIndexKey],
+        offsets: np.ndarray,
+        timestamps: np.ndarray,
+        features: List[np.ndarray],
+        _key_to_idx: Optional[Dict[NormalizedIndexKey, int]] = None,
+    ) -> None:
+        self.index_keys = index_keys
+        self.offsets = offsets
+        self.timestamps = timestamps
+        self.features = features
+
+        # Position of each index key in "index_keys". Shared by the CompactData
+        # with the same index keys.
+        if _key_to_idx is None:
+            _key_to_idx = {key: idx for idx, key in enumerate(index_keys)}
+        self._key_to_idx = _key_to_idx
+
+    @classmethod
+    def from_index_data(
+        cls, data: Mapping[NormalizedIndexKey, IndexData], schema: Schema
+    ) -> CompactData:
+        """Copies a mapping of index keys to IndexData into a CompactData."""
+
+        values = list(data.values())
+        offsets = np.zeros(len(values) + 1, dtype=np.int64)
+        np.cumsum([len(value.timestamps) for value in values], out=offsets[1:])
+
+        def concatenate(arrays: List[np.ndarray], dtype: Any) -> np.ndarray:
+            if not arrays:
+                return np.array([], dtype=dtype)
+            return dictionary_array.concatenate(arrays)
+
+        return cls(
+            index_keys=list(data.keys()),
+            offsets=offsets,
+            timestamps=concatenate(
+                [value.timestamps for value in values],
+                _DTYPE_REVERSE_MAPPING[schema.timestamp_dtype],
+            ),
+            features=[
+                concatenate(
+                    [value.features[feature_idx] for value in values],
+                    _DTYPE_REVERSE_MAPPING[feature.dtype],
+                )
+                for feature_idx, feature in enumerate(schema.features)
+            ],
+        )
+
+    def with_features(self, features: List[np.ndarray]) -> CompactData:
+        """Creates a CompactData with the same index keys and timestamps, and
+        different features.
+
+        No data is copied.
+        """
+
+        return CompactData(
+            index_keys=self.index_keys,
+            offsets=self.offsets,
+            timestamps=self.timestamps,
+            features=features,
+            _key_to_idx=self._key_to_idx,
+        )
+
+    def has_same_layout(self, other: CompactData) -> bool:
+        """Tests if two CompactData have the same index keys in the same order,
+        and the same number of events for each index key.
+
+        In this case, the i-th value of the features of both CompactData
+        belong to the same index key.
+        """
+
+        return self._key_to_idx is other._key_to_idx and (
+            self.offsets is other.offsets
+            or np.array_equal(self.offsets, other.offsets)
+        )
+
+    def __getitem__(self, index_key: NormalizedIndexKey) -> IndexData:
+        idx = self._key_to_idx[index_key]
+        begin = int(self.offsets[idx])
+        end = int(self.offsets[idx + 1])
+        return IndexData(
+            features=[feature[begin:end] for feature in self.features],
+            timestamps=self.timestamps[begin:end],
+        )
+
+    def __contains__(self, index_key: Any) -> bool:
+        return index_key in self._key_to_idx
+
+    def __iter__(self) -> Iterator[NormalizedIndexKey]:
+        return iter(self.index_keys)
+
+    def __len__(self) -> int:
+        return len(self.index_keys)
+
+    def __sizeof__(self) -> int:
+        size = (
+            object.__sizeof__(self)
+            + sys.getsizeof(self.index_keys)
+            + sys.getsizeof(self._key_to_idx)
+            + sys.getsizeof(self.offsets)
+            + sys.getsizeof(self.timestamps)
+        )
+        for index_key in self.index_keys:
+            size += sys.getsizeof(index_key)
+        for feature in self.features:
+            size += sys.getsizeof(feature)
+        return size
+
+
 class EventSet(EventSetOperations):
     """Actual temporal data.
 
@@ -179,6 +350,9 @@ class EventSet(EventSetOperations):
         # EventSetNode created when "self.node()" is called.
         self._internal_node: Optional[EventSetNode] = None
 
+        # Index of the index keys created when "self._key_index()" is called.
+        self._internal_key_index: Optional[KeyIndex] = None
+
     @property
     def data(self) -> Dict[NormalizedIndexKey, IndexData]:
         return self._data
@@ -196,8 +370,33 @@ class EventSet(EventSetOperations):
         self._name = name
 
     def get_index_keys(self, sort: bool = False) -> List[NormalizedIndexKey]:
-        idx_list = list(self.data.keys())
-        return sorted(idx_list) if sort else idx_list
+        if not sort:
+            return list(self.data.keys())
+        key_index = self._key_index()
+        return [
+            key_index.keys[position]
+            for position in key_index.sorted_positions().tolist()
+        ]
+
+    def _key_index(self) -> KeyIndex:
+        """Vectorized index of the index keys.
+
+        The KeyIndex is created on the first call, and kept until index keys
+        are added with `set_index_value`. Index keys added directly to `data`
+        are detected by the number of index keys.
+        """
+
+        if self._internal_key_index is None or len(
+            self._internal_key_index
+        ) != len(self._data):
+            self._internal_key_index = KeyIndex(
+                list(self._data.keys()),
+                [
+                    _DTYPE_REVERSE_MAPPING[index.dtype]
+                    for index in self._schema.indexes
+                ],
+            )
+        return self._internal_key_index
 
     def get_arbitrary_index_key(self) -> Optional[IndexKey]:
         """Gets an arbitrary index key.
@@ -281,7 +480,10 @@ class EventSet(EventSetOperations):
 
         if normalize:
             index_key = normalize_index_key(index_key)
-        self.data[index_key] = value
+        if index_key not in self._data:
+            # The index keys change.
+            self._internal_key_index = None
+        self._data[index_key] = value
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, EventSet):
@@ -315,6 +517,8 @@ class EventSet(EventSetOperations):
         return plotter.plot(evsets=self, *args, **wargs)
 
     def __sizeof__(self) -> int:
+        if isinstance(self.data, CompactData):
+            return sys.getsizeof(self.data)
         size = sys.getsizeof(self.data)
         for index_key, index_data in self.data.items():
             size += sys.getsizeof(index_key) + sys.getsizeof(
@@ -324,17 +528,136 @@ class EventSet(EventSetOperations):
                 size += sys.getsizeof(feature)
         return size
 
-    def memory_usage(self) -> int:
+    def memory_usage(self, deep: bool = False) -> Union[int, MemoryUsage]:
         """Gets the approximated memory usage of the EventSet in bytes.
 
-        Takes into account garbage collector overhead.
+        If `deep=False` (default), returns the sum of the sizes of the arrays
+        and index keys of the EventSet. Takes into account garbage collector
+        overhead.
+
+        If `deep=True`, returns a [`tp.MemoryUsage`][temporian.MemoryUsage]
+        with the memory used by the timestamps, the features, the index keys
+        and the Python objects of the EventSet. Buffers shared by several
+        arrays (e.g., the views of the compact layout) are counted once.
+
+        Usage example:
+            ```python
+            >>> evset = tp.event_set(
+            ...     timestamps=[1, 2, 3],
+            ...     features={"f": [1.0, 2.0, 3.0]},
+            ... ).compact()
+            >>> usage = evset.memory_usage(deep=True)
+            >>> usage.timestamps, usage.features
+            (24, 24)
+            >>> usage.total > 48
+            True
+
+            ```
+
+        Args:
+            deep: If true, returns a breakdown of the memory usage, without
+                counting shared buffers twice.
+
+        Returns:
+            Number of bytes, or a `tp.MemoryUsage` if `deep=True`.
         """
 
+        if deep:
+            from temporian.implementation.numpy.data import memory_usage
+
+            return memory_usage.memory_usage([self])
+
         return sys.getsizeof(self)
 
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        """Pickles the EventSet as a few contiguous arrays.
+
+        The data is pickled in the compact layout (see
+        [`EventSet.compact()`][temporian.EventSet.compact]): One array for the
+        timestamps, one array per feature, and one array or list per index.
+        With pickle protocol 5, the arrays are transferred out-of-band (see
+        `pickle.PickleBuffer`), e.g., without copy to shared memory.
+
+        An EventSet not in the compact layout is unpickled with its original
+        layout, its IndexData being views of the unpickled arrays. The
+        EventSetNode of the EventSet (see
+        [`EventSet.node()`][temporian.EventSet.node]) is not pickled.
+        """
+
+        data = self._data
+        if not isinstance(data, CompactData):
+            data = CompactData.from_index_data(data, self._schema)
+
+        index_keys = data.index_keys
+        index_columns: List[Any] = []
+        for index_idx, index in enumerate(self._schema.indexes):
+            column = [index_key[index_idx] for index_key in index_keys]
+            if index.dtype.is_integer:
+                column = np.array(
+                    column, dtype=_DTYPE_REVERSE_MAPPING[index.dtype]
+                )
+            index_columns.append(column)
+
+        return _unpickle_event_set, (
+            self._schema,
+            self._name,
+            self.is_compact(),
+            index_columns,
+            data.offsets,
+            data.timestamps,
+            data.features,
+        )
+
+    def compact(self) -> EventSet:
+        """Converts the EventSet into the compact layout.
+
+        In the compact layout, the timestamps and the values of each feature
+        of all the index keys are stored in contiguous arrays (see
+        [`tp.CompactData`][temporian.CompactData]). This layout reduces the
+        memory overhead of EventSets with many index keys, and some operators
+        (e.g., arithmetic operators) process it in a single vectorized call.
+
+        If the EventSet is already compact, returns the EventSet itself.
+
+        Usage example:
+            ```python
+            >>> evset = tp.event_set(
+            ...     timestamps=[1, 2, 3, 4],
+            ...     features={"f": [10, 11, 12, 13], "k": [1, 2, 1, 2]},
+            ...     indexes=["k"],
+            ... )
+            >>> compact_evset = evset.compact()
+            >>> compact_evset.is_compact()
+            True
+
+            ```
+
+        Returns:
+            EventSet with the same data in the compact layout.
+        """
+
+        if self.is_compact():
+            return self
+        return EventSet(
+            data=CompactData.from_index_data(self._data, self._schema),
+            schema=self._schema,
+            name=self._name,
+        )
+
+    def is_compact(self) -> bool:
+        """Tests if the EventSet is stored in the compact layout.
+
+        See [`EventSet.compact()`][temporian.EventSet.compact].
+        """
+
+        return isinstance(self._data, CompactData)
+
     def num_events(self) -> int:
         """Total number of events."""
 
+        if isinstance(self._data, CompactData):
+            return len(self._data.timestamps)
+
         count = 0
         for data in self.data.values():
             count += len(data.timestamps)
@@ -368,3 +691,39 @@ class EventSet(EventSetOperations):
         )
 
         return display_html(self)
+
+
+def _unpickle_event_set(
+    schema: Schema,
+    name: Optional[str],
+    is_compact: bool,
+    index_columns: List[Any],
+    offsets: np.ndarray,
+    timestamps: np.ndarray,
+    features: List[np.ndarray],
+) -> EventSet:
+    """Creates an EventSet pickled with `EventSet.__reduce_ex__`."""
+
+    if index_columns:
+        index_keys = list(
+            zip(
+                *[
+                    column.tolist()
+                    if isinstance(column, np.ndarray)
+                    else column
+                    for column in index_columns
+                ]
+            )
+        )
+    else:
+        index_keys = [()] * (len(offsets) - 1)
+
+    data = CompactData(
+        index_keys=index_keys,
+        offsets=offsets,
+        timestamps=timestamps,
+        features=features,
+    )
+    if not is_compact:
+        data = dict(data.items())
+    return EventSet(data=data, schema=schema, name=name)
@@ -2,6 +2,9 @@ from typing import Any, List, Optional, Union, Dict
 
 import logging
 import numpy as np
+from temporian.implementation.numpy.data.dictionary_array import (
+    DictionaryArray,
+)
 from temporian.implementation.numpy.data.dtype_normalization import (
     normalize_features,
     normalize_timestamps,
@@ -12,10 +15,11 @@ from temporian.utils.typecheck import typecheck
 from temporian.implementation.numpy.data.event_set import EventSet, IndexData
 from temporian.core.evaluation import run
 from temporian.core.operators.add_index import add_index
+from temporian.core.data.duration_utils import normalize_timestamp_unit
 from temporian.core.data.schema import Schema
 
 # Array of values as feed by the user.
-DataArray = Union[List[Any], np.ndarray, "pandas.Series"]
+DataArray = Union[List[Any], np.ndarray, "pandas.Series", DictionaryArray]
 
 
 # Note: Keep the documentation about supported types in sync with
@@ -28,6 +32,7 @@ def event_set(
     name: Optional[str] = None,
     is_unix_timestamp: Optional[bool] = None,
     same_sampling_as: Optional[EventSet] = None,
+    timestamp_unit: Optional[str] = None,
 ) -> EventSet:
     """Creates an [`EventSet`][temporian.EventSet] from arrays (lists, NumPy
     arrays, Pandas Series.)
@@ -66,6 +71,14 @@ def event_set(
         ...     indexes=["feature_2"],
         ... )
 
+        >>> # Create an EventSet with int64 nanosecond timestamps.
+        >>> evset = tp.event_set(
+        ...     timestamps=["2015-01-01T00:00:00.000000001", "2015-01-01"],
+        ...     timestamp_unit="ns",
+        ... )
+        >>> evset.data[()].timestamps
+        array([1420070400000000000, 1420070400000000001])
+
         ```
 
     Supported values for `timestamps`:
@@ -77,12 +90,24 @@ def event_set(
 
     String timestamps are interpreted as ISO 8601 datetime.
 
+    By default, timestamps are stored as float64 numbers of seconds. If
+    `timestamp_unit` is set, timestamps are instead stored as int64 numbers of
+    `timestamp_unit` (e.g., nanoseconds for "ns"). In this case, numerical
+    timestamps are interpreted as numbers of `timestamp_unit`, dates are
+    converted without loss of precision, and timestamps are compared with
+    integer comparisons. Durations (e.g., window lengths) are still expressed
+    in seconds.
+
     Supported values for `features`:
 
     - List of int, float, str, bytes, bool, and datetime.
-    - Numpy arrays of int{32, 64}, float{32, 64}, str_, string_ / bytes_,
-        Numpy datetime64, or object containing "str".
-    - Pandas series of int{32, 64}, float{32, 64}, Pandas Timestamp.
+    - Numpy arrays of int{8, 16, 32, 64}, uint{8, 16, 32, 64},
+        float{16, 32, 64}, str_, string_ / bytes_, Numpy datetime64, or object
+        containing "str".
+    - Pandas series of int{8, 16, 32, 64}, uint{8, 16, 32, 64},
+        float{16, 32, 64}, Pandas Timestamp, and categorical of str.
+    - [`tp.DictionaryArray`][temporian.DictionaryArray] for dictionary-encoded
+        strings.
 
     Date / datetime features are converted to int64 unix times.
     NaN for float-like features are interpreted as missing values.
@@ -92,8 +117,8 @@ def event_set(
         features: Dictionary of feature names to feature values. Feature
             and timestamp arrays must be of the same length.
         indexes: Names of the features to use as indexes. If empty
-            (default), the data is not indexed. Only integer and string features
-            can be used as indexes.
+            (default), the data is not indexed. Only int32, int64 and string
+            features can be used as indexes.
         name: Optional name of the EventSet. Used for debugging, and
             graph serialization.
         is_unix_timestamp: Whether the timestamps correspond to unix time. Unix
@@ -104,6 +129,9 @@ def event_set(
             having the same sampling as `same_sampling_as`. Some operators,
             such as [`EventSet.filter()`][temporian.EventSet.filter], require
             their inputs to have the same sampling.
+        timestamp_unit: Unit of int64 timestamps. One of "s", "ms", "us" or
+            "ns". If `None` (default), timestamps are float64 numbers of
+            seconds.
 
     Returns:
         An EventSet.
@@ -125,7 +153,10 @@ def event_set(
 
     # Convert timestamps to expected type.
     logging.debug("Normalizing timestamps")
-    timestamps, auto_is_unix_timestamp = normalize_timestamps(timestamps)
+    timestamp_unit = normalize_timestamp_unit(timestamp_unit)
+    timestamps, auto_is_unix_timestamp = normalize_timestamps(
+        timestamps, timestamp_unit=timestamp_unit
+    )
 
     if not np.all(timestamps[:-1] <= timestamps[1:]):
         logging.debug("Sorting timestamps")
@@ -146,6 +177,7 @@ def event_set(
         ],
         indexes=[],
         is_unix_timestamp=is_unix_timestamp,
+        timestamp_unit=timestamp_unit,
     )
 
     # Shallow copy the data to temporian format
@@ -175,6 +207,7 @@ def event_set(
     if same_sampling_as is not None:
         logging.debug("Setting same sampling")
         evset.schema.check_compatible_index(same_sampling_as.schema)
+        evset.schema.check_compatible_timestamps(same_sampling_as.schema)
 
         if evset.data.keys() != same_sampling_as.data.keys():
             raise ValueError(
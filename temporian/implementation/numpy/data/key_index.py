@@ -0,0 +1,91 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Vectorized index of the index keys of an EventSet."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, List, Sequence
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from temporian.core.typing import NormalizedIndexKey
+
+
+class KeyIndex:
+    """Index keys stored as one NumPy array per index, sorted with vectorized
+    operations.
+
+    Each index key is identified by its rank in lexicographic order. The rank
+    is computed one index at a time: The values of an index are replaced by
+    their position in the sorted distinct values of the index, and combined
+    with the rank of the previous indexes.
+
+    Attributes:
+        keys: Index keys, in order.
+        columns: Values of each index for each index key.
+    """
+
+    def __init__(
+        self, keys: List[NormalizedIndexKey], dtypes: Sequence[Any]
+    ) -> None:
+        self.keys = keys
+        self.columns = _keys_to_columns(keys, dtypes)
+
+        ranks = _rank(self.columns, len(keys))
+        if len(keys) and int(ranks.max()) + 1 != len(keys):
+            # NumPy ignores the trailing null bytes of fixed-width strings.
+            # Compare the Python bytes objects instead.
+            self.columns = _keys_to_columns(
+                keys,
+                [
+                    object if column.dtype.kind == "S" else column.dtype
+                    for column in self.columns
+                ],
+            )
+            ranks = _rank(self.columns, len(keys))
+
+        # Position of the index key of each rank.
+        self._positions = np.empty(len(keys), dtype=np.int64)
+        self._positions[ranks] = np.arange(len(keys), dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def sorted_positions(self) -> np.ndarray:
+        """Positions of the index keys sorted in lexicographic order."""
+
+        return self._positions
+
+
+def _keys_to_columns(
+    keys: List[NormalizedIndexKey], dtypes: Sequence[Any]
+) -> List[np.ndarray]:
+    return [
+        np.array([key[idx] for key in keys], dtype=dtype)
+        for idx, dtype in enumerate(dtypes)
+    ]
+
+
+def _rank(columns: List[np.ndarray], num_keys: int) -> np.ndarray:
+    """Lexicographic rank of index keys."""
+
+    ranks = np.zeros(num_keys, dtype=np.int64)
+    for column in columns:
+        vocabulary, codes = np.unique(column, return_inverse=True)
+        combined = ranks * len(vocabulary) + codes.reshape(-1)
+        _, ranks = np.unique(combined, return_inverse=True)
+        ranks = ranks.reshape(-1).astype(np.int64, copy=False)
+    return ranks
@@ -0,0 +1,255 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Memory usage of EventSets, without counting shared buffers twice."""
+
+from __future__ import annotations
+
+import mmap
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, Set, Tuple
+
+import numpy as np
+
+from temporian.implementation.numpy.data.dictionary_array import (
+    DictionaryArray,
+)
+from temporian.implementation.numpy.data.event_set import (
+    CompactData,
+    EventSet,
+)
+
+
+@dataclass
+class MemoryUsage:
+    """Memory used by one or several EventSets, in bytes.
+
+    Returned by [`EventSet.memory_usage(deep=True)`][temporian.EventSet.memory_usage].
+
+    Each buffer is counted once, even if it is shared by several arrays (e.g.,
+    the timestamps shared by the EventSets with the same sampling, or the
+    views of the compact layout). A buffer is counted in full, even if only a
+    part of it is used (e.g., the output of `tp.EventSet.time_range()`), since
+    the whole buffer is kept in memory. A buffer used by several categories
+    (e.g., an EventSet loaded with `tp.load_event_set(..., memory_map=False)`)
+    is counted in the first of `index_keys`, `timestamps` and `features` using
+    it.
+
+    Attributes:
+        timestamps: Bytes of the buffers of the timestamps.
+        features: Bytes of the buffers of the feature values, not counted in
+            `timestamps`.
+        index_keys: Bytes of the index keys, and of the offsets of the compact
+            layout.
+        overhead: Bytes of the Python objects holding the data (e.g.,
+            dictionaries, `IndexData`, NumPy array headers).
+        memory_mapped: Bytes of the buffers mapped from a file (e.g., with
+            [`tp.load_event_set()`][temporian.load_event_set]). Those buffers
+            are read from disk on demand and are not counted in the other
+            fields.
+    """
+
+    timestamps: int = 0
+    features: int = 0
+    index_keys: int = 0
+    overhead: int = 0
+    memory_mapped: int = 0
+
+    @property
+    def total(self) -> int:
+        """Bytes of memory used by the EventSets, excluding the memory-mapped
+        buffers."""
+
+        return self.timestamps + self.features + self.index_keys + self.overhead
+
+
+def memory_usage(evsets: Iterable[EventSet]) -> MemoryUsage:
+    """Computes the memory used by several EventSets together.
+
+    The buffers and index keys shared by several EventSets are only counted
+    once.
+    """
+
+    counter = _MemoryCounter()
+    for evset in evsets:
+        counter.add_event_set(evset)
+    return counter.usage
+
+
+def allocated_buffers(evsets: Iterable[EventSet]) -> Dict[int, Tuple[Any, int]]:
+    """Buffers of the timestamps and feature values of several EventSets.
+
+    Unlike the id of an array, the object owning a buffer identifies the
+    buffer even when the arrays are temporary views (e.g., the views of the
+    compact layout). The buffers mapped from a file are not listed.
+
+    Returns:
+        The object owning each buffer and the size of the buffer in bytes,
+        indexed by the id of the owner.
+    """
+
+    buffers: Dict[int, Tuple[Any, int]] = {}
+    for evset in evsets:
+        for array in _value_arrays(evset):
+            owner, num_bytes, memory_mapped = _buffer_owner(array)
+            if not memory_mapped:
+                buffers[id(owner)] = (owner, num_bytes)
+    return buffers
+
+
+def _value_arrays(evset: EventSet) -> Iterator[np.ndarray]:
+    """Arrays of the timestamps and feature values of an EventSet."""
+
+    data = evset.data
+    if isinstance(data, CompactData):
+        arrays = [data.timestamps, *data.features]
+    else:
+        arrays = [
+            array
+            for index_data in data.values()
+            for array in [index_data.timestamps, *index_data.features]
+        ]
+    for array in arrays:
+        if isinstance(array, DictionaryArray):
+            yield array.codes
+            yield array.vocabulary
+        else:
+            yield array
+
+
+class _MemoryCounter:
+    """Accumulates the memory usage of EventSets.
+
+    The objects already counted are identified by their id. NumPy buffers are
+    identified by the object owning them (see `_buffer_owner`).
+    """
+
+    def __init__(self) -> None:
+        self.usage = MemoryUsage()
+        self._visited: Set[int] = set()
+        # Ids of the owners of the buffers already counted.
+        self._buffers: Set[int] = set()
+
+    def _visit(self, obj: Any) -> bool:
+        """Marks an object as counted. Returns false if it was already
+        counted."""
+
+        if id(obj) in self._visited:
+            return False
+        self._visited.add(id(obj))
+        return True
+
+    def add_event_set(self, evset: EventSet) -> None:
+        if not self._visit(evset):
+            return
+        self.usage.overhead += object.__sizeof__(evset)
+
+        data = evset.data
+        if isinstance(data, CompactData):
+            if self._visit(data):
+                self.usage.overhead += object.__sizeof__(data)
+                self._add_index_keys(data.index_keys)
+                if self._visit(data._key_to_idx):
+                    self.usage.overhead += sys.getsizeof(data._key_to_idx)
+                self.usage.index_keys += self._add_array(data.offsets)
+                self.usage.timestamps += self._add_array(data.timestamps)
+                if self._visit(data.features):
+                    self.usage.overhead += sys.getsizeof(data.features)
+                for feature in data.features:
+                    self.usage.features += self._add_array(feature)
+            return
+
+        if self._visit(data):
+            self.usage.overhead += sys.getsizeof(data)
+        for index_key, index_data in data.items():
+            self._add_index_key(index_key)
+            if not self._visit(index_data):
+                continue
+            self.usage.overhead += object.__sizeof__(
+                index_data
+            ) + sys.getsizeof(index_data.features)
+            self.usage.timestamps += self._add_array(index_data.timestamps)
+            for feature in index_data.features:
+                self.usage.features += self._add_array(feature)
+
+    def _add_index_keys(self, index_keys: Any) -> None:
+        if not self._visit(index_keys):
+            return
+        self.usage.overhead += sys.getsizeof(index_keys)
+        for index_key in index_keys:
+            self._add_index_key(index_key)
+
+    def _add_index_key(self, index_key: Any) -> None:
+        if not self._visit(index_key):
+            return
+        self.usage.index_keys += sys.getsizeof(index_key) + sum(
+            sys.getsizeof(item) for item in index_key
+        )
+
+    def _add_array(self, array: Any) -> int:
+        """Counts the array header as overhead, and returns the number of
+        bytes of the buffers of the array not counted yet."""
+
+        if isinstance(array, DictionaryArray):
+            if not self._visit(array):
+                return 0
+            self.usage.overhead += object.__sizeof__(array)
+            return self._add_array(array.codes) + self._add_array(
+                array.vocabulary
+            )
+
+        if not self._visit(array):
+            return 0
+        # The size of an array includes its buffer if it allocated it.
+        self.usage.overhead += sys.getsizeof(array) - (
+            array.nbytes if array.base is None else 0
+        )
+
+        owner, num_bytes, memory_mapped = _buffer_owner(array)
+        if id(owner) in self._buffers:
+            return 0
+        self._buffers.add(id(owner))
+        if memory_mapped:
+            self.usage.memory_mapped += num_bytes
+            return 0
+        return num_bytes
+
+
+def _buffer_owner(array: np.ndarray) -> Tuple[Any, int, bool]:
+    """Object owning the buffer of an array.
+
+    Returns the owner, the size of the buffer in bytes, and whether the buffer
+    is mapped from a file.
+    """
+
+    # Follow the views to the array allocating the buffer.
+    root = array
+    while isinstance(root.base, np.ndarray):
+        root = root.base
+
+    if root.base is None:
+        # The array allocated its buffer. It is not memory-mapped, since
+        # `np.memmap` arrays point to a `mmap.mmap` object.
+        return root, root.nbytes, False
+
+    # The buffer is owned by another Python object, e.g., a `mmap.mmap`, a
+    # `bytes` or an Arrow buffer.
+    owner = root.base
+    try:
+        with memoryview(owner) as view:
+            num_bytes = view.nbytes
+    except TypeError:
+        num_bytes = root.nbytes
+    return owner, num_bytes, isinstance(owner, mmap.mmap)
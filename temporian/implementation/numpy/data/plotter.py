@@ -380,6 +380,13 @@ def plot_with_plotter(
 
             for group_item in group.items:
                 xs = group_item.evset.data[index].timestamps
+                timestamp_unit = group_item.evset.schema.timestamp_unit
+                if (
+                    timestamp_unit is not None
+                    and group_item.evset.schema.is_unix_timestamp
+                ):
+                    # Plot unix times from float64 seconds.
+                    xs = duration_utils.ticks_to_seconds(xs, timestamp_unit)
                 uniform = is_uniform(xs)
 
                 plot_mask = np.full(len(xs), True)
@@ -0,0 +1,130 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+from absl.testing import absltest
+
+from temporian.implementation.numpy.data import dictionary_array
+from temporian.implementation.numpy.data.dictionary_array import (
+    DictionaryArray,
+)
+from temporian.implementation.numpy.data.io import event_set
+from temporian.io.pandas import from_pandas
+
+
+class DictionaryArrayTest(absltest.TestCase):
+    def test_encode(self):
+        values = DictionaryArray.encode(["b", "a", "b", "c"])
+        np.testing.assert_array_equal(values.codes, [1, 0, 1, 2])
+        np.testing.assert_array_equal(values.vocabulary, [b"a", b"b", b"c"])
+        np.testing.assert_array_equal(values, [b"b", b"a", b"b", b"c"])
+        self.assertEqual(values.dtype.type, np.bytes_)
+        self.assertLen(values, 4)
+        self.assertEqual(values[1], b"a")
+
+        selected = values[np.array([True, False, True, True])]
+        self.assertIsInstance(selected, DictionaryArray)
+        self.assertIs(selected.vocabulary, values.vocabulary)
+        np.testing.assert_array_equal(selected, [b"b", b"b", b"c"])
+
+    def test_equal(self):
+        a = DictionaryArray.encode(["x", "y", "z", "x"])
+        b = DictionaryArray.encode(["x", "w", "z", "y"])
+        plain = np.array([b"x", b"y", b"y", b"y"])
+
+        np.testing.assert_array_equal(
+            dictionary_array.equal(a, b), [True, False, True, False]
+        )
+        np.testing.assert_array_equal(
+            dictionary_array.equal(a, plain), [True, True, False, False]
+        )
+        np.testing.assert_array_equal(
+            dictionary_array.equal(plain, b), [True, False, False, True]
+        )
+        np.testing.assert_array_equal(
+            dictionary_array.equal(a, "x"), [True, False, False, True]
+        )
+        np.testing.assert_array_equal(
+            dictionary_array.equal(a, b"missing"), [False] * 4
+        )
+        np.testing.assert_array_equal(a != b, [False, True, False, True])
+
+    def test_concatenate(self):
+        a = DictionaryArray.encode(["x", "y"])
+        b = DictionaryArray.encode(["z", "x"])
+
+        same_vocabulary = dictionary_array.concatenate([a, a[:1]])
+        self.assertIs(same_vocabulary.vocabulary, a.vocabulary)
+        np.testing.assert_array_equal(same_vocabulary, [b"x", b"y", b"x"])
+
+        merged = dictionary_array.concatenate([a, b])
+        self.assertIsInstance(merged, DictionaryArray)
+        np.testing.assert_array_equal(merged.vocabulary, [b"x", b"y", b"z"])
+        np.testing.assert_array_equal(merged, [b"x", b"y", b"z", b"x"])
+
+        mixed = dictionary_array.concatenate([a, np.array([b"w"])])
+        self.assertIsInstance(mixed, np.ndarray)
+        np.testing.assert_array_equal(mixed, [b"x", b"y", b"w"])
+
+    def test_operators(self):
+        values = ["a", "b" * 100, "a", "c", "b" * 100, "a"]
+        other = ["c", "a", "a", "c", "a", "b" * 100]
+
+        def create(encoded: bool):
+            return event_set(
+                timestamps=[1, 2, 3, 4, 5, 6],
+                features={
+                    "x": DictionaryArray.encode(values) if encoded else values,
+                    "y": DictionaryArray.encode(other) if encoded else other,
+                    "v": [1, 2, 3, 4, 5, 6],
+                },
+            )
+
+        queries = [
+            lambda e: e.filter(e["x"].equal("a")),
+            lambda e: e["x"] == e["y"],
+            lambda e: e["x"] != e["y"],
+            lambda e: e.add_index("x"),
+            lambda e: e.add_index(["x", "y"]).drop_index("x"),
+            lambda e: e.add_index("x").drop_index("x").compact(),
+        ]
+        encoded_evset = create(encoded=True)
+        evset = create(encoded=False)
+        for query in queries:
+            self.assertEqual(query(encoded_evset), query(evset))
+
+        indexed = encoded_evset.add_index("x")
+        self.assertIsInstance(
+            indexed.get_index_value(("a",)).features[0], DictionaryArray
+        )
+        self.assertLess(encoded_evset.memory_usage(), evset.memory_usage())
+
+    def test_from_pandas_categorical(self):
+        df = pd.DataFrame(
+            {
+                "timestamp": [1, 2, 3],
+                "x": pd.Categorical(["a", "b", None]),
+                "y": pd.Categorical([1, 2, 1]),
+            }
+        )
+        evset = from_pandas(df)
+        x, y = evset.data[()].features
+        self.assertIsInstance(x, DictionaryArray)
+        np.testing.assert_array_equal(x, [b"a", b"b", b""])
+        np.testing.assert_array_equal(y, [1, 2, 1])
+
+
+if __name__ == "__main__":
+    absltest.main()
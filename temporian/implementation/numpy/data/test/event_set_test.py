@@ -1,6 +1,9 @@
+import pickle
+
 import numpy as np
 from absl.testing import absltest
 
+from temporian.implementation.numpy.data.event_set import CompactData
 from temporian.implementation.numpy.data.io import event_set, IndexData
 from temporian.utils import config
 from temporian.utils import golden
@@ -52,6 +55,72 @@ class EventSetTest(absltest.TestCase):
             repr(self.evset.schema.indexes), "[('x', int64), ('y', str_)]"
         )
 
+    def test_compact(self):
+        compact_evset = self.evset.compact()
+        self.assertTrue(compact_evset.is_compact())
+        self.assertFalse(self.evset.is_compact())
+        self.assertIs(compact_evset.compact(), compact_evset)
+        self.assertEqual(compact_evset, self.evset)
+        self.assertEqual(compact_evset.num_events(), 5)
+
+        data = compact_evset.data
+        self.assertIsInstance(data, CompactData)
+        self.assertLen(data, 2)
+        self.assertIn((2, b"world"), data)
+        self.assertEqual(data.index_keys, list(self.evset.data.keys()))
+        self.assertEqual(data.offsets[-1], 5)
+
+        # The index data are views of the contiguous arrays.
+        index_data = compact_evset.get_index_value((2, "world"))
+        np.testing.assert_array_equal(index_data.features[1], [9, 10])
+        self.assertTrue(
+            np.shares_memory(index_data.features[1], data.features[1])
+        )
+        self.assertTrue(
+            np.shares_memory(index_data.timestamps, data.timestamps)
+        )
+
+    def test_compact_layout(self):
+        data = self.evset.compact().data
+        other = data.with_features([f * 2 for f in data.features])
+        self.assertTrue(data.has_same_layout(other))
+        self.assertIs(other.timestamps, data.timestamps)
+        self.assertFalse(data.has_same_layout(self.evset.compact().data))
+
+    def test_compact_empty(self):
+        evset = event_set(
+            timestamps=[], features={"a": [], "x": []}, indexes=["x"]
+        ).compact()
+        self.assertEqual(evset.num_events(), 0)
+        self.assertEqual(evset.data.features[0].dtype, np.float64)
+
+    def test_pickle(self):
+        self.evset.name = "evset"
+        self.evset.node()
+        for evset in [self.evset, self.evset.compact()]:
+            # Protocol 5 transfers the offsets, timestamps, features and
+            # integer index values out-of-band.
+            buffers = []
+            pickled = pickle.dumps(
+                evset, protocol=5, buffer_callback=buffers.append
+            )
+            self.assertLen(buffers, 5)
+            unpickled = pickle.loads(pickled, buffers=buffers)
+            self.assertEqual(unpickled, evset)
+            self.assertEqual(unpickled.is_compact(), evset.is_compact())
+            self.assertIsNone(unpickled._internal_node)
+
+            unpickled = pickle.loads(pickle.dumps(evset, protocol=4))
+            self.assertEqual(unpickled, evset)
+
+        empty = event_set(
+            timestamps=[], features={"a": [], "x": []}, indexes=["x"]
+        )
+        self.assertEqual(pickle.loads(pickle.dumps(empty)), empty)
+
+        index_data = self.evset.get_index_value((1, "hello"))
+        self.assertEqual(pickle.loads(pickle.dumps(index_data)), index_data)
+
     def test_memory_usage(self):
         memory_usage = self.evset.memory_usage()
         print("memory_usage:", memory_usage)
@@ -152,6 +152,44 @@ class IOTest(absltest.TestCase):
             ):
                 _ = event_set(timestamps)
 
+    def test_timestamp_unit(self):
+        evset = event_set(
+            timestamps=[
+                "2020-01-01T00:00:00.000000002",
+                "2020-01-01T00:00:00.000000001",
+            ],
+            features={"a": [1, 2]},
+            timestamp_unit="ns",
+        )
+        assert_array_equal(
+            evset.get_arbitrary_index_data().timestamps,
+            np.array([1577836800000000001, 1577836800000000002]),
+        )
+        assert_array_equal(evset.get_arbitrary_index_data().features[0], [2, 1])
+        self.assertTrue(evset.schema.is_unix_timestamp)
+        self.assertEqual(evset.schema.timestamp_dtype, DType.INT64)
+        self.assertEqual(evset.schema.timestamp_unit.ticks_per_second, 10**9)
+
+        # Numbers are expressed in the timestamp unit.
+        evset = event_set(timestamps=[2.0, 1.0], timestamp_unit="ms")
+        assert_array_equal(
+            evset.get_arbitrary_index_data().timestamps, np.array([1, 2])
+        )
+        self.assertFalse(evset.schema.is_unix_timestamp)
+
+        evset = event_set(timestamps=[datetime(1970, 1, 2)], timestamp_unit="s")
+        assert_array_equal(
+            evset.get_arbitrary_index_data().timestamps, np.array([86400])
+        )
+
+    def test_timestamp_unit_errors(self):
+        with self.assertRaisesRegex(ValueError, "should be integers"):
+            event_set(timestamps=[1.5], timestamp_unit="ns")
+        with self.assertRaisesRegex(ValueError, "null/NaT"):
+            event_set(timestamps=["2020-01-01", None], timestamp_unit="ns")
+        with self.assertRaisesRegex(ValueError, "Invalid timestamp unit"):
+            event_set(timestamps=[1], timestamp_unit="minutes")
+
     def test_arrays_not_same_length(self):
         with self.assertRaisesRegex(
             ValueError, "Timestamps and all features must have the same length."
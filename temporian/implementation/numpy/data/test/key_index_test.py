@@ -0,0 +1,69 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+from absl.testing import absltest
+
+from temporian.implementation.numpy.data.event_set import IndexData
+from temporian.implementation.numpy.data.io import event_set
+from temporian.implementation.numpy.data.key_index import KeyIndex
+
+
+class KeyIndexTest(absltest.TestCase):
+    def test_sorted_positions(self):
+        keys = [(b"b", 2), (b"a", 1), (b"b", 1), (b"", 5)]
+        key_index = KeyIndex(keys, [np.bytes_, np.int64])
+        self.assertEqual(
+            [keys[i] for i in key_index.sorted_positions()], sorted(keys)
+        )
+
+    def test_no_index(self):
+        key_index = KeyIndex([()], [])
+        np.testing.assert_array_equal(key_index.sorted_positions(), [0])
+
+    def test_empty(self):
+        key_index = KeyIndex([], [np.int64])
+        self.assertLen(key_index.sorted_positions(), 0)
+
+    def test_trailing_null_bytes(self):
+        keys = [(b"a\x00",), (b"a",)]
+        key_index = KeyIndex(keys, [np.bytes_])
+        np.testing.assert_array_equal(key_index.sorted_positions(), [1, 0])
+
+    def test_event_set(self):
+        evset = event_set(
+            timestamps=[1, 2, 3, 4],
+            features={"k1": [2, 1, 2, 1], "k2": ["x", "y", "y", "x"]},
+            indexes=["k1", "k2"],
+        )
+        self.assertEqual(
+            evset.get_index_keys(sort=True),
+            [(1, b"x"), (1, b"y"), (2, b"x"), (2, b"y")],
+        )
+        self.assertIs(evset._key_index(), evset._key_index())
+
+        # The index is updated when index keys are added.
+        evset.set_index_value(
+            (0, "z"),
+            IndexData(
+                features=[],
+                timestamps=np.array([5.0]),
+                schema=evset.schema,
+            ),
+        )
+        self.assertEqual(evset.get_index_keys(sort=True)[0], (0, b"z"))
+
+
+if __name__ == "__main__":
+    absltest.main()
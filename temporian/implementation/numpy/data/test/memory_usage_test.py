@@ -0,0 +1,120 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+
+from absl.testing import absltest
+
+from temporian.implementation.numpy.data.dictionary_array import (
+    DictionaryArray,
+)
+from temporian.implementation.numpy.data.io import event_set
+from temporian.implementation.numpy.data.memory_usage import memory_usage
+from temporian.io.native import load_event_set, save_event_set
+
+
+class MemoryUsageTest(absltest.TestCase):
+    def setUp(self):
+        self.evset = event_set(
+            timestamps=[1.0, 2.0, 3.0, 4.0],
+            features={"a": [1.0, 2.0, 3.0, 4.0], "k": [1, 1, 2, 2]},
+            indexes=["k"],
+        )
+
+    def test_breakdown(self):
+        usage = self.evset.memory_usage(deep=True)
+        self.assertEqual(usage.timestamps, 4 * 8)
+        self.assertEqual(usage.features, 4 * 8)
+        self.assertGreater(usage.index_keys, 0)
+        self.assertGreater(usage.overhead, 0)
+        self.assertEqual(usage.memory_mapped, 0)
+        self.assertEqual(
+            usage.total,
+            usage.timestamps
+            + usage.features
+            + usage.index_keys
+            + usage.overhead,
+        )
+
+    def test_compact_views(self):
+        compact = self.evset.compact()
+        # Accessing an index key creates views of the contiguous arrays.
+        _ = compact.get_index_value((1,))
+        usage = compact.memory_usage(deep=True)
+        self.assertEqual(usage.timestamps, 4 * 8)
+        self.assertEqual(usage.features, 4 * 8)
+        # The offsets are counted with the index keys.
+        self.assertGreaterEqual(usage.index_keys, 3 * 8)
+
+        # The output of time_range is made of views of its input.
+        usage = memory_usage([compact, compact.time_range(begin=2.0)])
+        self.assertEqual(usage.timestamps, 4 * 8)
+        self.assertEqual(usage.features, 4 * 8)
+
+    def test_shared_sampling(self):
+        moving_sum = self.evset.moving_sum(2.0)
+        usage = memory_usage([self.evset, moving_sum])
+        # The timestamps are shared.
+        self.assertEqual(usage.timestamps, 4 * 8)
+        self.assertEqual(usage.features, 2 * 4 * 8)
+        self.assertLess(
+            usage.total,
+            self.evset.memory_usage(deep=True).total
+            + moving_sum.memory_usage(deep=True).total,
+        )
+
+        # An EventSet passed twice is counted once.
+        self.assertEqual(
+            memory_usage([self.evset, self.evset]),
+            self.evset.memory_usage(deep=True),
+        )
+
+    def test_dictionary_array(self):
+        values = DictionaryArray.encode(["a", "b", "a", "b"])
+        evset = event_set(timestamps=[1, 2, 3, 4], features={"f": values})
+        filtered = evset.filter(evset["f"].equal("a"))
+        usage = memory_usage([evset, filtered])
+        # The vocabulary is shared.
+        self.assertEqual(
+            usage.features,
+            values.codes.nbytes
+            + values.vocabulary.nbytes
+            + filtered.get_index_value(()).features[0].codes.nbytes,
+        )
+
+    def test_memory_mapped(self):
+        compact = self.evset.compact()
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "evset.tpe")
+            save_event_set(compact, path)
+
+            usage = load_event_set(path).memory_usage(deep=True)
+            self.assertEqual(usage.timestamps, 0)
+            self.assertEqual(usage.features, 0)
+            self.assertEqual(usage.memory_mapped, os.path.getsize(path))
+
+            usage = load_event_set(path, memory_map=False).memory_usage(
+                deep=True
+            )
+            self.assertEqual(usage.memory_mapped, 0)
+            # All the arrays are views of the buffer read from the file,
+            # counted once with the offsets.
+            self.assertGreaterEqual(usage.index_keys, os.path.getsize(path))
+            self.assertEqual(usage.timestamps, 0)
+            self.assertEqual(usage.features, 0)
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -12,15 +12,37 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
+import functools
 import sys
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
 
-from typing import Dict
+import numpy as np
 
 from temporian.core.data.node import EventSetNode
+from temporian.core.typing import NormalizedIndexKey
 from temporian.implementation.numpy import implementation_lib
 from temporian.implementation.numpy.data.event_set import EventSet
-from temporian.core.schedule import Schedule
+from temporian.implementation.numpy.data.memory_usage import (
+    allocated_buffers,
+    memory_usage,
+)
+from temporian.implementation.numpy.operators.base import (
+    CheckMode,
+    OperatorImplementation,
+)
+from temporian.implementation.numpy.operators.fused import (
+    FusedElementwiseNumpyImplementation,
+)
+from temporian.core.profiler import ProfiledStep, Profiler
+from temporian.core.schedule import Schedule, ScheduleStep
+from temporian.utils import config
 
 # Loads all the numpy operator implementations
 from temporian.implementation.numpy import operators as _impls
@@ -30,7 +52,10 @@ def run_schedule(
     inputs: Dict[EventSetNode, EventSet],
     schedule: Schedule,
     verbose: int,
-    check_execution: bool,
+    check_execution: CheckMode,
+    num_threads: int = 1,
+    num_index_threads: int = 1,
+    profiler: Optional[Profiler] = None,
 ) -> Dict[EventSetNode, EventSet]:
     """Evaluates a schedule on a dictionary of input
     [`EventSets`][temporian.EventSet].
@@ -40,24 +65,71 @@ def run_schedule(
         schedule: Sequence of operators to apply on the data.
         verbose: If >0, prints details about the execution on the standard error
             output. The larger the number, the more information is displayed.
-        check_execution: If `True`, data of the intermediate results of the
-            operators is checked against its expected structure and raises if
-            it differs.
+        check_execution: Validation of the data of the intermediate results
+            of the operators against its expected structure. Raises if it
+            differs.
+        num_threads: Number of threads used to run the operators. If 1, the
+            operators are executed sequentially in the schedule order. If >1,
+            operators are executed as soon as all their inputs are available.
+        num_index_threads: Number of threads used to run each operator. If >1,
+            the index keys of index-wise operators are split into partitions
+            processed in parallel.
+        profiler: If set, records the execution of each step.
     """
-    data = {**inputs}
 
-    num_steps = len(schedule.steps)
-    for step_idx, step in enumerate(schedule.steps):
-        operator_def = step.op.definition
+    if num_index_threads > 1:
+        with ThreadPoolExecutor(max_workers=num_index_threads) as executor:
+            runner = _IndexPartitionedRunner(
+                executor=executor,
+                num_partitions=num_index_threads * _PARTITIONS_PER_THREAD,
+            )
+            return _run_schedule(
+                inputs=inputs,
+                schedule=schedule,
+                verbose=verbose,
+                check_execution=check_execution,
+                num_threads=num_threads,
+                runner=runner,
+                profiler=profiler,
+            )
 
-        # Get implementation
-        implementation_cls = implementation_lib.get_implementation_class(
-            operator_def.key
+    return _run_schedule(
+        inputs=inputs,
+        schedule=schedule,
+        verbose=verbose,
+        check_execution=check_execution,
+        num_threads=num_threads,
+        runner=None,
+        profiler=profiler,
+    )
+
+
+def _run_schedule(
+    inputs: Dict[EventSetNode, EventSet],
+    schedule: Schedule,
+    verbose: int,
+    check_execution: CheckMode,
+    num_threads: int,
+    runner: Optional[_IndexPartitionedRunner],
+    profiler: Optional[Profiler],
+) -> Dict[EventSetNode, EventSet]:
+    """Evaluates a schedule. See "run_schedule" for details."""
+
+    if num_threads > 1:
+        return _run_schedule_parallel(
+            inputs=inputs,
+            schedule=schedule,
+            verbose=verbose,
+            check_execution=check_execution,
+            num_threads=num_threads,
+            runner=runner,
+            profiler=profiler,
         )
 
-        # Instantiate implementation
-        implementation = implementation_cls(step.op)
+    data = {**inputs}
 
+    num_steps = len(schedule.steps)
+    for step_idx, step in enumerate(schedule.steps):
         if verbose == 1:
             print(
                 f"    {step_idx+1} / {num_steps}: {step.op.operator_key()}",
@@ -74,31 +146,36 @@ def run_schedule(
         # Construct operator inputs
         operator_inputs = {
             input_key: data[input_node]
-            for input_key, input_node in step.op.inputs.items()
+            for input_key, input_node in step.input_nodes.items()
         }
 
         if verbose >= 2:
             print(f"Inputs:\n{operator_inputs}\n", file=sys.stderr)
 
         # Compute output
-        begin_time = time.perf_counter()
-        if check_execution:
-            operator_outputs = implementation.call(**operator_inputs)
-        else:
-            operator_outputs = implementation(**operator_inputs)
-        end_time = time.perf_counter()
+        operator_outputs, timing = _run_timed_step(
+            step, operator_inputs, check_execution, runner
+        )
 
         if verbose == 1:
-            print(f" [{end_time - begin_time:.5f} s]", file=sys.stderr)
+            print(f" [{timing.wall_time:.5f} s]", file=sys.stderr)
         elif verbose >= 2:
             print(f"Outputs:\n{operator_outputs}\n", file=sys.stderr)
-            print(f"Duration: {end_time - begin_time} s", file=sys.stderr)
+            print(f"Duration: {timing.wall_time} s", file=sys.stderr)
+
+        if profiler is not None:
+            _record_step(
+                profiler,
+                step_idx,
+                step,
+                operator_inputs,
+                operator_outputs,
+                timing,
+                live_evsets=[*data.values(), *operator_outputs.values()],
+            )
 
         # materialize data in output nodes
-        for output_key, output_node in step.op.outputs.items():
-            output_evset = operator_outputs[output_key]
-            output_evset._internal_node = output_node
-            data[output_node] = output_evset
+        _materialize_outputs(step, operator_outputs, data)
 
         # Release unused memory
         for node in step.released_nodes:
@@ -106,3 +183,421 @@ def run_schedule(
             del data[node]
 
     return data
+
+
+class _StepTiming(NamedTuple):
+    """Time measurements of the execution of a step."""
+
+    begin_time: float
+    wall_time: float
+    cpu_time: float
+    thread_id: int
+
+
+def _run_timed_step(
+    step: ScheduleStep,
+    operator_inputs: Dict[str, EventSet],
+    check_execution: CheckMode,
+    runner: Optional[_IndexPartitionedRunner],
+) -> Tuple[Dict[str, EventSet], _StepTiming]:
+    """Runs a schedule step and measures its execution time."""
+
+    begin_time = time.perf_counter()
+    begin_cpu_time = time.thread_time()
+    operator_outputs = _run_step(step, operator_inputs, check_execution, runner)
+    timing = _StepTiming(
+        begin_time=begin_time,
+        wall_time=time.perf_counter() - begin_time,
+        cpu_time=time.thread_time() - begin_cpu_time,
+        thread_id=threading.get_ident(),
+    )
+    return operator_outputs, timing
+
+
+def _record_step(
+    profiler: Profiler,
+    step_idx: int,
+    step: ScheduleStep,
+    operator_inputs: Dict[str, EventSet],
+    operator_outputs: Dict[str, EventSet],
+    timing: _StepTiming,
+    live_evsets: List[EventSet],
+) -> None:
+    """Records the execution of a schedule step in a profiler.
+
+    "live_evsets" are the EventSets alive at the end of the step. Their memory
+    usage is only computed if the profiler records the live memory.
+    """
+
+    # Inputs referring to the same EventSet are only counted once.
+    inputs = list(
+        {id(evset): evset for evset in operator_inputs.values()}.values()
+    )
+    outputs = list(operator_outputs.values())
+
+    # Buffers allocated for the outputs. Buffers are compared by owner, since
+    # the ids of the temporary views of the compact layout are recycled.
+    input_buffers = allocated_buffers(inputs)
+    output_buffers = allocated_buffers(outputs)
+    output_num_bytes = sum(
+        num_bytes
+        for owner_id, (_, num_bytes) in output_buffers.items()
+        if owner_id not in input_buffers
+    )
+
+    profiler.record(
+        ProfiledStep(
+            step_idx=step_idx,
+            operator_key=step.op.operator_key(),
+            operator_id=step.op._internal_ordered_id,
+            begin_time=timing.begin_time - profiler.origin,
+            wall_time=timing.wall_time,
+            cpu_time=timing.cpu_time,
+            thread_id=timing.thread_id,
+            num_index_keys=max(
+                (len(evset.data) for evset in inputs or outputs), default=0
+            ),
+            num_input_events=sum(evset.num_events() for evset in inputs),
+            num_output_events=sum(evset.num_events() for evset in outputs),
+            output_num_bytes=output_num_bytes,
+            live_num_bytes=(
+                memory_usage(live_evsets).total
+                if profiler.live_memory
+                else None
+            ),
+        )
+    )
+
+
+def _run_step(
+    step: ScheduleStep,
+    operator_inputs: Dict[str, EventSet],
+    check_execution: CheckMode,
+    runner: Optional[_IndexPartitionedRunner],
+) -> Dict[str, EventSet]:
+    """Runs the operator of a schedule step on its inputs."""
+
+    if step.alias_of is not None:
+        # The inputs are the outputs of the aliased operator.
+        return {
+            output_key: EventSet(
+                data=evset.data, schema=evset.schema, name=evset.name
+            )
+            for output_key, evset in operator_inputs.items()
+        }
+
+    if step.fused_ops:
+        implementation = FusedElementwiseNumpyImplementation(
+            step.op, step.fused_ops, step.input_nodes
+        )
+    else:
+        # Get implementation
+        implementation_cls = implementation_lib.get_implementation_class(
+            step.op.definition.key
+        )
+
+        # Instantiate implementation
+        implementation = implementation_cls(step.op)
+
+    if check_execution == CheckMode.full:
+        call = implementation.call
+    elif check_execution == CheckMode.sampled:
+        call = functools.partial(
+            implementation.call,
+            max_index_keys=config.check_execution_max_index_keys,
+        )
+    else:
+        call = implementation
+
+    if runner is not None and runner.supports(implementation):
+        return runner.run(implementation, call, operator_inputs)
+    return call(**operator_inputs)
+
+
+# Number of index key partitions per thread in "_IndexPartitionedRunner". More
+# partitions than threads balance the work when the cost of index keys varies.
+_PARTITIONS_PER_THREAD = 4
+
+
+class _IndexPartitionedRunner:
+    """Runs operators on partitions of index keys in parallel.
+
+    The index keys of the inputs are split into disjoint partitions. The
+    operator is applied independently on each partition, and the outputs
+    for the partitions are merged.
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor, num_partitions: int):
+        self._executor = executor
+        self._num_partitions = num_partitions
+
+    def supports(self, implementation: OperatorImplementation) -> bool:
+        """Tests if an operator can run on partitions of index keys."""
+
+        if not implementation.index_wise:
+            return False
+
+        op = implementation.operator
+        nodes = list(op.inputs.values()) + list(op.outputs.values())
+        indexes = nodes[0].schema.indexes
+        if not indexes:
+            return False
+        return all(node.schema.indexes == indexes for node in nodes[1:])
+
+    def run(
+        self,
+        implementation: OperatorImplementation,
+        call: Callable[..., Dict[str, EventSet]],
+        operator_inputs: Dict[str, EventSet],
+    ) -> Dict[str, EventSet]:
+        # All the index keys, in order of appearance.
+        all_index_keys = list(
+            dict.fromkeys(
+                index_key
+                for evset in operator_inputs.values()
+                for index_key in evset.data.keys()
+            )
+        )
+        num_partitions = min(self._num_partitions, len(all_index_keys))
+        if num_partitions <= 1 or (
+            implementation.supports_compact_data
+            and any(evset.is_compact() for evset in operator_inputs.values())
+        ):
+            # Compact inputs are processed in a single vectorized call.
+            return call(**operator_inputs)
+
+        partition_size = -(-len(all_index_keys) // num_partitions)
+        futures = []
+        for begin in range(0, len(all_index_keys), partition_size):
+            partition_inputs = _select_index_keys(
+                operator_inputs, all_index_keys[begin : begin + partition_size]
+            )
+            futures.append(self._executor.submit(call, **partition_inputs))
+
+        partition_outputs = [future.result() for future in futures]
+
+        # Merge the outputs of the partitions.
+        outputs = {}
+        for output_key, first_output in partition_outputs[0].items():
+            data = {}
+            for partition_output in partition_outputs:
+                data.update(partition_output[output_key].data)
+            index_keys = _output_index_keys(
+                implementation, output_key, operator_inputs, all_index_keys
+            )
+            outputs[output_key] = EventSet(
+                data={
+                    **{key: data[key] for key in index_keys if key in data},
+                    **data,
+                },
+                schema=first_output.schema,
+                name=first_output.name,
+            )
+        return outputs
+
+
+def _output_index_keys(
+    implementation: OperatorImplementation,
+    output_key: str,
+    operator_inputs: Dict[str, EventSet],
+    all_index_keys: List[NormalizedIndexKey],
+) -> List[NormalizedIndexKey]:
+    """Order of the index keys of an output when the operator runs on all the
+    index keys at once.
+
+    Operators emit the index keys of an output in the order of the input
+    sharing its sampling (e.g., the "sampling" argument of a resample), or
+    else in the order of the inputs.
+    """
+
+    sampling_node = implementation.operator.outputs[output_key].sampling_node
+    for evset in operator_inputs.values():
+        if evset.node().sampling_node is sampling_node:
+            return list(evset.data.keys())
+    return all_index_keys
+
+
+def _select_index_keys(
+    operator_inputs: Dict[str, EventSet], index_keys: List[NormalizedIndexKey]
+) -> Dict[str, EventSet]:
+    """Restricts EventSets to a subset of index keys, without copying data.
+
+    The restricted EventSets use the same EventSetNodes as the original ones
+    so that sampling comparisons in the implementations are preserved.
+    """
+
+    # Inputs referring to the same EventSet share the same restricted EventSet.
+    restricted: Dict[int, EventSet] = {}
+    for evset in operator_inputs.values():
+        if id(evset) in restricted:
+            continue
+        data = evset.data
+        restricted_evset = EventSet(
+            data={key: data[key] for key in index_keys if key in data},
+            schema=evset.schema,
+            name=evset.name,
+        )
+        restricted_evset._internal_node = evset.node()
+        restricted[id(evset)] = restricted_evset
+
+    return {
+        input_key: restricted[id(evset)]
+        for input_key, evset in operator_inputs.items()
+    }
+
+
+def _materialize_outputs(
+    step: ScheduleStep,
+    operator_outputs: Dict[str, EventSet],
+    data: Dict[EventSetNode, EventSet],
+) -> None:
+    """Records the outputs of a schedule step in "data"."""
+
+    for output_key, output_node in step.op.outputs.items():
+        output_evset = operator_outputs[output_key]
+        output_evset._internal_node = output_node
+        data[output_node] = output_evset
+
+
+def _run_schedule_parallel(
+    inputs: Dict[EventSetNode, EventSet],
+    schedule: Schedule,
+    verbose: int,
+    check_execution: CheckMode,
+    num_threads: int,
+    runner: Optional[_IndexPartitionedRunner],
+    profiler: Optional[Profiler],
+) -> Dict[EventSetNode, EventSet]:
+    """Evaluates a schedule using a pool of threads.
+
+    An operator is dispatched to the pool as soon as all the operators it
+    depends on are done. Reading and writing "data" is done by the calling
+    thread only.
+    """
+
+    data = {**inputs}
+    steps = schedule.steps
+    num_steps = len(steps)
+
+    # "node_to_step[n]" is the index of the step that computes the node "n".
+    node_to_step: Dict[EventSetNode, int] = {}
+    for step_idx, step in enumerate(steps):
+        for output_node in step.op.outputs.values():
+            node_to_step[output_node] = step_idx
+
+    # "step_to_num_pending_steps[s]" is the number of not yet computed steps
+    # that step "s" depends on. "step_to_dependent_steps[s]" is the list of
+    # steps that depend on step "s".
+    step_to_num_pending_steps: List[int] = [0] * num_steps
+    step_to_dependent_steps: Dict[int, List[int]] = defaultdict(list)
+
+    # "node_to_num_pending_usages[n]" is the number of not yet computed steps
+    # that use node "n" as input.
+    node_to_num_pending_usages: Dict[EventSetNode, int] = defaultdict(int)
+
+    for step_idx, step in enumerate(steps):
+        parent_steps = set()
+        for input_node in step.input_nodes.values():
+            node_to_num_pending_usages[input_node] += 1
+            if input_node in node_to_step:
+                parent_steps.add(node_to_step[input_node])
+        step_to_num_pending_steps[step_idx] = len(parent_steps)
+        for parent_step in parent_steps:
+            step_to_dependent_steps[parent_step].append(step_idx)
+
+    # Nodes that can be released once they are not used anymore. The other
+    # nodes (e.g. the query nodes) are kept until the end.
+    releasable_nodes: Set[EventSetNode] = {
+        node for step in steps for node in step.released_nodes
+    }
+
+    # "step_inputs[s]" are the inputs of the running step "s".
+    step_inputs: Dict[int, Dict[str, EventSet]] = {}
+
+    num_done_steps = 0
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        running: Dict[Future, int] = {}
+
+        def submit(step_idx: int) -> None:
+            step = steps[step_idx]
+            operator_inputs = {
+                input_key: data[input_node]
+                for input_key, input_node in step.input_nodes.items()
+            }
+            if verbose >= 2:
+                print(
+                    f"Start {step_idx+1} / {num_steps}: {step.op}",
+                    file=sys.stderr,
+                )
+            future = executor.submit(
+                _run_timed_step,
+                step,
+                operator_inputs,
+                check_execution,
+                runner,
+            )
+            running[future] = step_idx
+            step_inputs[step_idx] = operator_inputs
+
+        for step_idx in range(num_steps):
+            if step_to_num_pending_steps[step_idx] == 0:
+                submit(step_idx)
+
+        while running:
+            done, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+
+            # Process the steps in the schedule order to make the execution
+            # deterministic when possible.
+            for future in sorted(done, key=lambda f: running[f]):
+                step_idx = running.pop(future)
+                step = steps[step_idx]
+
+                operator_inputs = step_inputs.pop(step_idx)
+
+                # Raises the operator exception, if any.
+                operator_outputs, timing = future.result()
+                num_done_steps += 1
+
+                if verbose >= 1:
+                    print(
+                        (
+                            f"    {num_done_steps} / {num_steps}:"
+                            f" {step.op.operator_key()}"
+                            f" [{timing.wall_time:.5f} s]"
+                        ),
+                        file=sys.stderr,
+                    )
+
+                if profiler is not None:
+                    _record_step(
+                        profiler,
+                        step_idx,
+                        step,
+                        operator_inputs,
+                        operator_outputs,
+                        timing,
+                        live_evsets=[
+                            *data.values(),
+                            *operator_outputs.values(),
+                        ],
+                    )
+
+                _materialize_outputs(step, operator_outputs, data)
+
+                # Release unused memory
+                for input_node in step.input_nodes.values():
+                    node_to_num_pending_usages[input_node] -= 1
+                    if (
+                        node_to_num_pending_usages[input_node] == 0
+                        and input_node in releasable_nodes
+                    ):
+                        del data[input_node]
+
+                # Dispatch the steps that are now ready.
+                for dependent_step in step_to_dependent_steps[step_idx]:
+                    step_to_num_pending_steps[dependent_step] -= 1
+                    if step_to_num_pending_steps[dependent_step] == 0:
+                        submit(dependent_step)
+
+    assert num_done_steps == num_steps
+    return data
@@ -65,6 +65,7 @@ from temporian.implementation.numpy.operators import select_index_values
 from temporian.implementation.numpy.operators import since_last
 from temporian.implementation.numpy.operators import tick
 from temporian.implementation.numpy.operators import tick_calendar
+from temporian.implementation.numpy.operators import time_range
 from temporian.implementation.numpy.operators import timestamps
 from temporian.implementation.numpy.operators import unique_timestamps
 from temporian.implementation.numpy.operators import until_next
@@ -1,8 +1,13 @@
 from collections import defaultdict
-from typing import Dict
+from typing import Dict, List, Tuple
+
+import numpy as np
 
 from temporian.core.operators.add_index import AddIndexOperator
 from temporian.implementation.numpy import implementation_lib
+from temporian.implementation.numpy.data.dictionary_array import (
+    DictionaryArray,
+)
 from temporian.implementation.numpy.data.event_set import EventSet, IndexData
 from temporian.implementation.numpy.operators.base import OperatorImplementation
 from temporian.implementation.numpy_cc.operators import operators_cc
@@ -38,7 +43,13 @@ class AddIndexNumpyImplementation(OperatorImplementation):
                 group_keys,
                 row_idxs,
                 group_begin_idx,
-            ) = operators_cc.add_index_compute_index(index_features)
+            ) = operators_cc.add_index_compute_index(
+                [
+                    f.codes if isinstance(f, DictionaryArray) else f
+                    for f in index_features
+                ]
+            )
+            group_keys = _decode_group_keys(group_keys, index_features)
 
             for group_idx, group_key in enumerate(group_keys):
                 dst_index = src_index + group_key
@@ -64,6 +75,29 @@ class AddIndexNumpyImplementation(OperatorImplementation):
         }
 
 
+def _decode_group_keys(
+    group_keys: List[Tuple], index_features: List[np.ndarray]
+) -> List[Tuple]:
+    """Replaces the codes of the dictionary-encoded index features in the
+    group keys by their values."""
+
+    vocabularies = [
+        (idx, f.vocabulary.tolist())
+        for idx, f in enumerate(index_features)
+        if isinstance(f, DictionaryArray)
+    ]
+    if not vocabularies:
+        return group_keys
+
+    decoded_group_keys = []
+    for group_key in group_keys:
+        group_key = list(group_key)
+        for idx, vocabulary in vocabularies:
+            group_key[idx] = vocabulary[group_key[idx]]
+        decoded_group_keys.append(tuple(group_key))
+    return decoded_group_keys
+
+
 implementation_lib.register_operator_implementation(
     AddIndexOperator, AddIndexNumpyImplementation
 )
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Tuple
+from enum import Enum
+from itertools import islice
+from typing import Any, Dict, Optional, Tuple
 from temporian.implementation.numpy.data.dtype_normalization import (
     numpy_array_to_tp_dtype,
 )
@@ -13,7 +15,47 @@ from temporian.implementation.numpy.data.event_set import EventSet
 import numpy as np
 
 
+class CheckMode(str, Enum):
+    """Validation of the inputs and outputs of the operator implementations.
+
+    off: No validation.
+    sampled: Validates at most `config.check_execution_max_index_keys` index
+        keys of each input and output. The overhead does not depend on the
+        number of index keys.
+    full: Validates all the index keys.
+    """
+
+    off = "off"
+    sampled = "sampled"
+    full = "full"
+
+    def __str__(self) -> str:
+        return self.value
+
+    def __repr__(self) -> str:
+        return self.value
+
+    @classmethod
+    def is_valid(cls, value: Any) -> bool:
+        return isinstance(value, CheckMode) or (
+            isinstance(value, str)
+            and value in [item.value for item in CheckMode]
+        )
+
+
 class OperatorImplementation(ABC):
+    # If true, and if all the inputs and outputs of the operator have the same
+    # non-empty index, the operator can be applied independently on disjoint
+    # subsets of index keys and the results merged. Only set this on
+    # implementations whose output for an index key only depends on the inputs
+    # for the same index key.
+    index_wise: bool = False
+
+    # If true, the operator processes inputs in the compact layout (see
+    # "CompactData") in a single vectorized call instead of one call per index
+    # key. Such inputs are not split into partitions of index keys.
+    supports_compact_data: bool = False
+
     def __init__(self, operator: Operator):
         assert operator is not None
         self._operator = operator
@@ -23,12 +65,27 @@ class OperatorImplementation(ABC):
     def operator(self):
         return self._operator
 
-    def call(self, **inputs: EventSet) -> Dict[str, EventSet]:
-        """Like __call__, but with checks."""
+    def call(
+        self, max_index_keys: Optional[int] = None, **inputs: EventSet
+    ) -> Dict[str, EventSet]:
+        """Like __call__, but with checks.
+
+        Args:
+            max_index_keys: Maximum number of index keys to check in each
+                input and output. If None, all the index keys are checked.
+            **inputs: Inputs of the operator.
+        """
 
-        _check_input(inputs=inputs, operator=self.operator)
+        _check_input(
+            inputs=inputs, operator=self.operator, max_index_keys=max_index_keys
+        )
         outputs = self(**inputs)
-        _check_output(inputs=inputs, outputs=outputs, operator=self.operator)
+        _check_output(
+            inputs=inputs,
+            outputs=outputs,
+            operator=self.operator,
+            max_index_keys=max_index_keys,
+        )
         return outputs
 
     @abstractmethod
@@ -64,8 +121,13 @@ def _check_value_to_schema(
     values: Dict[str, EventSet],
     nodes: Dict[str, EventSetNode],
     label: str,
+    max_index_keys: Optional[int] = None,
 ) -> None:
-    """Checks if EventSets are matching the expected schema."""
+    """Checks if EventSets are matching the expected schema.
+
+    Only checks the first `max_index_keys` index keys of each EventSet. If
+    None, checks all the index keys.
+    """
 
     for key, node in nodes.items():
         value = values[key]
@@ -77,8 +139,7 @@ def _check_value_to_schema(
                 f"Expected schema:\n{node.schema}"
             )
 
-        index_data = value.get_arbitrary_index_data()
-        if index_data is not None:
+        for index_data in islice(value.data.values(), max_index_keys):
             if len(index_data.features) != len(value.schema.features):
                 raise RuntimeError(
                     "Invalid internal number of input features for argument"
@@ -110,6 +171,7 @@ def _check_value_to_schema(
 def _check_input(
     inputs: Dict[str, EventSet],
     operator: Operator,
+    max_index_keys: Optional[int] = None,
 ) -> None:
     """Checks if the input/output of an operator matches its definition."""
 
@@ -124,13 +186,19 @@ def _check_input(
                 f"Expected: {expected_input_keys}."
             )
 
-        _check_value_to_schema(inputs, nodes=operator.inputs, label="input")
+        _check_value_to_schema(
+            inputs,
+            nodes=operator.inputs,
+            label="input",
+            max_index_keys=max_index_keys,
+        )
 
 
 def _check_output(
     inputs: Dict[str, EventSet],
     outputs: Dict[str, EventSet],
     operator: Operator,
+    max_index_keys: Optional[int] = None,
 ) -> None:
     """Checks if the input/output of an operator matches its definition."""
 
@@ -145,7 +213,12 @@ def _check_output(
                 f"Expected: {expected_output_keys}."
             )
 
-        _check_value_to_schema(outputs, nodes=operator.outputs, label="outputs")
+        _check_value_to_schema(
+            outputs,
+            nodes=operator.outputs,
+            label="outputs",
+            max_index_keys=max_index_keys,
+        )
 
         # Check for unnecessary memory copy.
         for output_key in operator.outputs.keys():
@@ -161,7 +234,9 @@ def _check_output(
                     input_key,
                     output_key,
                 ) in matching_samplings
-                is_same, reason = _is_same_sampling(output, input)
+                is_same, reason = _is_same_sampling(
+                    output, input, max_index_keys=max_index_keys
+                )
                 if expected_matching_sampling and not is_same:
                     raise RuntimeError(
                         f"The sampling of the input argument '{input_key}' and"
@@ -172,18 +247,34 @@ def _check_output(
                     )
 
 
-def _is_same_sampling(evset_1: EventSet, evset_2: EventSet) -> Tuple[bool, str]:
-    if evset_1.schema.indexes != evset_2.schema.indexes:
-        return (False, "Different indexes")
+def _is_same_array(array_1: np.ndarray, array_2: np.ndarray) -> bool:
+    """Tests if two arrays are the same array, or views of the same memory.
 
-    # Number of index keys to ensure that the numpy array containing
-    # timestamps is the same for both evset_1 and evset_2.
-    num_checks = 1 if config.debug_mode else len(evset_1.data)
+    Views of the same memory are created when accessing the index keys of
+    EventSets in the compact layout.
+    """
 
-    for i, (index_key, index_data_1) in enumerate(evset_1.data.items()):
-        if i >= num_checks:
-            break
+    if array_1 is array_2:
+        return True
+    return (
+        array_1.__array_interface__["data"][0]
+        == array_2.__array_interface__["data"][0]
+        and array_1.shape == array_2.shape
+        and array_1.strides == array_2.strides
+    )
+
+
+def _is_same_sampling(
+    evset_1: EventSet,
+    evset_2: EventSet,
+    max_index_keys: Optional[int] = None,
+) -> Tuple[bool, str]:
+    if evset_1.schema.indexes != evset_2.schema.indexes:
+        return (False, "Different indexes")
 
+    # Check that the numpy arrays containing the timestamps are the same for
+    # both evset_1 and evset_2, on the first "max_index_keys" index keys.
+    for index_key, index_data_1 in islice(evset_1.data.items(), max_index_keys):
         if index_key not in evset_2.data:
             return (
                 False,
@@ -193,7 +284,7 @@ def _is_same_sampling(evset_1: EventSet, evset_2: EventSet) -> Tuple[bool, str]:
                 ),
             )
         index_data_2 = evset_2.data[index_key]
-        if index_data_1.timestamps is not index_data_2.timestamps:
+        if not _is_same_array(index_data_1.timestamps, index_data_2.timestamps):
             return (
                 False,
                 (
@@ -90,7 +90,7 @@ class DivideNumpyImplementation(BaseBinaryNumpyImplementation):
         evset_2_feature: np.ndarray,
         dtype: DType,
     ) -> np.ndarray:
-        if evset_1_feature.dtype in [DType.INT32, DType.INT64]:
+        if dtype.is_integer:
             raise ValueError(
                 "Cannot use the divide operator on feature "
                 f"{evset_1_feature} of type {evset_1_feature.dtype.type}. "
@@ -20,10 +20,14 @@ from temporian.core.data.dtype import DType
 from temporian.core.operators.binary.base import BaseBinaryOperator
 from temporian.implementation.numpy.data.event_set import IndexData
 from temporian.implementation.numpy.data.event_set import EventSet
+from temporian.implementation.numpy.data.event_set import CompactData
 from temporian.implementation.numpy.operators.base import OperatorImplementation
 
 
 class BaseBinaryNumpyImplementation(OperatorImplementation):
+    index_wise = True
+    supports_compact_data = True
+
     def __init__(self, operator: BaseBinaryOperator) -> None:
         super().__init__(operator)
         assert isinstance(operator, BaseBinaryOperator)
@@ -61,6 +65,25 @@ class BaseBinaryNumpyImplementation(OperatorImplementation):
             )
         num_features = len(input_1.schema.features)
 
+        if (
+            isinstance(input_1.data, CompactData)
+            and isinstance(input_2.data, CompactData)
+            and input_1.data.has_same_layout(input_2.data)
+        ):
+            data = input_1.data.with_features(
+                [
+                    self._do_operation(
+                        feature_1, feature_2, feature_schema.dtype
+                    )
+                    for feature_1, feature_2, feature_schema in zip(
+                        input_1.data.features,
+                        input_2.data.features,
+                        input_1.schema.features,
+                    )
+                ]
+            )
+            return {"output": EventSet(data=data, schema=output_schema)}
+
         # create destination EventSet
         dst_evset = EventSet(data={}, schema=output_schema)
 
@@ -26,6 +26,7 @@ from temporian.core.operators.binary import (
     LessEqualOperator,
 )
 from temporian.implementation.numpy import implementation_lib
+from temporian.implementation.numpy.data import dictionary_array
 
 
 class EqualNumpyImplementation(BaseBinaryNumpyImplementation):
@@ -41,10 +42,10 @@ class EqualNumpyImplementation(BaseBinaryNumpyImplementation):
         dtype: DType,
     ) -> np.ndarray:
         if dtype == DType.STRING:
-            return np.char.equal(evset_1_feature.data, evset_2_feature.data)
+            return dictionary_array.equal(evset_1_feature, evset_2_feature)
         else:
             # returns False on both NaNs
-            return np.equal(evset_1_feature.data, evset_2_feature.data)
+            return np.equal(evset_1_feature, evset_2_feature)
 
 
 class NotEqualNumpyImplementation(BaseBinaryNumpyImplementation):
@@ -58,9 +59,9 @@ class NotEqualNumpyImplementation(BaseBinaryNumpyImplementation):
         dtype: DType,
     ) -> np.ndarray:
         if dtype == DType.STRING:
-            return np.char.not_equal(evset_1_feature.data, evset_2_feature.data)
+            return ~dictionary_array.equal(evset_1_feature, evset_2_feature)
         else:
-            return np.not_equal(evset_1_feature.data, evset_2_feature.data)
+            return np.not_equal(evset_1_feature, evset_2_feature)
 
 
 class GreaterNumpyImplementation(BaseBinaryNumpyImplementation):
@@ -73,7 +74,7 @@ class GreaterNumpyImplementation(BaseBinaryNumpyImplementation):
         evset_2_feature: np.ndarray,
         dtype: DType,
     ) -> np.ndarray:
-        return np.greater(evset_1_feature.data, evset_2_feature.data)
+        return np.greater(evset_1_feature, evset_2_feature)
 
 
 class GreaterEqualNumpyImplementation(BaseBinaryNumpyImplementation):
@@ -86,7 +87,7 @@ class GreaterEqualNumpyImplementation(BaseBinaryNumpyImplementation):
         evset_2_feature: np.ndarray,
         dtype: DType,
     ) -> np.ndarray:
-        return np.greater_equal(evset_1_feature.data, evset_2_feature.data)
+        return np.greater_equal(evset_1_feature, evset_2_feature)
 
 
 class LessNumpyImplementation(BaseBinaryNumpyImplementation):
@@ -99,7 +100,7 @@ class LessNumpyImplementation(BaseBinaryNumpyImplementation):
         evset_2_feature: np.ndarray,
         dtype: DType,
     ) -> np.ndarray:
-        return np.less(evset_1_feature.data, evset_2_feature.data)
+        return np.less(evset_1_feature, evset_2_feature)
 
 
 class LessEqualNumpyImplementation(BaseBinaryNumpyImplementation):
@@ -112,7 +113,7 @@ class LessEqualNumpyImplementation(BaseBinaryNumpyImplementation):
         evset_2_feature: np.ndarray,
         dtype: DType,
     ) -> np.ndarray:
-        return np.less_equal(evset_1_feature.data, evset_2_feature.data)
+        return np.less_equal(evset_1_feature, evset_2_feature)
 
 
 implementation_lib.register_operator_implementation(
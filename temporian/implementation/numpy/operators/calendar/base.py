@@ -12,20 +12,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 from abc import abstractmethod
-from datetime import datetime, timezone, timedelta
-from typing import Dict
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple, Union
 
 import numpy as np
+import pytz
 
+from temporian.core.data.duration_utils import TimestampUnit
 from temporian.core.operators.calendar.base import BaseCalendarOperator
-from temporian.implementation.numpy.data.event_set import IndexData, EventSet
+from temporian.implementation.numpy.data.event_set import (
+    CompactData,
+    EventSet,
+    IndexData,
+)
 from temporian.implementation.numpy.operators.base import OperatorImplementation
 
 
 class BaseCalendarNumpyImplementation(OperatorImplementation):
     """Interface definition and common logic for numpy implementation of
-    calendar operators."""
+    calendar operators.
+
+    The calendar values are computed for all the timestamps of an index key
+    (or of all the index keys, in the compact layout) at once, with NumPy
+    integer and `datetime64` arithmetic.
+    """
+
+    index_wise = True
+    supports_compact_data = True
 
     def __init__(self, operator: BaseCalendarOperator) -> None:
         super().__init__(operator)
@@ -34,42 +49,223 @@ class BaseCalendarNumpyImplementation(OperatorImplementation):
     def __call__(self, sampling: EventSet) -> Dict[str, EventSet]:
         assert isinstance(self.operator, BaseCalendarOperator)
         output_schema = self.output_schema("output")
-        tzinfo = timezone(timedelta(hours=self.operator.utc_offset))
+        timestamp_unit = sampling.schema.timestamp_unit
+
+        def compute(timestamps: np.ndarray) -> np.ndarray:
+            seconds = to_local_seconds(
+                timestamps,
+                timestamp_unit,
+                self.operator.utc_offset,
+                self.operator.timezone,
+            )
+            return self._get_value_from_seconds(seconds).astype(np.int32)
+
+        if isinstance(sampling.data, CompactData):
+            data = sampling.data.with_features(
+                [compute(sampling.data.timestamps)]
+            )
+            return {"output": EventSet(data=data, schema=output_schema)}
 
         # create destination EventSet
         dst_evset = EventSet(data={}, schema=output_schema)
         for index_key, index_data in sampling.data.items():
-            value = np.array(
-                [
-                    self._get_value_from_datetime(
-                        datetime.fromtimestamp(ts, tz=tzinfo)
-                    )
-                    for ts in index_data.timestamps
-                ],
-                dtype=np.int32,
-            )
-
             dst_evset.set_index_value(
                 index_key,
-                IndexData([value], index_data.timestamps, schema=output_schema),
+                IndexData(
+                    [compute(index_data.timestamps)],
+                    index_data.timestamps,
+                    schema=output_schema,
+                ),
                 normalize=False,
             )
 
         return {"output": dst_evset}
 
     @abstractmethod
-    def _get_value_from_datetime(self, dt: datetime) -> int:
-        """Gets the value of the datetime object that corresponds to each
-        specific calendar operator.
+    def _get_value_from_seconds(self, seconds: np.ndarray) -> np.ndarray:
+        """Gets the values that correspond to each specific calendar operator.
 
-        For example, calendar_day_of_month will return the datetime's day, and
-        calendar_hour its hour.
+        For example, calendar_day_of_month will return the days of the month,
+        and calendar_hour the hours.
 
-        Returned value is converted to int32 by __call__.
+        Returned values are converted to int32 by __call__.
 
         Args:
-            dt: Datetime to get the value from.
+            seconds: Local times, as int64 numbers of seconds since 1970-01-01
+                00:00 in the timezone of the operator (see
+                `to_local_seconds`).
 
         Returns:
-            Numeric value for the datetime.
+            Numeric value for each local time.
         """
+
+
+_SECONDS_PER_DAY = 86_400
+_MICROSECONDS_PER_SECOND = 1_000_000
+_MICROSECOND = timedelta(microseconds=1)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+
+
+def to_local_seconds(
+    timestamps: np.ndarray,
+    unit: Optional[TimestampUnit],
+    utc_offset: float,
+    timezone: Optional[str],
+) -> np.ndarray:
+    """Converts unix timestamps into local times.
+
+    Gives the same results as `datetime.fromtimestamp(timestamp, tz=...)`:
+    Float timestamps are rounded to the microsecond, and int64 timestamps are
+    truncated to the microsecond.
+
+    Args:
+        timestamps: Float64 unix timestamps in seconds, or int64 unix
+            timestamps in `unit`.
+        unit: Unit of int64 timestamps, or None for float timestamps.
+        utc_offset: Offset of the timezone in hours. Ignored if `timezone` is
+            set.
+        timezone: Name of a timezone (see `pytz.all_timezones`). The offset of
+            the timezone, including daylight saving time, depends on the
+            timestamp.
+
+    Returns:
+        Int64 numbers of seconds since 1970-01-01 00:00 in the local time.
+    """
+
+    microseconds = _to_microseconds(timestamps, unit)
+    if timezone is None:
+        offsets = timedelta(hours=utc_offset) // _MICROSECOND
+    else:
+        offsets = _timezone_offsets(microseconds, timezone)
+    return np.floor_divide(microseconds + offsets, _MICROSECONDS_PER_SECOND)
+
+
+def _to_microseconds(
+    timestamps: np.ndarray, unit: Optional[TimestampUnit]
+) -> np.ndarray:
+    """Converts unix timestamps into int64 microseconds since the epoch."""
+
+    if unit is not None:
+        seconds, sub_ticks = np.divmod(timestamps, unit.ticks_per_second)
+        return (
+            seconds * _MICROSECONDS_PER_SECOND
+            + sub_ticks * _MICROSECONDS_PER_SECOND // unit.ticks_per_second
+        )
+
+    if not np.isfinite(timestamps).all():
+        raise ValueError(
+            "Calendar operators require finite timestamps. Got NaN or infinite"
+            " timestamps."
+        )
+    # Like "datetime.fromtimestamp", the fractional part of the seconds is
+    # rounded half to even.
+    seconds = np.floor(timestamps)
+    microseconds = np.round((timestamps - seconds) * _MICROSECONDS_PER_SECOND)
+    return seconds.astype(
+        np.int64
+    ) * _MICROSECONDS_PER_SECOND + microseconds.astype(np.int64)
+
+
+def _timezone_offsets(
+    microseconds: np.ndarray, timezone: str
+) -> Union[int, np.ndarray]:
+    """Offsets, in microseconds, of a timezone at the given unix times."""
+
+    transitions = _timezone_transitions(timezone)
+    if isinstance(transitions, int):
+        return transitions
+    times, offsets = transitions
+    # Same lookup as "pytz.tzinfo.DstTzInfo.fromutc".
+    idx = np.searchsorted(times, microseconds, side="right") - 1
+    return offsets[np.maximum(idx, 0)]
+
+
+@functools.lru_cache(maxsize=None)
+def _timezone_transitions(
+    timezone: str,
+) -> Union[int, Tuple[np.ndarray, np.ndarray]]:
+    """Offset changes of a timezone.
+
+    Returns the offset in microseconds of a timezone with a constant offset.
+    Otherwise, returns the times (in unix microseconds) at which the offset
+    changes, and the offset in microseconds starting at each time.
+    """
+
+    tz = pytz.timezone(timezone)
+    times = getattr(tz, "_utc_transition_times", None)
+    if times is None:
+        # E.g., "UTC" or "Etc/GMT+3".
+        return tz.utcoffset(_NAIVE_EPOCH) // _MICROSECOND
+    return (
+        np.array([(t - _NAIVE_EPOCH) // _MICROSECOND for t in times], np.int64),
+        np.array(
+            [info[0] // _MICROSECOND for info in tz._transition_info], np.int64
+        ),
+    )
+
+
+def days(seconds: np.ndarray) -> np.ndarray:
+    """Days since 1970-01-01 of local times."""
+
+    return np.floor_divide(seconds, _SECONDS_PER_DAY)
+
+
+def _dates(seconds: np.ndarray) -> np.ndarray:
+    return days(seconds).astype("datetime64[D]")
+
+
+def year(seconds: np.ndarray) -> np.ndarray:
+    return _dates(seconds).astype("datetime64[Y]").astype(np.int64) + 1970
+
+
+def month(seconds: np.ndarray) -> np.ndarray:
+    """Month, from 1 (January) to 12."""
+
+    return _dates(seconds).astype("datetime64[M]").astype(np.int64) % 12 + 1
+
+
+def day_of_month(seconds: np.ndarray) -> np.ndarray:
+    """Day of the month, from 1 to 31."""
+
+    dates = _dates(seconds)
+    return (dates - dates.astype("datetime64[M]")).astype(np.int64) + 1
+
+
+def day_of_year(seconds: np.ndarray) -> np.ndarray:
+    """Day of the year, from 1 to 366."""
+
+    dates = _dates(seconds)
+    return (dates - dates.astype("datetime64[Y]")).astype(np.int64) + 1
+
+
+def day_of_week(seconds: np.ndarray) -> np.ndarray:
+    """Day of the week, from 0 (Monday) to 6."""
+
+    # 1970-01-01 was a Thursday.
+    return (days(seconds) + 3) % 7
+
+
+def iso_week(seconds: np.ndarray) -> np.ndarray:
+    """ISO 8601 week number, from 1 to 53.
+
+    The ISO week of a day is the week of the Thursday of the same week
+    (starting on Monday) in the year of this Thursday.
+    """
+
+    thursdays = (days(seconds) - day_of_week(seconds) + 3).astype(
+        "datetime64[D]"
+    )
+    first_days = thursdays.astype("datetime64[Y]").astype("datetime64[D]")
+    return (thursdays - first_days).astype(np.int64) // 7 + 1
+
+
+def hour(seconds: np.ndarray) -> np.ndarray:
+    return seconds % _SECONDS_PER_DAY // 3600
+
+
+def minute(seconds: np.ndarray) -> np.ndarray:
+    return seconds % 3600 // 60
+
+
+def second(seconds: np.ndarray) -> np.ndarray:
+    return seconds % 60
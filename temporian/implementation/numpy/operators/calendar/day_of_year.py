@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from datetime import datetime
+import numpy as np
 
 from temporian.core.operators.calendar.day_of_year import (
     CalendarDayOfYearOperator,
@@ -20,6 +20,7 @@ from temporian.core.operators.calendar.day_of_year import (
 from temporian.implementation.numpy import implementation_lib
 from temporian.implementation.numpy.operators.calendar.base import (
     BaseCalendarNumpyImplementation,
+    day_of_year,
 )
 
 
@@ -29,8 +30,8 @@ class CalendarDayOfYearNumpyImplementation(BaseCalendarNumpyImplementation):
     def __init__(self, operator: CalendarDayOfYearOperator) -> None:
         super().__init__(operator)
 
-    def _get_value_from_datetime(self, dt: datetime) -> int:
-        return dt.timetuple().tm_yday
+    def _get_value_from_seconds(self, seconds: np.ndarray) -> np.ndarray:
+        return day_of_year(seconds)
 
 
 implementation_lib.register_operator_implementation(
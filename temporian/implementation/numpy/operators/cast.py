@@ -8,12 +8,23 @@ from temporian.implementation.numpy import implementation_lib
 from temporian.implementation.numpy.data.dtype_normalization import (
     tp_dtype_to_np_dtype,
 )
-from temporian.implementation.numpy.data.event_set import EventSet, IndexData
+from temporian.implementation.numpy.data.event_set import (
+    CompactData,
+    EventSet,
+    IndexData,
+)
 from temporian.implementation.numpy.operators.base import OperatorImplementation
 
 _DTYPE_LIMITS = {
+    DType.INT8: np.iinfo(np.int8),
+    DType.INT16: np.iinfo(np.int16),
     DType.INT32: np.iinfo(np.int32),
     DType.INT64: np.iinfo(np.int64),
+    DType.UINT8: np.iinfo(np.uint8),
+    DType.UINT16: np.iinfo(np.uint16),
+    DType.UINT32: np.iinfo(np.uint32),
+    DType.UINT64: np.iinfo(np.uint64),
+    DType.FLOAT16: np.finfo(np.float16),
     DType.FLOAT32: np.finfo(np.float32),
     DType.FLOAT64: np.finfo(np.float64),
 }
@@ -31,7 +42,11 @@ def _can_overflow(origin_dtype: DType, dst_dtype: DType) -> bool:
     """
     if origin_dtype in _NO_CHECK_TYPES or dst_dtype in _NO_CHECK_TYPES:
         return False
-    return _DTYPE_LIMITS[origin_dtype].max > _DTYPE_LIMITS[dst_dtype].max
+    origin_limits = _DTYPE_LIMITS[origin_dtype]
+    dst_limits = _DTYPE_LIMITS[dst_dtype]
+    return (
+        origin_limits.max > dst_limits.max or origin_limits.min < dst_limits.min
+    )
 
 
 def _check_overflow(
@@ -50,6 +65,9 @@ def _check_overflow(
 
 
 class CastNumpyImplementation(OperatorImplementation):
+    index_wise = True
+    supports_compact_data = True
+
     def __init__(self, operator: CastOperator) -> None:
         super().__init__(operator)
 
@@ -79,23 +97,21 @@ class CastNumpyImplementation(OperatorImplementation):
             tp_dtype_to_np_dtype(tp_dtype) for tp_dtype in self.operator.dtypes
         ]
 
-        output_evset = EventSet(data={}, schema=output_schema)
-        for index_key, index_data in input.data.items():
+        def cast_features(features: List[np.ndarray]) -> List[np.ndarray]:
             dst_features = []
-            for feature_idx, (
+            for (
+                src_values,
                 min_max,
                 np_dtype,
                 src_schema,
                 dst_schema,
-            ) in enumerate(
-                zip(
-                    mins_maxs,
-                    np_dtypes,
-                    input.schema.features,
-                    output_schema.features,
-                )
+            ) in zip(
+                features,
+                mins_maxs,
+                np_dtypes,
+                input.schema.features,
+                output_schema.features,
             ):
-                src_values = index_data.features[feature_idx]
                 if min_max is not None:
                     _check_overflow(
                         src_values,
@@ -105,11 +121,18 @@ class CastNumpyImplementation(OperatorImplementation):
                         min_max,
                     )
                 dst_features.append(src_values.astype(np_dtype))
+            return dst_features
 
+        if isinstance(input.data, CompactData):
+            data = input.data.with_features(cast_features(input.data.features))
+            return {"output": EventSet(data=data, schema=output_schema)}
+
+        output_evset = EventSet(data={}, schema=output_schema)
+        for index_key, index_data in input.data.items():
             output_evset.set_index_value(
                 index_key,
                 IndexData(
-                    features=dst_features,
+                    features=cast_features(index_data.features),
                     timestamps=index_data.timestamps,
                     schema=output_schema,
                 ),
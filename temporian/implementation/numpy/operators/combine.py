@@ -30,6 +30,8 @@ from temporian.implementation.numpy.operators.base import OperatorImplementation
 
 
 class CombineNumpyImplementation(OperatorImplementation):
+    index_wise = True
+
     def __init__(self, operator: Combine) -> None:
         assert isinstance(operator, Combine)
         super().__init__(operator)
@@ -5,6 +5,7 @@ import numpy as np
 
 from temporian.core.operators.drop_index import DropIndexOperator
 from temporian.implementation.numpy import implementation_lib
+from temporian.implementation.numpy.data import dictionary_array
 from temporian.implementation.numpy.data.event_set import EventSet, IndexData
 from temporian.implementation.numpy.operators.base import OperatorImplementation
 
@@ -82,7 +83,9 @@ class DropIndexNumpyImplementation(OperatorImplementation):
 
             # Append together and sort (according to the timestamps) all the feature values.
             aggregated_features = [
-                np.concatenate([f[idx] for f in group.features])[sorted_idxs]
+                dictionary_array.concatenate([f[idx] for f in group.features])[
+                    sorted_idxs
+                ]
                 for idx in range(num_output_features)
             ]
 
@@ -26,6 +26,8 @@ from temporian.implementation.numpy.operators.base import OperatorImplementation
 
 
 class EndNumpyImplementation(OperatorImplementation):
+    index_wise = True
+
     def __init__(self, operator: EndOperator) -> None:
         assert isinstance(operator, EndOperator)
         super().__init__(operator)
@@ -40,10 +42,11 @@ class EndNumpyImplementation(OperatorImplementation):
         # fill output EventSet data
         for index_key, index_data in input.data.items():
             if len(index_data.timestamps) == 0:
-                dst_timestamps = np.array([], dtype=np.float64)
+                dst_timestamps = np.array([], dtype=index_data.timestamps.dtype)
             else:
                 dst_timestamps = np.array(
-                    [index_data.timestamps[-1]], dtype=np.float64
+                    [index_data.timestamps[-1]],
+                    dtype=index_data.timestamps.dtype,
                 )
             output_evset.set_index_value(
                 index_key,
@@ -26,6 +26,8 @@ from temporian.implementation.numpy.operators.base import OperatorImplementation
 
 
 class EnumerateNumpyImplementation(OperatorImplementation):
+    index_wise = True
+
     def __init__(self, operator: Enumerate) -> None:
         assert isinstance(operator, Enumerate)
         super().__init__(operator)
@@ -16,8 +16,10 @@
 """Implementation for the FFT operator."""
 
 
-from typing import Dict
+from typing import Dict, Optional
+
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from temporian.implementation.numpy.data.event_set import IndexData, EventSet
 from temporian.core.operators.fast_fourier_transform import FastFourierTransform
@@ -26,6 +28,8 @@ from temporian.implementation.numpy.operators.base import OperatorImplementation
 
 
 class FastFourierTransformNumpyImplementation(OperatorImplementation):
+    index_wise = True
+
     def __init__(self, operator: FastFourierTransform) -> None:
         assert isinstance(operator, FastFourierTransform)
         super().__init__(operator)
@@ -55,29 +59,42 @@ class FastFourierTransformNumpyImplementation(OperatorImplementation):
         else:
             raise ValueError(f"Unknown window {self.operator.window}")
 
+        # Buffer of windowed frames, reused across batches and index keys.
+        buffer = None
+        if window is not None:
+            max_num_frames = max(
+                (
+                    (len(index_data) - num_events) // hop_size + 1
+                    for index_data in input.data.values()
+                ),
+                default=0,
+            )
+            buffer = np.empty(
+                (
+                    max(0, min(max_num_frames, _batch_size(num_events))),
+                    num_events,
+                ),
+                dtype=np.float64,
+            )
+
         # Fill output EventSet's data
         for index_key, index_data in input.data.items():
             src_values = index_data.features[0]
             dst_timestamps = index_data.timestamps[(num_events - 1) :: hop_size]
 
-            # TODO: Implement in c++.
-
-            dst_values = []
-            for evt_idx in range(num_events - 1, len(src_values), hop_size):
-                start_idx = evt_idx - num_events + 1
-                end_idx = evt_idx + 1
-                selected_src_values = src_values[start_idx:end_idx]
-                if window is not None:
-                    selected_src_values = selected_src_values * window
-                fft_res = np.fft.fft(selected_src_values)[:num_spectral_lines]
-                ft_ampl = np.abs(fft_res).astype(src_values.dtype)
-                dst_values.append(ft_ampl)
-            dst_values = np.stack(dst_values, axis=1)
+            dst_values = _spectral_amplitudes(
+                src_values,
+                num_events=num_events,
+                hop_size=hop_size,
+                num_spectral_lines=num_spectral_lines,
+                window=window,
+                buffer=buffer,
+            )
 
             output_evset.set_index_value(
                 index_key,
                 IndexData(
-                    features=dst_values,
+                    features=list(dst_values),
                     timestamps=dst_timestamps,
                     schema=output_schema,
                 ),
@@ -86,6 +103,55 @@ class FastFourierTransformNumpyImplementation(OperatorImplementation):
         return {"output": output_evset}
 
 
+# Maximum number of values in the frames transformed in a single call.
+_BATCH_NUM_VALUES = 1 << 20
+
+
+def _batch_size(num_events: int) -> int:
+    """Number of frames transformed in a single call."""
+
+    return max(1, _BATCH_NUM_VALUES // num_events)
+
+
+def _spectral_amplitudes(
+    values: np.ndarray,
+    num_events: int,
+    hop_size: int,
+    num_spectral_lines: int,
+    window: Optional[np.ndarray],
+    buffer: Optional[np.ndarray],
+) -> np.ndarray:
+    """Amplitudes of the spectral lines of the frames of a signal.
+
+    The frames are the windows of "num_events" consecutive values ending every
+    "hop_size" values. The frames are read from a strided view of the values,
+    multiplied by the window into "buffer", and transformed in batches of
+    "len(buffer)" frames with a single call to "np.fft.rfft" per batch.
+
+    Returns:
+        An array of shape (num_spectral_lines, num_frames).
+    """
+
+    if len(values) < num_events:
+        return np.empty((num_spectral_lines, 0), dtype=values.dtype)
+
+    frames = sliding_window_view(values, num_events)[::hop_size]
+    num_frames = len(frames)
+    amplitudes = np.empty((num_spectral_lines, num_frames), dtype=values.dtype)
+
+    batch_size = _batch_size(num_events)
+    for begin in range(0, num_frames, batch_size):
+        batch = frames[begin : begin + batch_size]
+        if window is not None:
+            assert buffer is not None
+            batch = np.multiply(batch, window, out=buffer[: len(batch)])
+        # The input is real: The first "num_events // 2 + 1" lines of "rfft"
+        # are the ones of "fft".
+        spectrum = np.fft.rfft(batch, axis=1)[:, :num_spectral_lines]
+        amplitudes[:, begin : begin + len(batch)] = np.abs(spectrum).T
+    return amplitudes
+
+
 implementation_lib.register_operator_implementation(
     FastFourierTransform, FastFourierTransformNumpyImplementation
 )
@@ -10,6 +10,8 @@ from temporian.implementation.numpy.operators.base import OperatorImplementation
 class FilterNumpyImplementation(OperatorImplementation):
     """Numpy implementation of the filter operator."""
 
+    index_wise = True
+
     def __init__(self, operator: FilterOperator) -> None:
         super().__init__(operator)
 
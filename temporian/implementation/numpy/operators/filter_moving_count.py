@@ -19,6 +19,7 @@
 from typing import Dict
 import numpy as np
 
+from temporian.core.data.duration_utils import duration_in_timestamp_unit
 from temporian.implementation.numpy.data.event_set import IndexData, EventSet
 from temporian.core.operators.filter_moving_count import (
     FilterMaxMovingCount,
@@ -29,6 +30,8 @@ from temporian.implementation.numpy_cc.operators import operators_cc
 
 
 class FilterMaxMovingCountNumpyImplementation(OperatorImplementation):
+    index_wise = True
+
     def __init__(self, operator: FilterMaxMovingCount) -> None:
         assert isinstance(operator, FilterMaxMovingCount)
         super().__init__(operator)
@@ -41,7 +44,9 @@ class FilterMaxMovingCountNumpyImplementation(OperatorImplementation):
         # Create output EventSet
         output_evset = EventSet(data={}, schema=output_schema)
 
-        window_length = self.operator.window_length
+        window_length = duration_in_timestamp_unit(
+            self.operator.window_length, input.schema.timestamp_unit
+        )
 
         # Fill output EventSet's data
         for index_key, index_data in input.data.items():
@@ -0,0 +1,183 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Implementation of a group of fused element-wise operators."""
+
+from collections import Counter
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from temporian.core.data.node import EventSetNode
+from temporian.core.operators.base import Operator
+from temporian.implementation.numpy import implementation_lib
+from temporian.implementation.numpy.data.event_set import (
+    CompactData,
+    EventSet,
+    IndexData,
+)
+from temporian.implementation.numpy.operators.base import (
+    OperatorImplementation,
+    _check_value_to_schema,
+)
+from temporian.implementation.numpy.operators.binary.base import (
+    BaseBinaryNumpyImplementation,
+)
+from temporian.implementation.numpy.operators.scalar.base import (
+    BaseScalarNumpyImplementation,
+)
+from temporian.implementation.numpy.operators.unary import (
+    BaseUnaryNumpyImplementation,
+)
+
+
+class FusedElementwiseNumpyImplementation(OperatorImplementation):
+    """Applies a chain of element-wise operators in a single pass.
+
+    The operators are applied one index key at a time. The intermediate
+    results are only kept for the index key being processed, and are released
+    as soon as they are consumed.
+
+    Args:
+        operator: Last operator of the chain. Its outputs are the outputs of
+            the chain.
+        fused_ops: Other operators of the chain, in order of execution.
+        input_nodes: Inputs of the chain.
+    """
+
+    index_wise = True
+    supports_compact_data = True
+
+    def __init__(
+        self,
+        operator: Operator,
+        fused_ops: List[Operator],
+        input_nodes: Dict[str, EventSetNode],
+    ) -> None:
+        super().__init__(operator)
+        self._ops = fused_ops + [operator]
+        self._input_nodes = input_nodes
+        self._implementations = [
+            implementation_lib.get_implementation_class(op.definition.key)(op)
+            for op in self._ops
+        ]
+
+        # Number of times each node is used in the chain.
+        self._num_usages = Counter(
+            node for op in self._ops for node in op.inputs.values()
+        )
+
+    def call(
+        self, max_index_keys: Optional[int] = None, **inputs: EventSet
+    ) -> Dict[str, EventSet]:
+        _check_value_to_schema(
+            inputs,
+            nodes=self._input_nodes,
+            label="input",
+            max_index_keys=max_index_keys,
+        )
+        outputs = self(**inputs)
+        _check_value_to_schema(
+            outputs,
+            nodes=self.operator.outputs,
+            label="outputs",
+            max_index_keys=max_index_keys,
+        )
+        return outputs
+
+    def __call__(self, **inputs: EventSet) -> Dict[str, EventSet]:
+        output_schema = self.output_schema("output")
+        first_input = inputs[next(iter(self._input_nodes))]
+
+        if isinstance(first_input.data, CompactData) and all(
+            isinstance(input.data, CompactData)
+            and input.data.has_same_layout(first_input.data)
+            for input in inputs.values()
+        ):
+            # Applies the chain on all the index keys at once.
+            features = self._apply(
+                {
+                    node: inputs[input_key].data.features
+                    for input_key, node in self._input_nodes.items()
+                }
+            )
+            data = first_input.data.with_features(features)
+            return {"output": EventSet(data=data, schema=output_schema)}
+
+        dst_evset = EventSet(data={}, schema=output_schema)
+        for index_key, index_data in first_input.data.items():
+            features = self._apply(
+                {
+                    node: inputs[input_key].data[index_key].features
+                    for input_key, node in self._input_nodes.items()
+                }
+            )
+            dst_evset.set_index_value(
+                index_key,
+                IndexData(
+                    features=features,
+                    timestamps=index_data.timestamps,
+                    schema=output_schema,
+                ),
+                normalize=False,
+            )
+
+        return {"output": dst_evset}
+
+    def _apply(
+        self, values: Dict[EventSetNode, List[np.ndarray]]
+    ) -> List[np.ndarray]:
+        """Applies the chain on the features of an index key."""
+
+        num_usages = self._num_usages.copy()
+        for op, implementation in zip(self._ops, self._implementations):
+            if isinstance(implementation, BaseBinaryNumpyImplementation):
+                input_1 = op.inputs["input_1"]
+                result = [
+                    implementation._do_operation(
+                        feature_1, feature_2, feature_schema.dtype
+                    )
+                    for feature_1, feature_2, feature_schema in zip(
+                        values[input_1],
+                        values[op.inputs["input_2"]],
+                        input_1.schema.features,
+                    )
+                ]
+            elif isinstance(implementation, BaseScalarNumpyImplementation):
+                input = op.inputs["input"]
+                result = [
+                    implementation._do_operation(
+                        feature, op.value, feature_schema.dtype
+                    )
+                    for feature, feature_schema in zip(
+                        values[input], input.schema.features
+                    )
+                ]
+            elif isinstance(implementation, BaseUnaryNumpyImplementation):
+                result = [
+                    implementation._do_operation(feature)
+                    for feature in values[op.inputs["input"]]
+                ]
+            else:
+                raise ValueError(f"Operator {op} is not element-wise")
+
+            # Release the intermediate results not used anymore.
+            for node in op.inputs.values():
+                num_usages[node] -= 1
+                if num_usages[node] == 0:
+                    del values[node]
+
+            values[op.outputs["output"]] = result
+
+        return values[self.operator.outputs["output"]]
@@ -24,6 +24,8 @@ from temporian.implementation.numpy.data.dtype_normalization import (
     tp_dtype_to_np_dtype,
 )
 
+from temporian.core.data.dtype import DType
+from temporian.implementation.numpy.data import dictionary_array
 from temporian.implementation.numpy.data.event_set import IndexData, EventSet
 from temporian.core.operators.join import Join
 from temporian.implementation.numpy import implementation_lib
@@ -39,6 +41,8 @@ class _OutputFeature:
 
 
 class JoinNumpyImplementation(OperatorImplementation):
+    index_wise = True
+
     def __init__(self, operator: Join) -> None:
         assert isinstance(operator, Join)
         super().__init__(operator)
@@ -52,6 +56,7 @@ class JoinNumpyImplementation(OperatorImplementation):
         if on is not None:
             left_on_feature_idx = left.schema.feature_names().index(on)
             right_on_feature_idx = right.schema.feature_names().index(on)
+            on_dtype = left.schema.features[left_on_feature_idx].dtype
 
         right_feature_defs = []
         for i, f in enumerate(right.schema.features):
@@ -94,11 +99,21 @@ class JoinNumpyImplementation(OperatorImplementation):
                         left_item.timestamps, right_item.timestamps
                     )
                 else:
+                    left_on = left_item.features[left_on_feature_idx]
+                    right_on = right_item.features[right_on_feature_idx]
+                    if on_dtype == DType.STRING:
+                        # Join on the codes of the strings.
+                        left_on, right_on = (
+                            codes.astype(np.int64, copy=False)
+                            for codes in dictionary_array.shared_codes(
+                                left_on, right_on
+                            )
+                        )
                     join_idxs = operators_cc.left_join_on_idxs(
                         left_item.timestamps,
                         right_item.timestamps,
-                        left_item.features[left_on_feature_idx],
-                        right_item.features[right_on_feature_idx],
+                        left_on,
+                        right_on,
                     )
 
                 for dst_right_feature, right_feature_def in zip(
@@ -14,6 +14,7 @@
 
 from typing import Dict
 
+from temporian.core.data.duration_utils import duration_in_timestamp_unit
 from temporian.core.operators.lag import LagOperator
 from temporian.implementation.numpy import implementation_lib
 from temporian.implementation.numpy.data.event_set import IndexData, EventSet
@@ -21,6 +22,8 @@ from temporian.implementation.numpy.operators.base import OperatorImplementation
 
 
 class LagNumpyImplementation(OperatorImplementation):
+    index_wise = True
+
     def __init__(self, operator: LagOperator) -> None:
         super().__init__(operator)
         assert isinstance(operator, LagOperator)
@@ -30,7 +33,9 @@ class LagNumpyImplementation(OperatorImplementation):
         output_schema = self.output_schema("output")
 
         # gather operator attributes
-        duration = self.operator.duration
+        duration = duration_in_timestamp_unit(
+            self.operator.duration, input.schema.timestamp_unit
+        )
 
         # create output EventSet
         output_evset = EventSet(data={}, schema=output_schema)
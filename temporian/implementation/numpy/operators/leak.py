@@ -14,6 +14,7 @@
 
 from typing import Dict
 
+from temporian.core.data.duration_utils import duration_in_timestamp_unit
 from temporian.core.operators.leak import LeakOperator
 from temporian.implementation.numpy import implementation_lib
 from temporian.implementation.numpy.data.event_set import IndexData
@@ -22,6 +23,8 @@ from temporian.implementation.numpy.operators.base import OperatorImplementation
 
 
 class LeakNumpyImplementation(OperatorImplementation):
+    index_wise = True
+
     def __init__(self, operator: LeakOperator) -> None:
         super().__init__(operator)
         assert isinstance(operator, LeakOperator)
@@ -31,7 +34,9 @@ class LeakNumpyImplementation(OperatorImplementation):
         output_schema = self.output_schema("output")
 
         # gather operator attributes
-        duration = self.operator.duration
+        duration = duration_in_timestamp_unit(
+            self.operator.duration, input.schema.timestamp_unit
+        )
 
         # create output EventSet
         output_evset = EventSet(data={}, schema=output_schema)
@@ -14,22 +14,32 @@
 
 """Implementation for the Map operator."""
 
-from inspect import signature
-from typing import Dict
+from typing import Any, Dict, Optional
 
 import numpy as np
-from temporian.core.types import MapExtras
+from temporian.core.data.dtype import DType
+from temporian.core.types import MapExtras, VectorizedMapExtras
+from temporian.implementation.numpy.data.dictionary_array import (
+    DictionaryArray,
+)
 from temporian.implementation.numpy.data.dtype_normalization import (
     tp_dtype_to_np_dtype,
 )
 
-from temporian.implementation.numpy.data.event_set import IndexData, EventSet
+from temporian.implementation.numpy.data.event_set import (
+    CompactData,
+    IndexData,
+    EventSet,
+)
 from temporian.core.operators.map import Map
 from temporian.implementation.numpy import implementation_lib
 from temporian.implementation.numpy.operators.base import OperatorImplementation
 
 
 class MapNumpyImplementation(OperatorImplementation):
+    index_wise = True
+    supports_compact_data = True
+
     def __init__(self, operator: Map) -> None:
         assert isinstance(operator, Map)
         super().__init__(operator)
@@ -39,6 +49,9 @@ class MapNumpyImplementation(OperatorImplementation):
 
         output_schema = self.output_schema("output")
 
+        if self.operator.vectorized:
+            return {"output": self._vectorized_map(input)}
+
         func = self.operator.func
         receive_extras = self.operator.receive_extras
 
@@ -74,19 +87,7 @@ class MapNumpyImplementation(OperatorImplementation):
                     else:
                         output_values[i] = func(value)  # type: ignore
 
-                try:
-                    output_arr = np.array(
-                        output_values, dtype=tp_dtype_to_np_dtype(output_dtype)
-                    )
-                except ValueError as exc:
-                    raise ValueError(
-                        f"Failed to build array of type {output_dtype} with the"
-                        " results of `func`. Make sure you are specifying the"
-                        " correct `output_dypes` and returning those types in"
-                        " `func`."
-                    ) from exc
-
-                features.append(output_arr)
+                features.append(_to_array(output_values, output_dtype))
 
             output_evset.set_index_value(
                 index_key,
@@ -99,5 +100,137 @@ class MapNumpyImplementation(OperatorImplementation):
 
         return {"output": output_evset}
 
+    def _vectorized_map(self, input: EventSet) -> EventSet:
+        """Applies the function on arrays of values."""
+
+        assert isinstance(self.operator, Map)
+
+        output_schema = self.output_schema("output")
+        feature_names = input.schema.feature_names()
+        output_dtypes = output_schema.feature_dtypes()
+
+        if (
+            isinstance(input.data, CompactData)
+            and not self.operator.receive_extras
+        ):
+            # Without extras, the values of all the index keys are mapped
+            # together.
+            data = input.data.with_features(
+                [
+                    self._map_values(values, None, feature_name, output_dtype)
+                    for values, feature_name, output_dtype in zip(
+                        input.data.features, feature_names, output_dtypes
+                    )
+                ]
+            )
+            return EventSet(data=data, schema=output_schema)
+
+        output_evset = EventSet(data={}, schema=output_schema)
+        for index_key, index_data in input.data.items():
+            features = []
+            for values, feature_name, output_dtype in zip(
+                index_data.features, feature_names, output_dtypes
+            ):
+                extras = None
+                if self.operator.receive_extras:
+                    extras = VectorizedMapExtras(
+                        index_key=index_key,
+                        timestamps=index_data.timestamps,
+                        feature_name=feature_name,
+                    )
+                features.append(
+                    self._map_values(values, extras, feature_name, output_dtype)
+                )
+            output_evset.set_index_value(
+                index_key,
+                IndexData(
+                    features=features,
+                    timestamps=index_data.timestamps,
+                    schema=output_schema,
+                ),
+                normalize=False,
+            )
+        return output_evset
+
+    def _map_values(
+        self,
+        values: Any,
+        extras: Optional[VectorizedMapExtras],
+        feature_name: str,
+        output_dtype: DType,
+    ) -> np.ndarray:
+        """Applies the function on the values of a feature, in batches of at
+        most "batch_size" values."""
+
+        assert isinstance(self.operator, Map)
+
+        if isinstance(values, DictionaryArray):
+            if extras is None:
+                # The function is only applied on the distinct values.
+                return self._map_values(
+                    values.vocabulary, None, feature_name, output_dtype
+                )[values.codes]
+            values = values.decode()
+
+        batch_size = self.operator.batch_size
+        if batch_size is None or len(values) <= batch_size:
+            return self._map_batch(values, extras, feature_name, output_dtype)
+
+        batches = []
+        for begin in range(0, len(values), batch_size):
+            end = begin + batch_size
+            batch_extras = None
+            if extras is not None:
+                batch_extras = VectorizedMapExtras(
+                    index_key=extras.index_key,
+                    timestamps=extras.timestamps[begin:end],
+                    feature_name=feature_name,
+                )
+            batches.append(
+                self._map_batch(
+                    values[begin:end], batch_extras, feature_name, output_dtype
+                )
+            )
+        return np.concatenate(batches)
+
+    def _map_batch(
+        self,
+        values: np.ndarray,
+        extras: Optional[VectorizedMapExtras],
+        feature_name: str,
+        output_dtype: DType,
+    ) -> np.ndarray:
+        assert isinstance(self.operator, Map)
+
+        func = self.operator.func
+        if extras is not None:
+            output = func(values, extras)  # type: ignore
+        else:
+            output = func(values)  # type: ignore
+
+        output = _to_array(output, output_dtype)
+        if output.shape != (len(values),):
+            raise ValueError(
+                "The function of a vectorized map should return a"
+                " one-dimensional array with one value per input value. Got"
+                f" an array of shape {output.shape} for {len(values)} values"
+                f" of feature {feature_name!r}."
+            )
+        return output
+
+
+def _to_array(values: Any, dtype: DType) -> np.ndarray:
+    """Converts the results of the function into an array."""
+
+    try:
+        return np.asarray(values, dtype=tp_dtype_to_np_dtype(dtype))
+    except ValueError as exc:
+        raise ValueError(
+            f"Failed to build array of type {dtype} with the"
+            " results of `func`. Make sure you are specifying the"
+            " correct `output_dypes` and returning those types in"
+            " `func`."
+        ) from exc
+
 
 implementation_lib.register_operator_implementation(Map, MapNumpyImplementation)
@@ -23,6 +23,8 @@ from temporian.implementation.numpy.operators.base import OperatorImplementation
 class PrefixNumpyImplementation(OperatorImplementation):
     """Numpy implementation of the prefix operator."""
 
+    index_wise = True
+
     def __init__(self, operator: Prefix) -> None:
         super().__init__(operator)
         assert isinstance(operator, Prefix)
@@ -9,6 +9,8 @@ from temporian.implementation.numpy.operators.base import OperatorImplementation
 class RenameNumpyImplementation(OperatorImplementation):
     """Numpy implementation for the rename operator."""
 
+    index_wise = True
+
     def __init__(self, operator: RenameOperator) -> None:
         super().__init__(operator)
         assert isinstance(operator, RenameOperator)
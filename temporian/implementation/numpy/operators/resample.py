@@ -29,6 +29,8 @@ from temporian.implementation.numpy.operators.base import OperatorImplementation
 class ResampleNumpyImplementation(OperatorImplementation):
     """Numpy implementation of the sample operator."""
 
+    index_wise = True
+
     def __init__(self, operator: Resample) -> None:
         super().__init__(operator)
         assert isinstance(operator, Resample)
@@ -20,11 +20,21 @@ from temporian.core.data.dtype import DType
 from temporian.core.operators.scalar.base import (
     BaseScalarOperator,
 )
-from temporian.implementation.numpy.data.event_set import EventSet, IndexData
+from temporian.implementation.numpy.data.dtype_normalization import (
+    tp_dtype_to_np_dtype,
+)
+from temporian.implementation.numpy.data.event_set import (
+    CompactData,
+    EventSet,
+    IndexData,
+)
 from temporian.implementation.numpy.operators.base import OperatorImplementation
 
 
 class BaseScalarNumpyImplementation(OperatorImplementation, ABC):
+    index_wise = True
+    supports_compact_data = True
+
     def __init__(self, operator: BaseScalarOperator) -> None:
         super().__init__(operator)
 
@@ -51,17 +61,40 @@ class BaseScalarNumpyImplementation(OperatorImplementation, ABC):
         assert isinstance(self.operator, BaseScalarOperator)
         output_schema = self.output_schema("output")
 
+        def operation(feature: np.ndarray, feature_idx: int) -> np.ndarray:
+            result = self._do_operation(
+                feature,
+                self.operator.value,
+                input.schema.features[feature_idx].dtype,
+            )
+            # NumPy can upcast the result to fit the value (e.g., the integer
+            # 65000 does not fit exactly in a float16).
+            output_dtype = output_dtypes[feature_idx]
+            if result.dtype != output_dtype:
+                result = result.astype(output_dtype)
+            return result
+
+        output_dtypes = [
+            tp_dtype_to_np_dtype(feature.dtype)
+            for feature in output_schema.features
+        ]
+
+        if isinstance(input.data, CompactData):
+            data = input.data.with_features(
+                [
+                    operation(feature, feature_idx)
+                    for feature_idx, feature in enumerate(input.data.features)
+                ]
+            )
+            return {"output": EventSet(data=data, schema=output_schema)}
+
         dst_evset = EventSet(data={}, schema=output_schema)
         for index_key, index_data in input.data.items():
             dst_evset.set_index_value(
                 index_key,
                 IndexData(
                     [
-                        self._do_operation(
-                            feature,
-                            self.operator.value,
-                            input.schema.features[feature_idx].dtype,
-                        )
+                        operation(feature, feature_idx)
                         for feature_idx, feature in enumerate(
                             index_data.features
                         )
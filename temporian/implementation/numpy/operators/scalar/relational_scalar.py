@@ -28,6 +28,7 @@ from temporian.core.operators.scalar import (
     LessScalarOperator,
 )
 from temporian.implementation.numpy import implementation_lib
+from temporian.implementation.numpy.data import dictionary_array
 
 
 class EqualScalarNumpyImplementation(BaseScalarNumpyImplementation):
@@ -38,7 +39,7 @@ class EqualScalarNumpyImplementation(BaseScalarNumpyImplementation):
         dtype: DType,
     ) -> np.ndarray:
         if dtype == DType.STRING:
-            return np.char.equal(feature, value)
+            return dictionary_array.equal(feature, value)
         else:
             # Returns False if both NaNs
             return np.equal(feature, value)
@@ -52,7 +53,7 @@ class NotEqualScalarNumpyImplementation(BaseScalarNumpyImplementation):
         dtype: DType,
     ) -> np.ndarray:
         if dtype == DType.STRING:
-            return np.char.not_equal(feature, value)
+            return ~dictionary_array.equal(feature, value)
         else:
             return np.not_equal(feature, value)
 
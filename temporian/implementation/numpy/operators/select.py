@@ -18,12 +18,16 @@ from temporian.core.operators.select import SelectOperator
 from temporian.implementation.numpy import implementation_lib
 from temporian.implementation.numpy.data.event_set import IndexData
 from temporian.implementation.numpy.data.event_set import EventSet
+from temporian.implementation.numpy.data.event_set import CompactData
 from temporian.implementation.numpy.operators.base import OperatorImplementation
 
 
 class SelectNumpyImplementation(OperatorImplementation):
     """Numpy implementation of the select operator."""
 
+    index_wise = True
+    supports_compact_data = True
+
     def __init__(self, operator: SelectOperator) -> None:
         super().__init__(operator)
         assert isinstance(operator, SelectOperator)
@@ -42,6 +46,12 @@ class SelectNumpyImplementation(OperatorImplementation):
             src_feature_names.index(feature_name)
             for feature_name in feature_names
         ]
+        if isinstance(input.data, CompactData):
+            data = input.data.with_features(
+                [input.data.features[idx] for idx in feature_idxs]
+            )
+            return {"output": EventSet(data=data, schema=output_schema)}
+
         # create output EventSet
         output_evset = EventSet(data={}, schema=output_schema)
         # select feature index key-wise
@@ -17,15 +17,25 @@
 
 
 import random
-from typing import Dict
+from typing import Dict, List
 
-from temporian.implementation.numpy.data.event_set import IndexData, EventSet
+import numpy as np
+
+from temporian.core.typing import NormalizedIndexKey
+from temporian.implementation.numpy.data.event_set import (
+    CompactData,
+    EventSet,
+    IndexData,
+)
 from temporian.core.operators.select_index_values import SelectIndexValues
 from temporian.implementation.numpy import implementation_lib
 from temporian.implementation.numpy.operators.base import OperatorImplementation
 
 
 class SelectIndexValuesNumpyImplementation(OperatorImplementation):
+    # Not index-wise: the index keys are sampled among all the index keys.
+    index_wise = False
+
     def __init__(self, operator: SelectIndexValues) -> None:
         assert isinstance(operator, SelectIndexValues)
         super().__init__(operator)
@@ -57,6 +67,12 @@ class SelectIndexValuesNumpyImplementation(OperatorImplementation):
             # if number and fraction are None, keys must be not None
             assert keys is not None
 
+        if isinstance(input.data, CompactData):
+            output_evset = EventSet(
+                data=_select_compact(input.data, keys), schema=output_schema
+            )
+            return {"output": output_evset}
+
         # Fill output EventSet's data
         for key in keys:
             try:
@@ -79,6 +95,45 @@ class SelectIndexValuesNumpyImplementation(OperatorImplementation):
         return {"output": output_evset}
 
 
+def _select_compact(
+    data: CompactData, keys: List[NormalizedIndexKey]
+) -> CompactData:
+    """Copies the events of some index keys of a CompactData into a new
+    CompactData.
+
+    The events of all the selected index keys are gathered with a single
+    indexing of each array, instead of creating an IndexData per index key.
+    """
+
+    # Like in a dictionary, an index key selected several times is kept once.
+    keys = list(dict.fromkeys(keys))
+
+    positions = np.empty(len(keys), dtype=np.int64)
+    for idx, key in enumerate(keys):
+        try:
+            positions[idx] = data._key_to_idx[key]
+        except KeyError as e:
+            raise ValueError(
+                f"Index key '{key}' not found in input EventSet."
+            ) from e
+
+    begins = data.offsets[positions]
+    lengths = data.offsets[positions + 1] - begins
+    offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    # Position in the input of each selected event.
+    event_idxs = np.arange(offsets[-1], dtype=np.int64) + np.repeat(
+        begins - offsets[:-1], lengths
+    )
+    return CompactData(
+        index_keys=keys,
+        offsets=offsets,
+        timestamps=data.timestamps[event_idxs],
+        features=[feature[event_idxs] for feature in data.features],
+    )
+
+
 implementation_lib.register_operator_implementation(
     SelectIndexValues, SelectIndexValuesNumpyImplementation
 )
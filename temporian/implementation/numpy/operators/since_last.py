@@ -16,6 +16,7 @@ from typing import Dict, Optional
 
 import numpy as np
 
+from temporian.core.data.duration_utils import ticks_to_seconds
 from temporian.core.operators.since_last import SinceLast
 from temporian.implementation.numpy import implementation_lib
 from temporian.implementation.numpy.data.event_set import IndexData, EventSet
@@ -26,6 +27,8 @@ from temporian.implementation.numpy_cc.operators import operators_cc
 class SinceLastNumpyImplementation(OperatorImplementation):
     """Numpy implementation of the since last operator."""
 
+    index_wise = True
+
     def __init__(self, operator: SinceLast) -> None:
         super().__init__(operator)
         assert isinstance(operator, SinceLast)
@@ -37,6 +40,7 @@ class SinceLastNumpyImplementation(OperatorImplementation):
 
         assert self.operator.has_sampling == (sampling is not None)
         steps = self.operator.steps
+        timestamp_unit = input.schema.timestamp_unit
 
         output_schema = self.output_schema("output")
         output_evset = EventSet(data={}, schema=output_schema)
@@ -47,6 +51,11 @@ class SinceLastNumpyImplementation(OperatorImplementation):
                 feature_values = operators_cc.since_last(
                     index_data.timestamps, sampling_timestamps, steps
                 )
+                if timestamp_unit is not None:
+                    # The durations are always expressed in seconds.
+                    feature_values = ticks_to_seconds(
+                        feature_values, timestamp_unit
+                    )
                 output_evset.set_index_value(
                     index_key,
                     IndexData(
@@ -58,8 +67,11 @@ class SinceLastNumpyImplementation(OperatorImplementation):
                 )
             else:
                 t = index_data.timestamps
-                diffs = np.full_like(t, np.nan)
+                diffs = np.full(len(t), np.nan)
                 diffs[steps:] = t[steps:] - t[:-steps]  # ok if steps >= len(t)
+                if timestamp_unit is not None:
+                    # The durations are always expressed in seconds.
+                    diffs = ticks_to_seconds(diffs, timestamp_unit)
                 output_evset.set_index_value(
                     index_key,
                     IndexData(
@@ -20,6 +20,10 @@ from typing import Dict
 
 import math
 import numpy as np
+from temporian.core.data.duration_utils import duration_in_timestamp_unit
+from temporian.implementation.numpy.data.dtype_normalization import (
+    tp_dtype_to_np_dtype,
+)
 from temporian.implementation.numpy.data.event_set import IndexData, EventSet
 from temporian.core.operators.tick import Tick
 from temporian.implementation.numpy import implementation_lib
@@ -27,6 +31,8 @@ from temporian.implementation.numpy.operators.base import OperatorImplementation
 
 
 class TickNumpyImplementation(OperatorImplementation):
+    index_wise = True
+
     def __init__(self, operator: Tick) -> None:
         assert isinstance(operator, Tick)
         super().__init__(operator)
@@ -35,6 +41,16 @@ class TickNumpyImplementation(OperatorImplementation):
         assert isinstance(self.operator, Tick)
 
         output_schema = self.output_schema("output")
+        timestamp_unit = output_schema.timestamp_unit
+        timestamp_dtype = tp_dtype_to_np_dtype(output_schema.timestamp_dtype)
+        interval = duration_in_timestamp_unit(
+            self.operator.interval, timestamp_unit
+        )
+        if interval <= 0:
+            raise ValueError(
+                f"The tick interval {self.operator.interval}s is shorter than"
+                f" the timestamp unit {timestamp_unit.value!r}."
+            )
 
         # create output EventSet
         output_evset = EventSet(data={}, schema=output_schema)
@@ -42,26 +58,28 @@ class TickNumpyImplementation(OperatorImplementation):
         # fill output EventSet data
         for index_key, index_data in input.data.items():
             if len(index_data.timestamps) == 0:
-                dst_timestamps = np.array([], dtype=np.float64)
+                dst_timestamps = np.array([], dtype=timestamp_dtype)
             else:
                 begin = index_data.timestamps[0]
                 end = index_data.timestamps[-1]
 
                 if self.operator.align:
                     save_begin = begin
-                    begin = (
-                        float(begin // self.operator.interval)
-                        * self.operator.interval
-                    )
+                    begin = (begin // interval) * interval
 
                     if save_begin != begin:
-                        begin += self.operator.interval
+                        begin += interval
 
                 dst_timestamps = np.arange(
                     begin,
-                    np.nextafter(end, math.inf),
-                    self.operator.interval,
-                    dtype=np.float64,
+                    # Note: "end" is included.
+                    (
+                        np.nextafter(end, math.inf)
+                        if timestamp_unit is None
+                        else end + 1
+                    ),
+                    interval,
+                    dtype=timestamp_dtype,
                 )
 
             output_evset.set_index_value(
@@ -19,6 +19,7 @@ from typing import Dict, Literal, Union, Tuple
 
 import numpy as np
 
+from temporian.core.data.duration_utils import ticks_to_seconds
 from temporian.implementation.numpy.data.event_set import IndexData, EventSet
 from temporian.core.operators.tick_calendar import TickCalendar
 from temporian.implementation.numpy import implementation_lib
@@ -27,6 +28,8 @@ from temporian.implementation.numpy_cc.operators import operators_cc
 
 
 class TickCalendarNumpyImplementation(OperatorImplementation):
+    index_wise = True
+
     def __init__(self, operator: TickCalendar) -> None:
         assert isinstance(operator, TickCalendar)
         super().__init__(operator)
@@ -81,14 +84,24 @@ class TickCalendarNumpyImplementation(OperatorImplementation):
             wday = self._wday_py_to_cpp(wday)
         wday_range = self._get_arg_range(wday, self.operator.wday_max_range())
 
+        timestamp_unit = output_schema.timestamp_unit
+
         # Fill output EventSet's data
         for index_key, index_data in input.data.items():
-            if len(index_data.timestamps) == 0:
+            timestamps = index_data.timestamps
+            if timestamp_unit is not None:
+                # The calendar is computed on float64 seconds.
+                timestamps = ticks_to_seconds(
+                    timestamps[[0, -1]] if len(timestamps) else timestamps,
+                    timestamp_unit,
+                )
+
+            if len(timestamps) == 0:
                 dst_timestamps = np.array([], dtype=np.float64)
             else:
                 dst_timestamps = operators_cc.tick_calendar(
-                    start_timestamp=index_data.timestamps[0],
-                    end_timestamp=index_data.timestamps[-1],
+                    start_timestamp=timestamps[0],
+                    end_timestamp=timestamps[-1],
                     min_second=second_range[0],
                     max_second=second_range[1],
                     min_minute=minute_range[0],
@@ -102,6 +115,11 @@ class TickCalendarNumpyImplementation(OperatorImplementation):
                     min_wday=wday_range[0],
                     max_wday=wday_range[1],
                 )
+            if timestamp_unit is not None:
+                # The ticks are on whole seconds.
+                dst_timestamps = np.round(
+                    dst_timestamps * timestamp_unit.ticks_per_second
+                ).astype(np.int64)
             output_evset.set_index_value(
                 index_key,
                 IndexData(
@@ -0,0 +1,78 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Implementation for the TimeRange operator."""
+
+from typing import Dict
+
+import numpy as np
+
+from temporian.core.operators.time_range import TimeRange
+from temporian.implementation.numpy import implementation_lib
+from temporian.implementation.numpy.data.event_set import IndexData, EventSet
+from temporian.implementation.numpy.operators.base import OperatorImplementation
+
+
+class TimeRangeNumpyImplementation(OperatorImplementation):
+    """Numpy implementation of the time range operator.
+
+    The events in the range are found with a binary search on the timestamps
+    of each index key. The output features and timestamps are views (i.e., not
+    copies) of the input ones.
+    """
+
+    index_wise = True
+
+    def __init__(self, operator: TimeRange) -> None:
+        assert isinstance(operator, TimeRange)
+        super().__init__(operator)
+
+    def __call__(self, input: EventSet) -> Dict[str, EventSet]:
+        assert isinstance(self.operator, TimeRange)
+
+        output_schema = self.output_schema("output")
+        begin = self.operator.begin
+        end = self.operator.end
+
+        output_evset = EventSet(data={}, schema=output_schema)
+        for index_key, index_data in input.data.items():
+            timestamps = index_data.timestamps
+
+            first = 0
+            if begin is not None:
+                first = int(np.searchsorted(timestamps, begin, side="left"))
+
+            last = len(timestamps)
+            if end is not None:
+                last = int(np.searchsorted(timestamps, end, side="left"))
+            last = max(first, last)
+
+            output_evset.set_index_value(
+                index_key,
+                IndexData(
+                    features=[
+                        feature[first:last] for feature in index_data.features
+                    ],
+                    timestamps=timestamps[first:last],
+                    schema=output_schema,
+                ),
+                normalize=False,
+            )
+
+        return {"output": output_evset}
+
+
+implementation_lib.register_operator_implementation(
+    TimeRange, TimeRangeNumpyImplementation
+)
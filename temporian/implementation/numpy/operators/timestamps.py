@@ -26,6 +26,8 @@ from temporian.implementation.numpy.operators.base import OperatorImplementation
 
 
 class TimestampsNumpyImplementation(OperatorImplementation):
+    index_wise = True
+
     def __init__(self, operator: Timestamps) -> None:
         assert isinstance(operator, Timestamps)
         super().__init__(operator)
@@ -14,10 +14,14 @@ from temporian.core.operators.unary import (
 from temporian.implementation.numpy import implementation_lib
 from temporian.implementation.numpy.data.event_set import IndexData
 from temporian.implementation.numpy.data.event_set import EventSet
+from temporian.implementation.numpy.data.event_set import CompactData
 from temporian.implementation.numpy.operators.base import OperatorImplementation
 
 
 class BaseUnaryNumpyImplementation(OperatorImplementation):
+    index_wise = True
+    supports_compact_data = True
+
     def __init__(self, operator: BaseUnaryOperator) -> None:
         super().__init__(operator)
 
@@ -25,6 +29,13 @@ class BaseUnaryNumpyImplementation(OperatorImplementation):
         assert isinstance(self.operator, BaseUnaryOperator)
 
         output_schema = self.output_schema("output")
+
+        if isinstance(input.data, CompactData):
+            data = input.data.with_features(
+                [self._do_operation(feature) for feature in input.data.features]
+            )
+            return {"output": EventSet(data=data, schema=output_schema)}
+
         dst_evset = EventSet(
             data={},
             schema=output_schema,
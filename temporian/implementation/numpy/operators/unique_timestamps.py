@@ -26,6 +26,8 @@ from temporian.implementation.numpy.operators.base import OperatorImplementation
 
 
 class UniqueTimestampsNumpyImplementation(OperatorImplementation):
+    index_wise = True
+
     def __init__(self, operator: UniqueTimestamps) -> None:
         super().__init__(operator)
         assert isinstance(operator, UniqueTimestamps)
@@ -19,6 +19,13 @@
 from typing import Dict
 import numpy as np
 
+from temporian.core.data.duration_utils import (
+    duration_in_timestamp_unit,
+    ticks_to_seconds,
+)
+from temporian.implementation.numpy.data.dtype_normalization import (
+    tp_dtype_to_np_dtype,
+)
 from temporian.implementation.numpy.data.event_set import IndexData, EventSet
 from temporian.core.operators.until_next import UntilNext
 from temporian.implementation.numpy import implementation_lib
@@ -27,6 +34,8 @@ from temporian.implementation.numpy_cc.operators import operators_cc
 
 
 class UntilNextNumpyImplementation(OperatorImplementation):
+    index_wise = True
+
     def __init__(self, operator: UntilNext) -> None:
         assert isinstance(operator, UntilNext)
         super().__init__(operator)
@@ -38,12 +47,17 @@ class UntilNextNumpyImplementation(OperatorImplementation):
 
         output_schema = self.output_schema("output")
 
-        timeout = self.operator.timeout
+        timestamp_unit = output_schema.timestamp_unit
+        timeout = duration_in_timestamp_unit(
+            self.operator.timeout, timestamp_unit
+        )
 
         # Create output EventSet
         output_evset = EventSet(data={}, schema=output_schema)
 
-        empty_timestamps = np.array([], dtype=np.float64)
+        empty_timestamps = np.array(
+            [], dtype=tp_dtype_to_np_dtype(output_schema.timestamp_dtype)
+        )
 
         # Fill output EventSet's data
         for index_key, index_data in input.data.items():
@@ -55,6 +69,11 @@ class UntilNextNumpyImplementation(OperatorImplementation):
             until_next_timestamps, until_next_values = operators_cc.until_next(
                 index_data.timestamps, sampling_timestamps, timeout
             )
+            if timestamp_unit is not None:
+                # The durations are always expressed in seconds.
+                until_next_values = ticks_to_seconds(
+                    until_next_values, timestamp_unit
+                )
             output_evset.set_index_value(
                 index_key,
                 IndexData(
@@ -29,6 +29,8 @@ from temporian.implementation.numpy.operators.base import OperatorImplementation
 
 
 class WhereNumpyImplementation(OperatorImplementation):
+    index_wise = True
+
     def __init__(self, operator: Where) -> None:
         assert isinstance(operator, Where)
         super().__init__(operator)
@@ -13,11 +13,15 @@
 # limitations under the License.
 
 from abc import abstractmethod
+from collections import defaultdict
 import logging
 from typing import Dict, Optional, List, Any, Union
 
 import numpy as np
-from temporian.core.data.duration_utils import NormalizedDuration
+from temporian.core.data.duration_utils import (
+    NormalizedDuration,
+    duration_in_timestamp_unit,
+)
 
 from temporian.core.operators.window.base import BaseWindowOperator
 from temporian.implementation.numpy.data.event_set import IndexData
@@ -34,6 +38,8 @@ class BaseWindowNumpyImplementation(OperatorImplementation):
     """Interface definition and common logic for numpy implementation of
     window operators."""
 
+    index_wise = True
+
     def __init__(self, operator: BaseWindowOperator) -> None:
         super().__init__(operator)
         assert isinstance(operator, BaseWindowOperator)
@@ -85,9 +91,15 @@ class BaseWindowNumpyImplementation(OperatorImplementation):
                         " positive. 0, NaN and negative window lengths will"
                         " output missing values."
                     )
+            elif self.operator.has_multiple_winlen:
+                assert self.operator.window_lengths is not None
+                effective_window_length = self.operator.window_lengths
             else:
                 assert self.operator.window_length is not None
                 effective_window_length = self.operator.window_length
+            effective_window_length = self._window_length_in_ticks(
+                effective_window_length
+            )
 
             sampling_timestamps = (
                 sampling_data.timestamps if has_sampling else None
@@ -104,12 +116,19 @@ class BaseWindowNumpyImplementation(OperatorImplementation):
                     window_length=effective_window_length,
                 )
             else:
-                # Sets the feature data as missing.
+                # Sets the feature data as missing. With several window
+                # lengths, the output features of each input feature are
+                # contiguous.
+                num_window_lengths = (
+                    len(effective_window_length)
+                    if isinstance(effective_window_length, list)
+                    else 1
+                )
                 empty_features = [
                     np.empty((0,), dtype=tp_dtype_to_np_dtype(f.dtype))
-                    for f in output_schema.features
+                    for f in output_schema.features[::num_window_lengths]
                 ]
-                empty_timestamps = np.empty((0,), dtype=np.float64)
+                empty_timestamps = self._empty_timestamps()
                 self._compute(
                     src_timestamps=empty_timestamps,
                     src_features=empty_features,
@@ -129,27 +148,127 @@ class BaseWindowNumpyImplementation(OperatorImplementation):
     def _implementation(self) -> Any:
         pass
 
+    def _window_length_in_ticks(
+        self,
+        window_length: Union[
+            NormalizedDuration, List[NormalizedDuration], np.ndarray
+        ],
+    ) -> Union[NormalizedDuration, int, List[Union[float, int]], np.ndarray]:
+        """Expresses window lengths in the unit of the timestamps.
+
+        Window lengths are always in seconds. If the timestamps are int64 ticks
+        (i.e., the schema has a timestamp unit), the window lengths are
+        converted to int64 ticks.
+        """
+
+        if isinstance(window_length, list):
+            return [self._window_length_in_ticks(w) for w in window_length]
+
+        window_length = duration_in_timestamp_unit(
+            window_length, self.operator.inputs["input"].schema.timestamp_unit
+        )
+        if (
+            isinstance(window_length, np.ndarray)
+            and window_length.dtype.type == np.int64
+        ):
+            # Negative window lengths are equivalent to empty windows.
+            window_length = np.maximum(window_length, 0)
+        return window_length
+
+    def _empty_timestamps(self) -> np.ndarray:
+        return np.empty(
+            (0,),
+            dtype=tp_dtype_to_np_dtype(
+                self.operator.inputs["input"].schema.timestamp_dtype
+            ),
+        )
+
+    def _run_implementation(self, feature_idx: int, **kwargs) -> np.ndarray:
+        """Runs the implementation on a feature.
+
+        The c++ kernels don't support float16: float16 values are processed as
+        float32, and the result is converted to the output dtype.
+        """
+
+        implementation = self._implementation()
+        if kwargs["evset_values"].dtype == np.float16:
+            kwargs["evset_values"] = kwargs["evset_values"].astype(np.float32)
+        return self._cast_result(feature_idx, implementation(**kwargs))
+
+    def _cast_result(self, feature_idx: int, result: np.ndarray) -> np.ndarray:
+        """Converts the result of a c++ kernel to the output dtype of a
+        feature, e.g., float32 results to float16."""
+
+        output_dtype = tp_dtype_to_np_dtype(
+            self.operator.outputs["output"].schema.features[feature_idx].dtype
+        )
+        return result.astype(output_dtype, copy=False)
+
     def _compute(
         self,
         src_timestamps: np.ndarray,
         src_features: List[np.ndarray],
         sampling_timestamps: Optional[np.ndarray],
         dst_features: List[np.ndarray],
-        window_length: Union[NormalizedDuration, np.ndarray],
+        window_length: Union[
+            NormalizedDuration, List[NormalizedDuration], np.ndarray
+        ],
     ) -> None:
+        """Computes the window operation on all the features of an index key.
+
+        The c++ kernels accept a list of features with the same dtype, and
+        compute the window boundaries once for all of them. The features are
+        grouped by dtype, and each group is processed with a single call.
+
+        If `window_length` is a list, the kernels compute all the window
+        lengths in the same pass over the events.
+        """
+
         assert isinstance(self.operator, BaseWindowOperator)
 
+        # Features grouped by dtype, in order of first appearance.
+        groups: Dict[np.dtype, List[int]] = defaultdict(list)
+        values = []
+        for feature_idx, src_feature in enumerate(src_features):
+            if src_feature.dtype == np.float16:
+                # The c++ kernels don't support float16.
+                src_feature = src_feature.astype(np.float32)
+            groups[src_feature.dtype].append(feature_idx)
+            values.append(src_feature)
+
+        # With several window lengths, the kernels return the results of each
+        # feature for all the window lengths, and the output features are
+        # ordered the same way.
+        if isinstance(window_length, list):
+            num_window_lengths = len(window_length)
+            window_length_key = "window_lengths"
+        else:
+            num_window_lengths = 1
+            window_length_key = "window_length"
+
+        results: List[Optional[np.ndarray]] = [None] * (
+            len(src_features) * num_window_lengths
+        )
         implementation = self._implementation()
-        for src_ts in src_features:
+        for feature_idxs in groups.values():
             kwargs = {
                 "evset_timestamps": src_timestamps,
-                "evset_values": src_ts,
-                "window_length": window_length,
+                "evset_values": [values[idx] for idx in feature_idxs],
+                window_length_key: window_length,
             }
             if sampling_timestamps is not None:
                 kwargs["sampling_timestamps"] = sampling_timestamps
-            dst_feature = implementation(**kwargs)
-            dst_features.append(dst_feature)
+            output_idxs = [
+                feature_idx * num_window_lengths + window_idx
+                for feature_idx in feature_idxs
+                for window_idx in range(num_window_lengths)
+            ]
+            for output_idx, result in zip(
+                output_idxs, implementation(**kwargs)
+            ):
+                results[output_idx] = self._cast_result(output_idx, result)
+
+        dst_features.extend(results)
 
     def apply_feature_wise(
         self,
@@ -160,13 +279,14 @@ class BaseWindowNumpyImplementation(OperatorImplementation):
         """Applies the operator on a single feature."""
         assert isinstance(self.operator, BaseWindowOperator)
 
-        implementation = self._implementation()
         kwargs = {
             "evset_timestamps": src_timestamps,
             "evset_values": src_feature,
-            "window_length": self.operator.window_length,
+            "window_length": self._window_length_in_ticks(
+                self.operator.window_length
+            ),
         }
-        return implementation(**kwargs)
+        return self._run_implementation(feature_idx, **kwargs)
 
     def apply_feature_wise_with_sampling(
         self,
@@ -178,16 +298,17 @@ class BaseWindowNumpyImplementation(OperatorImplementation):
         """Applies the operator on a single feature with a sampling."""
 
         assert isinstance(self.operator, BaseWindowOperator)
-        implementation = self._implementation()
 
         if src_feature is not None:
             kwargs = {
                 "evset_timestamps": src_timestamps,
                 "evset_values": src_feature,
-                "window_length": self.operator.window_length,
+                "window_length": self._window_length_in_ticks(
+                    self.operator.window_length
+                ),
                 "sampling_timestamps": sampling_timestamps,
             }
-            return implementation(**kwargs)
+            return self._run_implementation(feature_idx, **kwargs)
         else:
             # Sets the feature data as missing.
             output_schema = self.operator.outputs["output"].schema
@@ -195,11 +316,13 @@ class BaseWindowNumpyImplementation(OperatorImplementation):
             empty_features = np.empty(
                 (0,), dtype=tp_dtype_to_np_dtype(output_dtype)
             )
-            empty_timestamps = np.empty((0,), dtype=np.float64)
+            empty_timestamps = self._empty_timestamps()
             kwargs = {
                 "evset_timestamps": empty_timestamps,
                 "evset_values": empty_features,
-                "window_length": self.operator.window_length,
+                "window_length": self._window_length_in_ticks(
+                    self.operator.window_length
+                ),
                 "sampling_timestamps": sampling_timestamps,
             }
-            return implementation(**kwargs)
+            return self._run_implementation(feature_idx, **kwargs)
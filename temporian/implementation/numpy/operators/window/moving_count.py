@@ -38,7 +38,9 @@ class MovingCountNumpyImplementation(BaseWindowNumpyImplementation):
         src_features: List[np.ndarray],
         sampling_timestamps: Optional[np.ndarray],
         dst_features: List[np.ndarray],
-        window_length: Union[NormalizedDuration, np.ndarray],
+        window_length: Union[
+            NormalizedDuration, List[NormalizedDuration], np.ndarray
+        ],
     ) -> None:
         assert isinstance(self.operator, MovingCountOperator)
 
@@ -46,15 +48,18 @@ class MovingCountNumpyImplementation(BaseWindowNumpyImplementation):
 
         implementation = self._implementation()
 
-        kwargs = {
-            "evset_timestamps": src_timestamps,
-            "window_length": window_length,
-        }
+        kwargs = {"evset_timestamps": src_timestamps}
+        if isinstance(window_length, list):
+            kwargs["window_lengths"] = window_length
+        else:
+            kwargs["window_length"] = window_length
         if sampling_timestamps is not None:
             kwargs["sampling_timestamps"] = sampling_timestamps
 
-        dst_feature = implementation(**kwargs)
-        dst_features.append(dst_feature)
+        if isinstance(window_length, list):
+            dst_features.extend(implementation(**kwargs))
+        else:
+            dst_features.append(implementation(**kwargs))
 
     def apply_feature_wise(
         self,
@@ -69,7 +74,9 @@ class MovingCountNumpyImplementation(BaseWindowNumpyImplementation):
         implementation = self._implementation()
         kwargs = {
             "evset_timestamps": src_timestamps,
-            "window_length": self.operator.window_length,
+            "window_length": self._window_length_in_ticks(
+                self.operator.window_length
+            ),
         }
         return implementation(**kwargs)
 
@@ -88,16 +95,20 @@ class MovingCountNumpyImplementation(BaseWindowNumpyImplementation):
         if src_feature is not None:
             kwargs = {
                 "evset_timestamps": src_timestamps,
-                "window_length": self.operator.window_length,
+                "window_length": self._window_length_in_ticks(
+                    self.operator.window_length
+                ),
                 "sampling_timestamps": sampling_timestamps,
             }
             return implementation(**kwargs)
         else:
             # Sets the feature data as missing.
-            empty_timestamps = np.empty((0,), dtype=np.float64)
+            empty_timestamps = self._empty_timestamps()
             kwargs = {
                 "evset_timestamps": empty_timestamps,
-                "window_length": self.operator.window_length,
+                "window_length": self._window_length_in_ticks(
+                    self.operator.window_length
+                ),
                 "sampling_timestamps": sampling_timestamps,
             }
             return implementation(**kwargs)
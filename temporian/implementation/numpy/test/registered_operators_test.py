@@ -96,6 +96,7 @@ class RegisteredOperatorsTest(absltest.TestCase):
             "TICK",
             "TICK_CALENDAR",
             "TIMESTAMPS",
+            "TIME_RANGE",
             "UNIQUE_TIMESTAMPS",
             "UNTIL_NEXT",
             "WHERE",
@@ -112,6 +113,27 @@ class RegisteredOperatorsTest(absltest.TestCase):
             set(expected_implementations),
         )
 
+    def test_index_wise(self):
+        # Operators that cannot run independently on subsets of index keys.
+        # New operators should be audited before being added or removed here.
+        expected_not_index_wise = [
+            "ADD_INDEX",
+            "DROP_INDEX",
+            "PROPAGATE",
+            "SELECT_INDEX_VALUES",
+        ]
+
+        self.assertListEqual(
+            sorted(
+                key
+                for key, implementation in (
+                    implementation_lib.registered_implementations().items()
+                )
+                if not implementation.index_wise
+            ),
+            expected_not_index_wise,
+        )
+
 
 if __name__ == "__main__":
     absltest.main()
@@ -12,26 +12,33 @@
 namespace {
 namespace py = pybind11;
 
-py::array_t<double> filter_moving_count(
-    const py::array_t<double> &event_timestamps, const double window_length) {
+template <typename Timestamp>
+py::array_t<Timestamp> filter_moving_count(
+    const py::array_t<Timestamp> &event_timestamps,
+    const Timestamp window_length) {
   // Input size
   const Idx n_event = event_timestamps.shape(0);
 
   // Access raw input / output data
-  auto v_event = event_timestamps.unchecked<1>();
+  auto v_event = event_timestamps.template unchecked<1>();
 
-  std::vector<double> output;
+  std::vector<Timestamp> output;
 
-  // Index of the last emitted event. If -1, no event was emitted so far.
-  Idx last_emited_idx = -1;
+  {
+    // The GIL is not needed to access the raw data.
+    py::gil_scoped_release release;
 
-  for (Idx event_idx = 0; event_idx < n_event; event_idx++) {
-    const auto t = v_event[event_idx];
-    if (last_emited_idx == -1 ||
-        (t - v_event[last_emited_idx]) >= window_length) {
-      // Emitting event.
-      last_emited_idx = event_idx;
-      output.push_back(t);
+    // Index of the last emitted event. If -1, no event was emitted so far.
+    Idx last_emited_idx = -1;
+
+    for (Idx event_idx = 0; event_idx < n_event; event_idx++) {
+      const auto t = v_event[event_idx];
+      if (last_emited_idx == -1 ||
+          (t - v_event[last_emited_idx]) >= window_length) {
+        // Emitting event.
+        last_emited_idx = event_idx;
+        output.push_back(t);
+      }
     }
   }
 
@@ -41,6 +48,9 @@ py::array_t<double> filter_moving_count(
 }  // namespace
 
 void init_filter_moving_count(py::module &m) {
-  m.def("filter_moving_count", &filter_moving_count, "",
+  // Float64 timestamps (seconds) and int64 timestamps (ticks).
+  m.def("filter_moving_count", &filter_moving_count<double>, "",
+        py::arg("event_timestamps").noconvert(), py::arg("window_length"));
+  m.def("filter_moving_count", &filter_moving_count<int64_t>, "",
         py::arg("event_timestamps").noconvert(), py::arg("window_length"));
 }
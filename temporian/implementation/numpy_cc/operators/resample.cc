@@ -12,9 +12,10 @@
 namespace {
 namespace py = pybind11;
 
+template <typename Timestamp>
 std::tuple<py::array_t<Idx>, Idx> build_sampling_idxs(
-    const py::array_t<double> &evset_timestamps,
-    const py::array_t<double> &sampling_timestamps) {
+    const py::array_t<Timestamp> &evset_timestamps,
+    const py::array_t<Timestamp> &sampling_timestamps) {
   // Input size
   const Idx n_event = evset_timestamps.shape(0);
   const Idx n_sampling = sampling_timestamps.shape(0);
@@ -24,22 +25,27 @@ std::tuple<py::array_t<Idx>, Idx> build_sampling_idxs(
 
   // Access raw input / output data
   auto v_idxs = indices.mutable_unchecked<1>();
-  auto v_event = evset_timestamps.unchecked<1>();
-  auto v_sampling = sampling_timestamps.unchecked<1>();
+  auto v_event = evset_timestamps.template unchecked<1>();
+  auto v_sampling = sampling_timestamps.template unchecked<1>();
 
   // The index of the first value in "indices" that correspond to a valid
   // indice.
   Idx first_valid_idx = 0;
 
-  Idx next_event_idx = 0;
-  for (Idx sampling_idx = 0; sampling_idx < n_sampling; sampling_idx++) {
-    const auto t = v_sampling[sampling_idx];
-    while (next_event_idx < n_event && v_event[next_event_idx] <= t) {
-      next_event_idx++;
-    }
-    v_idxs[sampling_idx] = next_event_idx - 1;
-    if (next_event_idx == 0) {
-      first_valid_idx = sampling_idx + 1;
+  {
+    // The GIL is not needed to access the raw data.
+    py::gil_scoped_release release;
+
+    Idx next_event_idx = 0;
+    for (Idx sampling_idx = 0; sampling_idx < n_sampling; sampling_idx++) {
+      const auto t = v_sampling[sampling_idx];
+      while (next_event_idx < n_event && v_event[next_event_idx] <= t) {
+        next_event_idx++;
+      }
+      v_idxs[sampling_idx] = next_event_idx - 1;
+      if (next_event_idx == 0) {
+        first_valid_idx = sampling_idx + 1;
+      }
     }
   }
 
@@ -49,7 +55,11 @@ std::tuple<py::array_t<Idx>, Idx> build_sampling_idxs(
 }  // namespace
 
 void init_resample(py::module &m) {
-  m.def("build_sampling_idxs", &build_sampling_idxs, "",
+  // Float64 timestamps (seconds) and int64 timestamps (ticks).
+  m.def("build_sampling_idxs", &build_sampling_idxs<double>, "",
+        py::arg("evset_timestamps").noconvert(),
+        py::arg("sampling_timestamps").noconvert());
+  m.def("build_sampling_idxs", &build_sampling_idxs<int64_t>, "",
         py::arg("evset_timestamps").noconvert(),
         py::arg("sampling_timestamps").noconvert());
 }
@@ -1,11 +1,13 @@
 #include <assert.h>
 #include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
 
 #include <cstdint>
 #include <deque>
 #include <iostream>
 #include <map>
+#include <stdexcept>
 #include <string>
 #include <type_traits>
 #include <vector>
@@ -16,28 +18,81 @@ namespace py = pybind11;
 typedef py::array_t<double> ArrayD;
 typedef py::array_t<float> ArrayF;
 
-// NOTE: accumulate() is overloaded for the 4 possible combinations of:
+// NOTE: The window boundaries are computed by sweep(), which is overloaded for
+// the 6 possible combinations of:
 // - with or without external sampling
-// - with constant or variable window length
-
-// TODO: refactor to avoid code duplication where possible.
+// - with constant, variable, or several constant window lengths
+//
+// The timestamps and window lengths are either float64 seconds
+// (TIMESTAMP=double) or int64 ticks (TIMESTAMP=int64_t).
+//
+// sweep() moves the boundaries of the window once, and updates the
+// accumulators of all the features in the same pass (see
+// FeatureAccumulators).
 
-// No external sampling, constant window length
+// Accumulators of one or several features sharing the same timestamps.
+//
+// The values of the features are indexed by event index, and the results are
+// written in the outputs by output index.
 template <typename INPUT, typename OUTPUT, typename TAccumulator>
-py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
-                               const py::array_t<INPUT> &evset_values,
-                               const double window_length) {
-  // Input size
-  const size_t n_event = evset_timestamps.shape(0);
+class FeatureAccumulators {
+public:
+  FeatureAccumulators(const std::vector<py::array_t<INPUT>> &values,
+                      std::vector<py::array_t<OUTPUT>> &outputs)
+      : accumulators_(values.size()) {
+    assert(values.size() == outputs.size());
+    values_.reserve(values.size());
+    outputs_.reserve(outputs.size());
+    for (size_t feature_idx = 0; feature_idx < values.size(); feature_idx++) {
+      values_.push_back(values[feature_idx].template unchecked<1>());
+      outputs_.push_back(
+          outputs[feature_idx].template mutable_unchecked<1>());
+    }
+  }
 
-  // Allocate output array
-  auto output = py::array_t<OUTPUT>(n_event);
+  // Adds the values of the event "idx" to the right of the window.
+  void Add(const size_t idx) {
+    for (size_t feature_idx = 0; feature_idx < values_.size(); feature_idx++) {
+      accumulators_[feature_idx].Add(values_[feature_idx][idx]);
+    }
+  }
 
-  auto v_output = output.template mutable_unchecked<1>();
-  auto v_timestamps = evset_timestamps.unchecked<1>();
-  auto v_values = evset_values.template unchecked<1>();
+  // Adds the values of the event "idx" to the left of the window.
+  void AddLeft(const size_t idx) {
+    for (size_t feature_idx = 0; feature_idx < values_.size(); feature_idx++) {
+      accumulators_[feature_idx].AddLeft(values_[feature_idx][idx]);
+    }
+  }
+
+  // Removes the values of the event "idx" from the left of the window.
+  void Remove(const size_t idx) {
+    for (size_t feature_idx = 0; feature_idx < values_.size(); feature_idx++) {
+      accumulators_[feature_idx].Remove(values_[feature_idx][idx]);
+    }
+  }
+
+  // Writes the current results in the outputs [begin_idx, end_idx).
+  void Result(const size_t begin_idx, const size_t end_idx) {
+    for (size_t feature_idx = 0; feature_idx < values_.size(); feature_idx++) {
+      const OUTPUT result = accumulators_[feature_idx].Result();
+      auto &output = outputs_[feature_idx];
+      for (size_t idx = begin_idx; idx < end_idx; idx++) {
+        output[idx] = result;
+      }
+    }
+  }
+
+private:
+  std::vector<TAccumulator> accumulators_;
+  std::vector<py::detail::unchecked_reference<INPUT, 1>> values_;
+  std::vector<py::detail::unchecked_mutable_reference<OUTPUT, 1>> outputs_;
+};
 
-  TAccumulator accumulator;
+// No external sampling, constant window length
+template <typename TAccumulators, typename TIMESTAMP>
+void sweep(const py::detail::unchecked_reference<TIMESTAMP, 1> &v_timestamps,
+           const TIMESTAMP window_length, TAccumulators &accumulators) {
+  const size_t n_event = v_timestamps.shape(0);
 
   // Index of the first value in the window.
   size_t begin_idx = 0;
@@ -50,12 +105,12 @@ py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
     // values in v_timestamps.
 
     // Add all values with same timestamp as the current one.
-    accumulator.Add(v_values[end_idx]);
+    accumulators.Add(end_idx);
     const auto current_ts = v_timestamps[end_idx];
     size_t first_diff_ts_idx = end_idx + 1;
     while (first_diff_ts_idx < n_event &&
            v_timestamps[first_diff_ts_idx] == current_ts) {
-      accumulator.Add(v_values[first_diff_ts_idx]);
+      accumulators.Add(first_diff_ts_idx);
       first_diff_ts_idx++;
     }
 
@@ -63,42 +118,25 @@ py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
     while (begin_idx < n_event &&
            // Compare both sides around ~0 to get maximum float resolution
            v_timestamps[end_idx] - v_timestamps[begin_idx] >= window_length) {
-      accumulator.Remove(v_values[begin_idx]);
+      accumulators.Remove(begin_idx);
       begin_idx++;
     }
 
     // Set current value of window to all values with the same timestamp.
-    const auto result = accumulator.Result();
-    for (size_t i = end_idx; i < first_diff_ts_idx; i++) {
-      v_output[i] = result;
-    }
+    accumulators.Result(end_idx, first_diff_ts_idx);
 
     // Move pointer to the index of the last value with the same timestamp.
     end_idx = first_diff_ts_idx;
   }
-
-  return output;
 }
 
 // External sampling, constant window length
-template <typename INPUT, typename OUTPUT, typename TAccumulator>
-py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
-                               const py::array_t<INPUT> &evset_values,
-                               const ArrayD &sampling_timestamps,
-                               const double window_length) {
-  // Input size
-  const size_t n_event = evset_timestamps.shape(0);
-  const size_t n_sampling = sampling_timestamps.shape(0);
-
-  // Allocate output array
-  auto output = py::array_t<OUTPUT>(n_sampling);
-
-  auto v_output = output.template mutable_unchecked<1>();
-  auto v_timestamps = evset_timestamps.unchecked<1>();
-  auto v_values = evset_values.template unchecked<1>();
-  auto v_sampling = sampling_timestamps.unchecked<1>();
-
-  TAccumulator accumulator;
+template <typename TAccumulators, typename TIMESTAMP>
+void sweep(const py::detail::unchecked_reference<TIMESTAMP, 1> &v_timestamps,
+           const py::detail::unchecked_reference<TIMESTAMP, 1> &v_sampling,
+           const TIMESTAMP window_length, TAccumulators &accumulators) {
+  const size_t n_event = v_timestamps.shape(0);
+  const size_t n_sampling = v_sampling.shape(0);
 
   size_t begin_idx = 0;
   size_t end_idx = 0;
@@ -107,7 +145,7 @@ py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
     const auto right_limit = v_sampling[sampling_idx];
 
     while (end_idx < n_event && v_timestamps[end_idx] <= right_limit) {
-      accumulator.Add(v_values[end_idx]);
+      accumulators.Add(end_idx);
       end_idx++;
     }
 
@@ -115,42 +153,45 @@ py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
            // Compare both sides around ~0 to get maximum float resolution
            v_sampling[sampling_idx] - v_timestamps[begin_idx] >=
                window_length) {
-      accumulator.Remove(v_values[begin_idx]);
+      accumulators.Remove(begin_idx);
       begin_idx++;
     }
 
-    v_output[sampling_idx] = accumulator.Result();
+    accumulators.Result(sampling_idx, sampling_idx + 1);
   }
+}
 
-  return output;
+template <typename TIMESTAMP>
+bool begin_moved_forward(const TIMESTAMP ts, const TIMESTAMP prev_ts,
+                         const TIMESTAMP window_length,
+                         const TIMESTAMP prev_window_length) {
+  if constexpr (std::is_floating_point_v<TIMESTAMP>) {
+    return ts - prev_ts - (window_length - prev_window_length) > 0;
+  } else {
+    // Does not sum the two differences to avoid overflows.
+    return ts - prev_ts > window_length - prev_window_length;
+  }
 }
 
-bool begin_moved_forward(const double ts, const double prev_ts,
-                         const double window_length,
-                         const double prev_window_length) {
-  return ts - prev_ts - (window_length - prev_window_length) > 0;
+// Replaces a NaN window length by 0. Int64 window lengths are never NaN.
+template <typename TIMESTAMP>
+TIMESTAMP nan_window_length_to_zero(const TIMESTAMP window_length) {
+  if constexpr (std::is_floating_point_v<TIMESTAMP>) {
+    if (std::isnan(window_length)) {
+      return 0;
+    }
+  }
+  return window_length;
 }
 
 // No external sampling, variable window length
-template <typename INPUT, typename OUTPUT, typename TAccumulator>
-py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
-                               const py::array_t<INPUT> &evset_values,
-                               const ArrayD &window_length) {
-  // Input size
-  const size_t n_event = evset_timestamps.shape(0);
-
-  // Allocate output array
-  auto output = py::array_t<OUTPUT>(n_event);
-
-  auto v_output = output.template mutable_unchecked<1>();
-  auto v_timestamps = evset_timestamps.unchecked<1>();
-  auto v_values = evset_values.template unchecked<1>();
-  auto v_window_length = window_length.unchecked<1>();
+template <typename TAccumulators, typename TIMESTAMP>
+void sweep(const py::detail::unchecked_reference<TIMESTAMP, 1> &v_timestamps,
+           const py::detail::unchecked_reference<TIMESTAMP, 1> &v_window_length,
+           TAccumulators &accumulators) {
+  const size_t n_event = v_timestamps.shape(0);
 
   assert(v_timestamps.shape(0) == v_window_length.shape(0));
-  assert(v_timestamps.shape(0) == v_values.shape(0));
-
-  TAccumulator accumulator;
 
   // Index of the first value in the window.
   size_t begin_idx = 0;
@@ -166,14 +207,11 @@ py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
     // v_timestamps[end_idx], and there may be several contiguous equal
     // values in v_timestamps.
     const auto curr_ts = v_timestamps[idx];
-    auto curr_window_length = v_window_length[idx];
-
-    if (std::isnan(curr_window_length)) {
-      curr_window_length = 0;
-    }
+    const auto curr_window_length =
+        nan_window_length_to_zero(v_window_length[idx]);
 
     while (end_idx < n_event && v_timestamps[end_idx] <= curr_ts) {
-      accumulator.Add(v_values[end_idx]);
+      accumulators.Add(end_idx);
       end_idx++;
     }
 
@@ -185,7 +223,7 @@ py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
       while (begin_idx < n_event &&
              v_timestamps[idx] - v_timestamps[begin_idx] >=
                  curr_window_length) {
-        accumulator.Remove(v_values[begin_idx]);
+        accumulators.Remove(begin_idx);
         begin_idx++;
       }
     } else {
@@ -194,53 +232,35 @@ py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
       while (begin_idx > 0 && v_timestamps[idx] - v_timestamps[begin_idx - 1] <
                                   curr_window_length) {
         begin_idx--;
-        accumulator.AddLeft(v_values[begin_idx]);
+        accumulators.AddLeft(begin_idx);
       }
     }
 
-    v_output[idx] = accumulator.Result();
+    accumulators.Result(idx, idx + 1);
   }
-
-  return output;
 }
 
 // External sampling, variable window length
-template <typename INPUT, typename OUTPUT, typename TAccumulator>
-py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
-                               const py::array_t<INPUT> &evset_values,
-                               const ArrayD &sampling_timestamps,
-                               const ArrayD &window_length) {
-  // Input size
-  const size_t n_event = evset_timestamps.shape(0);
-  const size_t n_sampling = sampling_timestamps.shape(0);
-
-  // Allocate output array
-  auto output = py::array_t<OUTPUT>(n_sampling);
+template <typename TAccumulators, typename TIMESTAMP>
+void sweep(const py::detail::unchecked_reference<TIMESTAMP, 1> &v_timestamps,
+           const py::detail::unchecked_reference<TIMESTAMP, 1> &v_sampling,
+           const py::detail::unchecked_reference<TIMESTAMP, 1> &v_window_length,
+           TAccumulators &accumulators) {
+  const size_t n_event = v_timestamps.shape(0);
+  const size_t n_sampling = v_sampling.shape(0);
 
-  auto v_output = output.template mutable_unchecked<1>();
-  auto v_timestamps = evset_timestamps.unchecked<1>();
-  auto v_values = evset_values.template unchecked<1>();
-  auto v_sampling = sampling_timestamps.unchecked<1>();
-  auto v_window_length = window_length.unchecked<1>();
-
-  assert(v_timestamps.shape(0) == v_values.shape(0));
   assert(v_sampling.shape(0) == v_window_length.shape(0));
 
-  TAccumulator accumulator;
-
   size_t begin_idx = 0;
   size_t end_idx = 0;
 
   for (size_t sampling_idx = 0; sampling_idx < n_sampling; sampling_idx++) {
     const auto right_limit = v_sampling[sampling_idx];
-    auto curr_window_length = v_window_length[sampling_idx];
-
-    if (std::isnan(curr_window_length)) {
-      curr_window_length = 0;
-    }
+    const auto curr_window_length =
+        nan_window_length_to_zero(v_window_length[sampling_idx]);
 
     while (end_idx < n_event && v_timestamps[end_idx] <= right_limit) {
-      accumulator.Add(v_values[end_idx]);
+      accumulators.Add(end_idx);
       end_idx++;
     }
 
@@ -252,7 +272,7 @@ py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
       // Window's beginning moved forwards.
       while (begin_idx < n_event &&
              right_limit - v_timestamps[begin_idx] >= curr_window_length) {
-        accumulator.Remove(v_values[begin_idx]);
+        accumulators.Remove(begin_idx);
         begin_idx++;
       }
     } else {
@@ -261,14 +281,239 @@ py::array_t<OUTPUT> accumulate(const ArrayD &evset_timestamps,
       while (begin_idx > 0 &&
              right_limit - v_timestamps[begin_idx - 1] < curr_window_length) {
         begin_idx--;
-        accumulator.AddLeft(v_values[begin_idx]);
+        accumulators.AddLeft(begin_idx);
       }
     }
 
-    v_output[sampling_idx] = accumulator.Result();
+    accumulators.Result(sampling_idx, sampling_idx + 1);
   }
+}
+
+// No external sampling, several constant window lengths.
+//
+// The right boundary of the windows is shared, and each window length has its
+// own left boundary and accumulators.
+template <typename TAccumulators, typename TIMESTAMP>
+void sweep(const py::detail::unchecked_reference<TIMESTAMP, 1> &v_timestamps,
+           const std::vector<TIMESTAMP> &window_lengths,
+           std::vector<TAccumulators> &accumulators) {
+  const size_t n_event = v_timestamps.shape(0);
+  const size_t n_window = window_lengths.size();
+
+  // Index of the first value in each window.
+  std::vector<size_t> begin_idxs(n_window, 0);
+  // Index of the first value outside the windows.
+  size_t end_idx = 0;
+
+  while (end_idx < n_event) {
+    // Find all values with same timestamp as the current one.
+    const auto current_ts = v_timestamps[end_idx];
+    size_t first_diff_ts_idx = end_idx + 1;
+    while (first_diff_ts_idx < n_event &&
+           v_timestamps[first_diff_ts_idx] == current_ts) {
+      first_diff_ts_idx++;
+    }
+
+    for (size_t window_idx = 0; window_idx < n_window; window_idx++) {
+      auto &window_accumulators = accumulators[window_idx];
+      auto &begin_idx = begin_idxs[window_idx];
 
-  return output;
+      for (size_t idx = end_idx; idx < first_diff_ts_idx; idx++) {
+        window_accumulators.Add(idx);
+      }
+
+      // Remove all values that no longer belong to the window.
+      while (begin_idx < n_event &&
+             // Compare both sides around ~0 to get maximum float resolution
+             current_ts - v_timestamps[begin_idx] >=
+                 window_lengths[window_idx]) {
+        window_accumulators.Remove(begin_idx);
+        begin_idx++;
+      }
+
+      window_accumulators.Result(end_idx, first_diff_ts_idx);
+    }
+
+    end_idx = first_diff_ts_idx;
+  }
+}
+
+// External sampling, several constant window lengths.
+template <typename TAccumulators, typename TIMESTAMP>
+void sweep(const py::detail::unchecked_reference<TIMESTAMP, 1> &v_timestamps,
+           const py::detail::unchecked_reference<TIMESTAMP, 1> &v_sampling,
+           const std::vector<TIMESTAMP> &window_lengths,
+           std::vector<TAccumulators> &accumulators) {
+  const size_t n_event = v_timestamps.shape(0);
+  const size_t n_sampling = v_sampling.shape(0);
+  const size_t n_window = window_lengths.size();
+
+  std::vector<size_t> begin_idxs(n_window, 0);
+  size_t end_idx = 0;
+
+  for (size_t sampling_idx = 0; sampling_idx < n_sampling; sampling_idx++) {
+    const auto right_limit = v_sampling[sampling_idx];
+
+    size_t next_end_idx = end_idx;
+    while (next_end_idx < n_event && v_timestamps[next_end_idx] <= right_limit) {
+      next_end_idx++;
+    }
+
+    for (size_t window_idx = 0; window_idx < n_window; window_idx++) {
+      auto &window_accumulators = accumulators[window_idx];
+      auto &begin_idx = begin_idxs[window_idx];
+
+      for (size_t idx = end_idx; idx < next_end_idx; idx++) {
+        window_accumulators.Add(idx);
+      }
+
+      while (begin_idx < n_event &&
+             // Compare both sides around ~0 to get maximum float resolution
+             right_limit - v_timestamps[begin_idx] >=
+                 window_lengths[window_idx]) {
+        window_accumulators.Remove(begin_idx);
+        begin_idx++;
+      }
+
+      window_accumulators.Result(sampling_idx, sampling_idx + 1);
+    }
+
+    end_idx = next_end_idx;
+  }
+}
+
+// Computes the window operation on several features with the same timestamps.
+//
+// "sampling" is either an array of sampling timestamps, or std::nullptr_t
+// without external sampling. "window_length" is either a constant window
+// length, or an array of window lengths (one per output value).
+//
+// The window boundaries are only computed once for all the features.
+template <typename INPUT, typename OUTPUT, typename TAccumulator,
+          typename TIMESTAMP, typename SAMPLING, typename WINDOW_LENGTH>
+std::vector<py::array_t<OUTPUT>>
+accumulate(const py::array_t<TIMESTAMP> &evset_timestamps,
+           const std::vector<py::array_t<INPUT>> &evset_values,
+           const SAMPLING &sampling_timestamps,
+           const WINDOW_LENGTH &window_length) {
+  constexpr bool has_sampling = !std::is_same_v<SAMPLING, std::nullptr_t>;
+  constexpr bool variable_window_length =
+      !std::is_same_v<WINDOW_LENGTH, TIMESTAMP>;
+
+  // Input size
+  const size_t n_event = evset_timestamps.shape(0);
+  size_t n_output = n_event;
+  if constexpr (has_sampling) {
+    n_output = sampling_timestamps.shape(0);
+  }
+
+  // Allocate output arrays
+  std::vector<py::array_t<OUTPUT>> outputs;
+  outputs.reserve(evset_values.size());
+  for (const auto &values : evset_values) {
+    if (static_cast<size_t>(values.shape(0)) != n_event) {
+      throw std::invalid_argument(
+          "evset_values should have the same length as evset_timestamps.");
+    }
+    outputs.push_back(py::array_t<OUTPUT>(n_output));
+  }
+
+  auto v_timestamps = evset_timestamps.template unchecked<1>();
+  FeatureAccumulators<INPUT, OUTPUT, TAccumulator> accumulators(evset_values,
+                                                                outputs);
+
+  {
+    // The GIL is not needed to access the raw data.
+    py::gil_scoped_release release;
+
+    if constexpr (has_sampling && variable_window_length) {
+      sweep(v_timestamps, sampling_timestamps.template unchecked<1>(),
+            window_length.template unchecked<1>(), accumulators);
+    } else if constexpr (has_sampling) {
+      sweep(v_timestamps, sampling_timestamps.template unchecked<1>(),
+            window_length, accumulators);
+    } else if constexpr (variable_window_length) {
+      sweep(v_timestamps, window_length.template unchecked<1>(),
+            accumulators);
+    } else {
+      sweep(v_timestamps, window_length, accumulators);
+    }
+  }
+
+  return outputs;
+}
+
+// Computes the window operation on several features with the same timestamps,
+// for several constant window lengths.
+//
+// Returns one output per feature and window length, ordered by feature and
+// then by window length. The events are only swept once for all the features
+// and window lengths.
+template <typename INPUT, typename OUTPUT, typename TAccumulator,
+          typename TIMESTAMP, typename SAMPLING>
+std::vector<py::array_t<OUTPUT>>
+accumulate(const py::array_t<TIMESTAMP> &evset_timestamps,
+           const std::vector<py::array_t<INPUT>> &evset_values,
+           const SAMPLING &sampling_timestamps,
+           const std::vector<TIMESTAMP> &window_lengths) {
+  constexpr bool has_sampling = !std::is_same_v<SAMPLING, std::nullptr_t>;
+
+  // Input size
+  const size_t n_event = evset_timestamps.shape(0);
+  const size_t n_window = window_lengths.size();
+  size_t n_output = n_event;
+  if constexpr (has_sampling) {
+    n_output = sampling_timestamps.shape(0);
+  }
+
+  // Allocate output arrays, and group them by window length.
+  std::vector<py::array_t<OUTPUT>> outputs;
+  outputs.reserve(evset_values.size() * n_window);
+  std::vector<std::vector<py::array_t<OUTPUT>>> window_outputs(n_window);
+  for (const auto &values : evset_values) {
+    if (static_cast<size_t>(values.shape(0)) != n_event) {
+      throw std::invalid_argument(
+          "evset_values should have the same length as evset_timestamps.");
+    }
+    for (size_t window_idx = 0; window_idx < n_window; window_idx++) {
+      outputs.push_back(py::array_t<OUTPUT>(n_output));
+      window_outputs[window_idx].push_back(outputs.back());
+    }
+  }
+
+  auto v_timestamps = evset_timestamps.template unchecked<1>();
+  std::vector<FeatureAccumulators<INPUT, OUTPUT, TAccumulator>> accumulators;
+  accumulators.reserve(n_window);
+  for (size_t window_idx = 0; window_idx < n_window; window_idx++) {
+    accumulators.emplace_back(evset_values, window_outputs[window_idx]);
+  }
+
+  {
+    // The GIL is not needed to access the raw data.
+    py::gil_scoped_release release;
+
+    if constexpr (has_sampling) {
+      sweep(v_timestamps, sampling_timestamps.template unchecked<1>(),
+            window_lengths, accumulators);
+    } else {
+      sweep(v_timestamps, window_lengths, accumulators);
+    }
+  }
+
+  return outputs;
+}
+
+// Computes the window operation on a single feature.
+template <typename INPUT, typename OUTPUT, typename TAccumulator,
+          typename TIMESTAMP, typename SAMPLING, typename WINDOW_LENGTH>
+py::array_t<OUTPUT> accumulate(const py::array_t<TIMESTAMP> &evset_timestamps,
+                               const py::array_t<INPUT> &evset_values,
+                               const SAMPLING &sampling_timestamps,
+                               const WINDOW_LENGTH &window_length) {
+  return accumulate<INPUT, OUTPUT, TAccumulator, TIMESTAMP>(
+             evset_timestamps, std::vector<py::array_t<INPUT>>{evset_values},
+             sampling_timestamps, window_length)
+      .front();
 }
 
 // Note: We only use inheritance to compile check the code.
@@ -356,15 +601,16 @@ struct MovingStandardDeviationAccumulator : Accumulator<INPUT, OUTPUT> {
   int num_values = 0;
 };
 
-template <typename OUTPUT>
-struct MovingCountAccumulator : Accumulator<double, OUTPUT> {
-  void Add(double value) override {
+// The input values are the timestamps, and are ignored.
+template <typename INPUT, typename OUTPUT>
+struct MovingCountAccumulator : Accumulator<INPUT, OUTPUT> {
+  void Add(INPUT value) override {
     static_assert(std::is_same<OUTPUT, int32_t>::value,
                   "OUTPUT must be int32_t");
     num_values++;
   }
 
-  void Remove(double value) override { num_values--; }
+  void Remove(INPUT value) override { num_values--; }
 
   OUTPUT Result() override { return num_values; }
 
@@ -474,74 +720,140 @@ struct MovingMaxAccumulator : MovingExtremumAccumulator<INPUT, OUTPUT> {
 };
 
 // Instantiate the "accumulate" function with and without sampling,
-// and with and without variable window length.
+// and with and without variable window length, for a given timestamp type and
+// a given representation of the values.
 //
 // Args:
 //   NAME: Name of the python and c++ function.
 //   INPUT: Input value type.
 //   OUTPUT: Output value type.
 //   ACCUMULATOR: Accumulator class.
-#define REGISTER_CC_FUNC(NAME, INPUT, OUTPUT, ACCUMULATOR)                     \
+//   TS: Timestamp and window length type.
+//   VALUES: Type of the input values, i.e. a single feature or a list of
+//     features.
+//   RESULT: Type of the output values.
+#define REGISTER_CC_FUNC_TS_VALUES(NAME, INPUT, OUTPUT, ACCUMULATOR, TS,       \
+                                   VALUES, RESULT)                             \
                                                                                \
-  py::array_t<OUTPUT> NAME(const ArrayD &evset_timestamps,                     \
-                           const py::array_t<INPUT> &evset_values,             \
-                           const double window_length) {                       \
-    return accumulate<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>>(              \
-        evset_timestamps, evset_values, window_length);                        \
+  RESULT NAME(const py::array_t<TS> &evset_timestamps,                         \
+              const VALUES &evset_values, const TS window_length) {            \
+    return accumulate<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>, TS>(          \
+        evset_timestamps, evset_values, nullptr, window_length);               \
   }                                                                            \
                                                                                \
-  py::array_t<OUTPUT> NAME(                                                    \
-      const ArrayD &evset_timestamps, const py::array_t<INPUT> &evset_values,  \
-      const ArrayD &sampling_timestamps, const double window_length) {         \
-    return accumulate<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>>(              \
+  RESULT NAME(const py::array_t<TS> &evset_timestamps,                         \
+              const VALUES &evset_values,                                      \
+              const py::array_t<TS> &sampling_timestamps,                      \
+              const TS window_length) {                                        \
+    return accumulate<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>, TS>(          \
         evset_timestamps, evset_values, sampling_timestamps, window_length);   \
   }                                                                            \
                                                                                \
-  py::array_t<OUTPUT> NAME(const ArrayD &evset_timestamps,                     \
-                           const py::array_t<INPUT> &evset_values,             \
-                           const ArrayD &window_length) {                      \
-    return accumulate<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>>(              \
-        evset_timestamps, evset_values, window_length);                        \
+  RESULT NAME(const py::array_t<TS> &evset_timestamps,                         \
+              const VALUES &evset_values,                                      \
+              const py::array_t<TS> &window_length) {                          \
+    return accumulate<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>, TS>(          \
+        evset_timestamps, evset_values, nullptr, window_length);               \
   }                                                                            \
                                                                                \
-  py::array_t<OUTPUT> NAME(                                                    \
-      const ArrayD &evset_timestamps, const py::array_t<INPUT> &evset_values,  \
-      const ArrayD &sampling_timestamps, const ArrayD &window_length) {        \
-    return accumulate<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>>(              \
+  RESULT NAME(const py::array_t<TS> &evset_timestamps,                         \
+              const VALUES &evset_values,                                      \
+              const py::array_t<TS> &sampling_timestamps,                      \
+              const py::array_t<TS> &window_length) {                          \
+    return accumulate<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>, TS>(          \
         evset_timestamps, evset_values, sampling_timestamps, window_length);   \
   }
 
-// Similar to REGISTER_CC_FUNC, but without inputs
-#define REGISTER_CC_FUNC_NO_INPUT(NAME, OUTPUT, ACCUMULATOR)                   \
+// Instantiate the "accumulate" function on a list of features with several
+// constant window lengths, with and without sampling.
+#define REGISTER_CC_FUNC_TS_WINDOW_LENGTHS(NAME, INPUT, OUTPUT, ACCUMULATOR,   \
+                                           TS)                                 \
+                                                                               \
+  std::vector<py::array_t<OUTPUT>> NAME(                                       \
+      const py::array_t<TS> &evset_timestamps,                                 \
+      const std::vector<py::array_t<INPUT>> &evset_values,                     \
+      const std::vector<TS> &window_lengths) {                                 \
+    return accumulate<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>, TS>(          \
+        evset_timestamps, evset_values, nullptr, window_lengths);              \
+  }                                                                            \
+                                                                               \
+  std::vector<py::array_t<OUTPUT>> NAME(                                       \
+      const py::array_t<TS> &evset_timestamps,                                 \
+      const std::vector<py::array_t<INPUT>> &evset_values,                     \
+      const py::array_t<TS> &sampling_timestamps,                              \
+      const std::vector<TS> &window_lengths) {                                 \
+    return accumulate<INPUT, OUTPUT, ACCUMULATOR<INPUT, OUTPUT>, TS>(          \
+        evset_timestamps, evset_values, sampling_timestamps, window_lengths);  \
+  }
+
+// Instantiate the "accumulate" function on a single feature and on a list of
+// features.
+#define REGISTER_CC_FUNC_TS(NAME, INPUT, OUTPUT, ACCUMULATOR, TS)             \
+  REGISTER_CC_FUNC_TS_VALUES(NAME, INPUT, OUTPUT, ACCUMULATOR, TS,             \
+                             py::array_t<INPUT>, py::array_t<OUTPUT>)          \
+  REGISTER_CC_FUNC_TS_VALUES(NAME, INPUT, OUTPUT, ACCUMULATOR, TS,             \
+                             std::vector<py::array_t<INPUT>>,                  \
+                             std::vector<py::array_t<OUTPUT>>)                 \
+  REGISTER_CC_FUNC_TS_WINDOW_LENGTHS(NAME, INPUT, OUTPUT, ACCUMULATOR, TS)
+
+// Instantiate the "accumulate" function for float64 and int64 timestamps.
+#define REGISTER_CC_FUNC(NAME, INPUT, OUTPUT, ACCUMULATOR)                     \
+  REGISTER_CC_FUNC_TS(NAME, INPUT, OUTPUT, ACCUMULATOR, double)                \
+  REGISTER_CC_FUNC_TS(NAME, INPUT, OUTPUT, ACCUMULATOR, int64_t)
+
+// Similar to REGISTER_CC_FUNC_TS, but without inputs
+#define REGISTER_CC_FUNC_NO_INPUT_TS(NAME, OUTPUT, ACCUMULATOR, TS)            \
                                                                                \
-  py::array_t<OUTPUT> NAME(const ArrayD &evset_timestamps,                     \
-                           const double window_length) {                       \
-    return accumulate<double, OUTPUT, ACCUMULATOR<OUTPUT>>(                    \
-        evset_timestamps, evset_timestamps, window_length);                    \
+  py::array_t<OUTPUT> NAME(const py::array_t<TS> &evset_timestamps,            \
+                           const TS window_length) {                           \
+    return accumulate<TS, OUTPUT, ACCUMULATOR<TS, OUTPUT>, TS>(                \
+        evset_timestamps, evset_timestamps, nullptr, window_length);           \
   }                                                                            \
                                                                                \
-  py::array_t<OUTPUT> NAME(const ArrayD &evset_timestamps,                     \
-                           const ArrayD &sampling_timestamps,                  \
-                           const double window_length) {                       \
-    return accumulate<double, OUTPUT, ACCUMULATOR<OUTPUT>>(                    \
+  py::array_t<OUTPUT> NAME(const py::array_t<TS> &evset_timestamps,            \
+                           const py::array_t<TS> &sampling_timestamps,         \
+                           const TS window_length) {                           \
+    return accumulate<TS, OUTPUT, ACCUMULATOR<TS, OUTPUT>, TS>(                \
         evset_timestamps, evset_timestamps, sampling_timestamps,               \
         window_length);                                                        \
   }                                                                            \
                                                                                \
-  py::array_t<OUTPUT> NAME(const ArrayD &evset_timestamps,                     \
-                           const ArrayD &window_length) {                      \
-    return accumulate<double, OUTPUT, ACCUMULATOR<OUTPUT>>(                    \
-        evset_timestamps, evset_timestamps, window_length);                    \
+  py::array_t<OUTPUT> NAME(const py::array_t<TS> &evset_timestamps,            \
+                           const py::array_t<TS> &window_length) {             \
+    return accumulate<TS, OUTPUT, ACCUMULATOR<TS, OUTPUT>, TS>(                \
+        evset_timestamps, evset_timestamps, nullptr, window_length);           \
   }                                                                            \
                                                                                \
-  py::array_t<OUTPUT> NAME(const ArrayD &evset_timestamps,                     \
-                           const ArrayD &sampling_timestamps,                  \
-                           const ArrayD &window_length) {                      \
-    return accumulate<double, OUTPUT, ACCUMULATOR<OUTPUT>>(                    \
+  py::array_t<OUTPUT> NAME(const py::array_t<TS> &evset_timestamps,            \
+                           const py::array_t<TS> &sampling_timestamps,         \
+                           const py::array_t<TS> &window_length) {             \
+    return accumulate<TS, OUTPUT, ACCUMULATOR<TS, OUTPUT>, TS>(                \
         evset_timestamps, evset_timestamps, sampling_timestamps,               \
         window_length);                                                        \
+  }                                                                            \
+                                                                               \
+  std::vector<py::array_t<OUTPUT>> NAME(                                       \
+      const py::array_t<TS> &evset_timestamps,                                 \
+      const std::vector<TS> &window_lengths) {                                 \
+    return accumulate<TS, OUTPUT, ACCUMULATOR<TS, OUTPUT>, TS>(                \
+        evset_timestamps, std::vector<py::array_t<TS>>{evset_timestamps},      \
+        nullptr, window_lengths);                                              \
+  }                                                                            \
+                                                                               \
+  std::vector<py::array_t<OUTPUT>> NAME(                                       \
+      const py::array_t<TS> &evset_timestamps,                                 \
+      const py::array_t<TS> &sampling_timestamps,                              \
+      const std::vector<TS> &window_lengths) {                                 \
+    return accumulate<TS, OUTPUT, ACCUMULATOR<TS, OUTPUT>, TS>(                \
+        evset_timestamps, std::vector<py::array_t<TS>>{evset_timestamps},      \
+        sampling_timestamps, window_lengths);                                  \
   }
 
+// Similar to REGISTER_CC_FUNC, but without inputs
+#define REGISTER_CC_FUNC_NO_INPUT(NAME, OUTPUT, ACCUMULATOR)                   \
+  REGISTER_CC_FUNC_NO_INPUT_TS(NAME, OUTPUT, ACCUMULATOR, double)              \
+  REGISTER_CC_FUNC_NO_INPUT_TS(NAME, OUTPUT, ACCUMULATOR, int64_t)
+
 // Note: ";" are not needed for the code, but are required for our code
 // formatter.
 
@@ -559,73 +871,152 @@ REGISTER_CC_FUNC(moving_sum, float, float, MovingSumAccumulator);
 REGISTER_CC_FUNC(moving_sum, double, double, MovingSumAccumulator);
 REGISTER_CC_FUNC(moving_sum, int32_t, int32_t, MovingSumAccumulator);
 REGISTER_CC_FUNC(moving_sum, int64_t, int64_t, MovingSumAccumulator);
+// The sum of narrow values is returned in 64 bits.
+REGISTER_CC_FUNC(moving_sum, int8_t, int64_t, MovingSumAccumulator);
+REGISTER_CC_FUNC(moving_sum, int16_t, int64_t, MovingSumAccumulator);
+REGISTER_CC_FUNC(moving_sum, uint8_t, uint64_t, MovingSumAccumulator);
+REGISTER_CC_FUNC(moving_sum, uint16_t, uint64_t, MovingSumAccumulator);
+REGISTER_CC_FUNC(moving_sum, uint32_t, uint64_t, MovingSumAccumulator);
+REGISTER_CC_FUNC(moving_sum, uint64_t, uint64_t, MovingSumAccumulator);
 
 REGISTER_CC_FUNC(moving_min, float, float, MovingMinAccumulator);
 REGISTER_CC_FUNC(moving_min, double, double, MovingMinAccumulator);
 REGISTER_CC_FUNC(moving_min, int32_t, int32_t, MovingMinAccumulator);
 REGISTER_CC_FUNC(moving_min, int64_t, int64_t, MovingMinAccumulator);
+REGISTER_CC_FUNC(moving_min, int8_t, int8_t, MovingMinAccumulator);
+REGISTER_CC_FUNC(moving_min, int16_t, int16_t, MovingMinAccumulator);
+REGISTER_CC_FUNC(moving_min, uint8_t, uint8_t, MovingMinAccumulator);
+REGISTER_CC_FUNC(moving_min, uint16_t, uint16_t, MovingMinAccumulator);
+REGISTER_CC_FUNC(moving_min, uint32_t, uint32_t, MovingMinAccumulator);
+REGISTER_CC_FUNC(moving_min, uint64_t, uint64_t, MovingMinAccumulator);
 
 REGISTER_CC_FUNC(moving_max, float, float, MovingMaxAccumulator);
 REGISTER_CC_FUNC(moving_max, double, double, MovingMaxAccumulator);
 REGISTER_CC_FUNC(moving_max, int32_t, int32_t, MovingMaxAccumulator);
 REGISTER_CC_FUNC(moving_max, int64_t, int64_t, MovingMaxAccumulator);
+REGISTER_CC_FUNC(moving_max, int8_t, int8_t, MovingMaxAccumulator);
+REGISTER_CC_FUNC(moving_max, int16_t, int16_t, MovingMaxAccumulator);
+REGISTER_CC_FUNC(moving_max, uint8_t, uint8_t, MovingMaxAccumulator);
+REGISTER_CC_FUNC(moving_max, uint16_t, uint16_t, MovingMaxAccumulator);
+REGISTER_CC_FUNC(moving_max, uint32_t, uint32_t, MovingMaxAccumulator);
+REGISTER_CC_FUNC(moving_max, uint64_t, uint64_t, MovingMaxAccumulator);
 
 REGISTER_CC_FUNC_NO_INPUT(moving_count, int32_t, MovingCountAccumulator);
 } // namespace
 
 // Register c++ functions to pybind with and without sampling,
-// and with and without variable window length.
+// and with and without variable window length, for a given timestamp type and
+// a given representation of the values.
 //
 // Args:
 //   NAME: Name of the python and c++ function.
 //   INPUT: Input value type.
 //   OUTPUT: Output value type.
+//   TS: Timestamp and window length type.
+//   VALUES: Type of the input values.
+//   RESULT: Type of the output values.
 //
-#define ADD_PY_DEF(NAME, INPUT, OUTPUT)                                        \
+#define ADD_PY_DEF_TS_VALUES(NAME, INPUT, OUTPUT, TS, VALUES, RESULT)          \
   m.def(#NAME,                                                                 \
-        py::overload_cast<const ArrayD &, const py::array_t<INPUT> &,          \
-                          const ArrayD &, double>(&NAME),                      \
+        py::overload_cast<const py::array_t<TS> &, const VALUES &,             \
+                          const py::array_t<TS> &, TS>(&NAME),                 \
         "", py::arg("evset_timestamps").noconvert(),                           \
         py::arg("evset_values").noconvert(),                                   \
         py::arg("sampling_timestamps").noconvert(), py::arg("window_length")); \
                                                                                \
   m.def(#NAME,                                                                 \
-        py::overload_cast<const ArrayD &, const py::array_t<INPUT> &, double>( \
-            &NAME),                                                            \
+        py::overload_cast<const py::array_t<TS> &, const VALUES &, TS>(&NAME), \
         "", py::arg("evset_timestamps").noconvert(),                           \
         py::arg("evset_values").noconvert(), py::arg("window_length"));        \
                                                                                \
   m.def(#NAME,                                                                 \
-        py::overload_cast<const ArrayD &, const py::array_t<INPUT> &,          \
-                          const ArrayD &, const ArrayD &>(&NAME),              \
+        py::overload_cast<const py::array_t<TS> &, const VALUES &,             \
+                          const py::array_t<TS> &, const py::array_t<TS> &>(   \
+            &NAME),                                                            \
         "", py::arg("evset_timestamps").noconvert(),                           \
         py::arg("evset_values").noconvert(),                                   \
         py::arg("sampling_timestamps").noconvert(), py::arg("window_length")); \
                                                                                \
   m.def(#NAME,                                                                 \
-        py::overload_cast<const ArrayD &, const py::array_t<INPUT> &,          \
-                          const ArrayD &>(&NAME),                              \
+        py::overload_cast<const py::array_t<TS> &, const VALUES &,             \
+                          const py::array_t<TS> &>(&NAME),                     \
         "", py::arg("evset_timestamps").noconvert(),                           \
         py::arg("evset_values").noconvert(), py::arg("window_length"));
 
-// Similar to ADD_PY_DEF, but without inputs.
-#define ADD_PY_DEF_NO_INPUT(NAME, OUTPUT)                                      \
+// Register c++ functions on a list of features with several constant window
+// lengths, with and without sampling.
+#define ADD_PY_DEF_TS_WINDOW_LENGTHS(NAME, INPUT, OUTPUT, TS)                  \
   m.def(#NAME,                                                                 \
-        py::overload_cast<const ArrayD &, const ArrayD &, double>(&NAME), "",  \
-        py::arg("evset_timestamps").noconvert(),                               \
+        py::overload_cast<const py::array_t<TS> &,                             \
+                          const std::vector<py::array_t<INPUT>> &,             \
+                          const py::array_t<TS> &,                             \
+                          const std::vector<TS> &>(&NAME),                     \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(),                                   \
+        py::arg("sampling_timestamps").noconvert(),                            \
+        py::arg("window_lengths").noconvert());                                \
+                                                                               \
+  m.def(#NAME,                                                                 \
+        py::overload_cast<const py::array_t<TS> &,                             \
+                          const std::vector<py::array_t<INPUT>> &,             \
+                          const std::vector<TS> &>(&NAME),                     \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("evset_values").noconvert(),                                   \
+        py::arg("window_lengths").noconvert());
+
+// Register c++ functions on a single feature and on a list of features.
+#define ADD_PY_DEF_TS(NAME, INPUT, OUTPUT, TS)                                \
+  ADD_PY_DEF_TS_VALUES(NAME, INPUT, OUTPUT, TS, py::array_t<INPUT>,            \
+                       py::array_t<OUTPUT>)                                    \
+  ADD_PY_DEF_TS_VALUES(NAME, INPUT, OUTPUT, TS,                                \
+                       std::vector<py::array_t<INPUT>>,                        \
+                       std::vector<py::array_t<OUTPUT>>)                       \
+  ADD_PY_DEF_TS_WINDOW_LENGTHS(NAME, INPUT, OUTPUT, TS)
+
+// Register c++ functions to pybind for float64 and int64 timestamps.
+#define ADD_PY_DEF(NAME, INPUT, OUTPUT)                                        \
+  ADD_PY_DEF_TS(NAME, INPUT, OUTPUT, double)                                   \
+  ADD_PY_DEF_TS(NAME, INPUT, OUTPUT, int64_t)
+
+// Similar to ADD_PY_DEF_TS, but without inputs.
+#define ADD_PY_DEF_NO_INPUT_TS(NAME, OUTPUT, TS)                               \
+  m.def(#NAME,                                                                 \
+        py::overload_cast<const py::array_t<TS> &, const py::array_t<TS> &,    \
+                          TS>(&NAME),                                          \
+        "", py::arg("evset_timestamps").noconvert(),                           \
         py::arg("sampling_timestamps").noconvert(), py::arg("window_length")); \
                                                                                \
-  m.def(#NAME, py::overload_cast<const ArrayD &, double>(&NAME), "",           \
+  m.def(#NAME, py::overload_cast<const py::array_t<TS> &, TS>(&NAME), "",      \
         py::arg("evset_timestamps").noconvert(), py::arg("window_length"));    \
                                                                                \
   m.def(#NAME,                                                                 \
-        py::overload_cast<const ArrayD &, const ArrayD &, const ArrayD &>(     \
-            &NAME),                                                            \
+        py::overload_cast<const py::array_t<TS> &, const py::array_t<TS> &,    \
+                          const py::array_t<TS> &>(&NAME),                     \
         "", py::arg("evset_timestamps").noconvert(),                           \
         py::arg("sampling_timestamps").noconvert(), py::arg("window_length")); \
                                                                                \
-  m.def(#NAME, py::overload_cast<const ArrayD &, const ArrayD &>(&NAME), "",   \
-        py::arg("evset_timestamps").noconvert(), py::arg("window_length"));
+  m.def(#NAME,                                                                 \
+        py::overload_cast<const py::array_t<TS> &, const py::array_t<TS> &>(   \
+            &NAME),                                                            \
+        "", py::arg("evset_timestamps").noconvert(), py::arg("window_length")); \
+                                                                               \
+  m.def(#NAME,                                                                 \
+        py::overload_cast<const py::array_t<TS> &, const py::array_t<TS> &,    \
+                          const std::vector<TS> &>(&NAME),                     \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("sampling_timestamps").noconvert(),                            \
+        py::arg("window_lengths").noconvert());                                \
+                                                                               \
+  m.def(#NAME,                                                                 \
+        py::overload_cast<const py::array_t<TS> &, const std::vector<TS> &>(   \
+            &NAME),                                                            \
+        "", py::arg("evset_timestamps").noconvert(),                           \
+        py::arg("window_lengths").noconvert());
+
+// Similar to ADD_PY_DEF, but without inputs.
+#define ADD_PY_DEF_NO_INPUT(NAME, OUTPUT)                                      \
+  ADD_PY_DEF_NO_INPUT_TS(NAME, OUTPUT, double)                                 \
+  ADD_PY_DEF_NO_INPUT_TS(NAME, OUTPUT, int64_t)
 
 void init_window(py::module &m) {
   ADD_PY_DEF(simple_moving_average, float, float)
@@ -638,16 +1029,34 @@ void init_window(py::module &m) {
   ADD_PY_DEF(moving_sum, double, double)
   ADD_PY_DEF(moving_sum, int32_t, int32_t)
   ADD_PY_DEF(moving_sum, int64_t, int64_t)
+  ADD_PY_DEF(moving_sum, int8_t, int64_t)
+  ADD_PY_DEF(moving_sum, int16_t, int64_t)
+  ADD_PY_DEF(moving_sum, uint8_t, uint64_t)
+  ADD_PY_DEF(moving_sum, uint16_t, uint64_t)
+  ADD_PY_DEF(moving_sum, uint32_t, uint64_t)
+  ADD_PY_DEF(moving_sum, uint64_t, uint64_t)
 
   ADD_PY_DEF(moving_min, float, float)
   ADD_PY_DEF(moving_min, double, double)
   ADD_PY_DEF(moving_min, int32_t, int32_t)
   ADD_PY_DEF(moving_min, int64_t, int64_t)
+  ADD_PY_DEF(moving_min, int8_t, int8_t)
+  ADD_PY_DEF(moving_min, int16_t, int16_t)
+  ADD_PY_DEF(moving_min, uint8_t, uint8_t)
+  ADD_PY_DEF(moving_min, uint16_t, uint16_t)
+  ADD_PY_DEF(moving_min, uint32_t, uint32_t)
+  ADD_PY_DEF(moving_min, uint64_t, uint64_t)
 
   ADD_PY_DEF(moving_max, float, float)
   ADD_PY_DEF(moving_max, double, double)
   ADD_PY_DEF(moving_max, int32_t, int32_t)
   ADD_PY_DEF(moving_max, int64_t, int64_t)
+  ADD_PY_DEF(moving_max, int8_t, int8_t)
+  ADD_PY_DEF(moving_max, int16_t, int16_t)
+  ADD_PY_DEF(moving_max, uint8_t, uint8_t)
+  ADD_PY_DEF(moving_max, uint16_t, uint16_t)
+  ADD_PY_DEF(moving_max, uint32_t, uint32_t)
+  ADD_PY_DEF(moving_max, uint64_t, uint64_t)
 
   ADD_PY_DEF_NO_INPUT(moving_count, int32_t)
 }
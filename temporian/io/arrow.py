@@ -0,0 +1,402 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Utilities for converting EventSets to Apache Arrow tables and viceversa."""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from temporian.core.data.dtype import DType, check_is_valid_index_dtype
+from temporian.core.data.duration_utils import normalize_timestamp_unit
+from temporian.core.data.schema import Schema
+from temporian.implementation.numpy.data.dictionary_array import (
+    DictionaryArray,
+)
+from temporian.implementation.numpy.data.dtype_normalization import (
+    normalize_features,
+    normalize_timestamps,
+    numpy_array_to_tp_dtype,
+    tp_dtype_to_np_dtype,
+)
+from temporian.implementation.numpy.data.event_set import (
+    CompactData,
+    EventSet,
+)
+from temporian.implementation.numpy_cc.operators import operators_cc
+
+
+def from_arrow(
+    table: "pyarrow.Table",
+    indexes: Optional[List[str]] = None,
+    timestamps: str = "timestamp",
+    name: Optional[str] = None,
+    is_unix_timestamp: Optional[bool] = None,
+    timestamp_unit: Optional[str] = None,
+) -> EventSet:
+    """Converts an Apache Arrow Table into an [`EventSet`][temporian.EventSet].
+
+    The column `timestamps` (defaults to "timestamp") contains the
+    timestamps. Columns `indexes` (default to `None`, equivalent to `[]`),
+    contains the indexes. The remaining columns are converted into features.
+
+    The returned EventSet is in the compact layout (see
+    [`EventSet.compact()`][temporian.EventSet.compact]). Float64 timestamps
+    (or int64 timestamps if `timestamp_unit` is set) and integer and floating
+    point features without missing values share their memory with the table
+    (i.e., they are not copied) if:
+
+    - The columns are made of a single chunk.
+    - The events of each index key are contiguous in the table, and sorted by
+        timestamp.
+
+    Other columns (e.g., strings) are converted as in
+    [`tp.event_set()`][temporian.event_set].
+
+    Usage example:
+        ```python
+        >>> import pyarrow as pa
+        >>> table = pa.table({
+        ...     "timestamp": [1.0, 2.0, 3.0, 1.0],
+        ...     "feature_1": [5, 6, 7, 8],
+        ...     "feature_2": ["A", "A", "A", "B"],
+        ... })
+        >>> evset = tp.from_arrow(table, indexes=["feature_2"])
+        >>> evset.get_index_value(("A",)).features
+        [array([5, 6, 7])]
+
+        ```
+
+    Args:
+        table: Apache Arrow Table.
+        indexes: Names of the columns to use as indexes. If empty
+            (default), the data is not indexed. Only integer and string columns
+            can be used as indexes.
+        timestamps: Name of the column containing the timestamps.
+        name: Optional name of the EventSet. Used for debugging, and
+            graph serialization.
+        is_unix_timestamp: Whether the timestamps correspond to unix time. If
+            `None` (default), timestamps are interpreted as unix times if the
+            timestamps column contains dates or datetimes.
+        timestamp_unit: If set, the timestamps are int64 numbers of this unit
+            (e.g., "ns" for nanoseconds). See
+            [`tp.event_set()`][temporian.event_set].
+
+    Returns:
+        An EventSet.
+
+    Raises:
+        ValueError: If `indexes` or `timestamps` are not in `table`'s
+            columns.
+        ValueError: If a column has an unsupported dtype.
+    """
+
+    if indexes is None:
+        indexes = []
+
+    for column_name in [timestamps] + indexes:
+        if column_name not in table.column_names:
+            raise ValueError(
+                f"Column {column_name!r} not found in the table. The"
+                f" available columns are {table.column_names}."
+            )
+
+    timestamp_unit = normalize_timestamp_unit(timestamp_unit)
+    timestamp_values, auto_is_unix_timestamp = normalize_timestamps(
+        _column_to_numpy(table.column(timestamps)),
+        copy=False,
+        timestamp_unit=timestamp_unit,
+    )
+    if is_unix_timestamp is None:
+        is_unix_timestamp = auto_is_unix_timestamp
+
+    features = {
+        column_name: normalize_features(
+            _column_to_numpy(table.column(column_name)), column_name
+        )
+        for column_name in table.column_names
+        if column_name != timestamps and column_name not in indexes
+    }
+    index_values = [
+        np.asarray(
+            normalize_features(_column_to_numpy(table.column(index)), index)
+        )
+        for index in indexes
+    ]
+
+    schema = Schema(
+        features=[
+            (feature_name, numpy_array_to_tp_dtype(feature_name, values))
+            for feature_name, values in features.items()
+        ],
+        indexes=[
+            (index, numpy_array_to_tp_dtype(index, values))
+            for index, values in zip(indexes, index_values)
+        ],
+        is_unix_timestamp=is_unix_timestamp,
+        timestamp_unit=timestamp_unit,
+    )
+    for index in schema.indexes:
+        check_is_valid_index_dtype(index.dtype)
+
+    # Group the events by index key.
+    num_events = len(timestamp_values)
+    if indexes:
+        index_keys, row_idxs, offsets = operators_cc.add_index_compute_index(
+            index_values
+        )
+        offsets = offsets.astype(np.int64, copy=False)
+        sizes = np.diff(offsets)
+        first_rows = row_idxs[offsets[:-1]]
+        if np.all(row_idxs[offsets[1:] - 1] - first_rows == sizes - 1):
+            # The events of each index key are contiguous in the table.
+            key_order = np.argsort(first_rows, kind="mergesort")
+            index_keys = [index_keys[i] for i in key_order]
+            offsets = np.zeros(len(index_keys) + 1, dtype=np.int64)
+            np.cumsum(sizes[key_order], out=offsets[1:])
+            row_idxs = None
+    else:
+        index_keys = [()]
+        offsets = np.array([0, num_events], dtype=np.int64)
+        row_idxs = None
+
+    # Sort the events of each index key by timestamp.
+    sorted_timestamps = (
+        timestamp_values if row_idxs is None else timestamp_values[row_idxs]
+    )
+    unsorted = sorted_timestamps[:-1] > sorted_timestamps[1:]
+    unsorted[offsets[1:-1] - 1] = False
+    if np.any(unsorted):
+        group_idxs = np.repeat(np.arange(len(index_keys)), np.diff(offsets))
+        order = np.lexsort((sorted_timestamps, group_idxs))
+        row_idxs = order if row_idxs is None else row_idxs[order]
+
+    if row_idxs is not None:
+        timestamp_values = timestamp_values[row_idxs]
+        features = {k: v[row_idxs] for k, v in features.items()}
+
+    evset = EventSet(
+        data=CompactData(
+            index_keys=index_keys,
+            offsets=offsets,
+            timestamps=timestamp_values,
+            features=[features[f] for f in schema.feature_names()],
+        ),
+        schema=schema,
+    )
+    evset.name = name
+    return evset
+
+
+def to_arrow(
+    evset: EventSet,
+    timestamp_to_datetime: bool = False,
+    timestamps: bool = True,
+) -> "pyarrow.Table":
+    """Converts an [`EventSet`][temporian.EventSet] to an Apache Arrow Table.
+
+    The timestamps and the integer and floating point features are not copied:
+    The columns of the table share their memory with the EventSet. If the
+    EventSet is not in the compact layout (see
+    [`EventSet.compact()`][temporian.EventSet.compact]), each column has one
+    chunk per index key.
+
+    Usage example:
+        ```python
+        >>> evset = tp.event_set(
+        ...     timestamps=[1, 2, 3],
+        ...     features={
+        ...         "feature_1": [0.5, 0.6, 0.7],
+        ...         "my_index": ["red", "red", "blue"],
+        ...     },
+        ...     indexes=["my_index"],
+        ... )
+        >>> table = tp.to_arrow(evset)
+        >>> table.column_names
+        ['my_index', 'feature_1', 'timestamp']
+
+        ```
+
+    Args:
+        evset: Input event set.
+        timestamp_to_datetime: If true, cast Temporian timestamps to Arrow
+            timestamps when is_unix_timestamp is set to True. Float64
+            timestamps are converted to nanosecond precision and copied. Int64
+            timestamps keep their unit and are not copied.
+        timestamps: If true, the timestamps are included as a column.
+
+    Returns:
+        Table created from EventSet.
+    """
+
+    import pyarrow as pa
+
+    timestamp_key = "timestamp"
+    index_schemas = evset.schema.indexes
+    feature_schemas = evset.schema.features
+
+    if isinstance(evset.data, CompactData):
+        chunks = [evset.data]
+        index_keys = evset.data.index_keys
+        sizes = np.diff(evset.data.offsets)
+        index_columns = [
+            [
+                np.repeat(
+                    np.array(
+                        [key[index_idx] for key in index_keys],
+                        dtype=tp_dtype_to_np_dtype(index.dtype),
+                    ),
+                    sizes,
+                )
+            ]
+            for index_idx, index in enumerate(index_schemas)
+        ]
+    else:
+        chunks = list(evset.data.values())
+        index_columns = [
+            [
+                np.full(
+                    len(data.timestamps),
+                    key[index_idx],
+                    dtype=tp_dtype_to_np_dtype(index.dtype),
+                )
+                for key, data in evset.data.items()
+            ]
+            for index_idx, index in enumerate(index_schemas)
+        ]
+
+    columns: Dict[str, "pyarrow.ChunkedArray"] = {}
+    for index, values in zip(index_schemas, index_columns):
+        columns[index.name] = _chunked_array(values, index.dtype)
+
+    for feature_idx, feature in enumerate(feature_schemas):
+        columns[feature.name] = _chunked_array(
+            [chunk.features[feature_idx] for chunk in chunks], feature.dtype
+        )
+
+    if timestamps:
+        timestamp_unit = evset.schema.timestamp_unit
+        timestamp_column = _chunked_array(
+            [chunk.timestamps for chunk in chunks],
+            evset.schema.timestamp_dtype,
+        )
+        if (
+            evset.schema.is_unix_timestamp
+            and timestamp_to_datetime
+            and timestamp_unit is not None
+        ):
+            timestamp_column = timestamp_column.cast(
+                pa.timestamp(timestamp_unit.value)
+            )
+        elif evset.schema.is_unix_timestamp and timestamp_to_datetime:
+            timestamp_column = pa.chunked_array(
+                [
+                    pa.array(
+                        np.round(chunk.timestamps * 1e9).astype(np.int64),
+                        type=pa.timestamp("ns"),
+                    )
+                    for chunk in chunks
+                ],
+                type=pa.timestamp("ns"),
+            )
+        columns[timestamp_key] = timestamp_column
+
+    return pa.table(columns)
+
+
+def _column_to_numpy(column: "pyarrow.ChunkedArray") -> np.ndarray:
+    """Converts an Arrow column into a NumPy array.
+
+    Integer and floating point columns made of a single chunk and without
+    missing values are not copied.
+    """
+
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if (
+        pa.types.is_dictionary(column.type)
+        and _is_string_type(column.type.value_type)
+        and column.null_count == 0
+    ):
+        column = column.unify_dictionaries().combine_chunks()
+        vocabulary = np.char.encode(
+            column.dictionary.to_numpy(zero_copy_only=False).astype(np.str_),
+            "UTF-8",
+        )
+        return DictionaryArray(
+            column.indices.to_numpy(zero_copy_only=False), vocabulary
+        )
+
+    if pa.types.is_dictionary(column.type):
+        column = column.cast(column.type.value_type)
+
+    if _is_string_type(column.type):
+        return pc.fill_null(column, "").to_numpy().astype(np.str_)
+
+    if column.num_chunks == 1 and column.null_count == 0:
+        if pa.types.is_integer(column.type) or pa.types.is_floating(
+            column.type
+        ):
+            return column.chunk(0).to_numpy(zero_copy_only=True)
+
+    return column.to_numpy()
+
+
+def _is_string_type(arrow_type: "pyarrow.DataType") -> bool:
+    import pyarrow as pa
+
+    return pa.types.is_string(arrow_type) or pa.types.is_large_string(
+        arrow_type
+    )
+
+
+def _chunked_array(
+    values: List[np.ndarray], dtype: DType
+) -> "pyarrow.ChunkedArray":
+    """Converts NumPy arrays into an Arrow chunked array.
+
+    Numerical arrays are not copied. Temporian strings (i.e., UTF-8 encoded
+    bytes) are converted into Arrow strings.
+    """
+
+    import pyarrow as pa
+
+    if dtype == DType.STRING and all(
+        isinstance(value, DictionaryArray) for value in values
+    ):
+        return pa.chunked_array(
+            [
+                pa.DictionaryArray.from_arrays(
+                    pa.array(value.codes),
+                    pa.array(value.vocabulary, type=pa.binary()).cast(
+                        pa.string()
+                    ),
+                )
+                for value in values
+            ],
+            type=pa.dictionary(pa.int32(), pa.string()),
+        )
+
+    if dtype == DType.STRING:
+        return pa.chunked_array(
+            [pa.array(value, type=pa.binary()) for value in values],
+            type=pa.binary(),
+        ).cast(pa.string())
+
+    arrow_type = pa.from_numpy_dtype(tp_dtype_to_np_dtype(dtype))
+    return pa.chunked_array(
+        [pa.array(value, type=arrow_type) for value in values],
+        type=arrow_type,
+    )
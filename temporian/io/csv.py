@@ -26,6 +26,7 @@ def from_csv(
     timestamps: str = "timestamp",
     indexes: Optional[List[str]] = None,
     sep: str = ",",
+    features: Optional[List[str]] = None,
 ) -> EventSet:
     """Reads an [`EventSet`][temporian.EventSet] from a CSV file.
 
@@ -61,6 +62,11 @@ def from_csv(
         indexes: Names of the columns to be used as indexes for the EventSet.
             If None, a flat EventSet will be created.
         sep: Separator to use.
+        features: Names of the columns to be used as features for the
+            EventSet. Only those columns (plus the timestamps and indexes) are
+            read from the file. If None, all the other columns are used as
+            features. See [`tp.required_features()`][temporian.required_features]
+            to list the features needed by a graph.
 
     Returns:
         EventSet read from file.
@@ -71,7 +77,11 @@ def from_csv(
     if indexes is None:
         indexes = []
 
-    df = pd.read_csv(path, sep=sep)
+    usecols = None
+    if features is not None:
+        usecols = [timestamps] + indexes + features
+
+    df = pd.read_csv(path, sep=sep, usecols=usecols)
     return from_pandas(df, indexes=indexes, timestamps=timestamps)
 
 
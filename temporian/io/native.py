@@ -0,0 +1,334 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Utilities for saving and loading EventSets in Temporian's native binary
+format.
+
+A file contains:
+
+- The magic bytes `TPEVSET\\x00`.
+- The size of the header in bytes, as a little-endian uint64.
+- The header: A UTF-8 JSON object with the format version, the schema, the
+    name and the number of index keys of the EventSet, and the dtype, length
+    and position of each array.
+- The arrays, in the compact layout (see
+    [`tp.CompactData`][temporian.CompactData]): The offsets of the index keys,
+    the timestamps, the features and one array of values per index. Each
+    array is a raw little-endian buffer aligned on 64 bytes.
+"""
+
+import json
+import struct
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+
+from temporian.core.data.dtype import DType
+from temporian.core.data.schema import Schema
+from temporian.implementation.numpy.data import dictionary_array
+from temporian.implementation.numpy.data.dictionary_array import (
+    DictionaryArray,
+)
+from temporian.implementation.numpy.data.dtype_normalization import (
+    tp_dtype_to_np_dtype,
+)
+from temporian.implementation.numpy.data.event_set import (
+    CompactData,
+    EventSet,
+)
+from temporian.utils.typecheck import typecheck
+
+_MAGIC = b"TPEVSET\x00"
+_VERSION = 1
+_ALIGNMENT = 64
+_HEADER_SIZE_FORMAT = "<Q"
+
+# Content and header description of an array: The chunks of the array, the
+# little-endian NumPy dtype, and the number of values.
+_Array = Tuple[List[np.ndarray], np.dtype, int]
+
+
+@typecheck
+def save_event_set(evset: EventSet, path: str) -> None:
+    """Saves an [`EventSet`][temporian.EventSet] to a file in Temporian's
+    native binary format.
+
+    The file contains the schema, the index keys, and the raw timestamps and
+    feature values of the EventSet. It can be read back with
+    [`tp.load_event_set()`][temporian.load_event_set] without parsing or
+    copying the data.
+
+    Unlike [`tp.to_parquet()`][temporian.to_parquet] or
+    [`tp.to_csv()`][temporian.to_csv], the EventSet is not converted into a
+    DataFrame: The arrays are written to the file as they are.
+
+    Usage example:
+        ```python
+        >>> path = str(tmp_dir / "evset.tpe")
+        >>> evset = tp.event_set(
+        ...     timestamps=[1, 2, 3],
+        ...     features={"f": [0.1, 0.2, 0.3], "k": ["a", "b", "a"]},
+        ...     indexes=["k"],
+        ... )
+        >>> tp.save_event_set(evset, path)
+        >>> tp.load_event_set(path) == evset
+        True
+
+        ```
+
+    Args:
+        evset: EventSet to save.
+        path: Path to the file.
+    """
+
+    schema = evset.schema
+    data = evset.data
+    if isinstance(data, CompactData):
+        index_keys = data.index_keys
+        offsets = data.offsets
+        chunks = [data]
+    else:
+        index_keys = list(data.keys())
+        offsets = np.zeros(len(index_keys) + 1, dtype=np.int64)
+        np.cumsum([len(v.timestamps) for v in data.values()], out=offsets[1:])
+        chunks = list(data.values())
+
+    timestamp_dtype = tp_dtype_to_np_dtype(schema.timestamp_dtype)
+    arrays: Dict[str, Any] = {
+        "offsets": _array([offsets], np.int64),
+        "timestamps": _array(
+            [chunk.timestamps for chunk in chunks], timestamp_dtype
+        ),
+        "features": [
+            _feature_arrays(
+                [chunk.features[feature_idx] for chunk in chunks],
+                feature.dtype,
+            )
+            for feature_idx, feature in enumerate(schema.features)
+        ],
+        "indexes": [],
+    }
+    for index_idx, index in enumerate(schema.indexes):
+        values = np.array(
+            [key[index_idx] for key in index_keys],
+            dtype=tp_dtype_to_np_dtype(index.dtype),
+        )
+        arrays["indexes"].append(_array([values], values.dtype))
+
+    # Position of the arrays, relatively to the end of the header.
+    content: List[_Array] = []
+    position = 0
+
+    def describe(array: _Array) -> Dict[str, Any]:
+        nonlocal position
+        position = _align(position)
+        description = {
+            "dtype": array[1].str,
+            "length": array[2],
+            "position": position,
+        }
+        content.append(array)
+        position += array[1].itemsize * array[2]
+        return description
+
+    header = {
+        "version": _VERSION,
+        "name": evset.name,
+        "schema": {
+            "features": [(f.name, f.dtype.value) for f in schema.features],
+            "indexes": [(i.name, i.dtype.value) for i in schema.indexes],
+            "is_unix_timestamp": schema.is_unix_timestamp,
+            "timestamp_unit": (
+                None
+                if schema.timestamp_unit is None
+                else schema.timestamp_unit.value
+            ),
+        },
+        "num_index_keys": len(index_keys),
+        "offsets": describe(arrays["offsets"]),
+        "timestamps": describe(arrays["timestamps"]),
+        "features": [
+            {key: describe(array) for key, array in feature.items()}
+            for feature in arrays["features"]
+        ],
+        "indexes": [describe(array) for array in arrays["indexes"]],
+    }
+    encoded_header = json.dumps(header).encode("utf-8")
+
+    with open(path, "wb") as file:
+        file.write(_MAGIC)
+        file.write(struct.pack(_HEADER_SIZE_FORMAT, len(encoded_header)))
+        file.write(encoded_header)
+        for array_chunks, dtype, _ in content:
+            file.write(b"\x00" * (_align(file.tell()) - file.tell()))
+            for chunk in array_chunks:
+                file.write(memoryview(np.ascontiguousarray(chunk, dtype=dtype)))
+
+
+@typecheck
+def load_event_set(path: str, memory_map: bool = True) -> EventSet:
+    """Loads an [`EventSet`][temporian.EventSet] saved with
+    [`tp.save_event_set()`][temporian.save_event_set].
+
+    If `memory_map` is true (default), the file is memory-mapped with
+    `np.memmap`: Loading the EventSet is instantaneous, and the timestamps
+    and feature values are only read from disk when accessed. This allows
+    processing EventSets larger than the available memory. The arrays of the
+    EventSet are read-only, and the file should not be modified while the
+    EventSet is in use.
+
+    The returned EventSet is in the compact layout (see
+    [`EventSet.compact()`][temporian.EventSet.compact]).
+
+    Usage example:
+        ```python
+        >>> path = str(tmp_dir / "evset.tpe")
+        >>> tp.save_event_set(
+        ...     tp.event_set(timestamps=[1, 2], features={"f": [3, 4]}), path
+        ... )
+        >>> evset = tp.load_event_set(path)
+        >>> evset
+        indexes: []
+        features: [('f', int64)]
+        events:
+            (2 events):
+                timestamps: [1. 2.]
+                'f': [3 4]
+        ...
+
+        ```
+
+    Args:
+        path: Path to the file.
+        memory_map: If true, memory-maps the file instead of reading it.
+
+    Returns:
+        EventSet read from the file.
+
+    Raises:
+        ValueError: If the file is not an EventSet file, or was created by a
+            more recent version of Temporian.
+    """
+
+    with open(path, "rb") as file:
+        magic = file.read(len(_MAGIC))
+        if magic != _MAGIC:
+            raise ValueError(
+                f"{path!r} is not an EventSet file created with"
+                " `tp.save_event_set()`."
+            )
+        (header_size,) = struct.unpack(
+            _HEADER_SIZE_FORMAT, file.read(struct.calcsize(_HEADER_SIZE_FORMAT))
+        )
+        header = json.loads(file.read(header_size).decode("utf-8"))
+        data_begin = _align(file.tell())
+
+    if header["version"] > _VERSION:
+        raise ValueError(
+            f"The EventSet file {path!r} has version {header['version']}, but"
+            " this version of Temporian only supports versions up to"
+            f" {_VERSION}. Update Temporian to read this file."
+        )
+
+    if memory_map:
+        buffer = np.memmap(path, dtype=np.uint8, mode="r")
+    else:
+        buffer = np.fromfile(path, dtype=np.uint8)
+
+    def read(description: Dict[str, Any]) -> np.ndarray:
+        dtype = np.dtype(description["dtype"])
+        array = np.ndarray(
+            shape=(description["length"],),
+            dtype=dtype,
+            buffer=buffer,
+            offset=data_begin + description["position"],
+        )
+        if not dtype.isnative:
+            array = array.astype(dtype.newbyteorder("="))
+        return array
+
+    def read_feature(
+        description: Dict[str, Any]
+    ) -> Union[np.ndarray, DictionaryArray]:
+        if "codes" in description:
+            return DictionaryArray(
+                read(description["codes"]), read(description["vocabulary"])
+            )
+        return read(description["values"])
+
+    src_schema = header["schema"]
+    schema = Schema(
+        features=[
+            (name, DType(dtype)) for name, dtype in src_schema["features"]
+        ],
+        indexes=[(name, DType(dtype)) for name, dtype in src_schema["indexes"]],
+        is_unix_timestamp=src_schema["is_unix_timestamp"],
+        timestamp_unit=src_schema["timestamp_unit"],
+    )
+
+    if schema.indexes:
+        index_keys = list(
+            zip(*[read(index).tolist() for index in header["indexes"]])
+        )
+    else:
+        index_keys = [()] * header["num_index_keys"]
+
+    evset = EventSet(
+        data=CompactData(
+            index_keys=index_keys,
+            offsets=read(header["offsets"]),
+            timestamps=read(header["timestamps"]),
+            features=[read_feature(f) for f in header["features"]],
+        ),
+        schema=schema,
+    )
+    evset.name = header["name"]
+    return evset
+
+
+def _align(position: int) -> int:
+    return -(-position // _ALIGNMENT) * _ALIGNMENT
+
+
+def _array(chunks: List[np.ndarray], dtype: Any) -> _Array:
+    """Content of an array made of several chunks, stored with a
+    little-endian dtype."""
+
+    dtype = np.dtype(dtype).newbyteorder("<")
+    return chunks, dtype, sum(len(chunk) for chunk in chunks)
+
+
+def _feature_arrays(
+    chunks: List[Union[np.ndarray, DictionaryArray]], dtype: DType
+) -> Dict[str, _Array]:
+    """Arrays storing the values of a feature.
+
+    Dictionary-encoded features are stored as codes and vocabulary. Other
+    string features are stored as fixed-width bytes.
+    """
+
+    if dtype != DType.STRING:
+        return {"values": _array(chunks, tp_dtype_to_np_dtype(dtype))}
+
+    if chunks and all(isinstance(chunk, DictionaryArray) for chunk in chunks):
+        values = dictionary_array.concatenate(chunks)
+        assert isinstance(values, DictionaryArray)
+        return {
+            "codes": _array([values.codes], values.codes.dtype),
+            "vocabulary": _array([values.vocabulary], values.vocabulary.dtype),
+        }
+
+    chunks = [np.asarray(chunk) for chunk in chunks]
+    width = max([chunk.dtype.itemsize for chunk in chunks] + [1])
+    return {"values": _array(chunks, f"S{width}")}
@@ -29,6 +29,7 @@ def from_pandas(
     timestamps: str = "timestamp",
     name: Optional[str] = None,
     same_sampling_as: Optional[EventSet] = None,
+    timestamp_unit: Optional[str] = None,
 ) -> EventSet:
     """Converts a Pandas DataFrame into an [`EventSet`][temporian.EventSet].
 
@@ -37,7 +38,9 @@ def from_pandas(
     contains the indexes. The remaining columns are converted into features.
 
     See [`tp.event_set()`][temporian.event_set] for the list of supported
-    timestamp and feature types.
+    timestamp and feature types. Categorical columns of strings are converted
+    into dictionary-encoded features (see
+    [`tp.DictionaryArray`][temporian.DictionaryArray]).
 
     Usage example:
         ```python
@@ -67,6 +70,9 @@ def from_pandas(
             having the same sampling as `same_sampling_as`. Some operators,
             such as [`EventSet.filter()`][temporian.EventSet.filter], require
             their inputs to have the same sampling.
+        timestamp_unit: If set, the timestamps are int64 numbers of this unit
+            (e.g., "ns" for nanoseconds). See
+            [`tp.event_set()`][temporian.event_set].
 
     Returns:
         An EventSet.
@@ -81,10 +87,15 @@ def from_pandas(
 
     return event_set(
         timestamps=df[timestamps].to_numpy(),
-        features={k: v.to_numpy() for k, v in feature_dict.items()},
+        features={
+            # Categorical columns are converted into DictionaryArrays.
+            k: v if v.dtype.name == "category" else v.to_numpy()
+            for k, v in feature_dict.items()
+        },
         indexes=indexes,
         name=name,
         same_sampling_as=same_sampling_as,
+        timestamp_unit=timestamp_unit,
     )
 
 
@@ -158,7 +169,11 @@ def to_pandas(
             # Timestamps
             if evset.schema.is_unix_timestamp and timestamp_to_datetime:
                 dst[timestamp_key].append(
-                    data.timestamps.astype("datetime64[s]")
+                    data.timestamps.astype(
+                        "datetime64[s]"
+                        if evset.schema.timestamp_unit is None
+                        else f"datetime64[{evset.schema.timestamp_unit.value}]"
+                    )
                 )
             else:
                 dst[timestamp_key].append(data.timestamps)
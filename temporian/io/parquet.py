@@ -26,6 +26,7 @@ def from_parquet(
     path: str,
     timestamps: str = "timestamp",
     indexes: Optional[List[str]] = None,
+    features: Optional[List[str]] = None,
     **kwargs,
 ) -> EventSet:
     """Reads an [`EventSet`][temporian.EventSet] from a parquet file.
@@ -53,6 +54,11 @@ def from_parquet(
             EventSet.
         indexes: Names of the columns to be used as indexes for the EventSet.
             If None, a flat EventSet will be created.
+        features: Names of the columns to be used as features for the
+            EventSet. Only those columns (plus the timestamps and indexes) are
+            read from the file. If None, all the other columns are used as
+            features. See [`tp.required_features()`][temporian.required_features]
+            to list the features needed by a graph.
 
     Returns:
         EventSet read from file.
@@ -63,6 +69,9 @@ def from_parquet(
     if indexes is None:
         indexes = []
 
+    if features is not None:
+        kwargs["columns"] = [timestamps] + indexes + features
+
     df = pd.read_parquet(path, **kwargs)
     return from_pandas(df, indexes=indexes, timestamps=timestamps)
 
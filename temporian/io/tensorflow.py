@@ -145,18 +145,14 @@ def to_tensorflow_record(
 
             # Features
             for feature_idx, feature_schema in enumerate(evset.schema.features):
-                if feature_schema.dtype in [
-                    DType.BOOLEAN,
-                    DType.INT32,
-                    DType.INT64,
-                ]:
+                if (
+                    feature_schema.dtype == DType.BOOLEAN
+                    or feature_schema.dtype.is_integer
+                ):
                     f(ex, feature_schema.name).int64_list.value[
                         :
                     ] = index_value.features[feature_idx]
-                elif feature_schema.dtype in [
-                    DType.FLOAT32,
-                    DType.FLOAT64,
-                ]:
+                elif feature_schema.dtype.is_float:
                     f(ex, feature_schema.name).float_list.value[
                         :
                     ] = index_value.features[feature_idx]
@@ -171,18 +167,14 @@ def to_tensorflow_record(
             for index_value, index_schema in zip(
                 index_key, evset.schema.indexes
             ):
-                if index_schema.dtype in [
-                    DType.BOOLEAN,
-                    DType.INT32,
-                    DType.INT64,
-                ]:
+                if (
+                    index_schema.dtype == DType.BOOLEAN
+                    or index_schema.dtype.is_integer
+                ):
                     f(ex, index_schema.name).int64_list.value.append(
                         index_value
                     )
-                elif index_schema.dtype in [
-                    DType.FLOAT32,
-                    DType.FLOAT64,
-                ]:
+                elif index_schema.dtype.is_float:
                     f(ex, index_schema.name).float_list.value.append(
                         index_value
                     )
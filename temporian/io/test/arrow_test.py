@@ -0,0 +1,155 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pyarrow as pa
+from absl.testing import absltest
+
+from temporian.implementation.numpy.data.dictionary_array import (
+    DictionaryArray,
+)
+from temporian.implementation.numpy.data.io import event_set
+from temporian.io.arrow import from_arrow, to_arrow
+
+
+class ArrowTest(absltest.TestCase):
+    def test_from_arrow(self):
+        table = pa.table(
+            {
+                "timestamp": [3.0, 1.0, 2.0, 1.0, 2.0],
+                "f1": [1, 2, 3, 4, 5],
+                "f2": ["a", "b", "c", "d", None],
+                "k": ["x", "x", "x", "y", "z"],
+            }
+        )
+        evset = from_arrow(table, indexes=["k"])
+        expected = event_set(
+            timestamps=[3.0, 1.0, 2.0, 1.0, 2.0],
+            features={
+                "f1": [1, 2, 3, 4, 5],
+                "f2": ["a", "b", "c", "d", ""],
+                "k": ["x", "x", "x", "y", "z"],
+            },
+            indexes=["k"],
+        )
+        self.assertTrue(evset.is_compact())
+        self.assertEqual(evset, expected)
+
+    def test_from_arrow_zero_copy(self):
+        timestamps = np.array([1.0, 2.0, 3.0, 1.0, 2.0])
+        f1 = np.array([1, 2, 3, 4, 5], dtype=np.int64)
+        table = pa.table(
+            {
+                "timestamp": timestamps,
+                "f1": f1,
+                "k": np.array([2, 2, 2, 1, 1], dtype=np.int64),
+            }
+        )
+        evset = from_arrow(table, indexes=["k"])
+        self.assertTrue(np.shares_memory(evset.data.timestamps, timestamps))
+        self.assertTrue(np.shares_memory(evset.data.features[0], f1))
+        np.testing.assert_array_equal(
+            evset.get_index_value((1,)).features[0], [4, 5]
+        )
+        self.assertEqual(
+            evset.moving_sum(2.0).get_index_value((2,)).features[0].tolist(),
+            [1, 3, 5],
+        )
+
+        # Events of the same index key are not contiguous.
+        table = table.take([0, 3, 1, 4, 2])
+        evset = from_arrow(table, indexes=["k"])
+        np.testing.assert_array_equal(
+            evset.get_index_value((2,)).features[0], [1, 2, 3]
+        )
+
+    def test_from_arrow_missing_column(self):
+        with self.assertRaisesRegex(ValueError, "'t' not found"):
+            from_arrow(pa.table({"timestamp": [1.0]}), timestamps="t")
+
+    def test_from_arrow_datetime(self):
+        table = pa.table(
+            {
+                "timestamp": pa.array(
+                    np.array(
+                        ["2020-01-01", "2020-01-02"], dtype="datetime64[ns]"
+                    )
+                ),
+                "f": pa.chunked_array([[1.0], [2.0]]),
+            }
+        )
+        evset = from_arrow(table)
+        self.assertTrue(evset.schema.is_unix_timestamp)
+        np.testing.assert_array_equal(
+            evset.data.timestamps, [1577836800.0, 1577923200.0]
+        )
+
+    def test_dictionary(self):
+        table = pa.table(
+            {
+                "timestamp": [1.0, 2.0, 3.0],
+                "f": pa.array(["a", "b", "a"]).dictionary_encode(),
+            }
+        )
+        evset = from_arrow(table)
+        values = evset.data.features[0]
+        self.assertIsInstance(values, DictionaryArray)
+        np.testing.assert_array_equal(values, [b"a", b"b", b"a"])
+
+        table = to_arrow(evset)
+        self.assertEqual(
+            table.schema.field("f").type, pa.dictionary(pa.int32(), pa.string())
+        )
+        self.assertEqual(table.column("f").to_pylist(), ["a", "b", "a"])
+
+    def test_to_arrow(self):
+        evset = event_set(
+            timestamps=[1.0, 2.0, 3.0, 4.0],
+            features={
+                "f1": [0.1, 0.2, 0.3, 0.4],
+                "f2": ["a", "b", "c", "d"],
+                "k": [1, 1, 2, 2],
+            },
+            indexes=["k"],
+        )
+        for src in [evset, evset.compact()]:
+            table = to_arrow(src)
+            self.assertEqual(table.column_names, ["k", "f1", "f2", "timestamp"])
+            self.assertEqual(table.schema.field("f2").type, pa.string())
+            self.assertEqual(from_arrow(table, indexes=["k"]), evset)
+
+        # The features are not copied.
+        compact = evset.compact()
+        table = to_arrow(compact, timestamps=False)
+        self.assertTrue(
+            np.shares_memory(
+                table.column("f1").chunk(0).to_numpy(),
+                compact.data.features[0],
+            )
+        )
+        self.assertNotIn("timestamp", table.column_names)
+
+    def test_to_arrow_datetime(self):
+        evset = event_set(
+            timestamps=np.array(["2020-01-01"], dtype="datetime64[ns]"),
+        )
+        table = to_arrow(evset, timestamp_to_datetime=True)
+        self.assertEqual(
+            table.schema.field("timestamp").type, pa.timestamp("ns")
+        )
+        self.assertEqual(from_arrow(table), evset)
+
+
+if __name__ == "__main__":
+    absltest.main()
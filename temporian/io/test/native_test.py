@@ -0,0 +1,121 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+
+import numpy as np
+from absl.testing import absltest
+
+from temporian.implementation.numpy.data.dictionary_array import (
+    DictionaryArray,
+)
+from temporian.implementation.numpy.data.io import event_set
+from temporian.io.native import load_event_set, save_event_set
+
+
+class NativeTest(absltest.TestCase):
+    def setUp(self) -> None:
+        self.path = os.path.join(tempfile.mkdtemp(), "evset.tpe")
+
+    def test_save_and_load(self):
+        evset = event_set(
+            timestamps=[1.0, 2.0, 3.0, 4.0, 5.0],
+            features={
+                "f1": [0.1, 0.2, 0.3, 0.4, 0.5],
+                "f2": np.array([1, 2, 3, 4, 5], dtype=np.int8),
+                "f3": ["a", "bb", "", "ccc", "a"],
+                "f4": [True, False, True, False, True],
+                "k1": ["x", "y", "x", "y", ""],
+                "k2": [1, 1, 2, 1, 1],
+            },
+            indexes=["k1", "k2"],
+            is_unix_timestamp=True,
+            name="my_evset",
+        )
+
+        for src in [evset, evset.compact()]:
+            save_event_set(src, self.path)
+            for memory_map in [True, False]:
+                result = load_event_set(self.path, memory_map=memory_map)
+                self.assertTrue(result.is_compact())
+                self.assertEqual(result.name, "my_evset")
+                self.assertEqual(result.schema, evset.schema)
+                self.assertEqual(result, evset)
+
+    def test_memory_map(self):
+        evset = event_set(
+            timestamps=[1, 2, 3],
+            features={"f": [1.0, 2.0, 3.0], "k": [1, 2, 1]},
+            indexes=["k"],
+        )
+        save_event_set(evset, self.path)
+
+        result = load_event_set(self.path)
+        self.assertIsInstance(result.data.timestamps.base, np.memmap)
+        self.assertFalse(result.data.features[0].flags.writeable)
+        self.assertEqual(
+            result.moving_sum(3.0).get_index_value((1,)).features[0].tolist(),
+            [1.0, 4.0],
+        )
+
+        result = load_event_set(self.path, memory_map=False)
+        self.assertNotIsInstance(result.data.timestamps.base, np.memmap)
+
+    def test_dictionary(self):
+        evset = event_set(
+            timestamps=[1, 2, 3],
+            features={
+                "f": DictionaryArray.encode(["a", "b", "a"]),
+                "k": [1, 2, 1],
+            },
+            indexes=["k"],
+        )
+        save_event_set(evset, self.path)
+
+        result = load_event_set(self.path)
+        self.assertIsInstance(result.data.features[0], DictionaryArray)
+        self.assertEqual(result, evset)
+
+    def test_timestamp_unit(self):
+        evset = event_set(
+            timestamps=["2020-01-01 00:00:00.000000001"], timestamp_unit="ns"
+        )
+        save_event_set(evset, self.path)
+
+        result = load_event_set(self.path)
+        self.assertEqual(result.schema.timestamp_unit, "ns")
+        self.assertEqual(result, evset)
+
+    def test_empty(self):
+        evset = event_set(
+            timestamps=np.array([], dtype=np.float64),
+            features={
+                "f": np.array([], dtype=np.str_),
+                "k": np.array([], dtype=np.int64),
+            },
+            indexes=["k"],
+        )
+        save_event_set(evset, self.path)
+        self.assertEqual(load_event_set(self.path), evset)
+
+    def test_not_an_event_set_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"hello")
+        with self.assertRaisesRegex(ValueError, "is not an EventSet file"):
+            load_event_set(self.path)
+
+
+if __name__ == "__main__":
+    absltest.main()
@@ -41,6 +41,32 @@ class ParquetEventSet(absltest.TestCase):
         result = from_parquet(f.name, indexes=["product_id"])
         self.assertEqual(es, result)
 
+    def test_features(self) -> None:
+        es = event_set(
+            timestamps=[1.0, 2.0, 3.0],
+            features={
+                "product_id": [666964, 666964, 574016],
+                "costs": [740.0, 508.0, 573.0],
+                "other": [1, 2, 3],
+            },
+            indexes=["product_id"],
+        )
+
+        f = NamedTemporaryFile(delete=False)
+        to_parquet(es, f.name)
+        result = from_parquet(
+            f.name, indexes=["product_id"], features=["costs"]
+        )
+        expected = event_set(
+            timestamps=[1.0, 2.0, 3.0],
+            features={
+                "product_id": [666964, 666964, 574016],
+                "costs": [740.0, 508.0, 573.0],
+            },
+            indexes=["product_id"],
+        )
+        self.assertEqual(result, expected)
+
 
 if __name__ == "__main__":
     absltest.main()
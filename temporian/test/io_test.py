@@ -59,6 +59,31 @@ class IOTest(absltest.TestCase):
 
             self.assertEqual(evset, saved_evset)
 
+    def test_from_csv_features(self) -> None:
+        df = pd.DataFrame(
+            [
+                [666964, 1.0, 740.0, 1],
+                [666964, 2.0, 508.0, 2],
+                [574016, 3.0, 573.0, 3],
+            ],
+            columns=["product_id", "timestamp", "costs", "other"],
+        )
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "events.csv")
+            df.to_csv(path, index=False)
+
+            evset = tp.from_csv(
+                path=path,
+                indexes=["product_id"],
+                features=["costs"],
+            )
+
+        expected_evset = tp.from_pandas(
+            df.drop(columns=["other"]), indexes=["product_id"]
+        )
+        self.assertEqual(evset, expected_evset)
+
 
 if __name__ == "__main__":
     absltest.main()
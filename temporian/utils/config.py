@@ -33,6 +33,17 @@ debug_mode = bool(os.environ.get("TEMPORIAN_DEBUG_MODE", False))
 """Whether to run Temporian in debugging mode. This will enable additional
 checks and logging, which may slow down execution."""
 
+# Execution
+schedule_cache_size = int(os.environ.get("TEMPORIAN_SCHEDULE_CACHE_SIZE", 128))
+"""Maximum number of execution schedules cached by `tp.run()`. Schedules are
+cached by input and output nodes, so that running the same graph repeatedly
+skips the graph inference and scheduling. Set to 0 to disable the cache."""
+check_execution_max_index_keys = int(
+    os.environ.get("TEMPORIAN_CHECK_EXECUTION_MAX_INDEX_KEYS", 8)
+)
+"""Maximum number of index keys of each input and output validated after each
+operator by `tp.run()` with `check_execution="sampled"`."""
+
 # Limits for repr(evset), print(evset)
 print_max_indexes = int(os.environ.get("TEMPORIAN_PRINT_MAX_INDEXES", 4))
 """Maximum number of index values to show when printing an EventSet."""